@@ -0,0 +1,32 @@
+"""
+File Reader Benchmarks
+
+Exports:
+    - CorpusSpec, SIZES, generate_corpus: Deterministic DOCX/XLSX/PDF corpus
+    - run_suite, Measurement, VARIANTS: Throughput and peak RSS per reader
+      variant
+    - compare, Comparison: Regression check between two result files
+
+Usage:
+    python -m benchmarks generate /tmp/corpus --size medium
+    python -m benchmarks run /tmp/corpus --output baseline.json
+    python -m benchmarks compare baseline.json benchmark-results.json
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing (Benchmarks)
+"""
+
+from .compare import Comparison, compare
+from .corpus import SIZES, CorpusSpec, generate_corpus
+from .measure import VARIANTS, Measurement, run_suite
+
+__all__ = [
+    'CorpusSpec',
+    'SIZES',
+    'generate_corpus',
+    'Measurement',
+    'VARIANTS',
+    'run_suite',
+    'Comparison',
+    'compare',
+]
@@ -0,0 +1,135 @@
+"""
+Benchmark CLI - Generate a Corpus, Measure the Readers, Compare Runs
+
+Usage (from the repository root):
+    python -m benchmarks generate <corpus_dir> [--size small|medium|large] [--pdf-pages N] ...
+    python -m benchmarks run <corpus_dir> [--output results.json] [--repeat N] [--format FMT]
+    python -m benchmarks compare <baseline.json> <current.json> [--threshold 0.10]
+
+The readers' libraries must be installed, e.g.:
+    uv run --with python-docx --with openpyxl --with PyMuPDF python -m benchmarks ...
+
+Exit Codes:
+    0 - Success (compare: no regression)
+    1 - Usage or input error (compare: at least one regression)
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing (Benchmarks)
+Pattern: CLI Facade
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, fields, replace
+from pathlib import Path
+from typing import List, Optional
+
+from .compare import DEFAULT_THRESHOLD, compare
+from .corpus import SIZES, CorpusSpec, generate_corpus
+from .measure import VARIANTS, format_measurement, run_suite
+
+DEFAULT_RESULTS = Path("benchmark-results.json")
+
+
+def cmd_generate(args) -> int:
+    """Write a corpus of the selected size, with per-format overrides."""
+    overrides = {
+        spec_field.name: getattr(args, spec_field.name)
+        for spec_field in fields(CorpusSpec)
+        if getattr(args, spec_field.name) is not None
+    }
+    try:
+        spec = replace(SIZES[args.size], **overrides)
+        files = generate_corpus(Path(args.corpus_dir), spec)
+    except (ValueError, ImportError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    for corpus_file in files:
+        print(f"{corpus_file.name:<40} {corpus_file.bytes:>12} bytes "
+              f"{corpus_file.units:>10} {corpus_file.unit}")
+    return 0
+
+
+def cmd_run(args) -> int:
+    """Measure every document and variant; write the results JSON."""
+    try:
+        results = run_suite(
+            Path(args.corpus_dir),
+            repeat=args.repeat,
+            formats=args.format,
+            isolate=not args.in_process,
+            on_result=lambda result: print(format_measurement(result), flush=True),
+        )
+    except (FileNotFoundError, RuntimeError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    Path(args.output).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+    print(f"Results written to {args.output}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    """Compare two results files; exit 1 on any regression."""
+    try:
+        baseline, current = (
+            json.loads(Path(path).read_text(encoding="utf-8"))
+            for path in (args.baseline, args.current)
+        )
+        comparison = compare(baseline, current, args.threshold, args.rss_threshold)
+    except (OSError, ValueError, KeyError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    print(comparison.format())
+    return 1 if comparison.regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Parse arguments and run a subcommand."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="File reader benchmarks: synthetic corpus, throughput and peak RSS",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    generate = commands.add_parser("generate", help="Generate a deterministic document corpus")
+    generate.add_argument("corpus_dir", help="Directory to write the documents into")
+    generate.add_argument("--size", choices=sorted(SIZES), default="medium",
+                          help="Size preset (default: medium)")
+    defaults = asdict(CorpusSpec())
+    for spec_field in fields(CorpusSpec):
+        generate.add_argument(
+            "--" + spec_field.name.replace("_", "-"),
+            type=int,
+            metavar="N",
+            help=f"Override the preset (medium: {defaults[spec_field.name]})",
+        )
+    generate.set_defaults(handler=cmd_generate)
+    
+    run = commands.add_parser("run", help="Measure the readers on a corpus")
+    run.add_argument("corpus_dir", help="Directory written by 'generate'")
+    run.add_argument("--output", default=str(DEFAULT_RESULTS),
+                     help=f"Results file (default: {DEFAULT_RESULTS})")
+    run.add_argument("--repeat", type=int, default=3,
+                     help="Timed repetitions per measurement (default: 3)")
+    run.add_argument("--format", action="append", choices=sorted(VARIANTS),
+                     help="Only benchmark this format (repeatable)")
+    run.add_argument("--in-process", action="store_true",
+                     help="Measure in this process (faster; peak RSS accumulates)")
+    run.set_defaults(handler=cmd_run)
+    
+    check = commands.add_parser("compare", help="Flag regressions between two result files")
+    check.add_argument("baseline", help="Reference results file")
+    check.add_argument("current", help="Results file to check")
+    check.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help="Allowed relative throughput drop (default: %(default)s)")
+    check.add_argument("--rss-threshold", type=float,
+                       help="Allowed relative peak RSS rise (default: --threshold)")
+    check.set_defaults(handler=cmd_compare)
+    
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
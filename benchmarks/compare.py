@@ -0,0 +1,141 @@
+"""
+Benchmark Comparison - Flag Regressions Between Two Result Files
+
+Matches measurements by id (document and reader variant) and compares:
+
+- throughput (mb_per_s): a drop of more than the threshold is a regression
+- peak RSS (peak_rss_mb): a rise of more than the RSS threshold is a
+  regression
+
+Measurements present in only one file are listed but never flagged, so a
+new variant or a resized corpus does not fail the comparison.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing (Benchmarks)
+Pattern: Specification (threshold per metric)
+
+Invariant:
+    change c is a regression ⇔ c moves in the metric's worse direction
+    by more than its threshold (relative to the baseline)
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Metric -> True if higher values are better
+METRICS = {
+    "mb_per_s": True,
+    "peak_rss_mb": False,
+}
+
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass
+class Change:
+    """
+    One metric of one measurement, baseline vs current.
+    
+    Attributes:
+        id: Measurement id ("<file name>:<variant>")
+        metric: Metric name (see METRICS)
+        baseline: Baseline value
+        current: Current value
+        relative: (current - baseline) / baseline
+        regression: True if the change is worse than the metric's threshold
+    """
+    id: str
+    metric: str
+    baseline: float
+    current: float
+    relative: float
+    regression: bool
+
+
+@dataclass
+class Comparison:
+    """
+    Outcome of comparing two result files.
+    
+    Attributes:
+        changes: Every compared metric, in baseline order
+        missing: Ids only in the baseline
+        added: Ids only in the current results
+    """
+    changes: List[Change] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    added: List[str] = field(default_factory=list)
+    
+    @property
+    def regressions(self) -> List[Change]:
+        """Changes flagged as regressions."""
+        return [change for change in self.changes if change.regression]
+    
+    def format(self) -> str:
+        """Human-readable table, regressions marked with '!'."""
+        lines = []
+        for change in self.changes:
+            marker = "!" if change.regression else " "
+            lines.append(
+                f"{marker} {change.id:<40} {change.metric:<12} "
+                f"{change.baseline:>10.2f} -> {change.current:>10.2f} "
+                f"({change.relative:+.1%})"
+            )
+        for name in self.missing:
+            lines.append(f"  {name:<40} missing from current results")
+        for name in self.added:
+            lines.append(f"  {name:<40} new (no baseline)")
+        lines.append(f"{len(self.regressions)} regression(s) in {len(self.changes)} metric(s)")
+        return "\n".join(lines)
+
+
+def compare(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    rss_threshold: Optional[float] = None,
+) -> Comparison:
+    """
+    Compare two results documents written by measure.run_suite().
+    
+    Args:
+        baseline: Reference results
+        current: Results to check
+        threshold: Allowed relative throughput drop (0.10 = 10%)
+        rss_threshold: Allowed relative peak RSS rise (default: threshold)
+        
+    Returns:
+        Comparison of every measurement present in both documents
+        
+    Raises:
+        ValueError: If a threshold is negative
+    """
+    if rss_threshold is None:
+        rss_threshold = threshold
+    if threshold < 0 or rss_threshold < 0:
+        raise ValueError("Thresholds must not be negative")
+    limits = {"mb_per_s": threshold, "peak_rss_mb": rss_threshold}
+    
+    before = {result["id"]: result for result in baseline["results"]}
+    after = {result["id"]: result for result in current["results"]}
+    comparison = Comparison(
+        missing=[name for name in before if name not in after],
+        added=[name for name in after if name not in before],
+    )
+    for name, old in before.items():
+        new = after.get(name)
+        if new is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old_value, new_value = old[metric], new[metric]
+            relative = (new_value - old_value) / old_value if old_value else 0.0
+            worse = -relative if higher_is_better else relative
+            comparison.changes.append(Change(
+                id=name,
+                metric=metric,
+                baseline=old_value,
+                current=new_value,
+                relative=relative,
+                regression=worse > limits[metric],
+            ))
+    return comparison
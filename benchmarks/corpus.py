@@ -0,0 +1,305 @@
+"""
+Benchmark Corpus - Deterministic Synthetic DOCX/XLSX/PDF Fixtures
+
+Generates one document per format at a configurable size, written with
+the same libraries the readers parse (python-docx, openpyxl, PyMuPDF):
+
+- PDF: N pages of wrapped prose
+- XLSX: S sheets of R rows × C columns mixing text, integers, decimals
+  and blank cells (shared strings and sparse rows, like real workbooks)
+- DOCX: P paragraphs with headings, T tables and one header/footer pair
+  per section
+
+The same spec and seed always produce the same documents: text comes
+from a seeded generator, and timestamps (document metadata and ZIP entry
+dates) are fixed, so results from different runs describe the same input.
+A corpus.json manifest records the spec and, per file, the work unit
+(pages, rows, blocks) used for throughput.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing (Benchmarks)
+Pattern: Builder (seeded) + Manifest
+
+Invariant:
+    generate_corpus(dir_a, spec) and generate_corpus(dir_b, spec) write
+    byte-identical documents (for the same library versions)
+"""
+
+import json
+import random
+import re
+import zipfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+MANIFEST_NAME = "corpus.json"
+
+# Fixed timestamp for document metadata and ZIP entries
+_EPOCH = datetime(2024, 1, 1)
+
+# Creation/modification dates in docProps/core.xml
+_CORE_DATES = re.compile(rb"(<dcterms:(?:created|modified)[^>]*>)[^<]*(</dcterms:)")
+
+_WORDS = (
+    "account", "agent", "amount", "analysis", "archive", "balance", "budget",
+    "cache", "contract", "customer", "data", "delivery", "design", "domain",
+    "estimate", "extract", "file", "forecast", "invoice", "knowledge", "ledger",
+    "margin", "model", "order", "page", "payment", "plan", "policy", "price",
+    "project", "quarter", "record", "report", "request", "review", "risk",
+    "sales", "schedule", "section", "service", "sheet", "source", "stream",
+    "summary", "supplier", "table", "target", "team", "total", "update",
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """
+    Sizes of the generated documents.
+    
+    Attributes:
+        pdf_pages: Pages in the PDF
+        xlsx_rows: Rows per sheet in the workbook (including a header row)
+        xlsx_cols: Columns per row
+        xlsx_sheets: Sheets in the workbook
+        docx_paragraphs: Body paragraphs in the DOCX (every 25th a heading)
+        docx_tables: Tables in the DOCX, spread evenly between paragraphs
+        docx_table_rows: Rows per DOCX table (4 columns)
+        docx_sections: Sections in the DOCX, each with a header and footer
+        seed: Seed for the generated text
+    """
+    pdf_pages: int = 100
+    xlsx_rows: int = 20000
+    xlsx_cols: int = 10
+    xlsx_sheets: int = 3
+    docx_paragraphs: int = 2000
+    docx_tables: int = 20
+    docx_table_rows: int = 20
+    docx_sections: int = 2
+    seed: int = 0
+    
+    def __post_init__(self):
+        for name, value in asdict(self).items():
+            if name != "seed" and value < (0 if name == "docx_tables" else 1):
+                raise ValueError(f"{name} must be positive, got {value}")
+        if self.docx_tables > self.docx_paragraphs:
+            raise ValueError("docx_tables cannot exceed docx_paragraphs")
+
+
+# Named presets for `python -m benchmarks generate --size`
+SIZES: Dict[str, CorpusSpec] = {
+    "small": CorpusSpec(pdf_pages=10, xlsx_rows=1000, xlsx_cols=8, xlsx_sheets=2,
+                        docx_paragraphs=200, docx_tables=5, docx_table_rows=10,
+                        docx_sections=1),
+    "medium": CorpusSpec(),
+    "large": CorpusSpec(pdf_pages=1000, xlsx_rows=200000, xlsx_cols=12, xlsx_sheets=4,
+                        docx_paragraphs=20000, docx_tables=100, docx_table_rows=40,
+                        docx_sections=4),
+}
+
+
+@dataclass
+class CorpusFile:
+    """
+    One generated document.
+    
+    Attributes:
+        name: File name within the corpus directory
+        format: Reader format (extension)
+        bytes: File size
+        unit: Work unit counted for throughput ("pages", "rows", "blocks")
+        units: Number of work units in the document
+    """
+    name: str
+    format: str
+    bytes: int
+    unit: str
+    units: int
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    """A capitalized pseudo-sentence of the given number of words."""
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _normalize_zip(path: Path) -> None:
+    """
+    Rewrite a ZIP package with fixed dates (byte-stable output).
+    
+    Entry dates and the core properties' modification time (which
+    openpyxl sets to the time of saving) are set to _EPOCH.
+    """
+    with zipfile.ZipFile(path) as archive:
+        entries = [(info.filename, archive.read(info)) for info in archive.infolist()]
+    stamp = _EPOCH.strftime("%Y-%m-%dT%H:%M:%SZ").encode("ascii")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in entries:
+            if name == "docProps/core.xml":
+                data = _CORE_DATES.sub(lambda m: m.group(1) + stamp + m.group(2), data)
+            info = zipfile.ZipInfo(name, date_time=_EPOCH.timetuple()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, data)
+
+
+def generate_pdf(path: Path, pages: int, rng: random.Random) -> None:
+    """
+    Write a PDF of prose pages.
+    
+    Raises:
+        ImportError: If PyMuPDF is not installed
+    """
+    try:
+        import pymupdf
+    except ImportError as e:
+        raise ImportError(
+            "PyMuPDF not installed. Use: uv run --with pymupdf python -m benchmarks ..."
+        ) from e
+    
+    doc = pymupdf.open()
+    for number in range(1, pages + 1):
+        page = doc.new_page()
+        lines = [f"Page {number}"] + [_sentence(rng, 10) for _ in range(40)]
+        page.insert_text((54, 54), "\n".join(lines), fontsize=9)
+    stamp = "D:" + _EPOCH.strftime("%Y%m%d%H%M%S")
+    doc.set_metadata({"creationDate": stamp, "modDate": stamp, "producer": "benchmarks"})
+    doc.save(str(path), garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+
+
+def generate_xlsx(path: Path, rows: int, cols: int, sheets: int, rng: random.Random) -> None:
+    """
+    Write a workbook of mixed-type rows (write-only mode, constant memory).
+    
+    Every 7th cell is blank and every 50th row is empty.
+    
+    Raises:
+        ImportError: If openpyxl is not installed
+    """
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise ImportError(
+            "openpyxl not installed. Use: uv run --with openpyxl python -m benchmarks ..."
+        ) from e
+    
+    workbook = openpyxl.Workbook(write_only=True)
+    workbook.properties.created = _EPOCH
+    workbook.properties.modified = _EPOCH
+    for sheet_number in range(1, sheets + 1):
+        sheet = workbook.create_sheet(f"Sheet{sheet_number}")
+        sheet.append([f"{rng.choice(_WORDS)}_{col}" for col in range(cols)])
+        for row in range(2, rows + 1):
+            if row % 50 == 0:
+                sheet.append([])
+                continue
+            values = []
+            for col in range(cols):
+                kind = (row + col) % 7
+                if kind == 0:
+                    values.append(None)
+                elif kind in (1, 2):
+                    values.append(rng.randint(0, 100000))
+                elif kind == 3:
+                    values.append(round(rng.uniform(0, 10000), 2))
+                else:
+                    values.append(rng.choice(_WORDS))
+            sheet.append(values)
+    workbook.save(str(path))
+    _normalize_zip(path)
+
+
+def generate_docx(path: Path, paragraphs: int, tables: int, table_rows: int,
+                  sections: int, rng: random.Random) -> None:
+    """
+    Write a document of paragraphs, headings, tables and headed sections.
+    
+    Raises:
+        ImportError: If python-docx is not installed
+    """
+    try:
+        import docx
+        from docx.enum.section import WD_SECTION
+    except ImportError as e:
+        raise ImportError(
+            "python-docx not installed. Use: uv run --with python-docx python -m benchmarks ..."
+        ) from e
+    
+    document = docx.Document()
+    document.core_properties.created = _EPOCH
+    document.core_properties.modified = _EPOCH
+    document.core_properties.last_modified_by = "benchmarks"
+    
+    table_every = paragraphs // tables if tables else 0
+    section_every = paragraphs // sections if sections > 1 else 0
+    for number in range(1, paragraphs + 1):
+        if section_every and number % section_every == 0 and number < paragraphs:
+            document.add_section(WD_SECTION.NEW_PAGE)
+        if number % 25 == 1:
+            document.add_heading(_sentence(rng, 4), level=1 + number % 2)
+        else:
+            document.add_paragraph(_sentence(rng, rng.randint(8, 40)))
+        if table_every and number % table_every == 0 and number // table_every <= tables:
+            table = document.add_table(rows=table_rows, cols=4)
+            for row in table.rows:
+                for cell in row.cells:
+                    cell.text = rng.choice(_WORDS)
+    
+    for number, section in enumerate(document.sections, start=1):
+        section.header.is_linked_to_previous = False
+        section.footer.is_linked_to_previous = False
+        section.header.paragraphs[0].text = f"Section {number} header"
+        section.footer.paragraphs[0].text = f"Section {number} footer"
+    document.save(str(path))
+    _normalize_zip(path)
+
+
+def generate_corpus(out_dir: Path, spec: CorpusSpec = CorpusSpec()) -> List[CorpusFile]:
+    """
+    Generate one document per format and a corpus.json manifest.
+    
+    Args:
+        out_dir: Directory to write into (created if missing)
+        spec: Document sizes and seed
+        
+    Returns:
+        The generated files, in manifest order
+        
+    Raises:
+        ImportError: If a document library is not installed
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    
+    name = f"pdf-{spec.pdf_pages}p.pdf"
+    generate_pdf(out_dir / name, spec.pdf_pages, random.Random(f"{spec.seed}:pdf"))
+    files.append(CorpusFile(name, "pdf", 0, "pages", spec.pdf_pages))
+    
+    name = f"xlsx-{spec.xlsx_sheets}x{spec.xlsx_rows}x{spec.xlsx_cols}.xlsx"
+    generate_xlsx(out_dir / name, spec.xlsx_rows, spec.xlsx_cols, spec.xlsx_sheets,
+                  random.Random(f"{spec.seed}:xlsx"))
+    files.append(CorpusFile(name, "xlsx", 0, "rows", spec.xlsx_rows * spec.xlsx_sheets))
+    
+    name = f"docx-{spec.docx_paragraphs}p-{spec.docx_tables}t.docx"
+    generate_docx(out_dir / name, spec.docx_paragraphs, spec.docx_tables,
+                  spec.docx_table_rows, spec.docx_sections, random.Random(f"{spec.seed}:docx"))
+    files.append(CorpusFile(name, "docx", 0, "blocks", spec.docx_paragraphs + spec.docx_tables))
+    
+    for corpus_file in files:
+        corpus_file.bytes = (out_dir / corpus_file.name).stat().st_size
+    manifest = {"spec": asdict(spec), "files": [asdict(f) for f in files]}
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return files
+
+
+def load_corpus(corpus_dir: Path) -> List[CorpusFile]:
+    """
+    Read the files of a generated corpus from its manifest.
+    
+    Raises:
+        FileNotFoundError: If corpus_dir has no corpus.json
+    """
+    manifest = json.loads((Path(corpus_dir) / MANIFEST_NAME).read_text(encoding="utf-8"))
+    return [CorpusFile(**entry) for entry in manifest["files"]]
@@ -0,0 +1,279 @@
+"""
+Benchmark Runner - Reader Throughput and Peak Memory
+
+Extracts every corpus document with each reader variant (engine or
+extraction mode) and records:
+
+- best and median wall-clock time over N repetitions (cache disabled)
+- throughput: MB/s of input and work units/s (pages, rows, blocks)
+- peak RSS of the extracting process (and of its workers, for
+  parallel PDF and XLSX extraction)
+
+Each (document, variant) pair runs in a fresh interpreter by default, so
+peak RSS is not inflated by earlier measurements and imports are not
+shared between variants. Results are written as one JSON document with
+the environment they were measured in (Python, platform, library and
+reader versions), ready for compare.py.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing (Benchmarks)
+Pattern: Command (child process per measurement) + Report
+
+Invariant:
+    ∀ m ∈ run_suite(corpus).results:
+        m.mb_per_s = m.bytes / 2^20 / m.best_seconds
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from templates.skills.file_readers import AbstractFileReader
+
+from .corpus import MANIFEST_NAME, CorpusFile, load_corpus
+
+# Repository root, put on the child interpreters' import path
+_ROOT = Path(__file__).resolve().parent.parent
+
+# Child interpreter command for isolated measurements
+_CHILD = "import sys; from benchmarks.measure import _main; sys.exit(_main(sys.argv[1:]))"
+
+# Bumped when the results format changes
+RESULTS_VERSION = 1
+
+# Reader variants per format: variant name -> reader options
+VARIANTS: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "pdf": {
+        "serial": {"parallel_threshold": None},
+        "parallel": {"parallel_threshold": 1},
+    },
+    "xlsx": {
+        "fast": {"engine": "fast", "parallel_threshold": None},
+        "openpyxl": {"engine": "openpyxl", "parallel_threshold": None},
+        "parallel": {"engine": "fast", "parallel_threshold": 1},
+    },
+    "docx": {
+        "fast": {"engine": "fast"},
+        "python-docx": {"engine": "python-docx"},
+    },
+}
+
+# Distributions whose versions are recorded with the results
+_PACKAGES = ("PyMuPDF", "openpyxl", "python-docx", "lxml")
+
+
+@dataclass
+class Measurement:
+    """
+    Timing and memory of one document extracted with one reader variant.
+    
+    Attributes:
+        id: "<file name>:<variant>", the key compared across runs
+        file: Document file name
+        format: Reader format
+        variant: Reader variant (see VARIANTS)
+        bytes: Document size
+        unit: Work unit ("pages", "rows", "blocks")
+        units: Work units in the document
+        chars: Length of the extracted text
+        repeat: Timed repetitions
+        best_seconds: Fastest repetition
+        median_seconds: Median repetition
+        mb_per_s: Input MB (2^20 bytes) per second, from best_seconds
+        units_per_s: Work units per second, from best_seconds
+        peak_rss_mb: Peak resident set size of the extracting process(es)
+        baseline_rss_mb: Peak RSS after imports, before the first extraction
+    """
+    id: str
+    file: str
+    format: str
+    variant: str
+    bytes: int
+    unit: str
+    units: int
+    chars: int
+    repeat: int
+    best_seconds: float
+    median_seconds: float
+    mb_per_s: float
+    units_per_s: float
+    peak_rss_mb: float
+    baseline_rss_mb: float
+
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of this process and its waited-for children, in MB."""
+    import resource
+    
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    return peak * scale / (1024 * 1024)
+
+
+def measure(corpus_dir: Path, corpus_file: CorpusFile, variant: str,
+            repeat: int = 3) -> Measurement:
+    """
+    Time one document with one reader variant in this process.
+    
+    The first extraction is timed too: a warm-up would hide one-time
+    costs every real call pays. Peak RSS includes everything this process
+    allocated before, so prefer run_suite() with isolation.
+    
+    Args:
+        corpus_dir: Directory of the corpus
+        corpus_file: Document to extract
+        variant: Reader variant of the document's format
+        repeat: Timed repetitions
+        
+    Returns:
+        Measurement of the document
+        
+    Raises:
+        KeyError: If the variant is unknown for the format
+    """
+    options = VARIANTS[corpus_file.format][variant]
+    path = Path(corpus_dir) / corpus_file.name
+    AbstractFileReader.set_cache(None)
+    reader = AbstractFileReader.get_reader(path, **options)
+    baseline = _peak_rss_mb()
+    
+    timings = []
+    chars = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        chars = len(reader.read(path))
+        timings.append(time.perf_counter() - started)
+    
+    best = min(timings)
+    return Measurement(
+        id=f"{corpus_file.name}:{variant}",
+        file=corpus_file.name,
+        format=corpus_file.format,
+        variant=variant,
+        bytes=corpus_file.bytes,
+        unit=corpus_file.unit,
+        units=corpus_file.units,
+        chars=chars,
+        repeat=repeat,
+        best_seconds=round(best, 6),
+        median_seconds=round(statistics.median(timings), 6),
+        mb_per_s=round(corpus_file.bytes / (1024 * 1024) / best, 4),
+        units_per_s=round(corpus_file.units / best, 1),
+        peak_rss_mb=round(_peak_rss_mb(), 1),
+        baseline_rss_mb=round(baseline, 1),
+    )
+
+
+def _measure_isolated(corpus_dir: Path, corpus_file: CorpusFile, variant: str,
+                      repeat: int) -> Measurement:
+    """Run measure() in a fresh interpreter and parse its JSON result."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD, str(corpus_dir), corpus_file.name, variant, str(repeat)],
+        capture_output=True, text=True, env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(
+            f"Benchmark of {corpus_file.name} ({variant}) failed:\n{completed.stderr}"
+        )
+    return Measurement(**json.loads(completed.stdout))
+
+
+def environment() -> Dict[str, Any]:
+    """Interpreter, platform, library and reader versions of this run."""
+    packages = {}
+    for name in _PACKAGES:
+        try:
+            packages[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            packages[name] = None
+    readers = {
+        extension: AbstractFileReader.get_reader(Path(f"x.{extension}"), sniff=False).reader_version
+        for extension in sorted(VARIANTS)
+    }
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "packages": packages,
+        "reader_versions": readers,
+    }
+
+
+def run_suite(
+    corpus_dir: Path,
+    repeat: int = 3,
+    formats: Optional[Iterable[str]] = None,
+    isolate: bool = True,
+    on_result=None,
+) -> Dict[str, Any]:
+    """
+    Measure every corpus document with every variant of its reader.
+    
+    Args:
+        corpus_dir: Directory written by corpus.generate_corpus()
+        repeat: Timed repetitions per measurement
+        formats: Only benchmark these formats (default: all)
+        isolate: Run each measurement in a fresh interpreter
+        on_result: Called with each Measurement as it completes
+        
+    Returns:
+        Results document: {"version", "created", "corpus", "environment",
+        "results": [Measurement as dict, ...]}
+        
+    Raises:
+        FileNotFoundError: If corpus_dir has no corpus.json
+        RuntimeError: If an isolated measurement fails
+    """
+    corpus_dir = Path(corpus_dir).resolve()
+    selected = set(formats) if formats else set(VARIANTS)
+    results: List[Measurement] = []
+    for corpus_file in load_corpus(corpus_dir):
+        if corpus_file.format not in selected:
+            continue
+        for variant in VARIANTS[corpus_file.format]:
+            if isolate:
+                result = _measure_isolated(corpus_dir, corpus_file, variant, repeat)
+            else:
+                result = measure(corpus_dir, corpus_file, variant, repeat)
+            results.append(result)
+            if on_result is not None:
+                on_result(result)
+    return {
+        "version": RESULTS_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "corpus": json.loads((corpus_dir / MANIFEST_NAME).read_text(encoding="utf-8"))["spec"],
+        "environment": environment(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def format_measurement(result: Measurement) -> str:
+    """One aligned table row for a measurement."""
+    return (
+        f"{result.id:<40} {result.mb_per_s:>9.2f} MB/s "
+        f"{result.units_per_s:>11.1f} {result.unit + '/s':<9} "
+        f"{result.peak_rss_mb:>8.1f} MB peak RSS"
+    )
+
+
+def _main(argv: List[str]) -> int:
+    """Child entry point: CORPUS_DIR FILE VARIANT REPEAT -> JSON on stdout."""
+    corpus_dir, name, variant, repeat = argv
+    corpus_file = next(f for f in load_corpus(Path(corpus_dir)) if f.name == name)
+    result = measure(Path(corpus_dir), corpus_file, variant, int(repeat))
+    print(json.dumps(asdict(result)))
+    return 0
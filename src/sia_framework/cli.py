@@ -141,5 +141,77 @@ def doctor():
         sys.exit(1)
 
 
+def _open_search_index(root: Path):
+    """Open the project's search index, exiting if SIA is not initialized."""
+    if not (root / ".sia").exists():
+        click.echo("❌ SIA not initialized. Run 'sia-framework init' first.")
+        sys.exit(1)
+    
+    from .templates.skills.file_readers.search import (DEFAULT_INDEX_PATH,
+                                                       SearchIndex)
+    
+    return SearchIndex(root / DEFAULT_INDEX_PATH)
+
+
+def _update_search_index(search_index, root: Path, workers) -> None:
+    """Re-index changed knowledge files and report to stderr."""
+    report = search_index.update(root, workers=workers)
+    click.echo(f"🔎 {report.format()}", err=True)
+    for path, error in report.failed:
+        click.echo(f"   ⚠️  {path}: {error}", err=True)
+
+
+@main.command()
+@click.option("--workers", type=click.IntRange(min=1), default=None,
+              help="Worker processes for document extraction (default: CPU count)")
+def index(workers):
+    """Update the full-text search index of the knowledge base.
+    
+    Indexes .sia/knowledge (active and _archive) and .sia/requirements,
+    including PDF, DOCX and XLSX files extracted through the file readers.
+    Only new and changed files are read.
+    """
+    root = Path.cwd()
+    with _open_search_index(root) as search_index:
+        _update_search_index(search_index, root, workers)
+
+
+@main.command()
+@click.argument("query")
+@click.option("--top", type=click.IntRange(min=1), default=10, show_default=True,
+              help="Number of results")
+@click.option("--raw", is_flag=True,
+              help="Use FTS5 query syntax (AND/OR/NOT, \"phrases\", NEAR)")
+@click.option("--refresh", is_flag=True,
+              help="Re-index changed files before searching")
+def search(query: str, top: int, raw: bool, refresh: bool):
+    """Search the knowledge base, best matches first (BM25).
+    
+    All words of QUERY must match; end a word with * to match prefixes.
+    The index is built on first use; run 'sia-framework index' (or pass
+    --refresh) after editing knowledge files.
+    
+    \b
+    Example:
+        sia-framework search "token refresh" --top 5
+    """
+    root = Path.cwd()
+    with _open_search_index(root) as search_index:
+        if refresh or not len(search_index):
+            _update_search_index(search_index, root, workers=None)
+        try:
+            hits = search_index.search(query, top=top, raw=raw)
+        except ValueError as e:
+            click.echo(f"❌ {e}")
+            sys.exit(1)
+    
+    if not hits:
+        click.echo("No results.")
+        return
+    for rank, hit in enumerate(hits, 1):
+        click.echo(f"{rank}. {hit.path}  ({hit.score:.2f})")
+        click.echo(f"   {' '.join(hit.snippet.split())}")
+
+
 if __name__ == "__main__":
     main()
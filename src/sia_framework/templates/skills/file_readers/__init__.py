@@ -7,12 +7,72 @@ Exports:
     - FileReaderError: Base exception class
     - CorruptedFileError: Raised for corrupted/invalid files
     - UnsupportedFormatError: Raised for unsupported file extensions
+    - ResourceLimitExceeded: Raised when a document exceeds a resource limit
     - validate_file_exists: Utility function for file validation
     
     Concrete Readers:
     - DocxReader: Microsoft Word documents (.docx)
     - XlsxReader: Microsoft Excel spreadsheets (.xlsx)
     - PdfReader: Portable Document Format (.pdf)
+    
+    Batch Extraction:
+    - extract_many: Extract many files through a process pool
+    - iter_files: Walk a directory for supported files
+    - BatchResult: Per-file batch outcome (text or error)
+    
+    Async:
+    - aread_many: Extract many files from asyncio code (completion order,
+      bounded concurrency, per-file timeouts); see also AbstractFileReader.aread
+    - shared_executor: Process-wide thread/process pool used by the async API
+    
+    Chunking:
+    - Chunker: Split streamed text into size-bounded chunks at structural
+      boundaries (pages, sheets, paragraphs, lines), with overlap
+    - Chunk: One chunk with its character offsets and size
+    - get_tokenizer: Size units for chunking (chars, words, tiktoken)
+    
+    Structured Records:
+    - Part: Fragment of streamed reader output tagged with its source
+      unit (page, row, paragraph, ...) and location
+    - Record: One structural unit with its location and character offsets
+      in read() output (see AbstractFileReader.iter_records)
+    - write_jsonl: Write dicts as buffered UTF-8 JSON Lines
+    
+    Full-Text Search:
+    - SearchIndex: Incremental SQLite FTS5 index of the knowledge base
+      (BM25-ranked search with snippets)
+    
+    Boilerplate:
+    - BoilerplateFilter: Drop headers, footers and page numbers repeated
+      across pages from streamed text (bounded-memory frequency sketch)
+    - BoilerplateStats: Lines and bytes a filter removed
+    
+    Resource Limits:
+    - ResourceLimits: Per-document timeout, memory, page/row, output and
+      ZIP-ratio limits (enable with AbstractFileReader.set_limits(...))
+    
+    Sources and Archives:
+    - DocumentSource: A document on disk or in memory (bytes, memoryview,
+      mmap, file object, stdin); readers accept it wherever they accept
+      a Path
+    - iter_archive: Yield the documents of a ZIP/TAR bundle (nested
+      bundles expanded) as in-memory sources, under a decompression budget
+    - read_member: Load one member named "bundle.zip!/docs/a.pdf"
+    
+    Probing:
+    - DocumentInfo: Metadata returned by AbstractFileReader.probe()
+      (pages, sheets, word estimate, encryption, text layer)
+    - SheetInfo: Declared dimensions of one worksheet
+    
+    Profiling:
+    - Profile: Per-phase timings and counters of one extraction
+    - collect: Collect the Profiles of extractions run in a block
+      (or install a hook with AbstractFileReader.set_profiler(...))
+    
+    Caching:
+    - ExtractionCache: Content-addressed LRU cache of extracted text
+      (enable with AbstractFileReader.set_cache(ExtractionCache()))
+    - CacheStats: Cache usage snapshot
 
 Usage:
     >>> from file_readers import AbstractFileReader
@@ -25,8 +85,21 @@ Usage:
     >>> text = reader.read(Path("document.pdf"))
 """
 
+from .aio import aread_many, shared_executor
+from .archive import iter_archive, read_member
 from .base import (AbstractFileReader, CorruptedFileError, FileReaderError,
+                   Part, Record, ResourceLimitExceeded,
                    UnsupportedFormatError, validate_file_exists)
+from .batch import BatchResult, extract_many, iter_files
+from .boilerplate import BoilerplateFilter, BoilerplateStats
+from .cache import CacheStats, ExtractionCache
+from .chunking import Chunk, Chunker, get_tokenizer
+from .jsonl import write_jsonl
+from .limits import ResourceLimits
+from .probe import DocumentInfo, SheetInfo
+from .profiling import Profile, collect
+from .search import SearchIndex
+from .source import DocumentSource
 # Import concrete readers to trigger auto-registration
 from .docx_reader import DocxReader
 from .pdf_reader import PdfReader
@@ -38,11 +111,47 @@ __all__ = [
     'FileReaderError',
     'CorruptedFileError',
     'UnsupportedFormatError',
+    'ResourceLimitExceeded',
     'validate_file_exists',
     # Concrete readers
     'DocxReader',
     'XlsxReader',
     'PdfReader',
+    # Batch extraction
+    'BatchResult',
+    'extract_many',
+    'iter_files',
+    # Async
+    'aread_many',
+    'shared_executor',
+    # Chunking
+    'Chunker',
+    'Chunk',
+    'get_tokenizer',
+    # Boilerplate stripping
+    'BoilerplateFilter',
+    'BoilerplateStats',
+    # Structured records
+    'Part',
+    'Record',
+    'write_jsonl',
+    # Full-text search
+    'SearchIndex',
+    # Resource limits
+    'ResourceLimits',
+    # Sources and archives
+    'DocumentSource',
+    'iter_archive',
+    'read_member',
+    # Probing
+    'DocumentInfo',
+    'SheetInfo',
+    # Profiling
+    'Profile',
+    'collect',
+    # Caching
+    'ExtractionCache',
+    'CacheStats',
 ]
 
 __version__ = '1.0.0'
@@ -0,0 +1,213 @@
+"""
+Async Extraction - asyncio Front-end for the File Readers
+
+Lets asyncio services extract text without blocking the event loop: the
+blocking reader call runs in a shared executor and the coroutine awaits it.
+
+Features:
+- AbstractFileReader.aread(): await a single extraction
+- aread_many(): extract many files, yielding results in completion order
+- Bounded concurrency via an asyncio.Semaphore (optionally shared between
+  calls to cap a whole service)
+- Per-file timeouts (reported as failed BatchResults)
+- Cancellation: closing the iterator or cancelling the consuming task
+  cancels queued extractions and stops waiting for running ones
+- Shared thread pool by default; a process pool for CPU-bound corpora
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Async Facade (executor offloading)
+
+Invariant:
+    ∀ path ∈ paths: |{r ∈ aread_many(paths) : r.path = path}| = 1
+    ∧ in-flight extractions ≤ concurrency
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Optional, Set
+
+from .base import AbstractFileReader
+from .batch import BatchResult, _extract_one, _init_worker
+
+# Extractions running at once when the caller does not say otherwise
+DEFAULT_CONCURRENCY = 8
+
+EXECUTOR_KINDS = ("thread", "process")
+
+_executors: Dict[str, Executor] = {}
+_executors_lock = threading.Lock()
+
+
+def shared_executor(kind: str = "thread") -> Executor:
+    """
+    Return the process-wide executor used by aread() / aread_many().
+    
+    Created on first use and reused afterwards, so services do not pay pool
+    start-up per request. Threads suit most documents (the parsers release
+    the GIL while inflating and in native code); processes isolate
+    CPU-bound pure-Python parsing.
+    
+    Args:
+        kind: "thread" or "process"
+        
+    Returns:
+        Shared executor of that kind
+        
+    Raises:
+        ValueError: If kind is unknown
+    """
+    if kind not in EXECUTOR_KINDS:
+        raise ValueError(
+            f"Unknown executor kind '{kind}'. Choose from: {', '.join(EXECUTOR_KINDS)}"
+        )
+    with _executors_lock:
+        executor = _executors.get(kind)
+        if executor is None:
+            workers = os.cpu_count() or 1
+            if kind == "thread":
+                executor = ThreadPoolExecutor(
+                    max_workers=max(DEFAULT_CONCURRENCY, workers),
+                    thread_name_prefix="file-readers",
+                )
+            else:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(AbstractFileReader.cache, AbstractFileReader.limits),
+                )
+            _executors[kind] = executor
+        return executor
+
+
+def shutdown_executors(wait: bool = True) -> None:
+    """
+    Shut down the shared executors (they are recreated on next use).
+    
+    Args:
+        wait: Block until running extractions finish
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _release_when_done(loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore) -> None:
+    """Give a semaphore slot back from an executor callback."""
+    try:
+        loop.call_soon_threadsafe(semaphore.release)
+    except RuntimeError:
+        pass  # Loop already closed: nobody is left waiting for the slot
+
+
+async def _extract(
+    path: Path,
+    fmt: Optional[str],
+    semaphore: asyncio.Semaphore,
+    executor: Executor,
+    timeout: Optional[float],
+) -> BatchResult:
+    """
+    Extract one file once a semaphore slot is free.
+    
+    The slot is released when the executor job finishes, not when this
+    coroutine stops waiting, so timed-out or cancelled extractions that are
+    still running keep counting against the concurrency bound.
+    """
+    await semaphore.acquire()
+    loop = asyncio.get_running_loop()
+    try:
+        job = executor.submit(_extract_one, path, fmt)
+    except BaseException:
+        semaphore.release()
+        raise
+    job.add_done_callback(lambda _: _release_when_done(loop, semaphore))
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(job), timeout)
+    except asyncio.TimeoutError:
+        return BatchResult(path=path, error=f"Timed out after {timeout:g}s")
+
+
+async def aread_many(
+    paths: Iterable[Path],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    *,
+    timeout: Optional[float] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    executor: Optional[Executor] = None,
+    fmt: Optional[str] = None,
+) -> AsyncIterator[BatchResult]:
+    """
+    Extract many files concurrently, yielding results as they complete.
+    
+    Paths are consumed lazily: at most `concurrency` extractions are
+    scheduled at a time, so large or generated path lists are streamed.
+    Errors (including timeouts) are reported per file and never end the
+    iteration early. To stop early and cancel the remaining work at once,
+    iterate inside contextlib.aclosing(aread_many(...)) (otherwise it is
+    cancelled when the event loop finalizes the generator).
+    
+    Args:
+        paths: Files to extract
+        concurrency: Maximum extractions in flight for this call
+        timeout: Seconds allowed per file, measured from when it gets a
+            semaphore slot and is submitted, so time queued behind other
+            work in a shared executor counts (None = no limit). A timed-out
+            extraction is abandoned: its result is discarded, but a worker
+            already running it finishes in the background and holds its
+            slot until then.
+        semaphore: Semaphore to acquire per extraction, e.g. one shared by
+            every request of a service (default: a new one of size
+            `concurrency`)
+        executor: Executor to run readers in (default: shared thread pool;
+            see shared_executor("process") for CPU-bound corpora)
+        fmt: Force a format for every file (extension without dot)
+        
+    Yields:
+        One BatchResult per input path, in completion order
+        
+    Raises:
+        ValueError: If concurrency < 1
+        
+    Example:
+        >>> async for result in aread_many(paths, concurrency=4, timeout=30):
+        ...     if result.ok:
+        ...         index(result.path, result.text)
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
+    executor = executor or shared_executor()
+    path_iter = iter(paths)
+    pending: Set[asyncio.Task] = set()
+    
+    def schedule_next() -> bool:
+        path = next(path_iter, None)
+        if path is None:
+            return False
+        pending.add(asyncio.ensure_future(
+            _extract(Path(path), fmt, semaphore, executor, timeout)
+        ))
+        return True
+    
+    try:
+        while len(pending) < concurrency and schedule_next():
+            pass
+        
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                pending.discard(finished)
+                schedule_next()
+                yield finished.result()
+    finally:
+        # Consumer stopped early or was cancelled: drop outstanding work
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,308 @@
+"""
+Archives - Documents Inside ZIP and TAR Bundles
+
+Reads the documents of a .zip or .tar[.gz|.bz2|.xz] bundle without
+unpacking it to disk: each member is decompressed into memory and handed
+to its reader as an in-memory DocumentSource labelled with its location,
+e.g. "bundle.zip!/docs/a.pdf". Members that are bundles themselves are
+expanded in place (up to MAX_NESTING levels deep), so
+"outer.zip!/inner.tar.gz!/a.pdf" names a document too.
+
+Detection uses the reader sniffing: DOCX and XLSX are ZIP packages as
+well, so a ZIP is a bundle only if it has no [Content_Types].xml. Members
+are selected the way --recursive selects files, by a supported (or
+archive) extension; other members are never decompressed.
+
+All members read count against one decompression budget (max_bytes):
+ResourceLimitExceeded stops the walk before the member that would exceed
+it is read. ZIP sizes come from the central directory (zipfile fails a
+member inflating past its declared size); a TAR stream decompresses every
+member it passes, so skipped TAR members count too.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Iterator (lazy member walk)
+
+Invariant:
+    Σ decompressed member bytes ≤ max_bytes
+    ∧ str(member) = str(archive) + ARCHIVE_SEPARATOR + member name
+"""
+
+import bz2
+import lzma
+import tarfile
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple
+
+from .base import (AbstractFileReader, CorruptedFileError,
+                   ResourceLimitExceeded, read_head, zip_content_types)
+from .source import DocumentSource, Source, as_input, as_source
+
+# Separates an archive from a member: "bundle.zip!/docs/a.pdf"
+ARCHIVE_SEPARATOR = "!/"
+
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+ARCHIVE_SUFFIXES = (".zip",) + TAR_SUFFIXES
+
+# Total bytes decompressed from one archive (nested archives included)
+DEFAULT_MAX_ARCHIVE_BYTES = 1024 * 1024 * 1024
+
+# Archives inside archives expanded at most this deep
+MAX_NESTING = 3
+
+_ZIP_SIGNATURES = (b"PK\x03\x04", b"PK\x05\x06")
+_TAR_MAGIC_OFFSET = 257
+_TAR_BLOCK = 512
+
+# (name, size, read) of one archive member
+_Member = Tuple[str, int, Callable[[], bytes]]
+
+
+class _Budget:
+    """Decompressed bytes still allowed for one archive walk."""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.used = 0
+    
+    def charge(self, size: int, label: str) -> None:
+        """Account for a member before it is decompressed."""
+        if self.used + size > self.max_bytes:
+            raise ResourceLimitExceeded(
+                f"Archive members decompress to more than {self.max_bytes} bytes "
+                f"(limit reached at {label})"
+            )
+        self.used += size
+
+
+def is_member_path(spec: str) -> bool:
+    """True if spec names an archive member ("bundle.zip!/docs/a.pdf")."""
+    return ARCHIVE_SEPARATOR in spec and not Path(spec).exists()
+
+
+def split_member_path(spec: str) -> Tuple[Path, List[str]]:
+    """
+    Split a member path into the archive file and the member names.
+    
+    Args:
+        spec: "bundle.zip!/docs/a.pdf", or nested
+            "outer.zip!/inner.tar!/a.pdf"
+            
+    Returns:
+        (archive path, member names from outermost to innermost)
+        
+    Raises:
+        ValueError: If a member name is empty
+    """
+    archive, *members = spec.split(ARCHIVE_SEPARATOR)
+    if not archive or not all(members):
+        raise ValueError(f"Invalid archive member path: {spec}")
+    return Path(archive), members
+
+
+def is_archive(filepath: Source) -> bool:
+    """
+    Tell whether a file is a ZIP or TAR bundle (not a DOCX/XLSX package).
+    
+    Args:
+        filepath: File or in-memory source
+        
+    Returns:
+        True for ZIP files without [Content_Types].xml and for TAR files
+        (plain or gzip/bzip2/xz-compressed); False if unreadable
+    """
+    try:
+        head = read_head(filepath)
+    except OSError:
+        return False
+    if head.startswith(_ZIP_SIGNATURES):
+        return not zip_content_types(filepath, head)
+    block = _tar_block(head)
+    if block[_TAR_MAGIC_OFFSET:_TAR_MAGIC_OFFSET + 5] == b"ustar":
+        return True
+    # Pre-POSIX tar headers carry no magic: trust the extension
+    return as_source(filepath).name.lower().endswith(TAR_SUFFIXES)
+
+
+def iter_archive(filepath: Source,
+                 max_bytes: int = DEFAULT_MAX_ARCHIVE_BYTES) -> Iterator[DocumentSource]:
+    """
+    Yield the supported documents of an archive, nested archives expanded.
+    
+    Members are decompressed one at a time, when the iteration reaches
+    them; only the member being yielded is held in memory.
+    
+    Args:
+        filepath: ZIP or TAR archive (file or in-memory source)
+        max_bytes: Decompression budget for the whole walk
+        
+    Yields:
+        In-memory DocumentSources in archive order
+        
+    Raises:
+        FileNotFoundError: If the archive doesn't exist
+        ResourceLimitExceeded: If the budget or MAX_NESTING is exceeded
+        CorruptedFileError: If the archive or a member is unreadable
+            (e.g. encrypted)
+    """
+    source = as_source(filepath)
+    if source.path is not None and not source.path.is_file():
+        raise FileNotFoundError(f"File not found: {source}")
+    yield from _walk(source, _Budget(max_bytes), depth=0)
+
+
+def read_member(spec: str, max_bytes: int = DEFAULT_MAX_ARCHIVE_BYTES) -> DocumentSource:
+    """
+    Load one archive member named by a member path.
+    
+    Args:
+        spec: "bundle.zip!/docs/a.pdf" (see split_member_path)
+        max_bytes: Decompression budget
+        
+    Returns:
+        The member as an in-memory DocumentSource labelled spec
+        
+    Raises:
+        FileNotFoundError: If the archive or a member doesn't exist
+        ValueError: If spec is malformed
+        ResourceLimitExceeded: If the budget is exceeded
+        CorruptedFileError: If an archive is unreadable
+    """
+    archive, names = split_member_path(spec)
+    if not archive.is_file():
+        raise FileNotFoundError(f"File not found: {archive}")
+    source: DocumentSource = as_source(archive)
+    budget = _Budget(max_bytes)
+    for name in names:
+        if not is_archive(source):
+            raise CorruptedFileError(f"Not a ZIP or TAR archive: {source}")
+        wanted = name.strip("/")
+        tar = _is_tar(source)
+        for member, size, read in _members(source):
+            label = f"{source}{ARCHIVE_SEPARATOR}{member}"
+            if member == wanted:
+                budget.charge(size, label)
+                source = DocumentSource.from_bytes(read(), label)
+                break
+            if tar:
+                budget.charge(size, label)  # Decompressed while skipping
+        else:
+            raise FileNotFoundError(f"No member '{wanted}' in {source}")
+    return source
+
+
+def _walk(source: DocumentSource, budget: _Budget, depth: int) -> Iterator[DocumentSource]:
+    """Yield the selected members of source, recursing into archives."""
+    extensions = set(AbstractFileReader.list_supported_formats())
+    tar = _is_tar(source)
+    for name, size, read in _members(source):
+        label = f"{source}{ARCHIVE_SEPARATOR}{name}"
+        lowered = name.lower()
+        wanted = (lowered.endswith(ARCHIVE_SUFFIXES)
+                  or lowered.rpartition(".")[2] in extensions)
+        if not wanted:
+            if tar:
+                budget.charge(size, label)  # Decompressed while skipping
+            continue
+        budget.charge(size, label)
+        member = DocumentSource.from_bytes(read(), label)
+        if is_archive(member):
+            if depth >= MAX_NESTING:
+                raise ResourceLimitExceeded(
+                    f"Archives nested more than {MAX_NESTING} levels deep: {label}"
+                )
+            yield from _walk(member, budget, depth + 1)
+        else:
+            yield member
+
+
+def _members(source: DocumentSource) -> Iterator[_Member]:
+    """Yield (name, size, read) for the regular files of an archive."""
+    if _is_tar(source):
+        yield from _tar_members(source)
+    else:
+        yield from _zip_members(source)
+
+
+def _zip_members(source: DocumentSource) -> Iterator[_Member]:
+    try:
+        archive = zipfile.ZipFile(as_input(source))
+    except (zipfile.BadZipFile, OSError) as e:
+        raise CorruptedFileError(f"Invalid ZIP archive: {source}: {e}") from e
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            yield info.filename, info.file_size, _zip_reader(archive, info, source)
+
+
+def _zip_reader(archive: zipfile.ZipFile, info: zipfile.ZipInfo,
+                source: DocumentSource) -> Callable[[], bytes]:
+    def read() -> bytes:
+        try:
+            return archive.read(info)
+        except RuntimeError as e:
+            # zipfile's error for password-protected members
+            raise CorruptedFileError(
+                f"Encrypted archive member: {source}{ARCHIVE_SEPARATOR}{info.filename}"
+            ) from e
+        except (zipfile.BadZipFile, zlib.error, EOFError) as e:
+            raise CorruptedFileError(
+                f"Corrupted archive member: {source}{ARCHIVE_SEPARATOR}{info.filename}: {e}"
+            ) from e
+    return read
+
+
+def _tar_members(source: DocumentSource) -> Iterator[_Member]:
+    stream = source.open()
+    try:
+        # Stream mode: one pass, no seeking back for skipped members
+        with tarfile.open(fileobj=stream, mode="r|*") as archive:
+            for info in archive:
+                if not info.isfile():
+                    continue
+                name = info.name[2:] if info.name.startswith("./") else info.name
+                label = f"{source}{ARCHIVE_SEPARATOR}{name}"
+                yield name, info.size, _tar_reader(archive, info, label)
+    except (tarfile.TarError, EOFError, OSError, zlib.error, lzma.LZMAError) as e:
+        raise CorruptedFileError(f"Invalid TAR archive: {source}: {e}") from e
+    finally:
+        stream.close()
+
+
+def _tar_reader(archive: tarfile.TarFile, info: tarfile.TarInfo,
+                label: str) -> Callable[[], bytes]:
+    # Runs in the caller's frame, outside _tar_members' error handling
+    def read() -> bytes:
+        try:
+            return archive.extractfile(info).read()
+        except (tarfile.TarError, EOFError, OSError, zlib.error, lzma.LZMAError) as e:
+            raise CorruptedFileError(f"Corrupted archive member: {label}: {e}") from e
+    return read
+
+
+def _is_tar(source: DocumentSource) -> bool:
+    """ZIP and TAR are the two archive kinds; ZIP has a signature."""
+    try:
+        return not read_head(source).startswith(_ZIP_SIGNATURES)
+    except OSError:
+        return False
+
+
+def _tar_block(head: bytes) -> bytes:
+    """First TAR header block of head, decompressed if needed ("" if not)."""
+    decompressor = None
+    if head.startswith(b"\x1f\x8b"):
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    elif head.startswith(b"BZh"):
+        decompressor = bz2.BZ2Decompressor()
+    elif head.startswith(b"\xfd7zXZ\x00"):
+        decompressor = lzma.LZMADecompressor()
+    if decompressor is None:
+        return head[:_TAR_BLOCK]
+    try:
+        return decompressor.decompress(head, _TAR_BLOCK)
+    except (zlib.error, OSError, EOFError, lzma.LZMAError):
+        return b""
@@ -0,0 +1,354 @@
+"""
+Chunking - Size-bounded Splitting of Extracted Text
+
+Splits streamed reader output into chunks that fit a context window,
+cutting at the strongest structural boundary available:
+
+1. Section markers (=== PAGE n ===, === SHEET: name ===)
+2. Paragraph breaks (after a blank line)
+3. Line breaks (DOCX paragraphs, XLSX table rows, PDF text lines)
+4. Whitespace, then anywhere, inside a line too long for one chunk
+
+Sizes are measured by a tokenizer: characters by default, whitespace-
+separated words, or a local tiktoken encoding (optional dependency).
+Chunks are produced while the reader streams, so memory stays bounded by
+the chunk size rather than the document.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Pipeline Stage (stream → chunks)
+
+Invariant:
+    ∀ c ∈ chunks: c.size ≤ chunk_size ∧ c.text = text[c.start:c.end]
+    ∧ chunks cover text in order (consecutive chunks overlap by ≤ overlap)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import (Callable, Iterable, Iterator, List, NamedTuple, Optional,
+                    Tuple)
+
+# Counts the size of a piece of text (characters, words, tokens, ...)
+Tokenizer = Callable[[str], int]
+
+TOKENIZERS = ("chars", "words", "tiktoken")
+
+# Boundary strength before a line (higher = better place to cut)
+_NONE, _WORD, _LINE, _PARAGRAPH, _SECTION = range(5)
+
+# A cut is moved back to a stronger boundary only while the chunk stays
+# at least this full
+_MIN_FILL = 0.5
+
+_SECTION_MARKER = re.compile(r"=== (?:PAGE \d+|SHEET: .*) ===\n?")
+_WORD_PIECE = re.compile(r"\s*\S+\s*")
+
+
+def count_words(text: str) -> int:
+    """Tokenizer counting whitespace-separated words."""
+    return len(text.split())
+
+
+def tiktoken_tokenizer(encoding: str = "cl100k_base") -> Tokenizer:
+    """
+    Tokenizer counting tokens of a local tiktoken encoding.
+    
+    Args:
+        encoding: tiktoken encoding name
+        
+    Returns:
+        Function returning the token count of a text
+        
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    try:
+        import tiktoken
+    except ImportError as e:
+        raise ImportError(
+            "tiktoken not installed. "
+            "Use: uv run --with tiktoken python your_script.py"
+        ) from e
+    
+    encoder = tiktoken.get_encoding(encoding)
+    return lambda text: len(encoder.encode_ordinary(text))
+
+
+def get_tokenizer(spec: str) -> Tokenizer:
+    """
+    Resolve a tokenizer by name.
+    
+    Args:
+        spec: "chars", "words" or "tiktoken[:ENCODING]"
+        
+    Returns:
+        Tokenizer function
+        
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the tokenizer needs a library that is not installed
+    """
+    name, _, argument = spec.partition(":")
+    if name == "chars" and not argument:
+        return len
+    if name == "words" and not argument:
+        return count_words
+    if name == "tiktoken":
+        return tiktoken_tokenizer(argument or "cl100k_base")
+    raise ValueError(
+        f"Unknown tokenizer '{spec}'. Choose from: chars, words, tiktoken[:ENCODING]"
+    )
+
+
+@dataclass
+class Chunk:
+    """
+    One chunk of extracted text.
+    
+    Attributes:
+        index: Position in the chunk sequence (0-based)
+        text: Chunk text (a verbatim slice of the extracted text)
+        start: Character offset of the chunk in the extracted text
+        end: Character offset just past the chunk
+        size: Size as measured by the chunker's tokenizer
+    """
+    index: int
+    text: str
+    start: int
+    end: int
+    size: int
+
+
+class _Unit(NamedTuple):
+    """Smallest piece the chunker moves: a line, or part of a long line."""
+    start: int
+    text: str
+    size: int
+    level: int  # Boundary strength before this unit
+
+
+class Chunker:
+    """
+    Split streamed text into chunks of at most chunk_size.
+    
+    Lines are packed greedily. When the next line does not fit, the chunk
+    is cut at the strongest boundary that keeps it at least half full, and
+    the lines after the cut move to the next chunk. Overlap repeats whole
+    trailing lines of the previous chunk (up to `overlap` in size) at the
+    start of the next one; it is not carried across section markers, so a
+    page or sheet starts a fresh chunk. Lines too long for a chunk are
+    split at whitespace, and words too long for a chunk are cut.
+    
+    Sizes add up per line, which is exact for characters and words; a
+    subword tokenizer may count a whole chunk slightly differently.
+    
+    Example:
+        >>> chunker = Chunker(2000, overlap=200)
+        >>> for chunk in chunker.chunks(reader.stream(path)):
+        ...     index(chunk.text, chunk.start, chunk.end)
+    """
+    
+    def __init__(
+        self,
+        chunk_size: int,
+        overlap: int = 0,
+        tokenizer: Optional[Tokenizer] = None,
+    ):
+        """
+        Initialize the chunker.
+        
+        Args:
+            chunk_size: Maximum chunk size in tokenizer units
+            overlap: Size of the trailing context repeated in the next chunk
+            tokenizer: Size function (default: len, i.e. characters)
+            
+        Raises:
+            ValueError: If chunk_size < 1 or overlap is not in [0, chunk_size)
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        if not 0 <= overlap < chunk_size:
+            raise ValueError(
+                f"overlap must be between 0 and chunk_size - 1, got {overlap}"
+            )
+        self.chunk_size = chunk_size
+        self.overlap = overlap
+        self.tokenizer = tokenizer or len
+    
+    def chunks(self, parts: Iterable[str]) -> Iterator[Chunk]:
+        """
+        Chunk a text given as consecutive parts (e.g. reader.stream()).
+        
+        Args:
+            parts: Text fragments, consumed lazily; their boundaries do not
+                matter
+                
+        Yields:
+            Chunks in text order
+        """
+        buffer: List[_Unit] = []
+        # Sizes are kept as running totals, never re-summed per line
+        buffer_size = 0
+        carried = 0  # Leading units of buffer repeated from the previous chunk
+        carried_size = 0
+        index = 0
+        
+        for unit in self._iter_units(parts):
+            while buffer and buffer_size + unit.size > self.chunk_size:
+                if carried == len(buffer):
+                    # Only overlap left and it does not fit: shed it
+                    shed = buffer.pop(0)
+                    buffer_size -= shed.size
+                    carried_size -= shed.size
+                    carried -= 1
+                    continue
+                cut = self._choose_cut(buffer, carried, carried_size, unit)
+                chunk = self._make_chunk(index, buffer[:cut])
+                yield chunk
+                index += 1
+                next_level = buffer[cut].level if cut < len(buffer) else unit.level
+                tail = self._overlap_tail(buffer[:cut]) if next_level < _SECTION else []
+                buffer = tail + buffer[cut:]
+                carried = len(tail)
+                carried_size = self._size(tail)
+                buffer_size += carried_size - chunk.size
+            buffer.append(unit)
+            buffer_size += unit.size
+        
+        if len(buffer) > carried:
+            yield self._make_chunk(index, buffer)
+    
+    @staticmethod
+    def _size(units: List[_Unit]) -> int:
+        """Total size of a run of units."""
+        return sum(unit.size for unit in units)
+    
+    def _choose_cut(self, buffer: List[_Unit], carried: int, carried_size: int,
+                    incoming: _Unit) -> int:
+        """
+        Pick how many buffered units to emit as the next chunk.
+        
+        Candidates are the boundaries after the carried overlap, up to and
+        including the one before the incoming unit. The strongest boundary
+        that leaves the chunk at least _MIN_FILL full wins (latest on ties);
+        if none is full enough, the whole buffer is emitted.
+        """
+        min_fill = self.chunk_size * _MIN_FILL
+        best, best_level = len(buffer), incoming.level
+        filled = carried_size
+        for cut in range(carried + 1, len(buffer)):
+            filled += buffer[cut - 1].size
+            if filled >= min_fill and buffer[cut].level > best_level:
+                best, best_level = cut, buffer[cut].level
+        return best
+    
+    def _overlap_tail(self, emitted: List[_Unit]) -> List[_Unit]:
+        """Trailing units of an emitted chunk that fit in the overlap."""
+        tail: List[_Unit] = []
+        size = 0
+        # Never the whole chunk: the next one must start further on
+        for unit in reversed(emitted[1:]):
+            if size + unit.size > self.overlap:
+                break
+            tail.append(unit)
+            size += unit.size
+        tail.reverse()
+        return [unit._replace(level=_NONE) for unit in tail]
+    
+    @staticmethod
+    def _make_chunk(index: int, units: List[_Unit]) -> Chunk:
+        """Assemble a chunk from consecutive units."""
+        last = units[-1]
+        return Chunk(
+            index=index,
+            text="".join(unit.text for unit in units),
+            start=units[0].start,
+            end=last.start + len(last.text),
+            size=sum(unit.size for unit in units),
+        )
+    
+    def _iter_units(self, parts: Iterable[str]) -> Iterator[_Unit]:
+        """Split a text stream into sized lines, each tagged with its boundary."""
+        offset = 0
+        previous_blank = False
+        after_marker = False  # Until the first content line of a section
+        
+        for line in _iter_lines(parts):
+            stripped = line.strip()
+            if _SECTION_MARKER.fullmatch(line.lstrip("\n")):
+                level = _SECTION
+                after_marker = True
+            elif after_marker:
+                level = _NONE  # Never separate a marker from its content
+                after_marker = not stripped
+            elif previous_blank:
+                level = _PARAGRAPH
+            else:
+                level = _LINE
+            previous_blank = not stripped
+            
+            size = self.tokenizer(line)
+            if size <= self.chunk_size:
+                yield _Unit(offset, line, size, level)
+            else:
+                yield from self._split_long_line(offset, line, level)
+            offset += len(line)
+    
+    def _split_long_line(self, offset: int, line: str, level: int) -> Iterator[_Unit]:
+        """Split a line larger than a chunk at whitespace (or anywhere)."""
+        group, group_start, group_size = "", offset, 0
+        for match in _WORD_PIECE.finditer(line):
+            piece = match.group()
+            piece_start = offset + match.start()
+            piece_size = self.tokenizer(piece)
+            if group and group_size + piece_size > self.chunk_size:
+                yield _Unit(group_start, group, group_size, level)
+                level = _WORD
+                group, group_size = "", 0
+            if piece_size > self.chunk_size:
+                for start, text in self._cut_piece(piece):
+                    yield _Unit(piece_start + start, text, self.tokenizer(text), level)
+                    level = _NONE
+                level = _WORD
+                continue
+            if not group:
+                group_start = piece_start
+            group += piece
+            group_size += piece_size
+        if group:
+            yield _Unit(group_start, group, group_size, level)
+        elif not line.strip():
+            # Whitespace only (no word pieces): cut it like one long word
+            for start, text in self._cut_piece(line):
+                yield _Unit(offset + start, text, self.tokenizer(text), level)
+                level = _NONE
+    
+    def _cut_piece(self, piece: str) -> Iterator[Tuple[int, str]]:
+        """Cut text with no usable boundary into pieces that each fit a chunk."""
+        start = 0
+        while start < len(piece):
+            # Longest prefix of the remainder within chunk_size (binary search)
+            low, high = start + 1, len(piece)
+            while low < high:
+                middle = (low + high + 1) // 2
+                if self.tokenizer(piece[start:middle]) <= self.chunk_size:
+                    low = middle
+                else:
+                    high = middle - 1
+            yield start, piece[start:low]
+            start = low
+
+
+def _iter_lines(parts: Iterable[str]) -> Iterator[str]:
+    """Re-split a stream of text fragments into lines (keeping the newline)."""
+    pending = ""
+    for part in parts:
+        if "\n" not in part:
+            pending += part
+            continue
+        lines = (pending + part).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    if pending:
+        yield pending
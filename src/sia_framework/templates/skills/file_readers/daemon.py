@@ -0,0 +1,316 @@
+"""
+Reader Daemon - Warm Reader Process on a Unix Socket
+
+Every `uv run read_file.py` call pays for environment resolution,
+interpreter startup and the PyMuPDF/openpyxl/python-docx imports before
+extracting anything. A daemon started with `read_file.py --serve` pays
+once: it imports the readers and listens on .sia/run/reader.sock, and
+later read_file.py calls forward their arguments to it.
+
+Protocol (one request per connection):
+    client → daemon: one JSON line {"argv": [...], "cwd": "..."}
+        (or {"stop": true}), with the client's stdin, stdout and stderr
+        file descriptors attached (SCM_RIGHTS)
+    daemon: forks a child (inheriting the warm imports) that changes to
+        cwd, installs the received descriptors as its own 0/1/2 and runs
+        the request, writing output straight to the client's streams
+    daemon → client: one JSON line {"exit": <exit code>}
+
+Forking per request keeps requests isolated (cache settings, failures)
+and lets several run at once. Unix only.
+
+This module imports only the standard library, so the client side can
+be loaded without importing the readers.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Pre-forked Server (fork per request) + Thin Client
+
+Invariant:
+    forward(argv) = exit code of handler(argv) run in the daemon
+    ∧ output of handler(argv) reaches the client's own stdout/stderr
+"""
+
+import importlib
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+import traceback
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Union
+
+DEFAULT_SOCKET_PATH = Path(".sia") / "run" / "reader.sock"
+
+# Libraries imported by the daemon up front (skipped when not installed)
+WARM_MODULES = ("pymupdf", "openpyxl", "docx", "lxml.etree")
+
+# Upper bound for one request line
+_MAX_REQUEST_BYTES = 1024 * 1024
+
+# Runs one request (parsed command-line arguments) and returns its exit code
+Handler = Callable[[List[str]], int]
+
+
+class DaemonRunningError(RuntimeError):
+    """Raised when another daemon already listens on the socket."""
+    pass
+
+
+def socket_path_from_argv(argv: Sequence[str]) -> Path:
+    """
+    Socket path selected by a --socket PATH (or --socket=PATH) argument.
+    
+    Args:
+        argv: Command-line arguments (without the program name)
+        
+    Returns:
+        The given path, or DEFAULT_SOCKET_PATH
+    """
+    for index, argument in enumerate(argv):
+        if argument == "--socket" and index + 1 < len(argv):
+            return Path(argv[index + 1])
+        if argument.startswith("--socket="):
+            return Path(argument.split("=", 1)[1])
+    return DEFAULT_SOCKET_PATH
+
+
+def _connect(socket_path: Union[str, Path]) -> Optional[socket.socket]:
+    """Connect to a listening daemon, or None if there is none."""
+    if not hasattr(socket, "send_fds") or not os.path.exists(socket_path):
+        return None
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(os.fspath(socket_path))
+    except OSError:
+        client.close()  # Stale socket file: nobody is listening
+        return None
+    return client
+
+
+def _request(client: socket.socket, message: dict) -> int:
+    """Send a request with this process's std streams; wait for the exit code."""
+    payload = json.dumps(message).encode("utf-8") + b"\n"
+    with client:
+        socket.send_fds(client, [payload], [0, 1, 2])
+        reply = b""
+        while True:
+            data = client.recv(4096)
+            if not data:
+                break
+            reply += data
+    try:
+        return int(json.loads(reply)["exit"])
+    except (ValueError, KeyError, TypeError):
+        sys.stderr.write("Error: reader daemon closed the connection without a result\n")
+        return 2
+
+
+def forward(argv: List[str], socket_path: Union[str, Path] = DEFAULT_SOCKET_PATH) -> Optional[int]:
+    """
+    Run a command in the daemon, if one is listening.
+    
+    Args:
+        argv: Command-line arguments (without the program name)
+        socket_path: Daemon socket
+        
+    Returns:
+        The command's exit code, or None if no daemon is listening (or the
+        platform cannot pass file descriptors) and the caller should run
+        the command itself
+    """
+    try:
+        for fd in (0, 1, 2):
+            os.fstat(fd)
+    except OSError:
+        return None  # A closed std stream cannot be passed on
+    client = _connect(socket_path)
+    if client is None:
+        return None
+    return _request(client, {"argv": list(argv), "cwd": os.getcwd()})
+
+
+def stop(socket_path: Union[str, Path] = DEFAULT_SOCKET_PATH) -> bool:
+    """
+    Ask a listening daemon to shut down.
+    
+    Args:
+        socket_path: Daemon socket
+        
+    Returns:
+        True if a daemon was listening and was asked to stop
+    """
+    client = _connect(socket_path)
+    if client is None:
+        return False
+    _request(client, {"stop": True})
+    return True
+
+
+def warm_up(modules: Sequence[str] = WARM_MODULES) -> List[str]:
+    """
+    Import reader libraries so forked children start with them loaded.
+    
+    Args:
+        modules: Module names to import
+        
+    Returns:
+        Names of the modules that could be imported
+    """
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        loaded.append(name)
+    return loaded
+
+
+def _reap_children(signum, frame) -> None:
+    """SIGCHLD handler: collect finished request children."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def _exit_code(code) -> int:
+    """Exit status of a SystemExit code, as the interpreter would report it."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+def _receive_request(connection: socket.socket):
+    """
+    Read one request line and the file descriptors attached to it.
+    
+    Returns:
+        (request, fds), or None if the peer closed without a request
+        (a probe such as serve()'s already-running check)
+    """
+    data, fds, _, _ = socket.recv_fds(connection, 65536, 3)
+    if not data:
+        return None
+    while not data.endswith(b"\n"):
+        if len(data) > _MAX_REQUEST_BYTES:
+            raise ValueError("request too large")
+        more = connection.recv(65536)
+        if not more:
+            raise ValueError("incomplete request")
+        data += more
+    return json.loads(data), fds
+
+
+def _handle(connection: socket.socket, handler: Handler) -> None:
+    """Run one request in a forked child (never returns normally)."""
+    code = 2
+    try:
+        for signum in (signal.SIGCHLD, signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, signal.SIG_DFL)
+        received = _receive_request(connection)
+        if received is None:
+            return
+        request, fds = received
+        if request.get("stop"):
+            os.kill(os.getppid(), signal.SIGTERM)
+            code = 0
+        else:
+            os.chdir(request["cwd"])
+            for target, fd in enumerate(fds):
+                os.dup2(fd, target)
+                os.close(fd)
+            sys.stdin = open(0, encoding="utf-8", closefd=False)
+            sys.stdout = open(1, "w", encoding="utf-8", closefd=False)
+            sys.stderr = open(2, "w", buffering=1, encoding="utf-8",
+                              errors="backslashreplace", closefd=False)
+            try:
+                code = handler(request["argv"])
+            except SystemExit as e:
+                code = _exit_code(e.code)
+            except BaseException:
+                traceback.print_exc()
+                code = 2
+            sys.stdout.flush()
+            sys.stderr.flush()
+        connection.sendall(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+    except BaseException:
+        traceback.print_exc()  # The client reports the missing result
+    finally:
+        os._exit(0)
+
+
+def serve(
+    handler: Handler,
+    socket_path: Union[str, Path] = DEFAULT_SOCKET_PATH,
+    on_ready: Optional[Callable[[], None]] = None,
+) -> None:
+    """
+    Listen on a Unix socket and run each request in a forked child.
+    
+    Runs in the foreground until stopped (stop(), SIGTERM or Ctrl-C); the
+    socket file is removed on exit. Import reader libraries (warm_up())
+    before calling, so every child starts with them loaded.
+    
+    Args:
+        handler: Runs one request's argv in the child and returns its exit
+            code (output goes to the child's stdout/stderr)
+        socket_path: Socket to listen on (parent directories are created
+            with owner-only access)
+        on_ready: Called once the socket accepts connections
+        
+    Raises:
+        DaemonRunningError: If a daemon already listens on socket_path
+        OSError: If the socket cannot be created (e.g. not a Unix platform)
+    """
+    socket_path = Path(socket_path)
+    client = _connect(socket_path)
+    if client is not None:
+        client.close()
+        raise DaemonRunningError(f"A reader daemon is already listening on {socket_path}")
+    socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if socket_path.exists():
+        socket_path.unlink()  # Left behind by a daemon that was killed
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    identity = None
+    previous_handlers = {
+        signum: signal.getsignal(signum) for signum in (signal.SIGCHLD, signal.SIGTERM)
+    }
+    try:
+        server.bind(os.fspath(socket_path))
+        os.chmod(socket_path, stat.S_IRUSR | stat.S_IWUSR)
+        identity = os.stat(socket_path).st_ino
+        server.listen(64)
+        signal.signal(signal.SIGCHLD, _reap_children)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        if on_ready is not None:
+            on_ready()
+        
+        sys.stdout.flush()
+        sys.stderr.flush()
+        while True:
+            connection, _ = server.accept()
+            if os.fork() == 0:
+                server.close()
+                _handle(connection, handler)
+            connection.close()
+    finally:
+        server.close()
+        for signum, previous in previous_handlers.items():
+            signal.signal(signum, previous)
+        try:
+            # Only remove the socket if it is still ours
+            if identity is not None and os.stat(socket_path).st_ino == identity:
+                socket_path.unlink()
+        except OSError:
+            pass
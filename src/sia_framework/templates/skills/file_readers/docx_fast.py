@@ -0,0 +1,423 @@
+"""
+Fast DOCX Engine - Streaming WordprocessingML Parser
+
+Streams word/document.xml with lxml's iterparse instead of loading the full
+python-docx object graph. Body paragraphs and table rows are emitted in
+document order as soon as their end tag is parsed, then dropped from the
+tree, so memory stays bounded by the largest single row. Text matches
+DocxReader's python-docx engine exactly:
+- Paragraph text from direct w:r / w:hyperlink runs (w:t, w:tab, w:br, ...)
+- Horizontally merged cells repeated once per spanned grid column
+- Vertically merged cells resolved to the cell above at the same grid
+  offset (only the previous row's cells are kept to resolve them)
+- Headers/footers read from the parts referenced by each w:sectPr
+
+Files python-docx would reject or treat differently (not a ZIP package, no
+main document part, non-document content type) raise UnsupportedDocument
+from FastDocument.open(), before any text is produced.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Strategy (alternative DOCX extraction engine)
+
+Dependencies:
+    - lxml: streaming parser (installed with python-docx)
+
+Invariant:
+    FastDocument body parts ≡ DocxReader python-docx body parts
+"""
+
+import posixpath
+import zipfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .base import CorruptedFileError
+from .selection import Span
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+)
+_DOCUMENT_MAIN_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+)
+
+
+def _w(tag: str) -> str:
+    """Clark-notation name in the WordprocessingML namespace."""
+    return f"{{{_W_NS}}}{tag}"
+
+
+_BODY = _w("body")
+_P = _w("p")
+_R = _w("r")
+_HYPERLINK = _w("hyperlink")
+_T = _w("t")
+_TAB = _w("tab")
+_PTAB = _w("ptab")
+_BR = _w("br")
+_CR = _w("cr")
+_NO_BREAK_HYPHEN = _w("noBreakHyphen")
+_TBL = _w("tbl")
+_TR = _w("tr")
+_TC = _w("tc")
+_P_PR = _w("pPr")
+_SECT_PR = _w("sectPr")
+_VAL = _w("val")
+_TYPE = _w("type")
+
+# Fixed run-content characters (w:t and w:br are handled separately)
+_RUN_CHARACTERS = {_TAB: "\t", _PTAB: "\t", _CR: "\n", _NO_BREAK_HYPHEN: "-"}
+
+# Section header/footer references: (kind, type) -> relationship id
+SectionRefs = Dict[Tuple[str, str], str]
+
+
+class UnsupportedDocument(Exception):
+    """The fast engine cannot reproduce python-docx's output for this file."""
+
+
+def _run_text(run) -> str:
+    """Text of a w:r element, translated like python-docx's CT_R.text."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _T:
+            parts.append(child.text or "")
+        elif tag == _BR:
+            # Only text-wrapping breaks (the default) are line breaks
+            if child.get(_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_CHARACTERS:
+            parts.append(_RUN_CHARACTERS[tag])
+    return "".join(parts)
+
+
+def paragraph_text(paragraph) -> str:
+    """Text of a w:p element: its direct runs and hyperlink runs, in order."""
+    parts = []
+    for child in paragraph:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(run) for run in child if run.tag == _R)
+    return "".join(parts)
+
+
+def _cell_text(tc) -> str:
+    """Stripped, non-empty paragraph texts of a cell joined by spaces."""
+    texts = []
+    for child in tc:
+        if child.tag == _P:
+            text = paragraph_text(child).strip()
+            if text:
+                texts.append(text)
+    return " ".join(texts)
+
+
+def _int_property(parent, properties_tag: str, tag: str, default: int) -> int:
+    """Integer w:val of parent/properties/tag, or default when absent."""
+    properties = parent.find(properties_tag)
+    if properties is None:
+        return default
+    element = properties.find(tag)
+    if element is None:
+        return default
+    return int(element.get(_VAL))
+
+
+class _RowResolver:
+    """
+    Resolve a body table's rows to cell texts, one row at a time.
+    
+    Keeps only the previous row's resolved cells (keyed by grid offset), which
+    is all python-docx's vertical-merge lookup ever consults.
+    """
+    
+    def __init__(self):
+        self._above: Dict[int, Tuple[str, int]] = {}
+    
+    def row_text(self, tr) -> str:
+        """Tab-joined non-empty cell texts for a w:tr, merged cells repeated."""
+        offset = _int_property(tr, _w("trPr"), _w("gridBefore"), 0)
+        resolved: Dict[int, Tuple[str, int]] = {}
+        texts = []
+        for tc in tr:
+            if tc.tag != _TC:
+                continue
+            properties = tc.find(_w("tcPr"))
+            span = _int_property(tc, _w("tcPr"), _w("gridSpan"), 1)
+            v_merge = properties.find(_w("vMerge")) if properties is not None else None
+            
+            if v_merge is not None and v_merge.get(_VAL, "continue") == "continue":
+                # Continuation: content (and width) come from the cell above
+                cell = self._above.get(offset, ("", 1))
+            else:
+                cell = (_cell_text(tc), span)
+            resolved[offset] = cell
+            
+            text, repeat = cell
+            if text:
+                texts.extend([text] * repeat)
+            offset += span
+        
+        self._above = resolved
+        return "\t".join(texts)
+
+
+class FastDocument:
+    """
+    Read-only view of a DOCX package that streams body content.
+    
+    Use FastDocument.open(); always close() it. Header/footer references are
+    collected while the body streams, so sections() is only complete after
+    iter_body() has run to the end.
+    
+    Example:
+        >>> document = FastDocument.open(Path("contract.docx"))
+        >>> try:
+        ...     for text in document.iter_body():
+        ...         print(text)
+        ... finally:
+        ...     document.close()
+    """
+    
+    def __init__(self, archive: zipfile.ZipFile, document_path: str,
+                 rels: Dict[str, str]):
+        self._archive = archive
+        self._document_path = document_path
+        self._rels = rels
+        self._sections: List[SectionRefs] = []
+    
+    @classmethod
+    def open(cls, filepath) -> 'FastDocument':
+        """
+        Open a DOCX package and locate its main document part.
+        
+        Args:
+            filepath: Path to the DOCX file, or a binary file object
+            
+        Returns:
+            Open FastDocument
+            
+        Raises:
+            UnsupportedDocument: If the file should be read with python-docx
+                instead (also raised for anything python-docx would reject,
+                so its error messages are preserved)
+        """
+        try:
+            from lxml import etree  # noqa: F401 - checked before committing to this engine
+        except ImportError as e:
+            raise UnsupportedDocument("lxml not installed") from e
+        
+        try:
+            archive = zipfile.ZipFile(filepath)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise UnsupportedDocument(str(e)) from e
+        
+        try:
+            document_path = cls._main_document_path(archive)
+            rels = cls._relationships(archive, document_path)
+        except (KeyError, ValueError, SyntaxError, zipfile.BadZipFile,
+                UnsupportedDocument) as e:
+            archive.close()
+            if isinstance(e, UnsupportedDocument):
+                raise
+            raise UnsupportedDocument(str(e)) from e
+        return cls(archive, document_path, rels)
+    
+    def close(self) -> None:
+        """Close the underlying ZIP file."""
+        self._archive.close()
+    
+    @staticmethod
+    def _main_document_path(archive: zipfile.ZipFile) -> str:
+        """Find the officeDocument part and check it is a Word document."""
+        from lxml import etree
+        
+        package_rels = etree.fromstring(archive.read("_rels/.rels"))
+        document_path = None
+        for rel in package_rels.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+            if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+                document_path = rel.get("Target", "").lstrip("/")
+                break
+        if document_path is None:
+            raise UnsupportedDocument("No main document part")
+        
+        content_types = etree.fromstring(archive.read("[Content_Types].xml"))
+        content_type = None
+        for override in content_types.iter(f"{{{_CONTENT_TYPES_NS}}}Override"):
+            if override.get("PartName", "").lstrip("/") == document_path:
+                content_type = override.get("ContentType")
+        if content_type is None:
+            extension = posixpath.splitext(document_path)[1].lstrip(".").lower()
+            for default in content_types.iter(f"{{{_CONTENT_TYPES_NS}}}Default"):
+                if default.get("Extension", "").lower() == extension:
+                    content_type = default.get("ContentType")
+        if content_type != _DOCUMENT_MAIN_TYPE:
+            raise UnsupportedDocument(f"Not a Word document: {content_type}")
+        return document_path
+    
+    @staticmethod
+    def _relationships(archive: zipfile.ZipFile, part: str) -> Dict[str, str]:
+        """Map relationship id -> archive path for a part's internal targets."""
+        from lxml import etree
+        
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        if rels_path not in archive.namelist():
+            return {}
+        rels = {}
+        for rel in etree.fromstring(archive.read(rels_path)).iter(
+                f"{{{_PKG_REL_NS}}}Relationship"):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = target
+        return rels
+    
+    def iter_body(self, block_span: Optional[Span] = None) -> Iterator[str]:
+        """
+        Stream body paragraphs and table rows in document order.
+        
+        See iter_blocks(), which also yields each text's block number.
+        
+        Args:
+            block_span: (first, last) 1-based inclusive block range, or None
+            
+        Yields:
+            Stripped non-empty paragraph texts and non-empty table rows
+            
+        Raises:
+            CorruptedFileError: If document.xml is malformed
+        """
+        for _, _, text in self.iter_blocks(block_span):
+            yield text
+    
+    def iter_blocks(self, block_span: Optional[Span] = None) -> Iterator[Tuple[int, str, str]]:
+        """
+        Stream body paragraphs and table rows with their block numbers.
+        
+        Blocks are the direct w:p / w:tbl children of w:body (empty paragraphs
+        count). Parsing stops after the last selected block.
+        
+        Args:
+            block_span: (first, last) 1-based inclusive block range, or None
+            
+        Yields:
+            (1-based block number, "paragraph" or "table", text) for each
+            stripped non-empty paragraph and non-empty table row
+            
+        Raises:
+            CorruptedFileError: If document.xml is malformed
+        """
+        from lxml import etree
+        
+        first, last = block_span or (1, None)
+        completed = 0  # body blocks fully parsed so far
+        resolver = None
+        
+        with self._archive.open(self._document_path) as source:
+            events = etree.iterparse(source, events=("end",),
+                                     tag=(_P, _TBL, _TR, _SECT_PR))
+            try:
+                for _, element in events:
+                    parent = element.getparent()
+                    tag = element.tag
+                    
+                    if tag == _SECT_PR:
+                        self._collect_section(element, parent)
+                        continue
+                    
+                    if tag == _TR:
+                        table = parent
+                        if table is None or table.getparent() is None \
+                                or table.getparent().tag != _BODY:
+                            continue  # Nested table row; read with its cell
+                        if resolver is None:
+                            resolver = _RowResolver()
+                        if completed + 1 >= first:
+                            text = resolver.row_text(element)
+                            if text:
+                                yield completed + 1, "table", text
+                        else:
+                            resolver.row_text(element)  # keep merge state only
+                        self._release(element)
+                        continue
+                    
+                    if parent is None or parent.tag != _BODY:
+                        continue  # Paragraph/table inside a cell or wrapper
+                    
+                    completed += 1
+                    if tag == _P and completed >= first:
+                        text = paragraph_text(element).strip()
+                        if text:
+                            yield completed, "paragraph", text
+                    resolver = None
+                    self._release(element)
+                    if last is not None and completed >= last:
+                        return
+            except etree.XMLSyntaxError as e:
+                raise CorruptedFileError(f"Invalid DOCX document XML: {e}") from e
+    
+    @staticmethod
+    def _release(element) -> None:
+        """Drop a processed element and everything before it from the tree."""
+        element.clear()
+        parent = element.getparent()
+        while element.getprevious() is not None:
+            del parent[0]
+    
+    def _collect_section(self, sect_pr, parent) -> None:
+        """Record header/footer references of a body or paragraph-level w:sectPr."""
+        if parent is None:
+            return
+        if parent.tag == _P_PR:
+            paragraph = parent.getparent()
+            body = paragraph.getparent() if paragraph is not None else None
+            if paragraph is None or paragraph.tag != _P or body is None \
+                    or body.tag != _BODY:
+                return
+        elif parent.tag != _BODY:
+            return
+        
+        refs: SectionRefs = {}
+        for kind in ("header", "footer"):
+            for reference in sect_pr.iterfind(_w(f"{kind}Reference")):
+                ref_type = reference.get(_TYPE)
+                if (kind, ref_type) not in refs:  # First match wins
+                    refs[(kind, ref_type)] = reference.get(f"{{{_R_NS}}}id")
+        self._sections.append(refs)
+    
+    def sections(self) -> List[SectionRefs]:
+        """Header/footer references per section, in document order."""
+        return self._sections
+    
+    def header_footer_text(self, rel_id: str) -> str:
+        """
+        Text of a header/footer part: its paragraphs joined by spaces.
+        
+        Args:
+            rel_id: Relationship id from a section reference
+            
+        Returns:
+            Stripped non-empty paragraph texts joined by single spaces
+            
+        Raises:
+            CorruptedFileError: If the part is missing or malformed
+        """
+        from lxml import etree
+        
+        try:
+            root = etree.fromstring(self._archive.read(self._rels[rel_id]))
+        except (KeyError, etree.XMLSyntaxError) as e:
+            raise CorruptedFileError(f"Invalid DOCX header/footer part: {e}") from e
+        return _cell_text(root)
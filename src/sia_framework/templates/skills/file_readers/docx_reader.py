@@ -6,6 +6,12 @@ Extracts text from DOCX files including:
 - Headers and footers (all types)
 - Nested tables and complex structures
 
+Engines:
+- "fast" (default): streams document.xml with iterparse (see docx_fast),
+  falling back to python-docx for files it does not handle
+- "python-docx": python-docx object model
+Both engines produce identical text.
+
 Domain: Skills (Infrastructure)
 Bounded Context: File Processing
 Pattern: Strategy (concrete implementation)
@@ -22,14 +28,40 @@ REQ-011: File Reader Skills System
 QUANT-011-003: Concrete Readers Implementation
 """
 
-from pathlib import Path
-from typing import TYPE_CHECKING
+import zipfile
+from itertools import islice
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional,
+                    Tuple)
 
-from .base import AbstractFileReader, CorruptedFileError, validate_file_exists
+from .base import (AbstractFileReader, CorruptedFileError, Part,
+                   iter_joined, join_parts, validate_file_exists)
+from .docx_fast import FastDocument, UnsupportedDocument
+from .probe import (DocumentInfo, has_encrypted_members, is_ole_file,
+                    read_app_properties)
+from .profiling import count_parts, phase
+from .selection import parse_span
+from .source import Source, as_input
 
 if TYPE_CHECKING:
     from docx import Document as DocxDocument
 
+# Extraction engines; "fast" falls back to "python-docx" when needed
+ENGINES = ("fast", "python-docx")
+
+# Header/footer labels in extraction order: (part kind, reference type, label)
+HEADER_FOOTER_REFERENCES = (
+    ("header", "default", "HEADER"),
+    ("header", "first", "FIRST_PAGE_HEADER"),
+    ("header", "even", "EVEN_PAGE_HEADER"),
+    ("footer", "default", "FOOTER"),
+    ("footer", "first", "FIRST_PAGE_FOOTER"),
+    ("footer", "even", "EVEN_PAGE_FOOTER"),
+)
+
+# Label -> (part kind, reference type), for header/footer record locations
+_LABEL_REFERENCES = {label: (kind, reference_type)
+                     for kind, reference_type, label in HEADER_FOOTER_REFERENCES}
+
 
 class DocxReader(AbstractFileReader):
     """
@@ -47,6 +79,11 @@ class DocxReader(AbstractFileReader):
         - Uses iter_inner_content() to preserve document order
         - Handles linked headers/footers to avoid duplication
         - Recursive extraction for nested tables
+        - Streaming: iter_read yields one paragraph / table row at a time
+        - Block range selection: body blocks outside the range are never
+          converted to text
+        - Fast engine: body XML streamed and discarded block by block, only
+          the previous table row kept (for vertically merged cells)
         - Text boxes are NOT supported (requires XML parsing)
     
     Edge Cases Handled:
@@ -59,14 +96,52 @@ class DocxReader(AbstractFileReader):
         >>> reader = DocxReader()
         >>> text = reader.read(Path("document.docx"))
         >>> print(text[:100])
+        
+        >>> # Body blocks 10-40 only (paragraphs and tables, 1-based)
+        >>> reader = DocxReader(block_range="10:40")
+        
+        >>> # Force the python-docx engine
+        >>> reader = DocxReader(engine="python-docx")
     """
     
+    # OPC (ZIP) package whose main part is a Word document
+    signatures = (b"PK\x03\x04",)
+    zip_content_types = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml",
+    )
+    
+    def __init__(self, block_range: Optional[str] = None, engine: str = "fast"):
+        """
+        Configure body block selection and the extraction engine.
+        
+        Args:
+            block_range: Span "first:last" over body blocks (paragraphs and
+                tables in document order, empty paragraphs included;
+                1-based, inclusive; either side may be omitted). When set,
+                headers and footers are not extracted.
+            engine: "fast" (iterparse, python-docx fallback) or "python-docx"
+        
+        Raises:
+            ValueError: If the span is malformed or the engine is unknown
+        """
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown DOCX engine '{engine}'. Choose from: {', '.join(ENGINES)}"
+            )
+        self.block_range = block_range
+        self._block_span = parse_span(block_range) if block_range else None
+        self.engine = engine
+    
+    def options(self) -> Dict[str, Any]:
+        """Block range selection changes output (the engine does not)."""
+        return {"block_range": self.block_range} if self.block_range else {}
+    
     @classmethod
     def get_extension(cls) -> str:
         """Return supported extension: 'docx'"""
         return "docx"
     
-    def read(self, filepath: Path) -> str:
+    def read(self, filepath: Source) -> str:
         """
         Extract all text from a DOCX file.
         
@@ -80,77 +155,219 @@ class DocxReader(AbstractFileReader):
             FileNotFoundError: If file doesn't exist
             CorruptedFileError: If file is corrupted, invalid, or password-protected
         """
+        return "".join(self.stream(filepath))
+    
+    def iter_read(self, filepath: Source) -> Iterator[str]:
+        """
+        Extract text from a DOCX file one body block at a time.
+        
+        Args:
+            filepath: Path to DOCX file
+            
+        Yields:
+            Paragraphs, table rows, then headers/footers
+            (concatenation equals read())
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        # Join plain strings: join_parts() would rebuild every Part
+        yield from iter_joined(part.text for part in count_parts(self._iter_parts(filepath)))
+    
+    def iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """
+        Extract a DOCX file as "paragraph", "table", "header" and "footer" parts.
+        
+        Body locations are {"block": n} (the numbering used by block_range;
+        a table's rows share its block). Header/footer locations are
+        {"section": n, "type": "default" | "first" | "even"}, with the
+        "[LABEL_Sn] " prefix counted as layout.
+        
+        Args:
+            filepath: Path to DOCX file
+            
+        Yields:
+            Parts whose texts concatenate to read()
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        yield from join_parts(self._iter_parts(filepath))
+    
+    def _iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """Yield the parts of iter_parts() before separators are joined in."""
         validate_file_exists(filepath)
         
-        # Lazy import to avoid forcing dependency
-        try:
-            from zipfile import BadZipFile
-
-            from docx import Document
-            from docx.opc.exceptions import PackageNotFoundError
-        except ImportError as e:
-            raise ImportError(
-                "python-docx not installed. "
-                "Use: uv run --with python-docx python your_script.py"
-            ) from e
+        if self.engine == "fast":
+            try:
+                with phase("open"):
+                    fast_document = FastDocument.open(as_input(filepath))
+            except UnsupportedDocument:
+                fast_document = None  # Fall through to python-docx
+            if fast_document is not None:
+                try:
+                    yield from self._iter_document_parts(
+                        fast_document.iter_blocks(self._block_span),
+                        lambda: self._iter_fast_headers_footers(fast_document),
+                    )
+                finally:
+                    fast_document.close()
+                return
         
-        # Open DOCX file
-        try:
-            document = Document(str(filepath))
-        except PackageNotFoundError as e:
-            raise CorruptedFileError(
-                f"Invalid DOCX structure - file may be corrupted: {e}"
-            ) from e
-        except BadZipFile as e:
-            raise CorruptedFileError(
-                f"Corrupted DOCX file - invalid ZIP archive: {e}"
-            ) from e
-        except Exception as e:
-            # Detect password-protected files
-            error_msg = str(e).lower()
-            if "encrypted" in error_msg or "password" in error_msg:
+        with phase("open"):
+            # Lazy import to avoid forcing dependency
+            try:
+                from zipfile import BadZipFile
+                
+                from docx import Document
+                from docx.opc.exceptions import PackageNotFoundError
+            except ImportError as e:
+                raise ImportError(
+                    "python-docx not installed. "
+                    "Use: uv run --with python-docx python your_script.py"
+                ) from e
+            
+            # Open DOCX file
+            try:
+                document = Document(as_input(filepath))
+            except PackageNotFoundError as e:
+                raise CorruptedFileError(
+                    f"Invalid DOCX structure - file may be corrupted: {e}"
+                ) from e
+            except BadZipFile as e:
+                raise CorruptedFileError(
+                    f"Corrupted DOCX file - invalid ZIP archive: {e}"
+                ) from e
+            except Exception as e:
+                # Detect password-protected files
+                error_msg = str(e).lower()
+                if "encrypted" in error_msg or "password" in error_msg:
+                    raise CorruptedFileError(
+                        "Password-protected DOCX files are not supported"
+                    ) from e
+                # Generic error handling
                 raise CorruptedFileError(
-                    "Password-protected DOCX files are not supported"
+                    f"Failed to open DOCX file: {e}"
                 ) from e
-            # Generic error handling
+        
+        yield from self._iter_document_parts(
+            self._iter_body(document),
+            lambda: self._iter_headers_footers(document),
+        )
+    
+    def probe(self, filepath: Source) -> DocumentInfo:
+        """
+        Report pages, words and encryption from docProps/app.xml.
+        
+        The counts are those the authoring application stored when the
+        document was last saved; documents generated without Word often
+        carry template values (a zero count is reported as unknown).
+        Password-protected documents are OLE files, reported as encrypted.
+        
+        Args:
+            filepath: Path to DOCX file
+            
+        Returns:
+            DocumentInfo with pages, words and encrypted
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If the file is neither a ZIP package nor
+                an encrypted document
+        """
+        info = super().probe(filepath)
+        if is_ole_file(filepath):
+            info.encrypted = True
+            return info
+        try:
+            with zipfile.ZipFile(as_input(filepath)) as archive:
+                info.encrypted = has_encrypted_members(archive)
+                properties = read_app_properties(archive)
+        except (zipfile.BadZipFile, OSError) as e:
             raise CorruptedFileError(
-                f"Failed to open DOCX file: {e}"
+                f"Corrupted DOCX file - invalid ZIP archive: {e}"
             ) from e
+        info.pages = properties.get("Pages") or None
+        info.words = properties.get("Words") or None
+        return info
+    
+    def _iter_document_parts(
+        self,
+        body: Iterator[Tuple[int, str, str]],
+        iter_headers_footers: Callable[[], Iterator[Tuple[str, int, str]]],
+    ) -> Iterator[Part]:
+        """
+        Yield body blocks in document order, then headers and footers.
         
-        # Extract text components
-        text_parts = []
-        
+        Args:
+            body: Engine-specific (block number, kind, text) of paragraphs
+                and table rows
+            iter_headers_footers: Engine-specific (label, section number,
+                text) extractor, called after the body is exhausted
+            
+        Yields:
+            Paragraph and table row parts, then "[LABEL_Sn] text" parts;
+            the first header/footer entry is prefixed with a newline to
+            separate it from the body
+        """
         # 1. Extract main body content (paragraphs and tables)
+        for block_num, kind, text in body:
+            yield Part(text, kind, {"block": block_num})
+        
+        # A block range selects body content only
+        if self._block_span is not None:
+            return
+        
+        # 2. Extract headers and footers from all sections
+        for index, (label, section_num, text) in enumerate(iter_headers_footers()):
+            kind, reference_type = _LABEL_REFERENCES[label]
+            prefix = f"[{label}_S{section_num}] "
+            if index == 0:
+                prefix = "\n" + prefix
+            yield Part(prefix + text, kind,
+                       {"section": section_num, "type": reference_type},
+                       lead=len(prefix))
+    
+    def _iter_body(self, document) -> Iterator[Tuple[int, str, str]]:
+        """
+        Extract body paragraphs and table rows with python-docx.
+        
+        Args:
+            document: docx.Document object
+            
+        Yields:
+            (block number, "paragraph" or "table", text) for stripped
+            non-empty paragraph texts and table rows
+        """
         # Using iter_inner_content() preserves document order
-        for item in document.iter_inner_content():
+        blocks = document.iter_inner_content()
+        first = 1
+        if self._block_span is not None:
+            first, last = self._block_span
+            # Skip leading blocks without reading their text; stop after last
+            blocks = islice(blocks, first - 1, last)
+        
+        for block_num, item in enumerate(blocks, start=first):
             if hasattr(item, 'text'):  # Paragraph
                 text = item.text.strip()
                 if text:  # Skip empty paragraphs
-                    text_parts.append(text)
+                    yield block_num, "paragraph", text
             elif hasattr(item, 'rows'):  # Table
-                table_text = self._extract_table_text(item)
-                if table_text:
-                    text_parts.append(table_text)
-        
-        # 2. Extract headers and footers from all sections
-        headers_footers = self._extract_headers_footers(document)
-        if headers_footers:
-            text_parts.append("\n" + headers_footers)
-        
-        return "\n".join(text_parts)
+                for row_text in self._iter_table_rows(item):
+                    yield block_num, "table", row_text
     
-    def _extract_table_text(self, table) -> str:
+    def _iter_table_rows(self, table) -> Iterator[str]:
         """
-        Extract text from a table, including nested tables.
+        Extract text from a table row by row.
         
         Args:
             table: docx.table.Table object
             
-        Returns:
-            Formatted table text with rows separated by newlines
+        Yields:
+            Tab-separated cell texts per non-empty row
         """
-        rows_text = []
-        
         for row in table.rows:
             cells_text = []
             for cell in row.cells:
@@ -165,11 +382,9 @@ class DocxReader(AbstractFileReader):
                     cells_text.append(" ".join(cell_content))
             
             if cells_text:
-                rows_text.append("\t".join(cells_text))
-        
-        return "\n".join(rows_text)
+                yield "\t".join(cells_text)
     
-    def _extract_headers_footers(self, document) -> str:
+    def _iter_headers_footers(self, document) -> Iterator[Tuple[str, int, str]]:
         """
         Extract headers and footers from all sections.
         
@@ -182,11 +397,9 @@ class DocxReader(AbstractFileReader):
         Args:
             document: docx.Document object
             
-        Returns:
-            Combined headers/footers text with markers
+        Yields:
+            (label, section number, text) per non-empty header/footer
         """
-        hf_parts = []
-        
         for section_num, section in enumerate(document.sections, start=1):
             # Extract headers
             headers = [
@@ -199,7 +412,7 @@ class DocxReader(AbstractFileReader):
                 if header and not header.is_linked_to_previous:
                     header_text = self._extract_header_footer_text(header)
                     if header_text:
-                        hf_parts.append(f"[{label}_S{section_num}] {header_text}")
+                        yield label, section_num, header_text
             
             # Extract footers
             footers = [
@@ -212,9 +425,7 @@ class DocxReader(AbstractFileReader):
                 if footer and not footer.is_linked_to_previous:
                     footer_text = self._extract_header_footer_text(footer)
                     if footer_text:
-                        hf_parts.append(f"[{label}_S{section_num}] {footer_text}")
-        
-        return "\n".join(hf_parts)
+                        yield label, section_num, footer_text
     
     def _extract_header_footer_text(self, hf_element) -> str:
         """
@@ -232,3 +443,26 @@ class DocxReader(AbstractFileReader):
             if text:
                 text_parts.append(text)
         return " ".join(text_parts)
+    
+    def _iter_fast_headers_footers(self, document: FastDocument,
+                                   ) -> Iterator[Tuple[str, int, str]]:
+        """
+        Extract headers and footers with the fast engine.
+        
+        Only parts referenced by a section are read, so linked (inherited)
+        headers/footers are skipped exactly as with python-docx.
+        
+        Args:
+            document: FastDocument whose body has been fully streamed
+            
+        Yields:
+            (label, section number, text) per non-empty header/footer
+        """
+        for section_num, references in enumerate(document.sections(), start=1):
+            for kind, reference_type, label in HEADER_FOOTER_REFERENCES:
+                rel_id = references.get((kind, reference_type))
+                if rel_id is None:
+                    continue  # Linked to previous section
+                text = document.header_footer_text(rel_id)
+                if text:
+                    yield label, section_num, text
@@ -0,0 +1,66 @@
+"""
+JSON Lines Output - Buffered Record Writer
+
+Writes dicts (records, chunks) as one JSON object per line. Lines are
+encoded once and written to the binary stream in large batches, so
+emitting a record per spreadsheet row does not cost a write per row.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Buffered Writer
+
+Invariant:
+    ∀ obj ∈ objects: json.loads(line_i) = obj_i ∧ lines end with "\n"
+"""
+
+import json
+import sys
+from typing import Any, BinaryIO, Dict, Iterable, Optional
+
+# Bytes collected before each write to the stream
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+def write_jsonl(
+    objects: Iterable[Dict[str, Any]],
+    stream: Optional[BinaryIO] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> int:
+    """
+    Write objects as UTF-8 JSON Lines through a write buffer.
+    
+    Objects are consumed lazily; pending lines are written whenever the
+    buffer fills, and at the end (also when iteration raises).
+    
+    Args:
+        objects: JSON-serializable dicts
+        stream: Binary output (default: sys.stdout.buffer, after flushing
+            any text already written to sys.stdout)
+        buffer_size: Bytes to collect before writing
+        
+    Returns:
+        Number of lines written
+    """
+    if stream is None:
+        sys.stdout.flush()
+        stream = sys.stdout.buffer
+    encode = json.JSONEncoder(ensure_ascii=False).encode
+    pending = []
+    pending_size = 0
+    count = 0
+    
+    try:
+        for obj in objects:
+            line = (encode(obj) + "\n").encode("utf-8")
+            pending.append(line)
+            pending_size += len(line)
+            count += 1
+            if pending_size >= buffer_size:
+                stream.write(b"".join(pending))
+                pending.clear()
+                pending_size = 0
+    finally:
+        if pending:
+            stream.write(b"".join(pending))
+        stream.flush()
+    return count
@@ -22,14 +22,62 @@ REQ-011: File Reader Skills System
 QUANT-011-003: Concrete Readers Implementation
 """
 
+import math
+import multiprocessing
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
-from .base import AbstractFileReader, CorruptedFileError, validate_file_exists
+from .base import (AbstractFileReader, CorruptedFileError, Part,
+                   iter_joined, join_parts, previewing, validate_file_exists)
+from .batch import worker_pool, worker_result
+from .probe import DocumentInfo, sample_pages
+from .profiling import count_parts, phase
+from .selection import parse_ranges, resolve_ranges
+from .source import Source, file_path, in_memory
 
 if TYPE_CHECKING:
     import pymupdf
 
+# Documents with at least this many pages are sharded across processes
+DEFAULT_PARALLEL_THRESHOLD = 200
+
+# Smallest shard worth a round-trip to a worker process
+_MIN_SHARD_PAGES = 8
+
+# Shards per worker: enough to balance uneven pages (dense vs blank)
+_SHARDS_PER_WORKER = 4
+
+# Pages probe() extracts (first, middle, last) to detect a text layer and
+# estimate the word count
+PROBE_SAMPLE_PAGES = 3
+
+
+def _extract_page_shard(path: str, page_numbers: List[int]) -> List[Tuple[int, str]]:
+    """
+    Extract a shard of pages in a worker process.
+    
+    Each worker opens its own document: pymupdf objects cannot be shared
+    across processes. Only the shard's pages are loaded.
+    
+    Args:
+        path: PDF file path
+        page_numbers: 1-based page numbers to extract, in order
+        
+    Returns:
+        (page_number, page_text) pairs
+    """
+    import pymupdf
+    
+    doc = pymupdf.open(path)
+    try:
+        return [
+            (page_num, doc.load_page(page_num - 1).get_text("text", sort=True))
+            for page_num in page_numbers
+        ]
+    finally:
+        doc.close()
+
 
 class PdfReader(AbstractFileReader):
     """
@@ -42,7 +90,10 @@ class PdfReader(AbstractFileReader):
         - Natural reading order (left-to-right, top-to-bottom)
         - Page-by-page extraction with markers
         - Support for multi-column layouts
-        - Efficient memory usage
+        - Streaming extraction (iter_read yields one page at a time)
+        - Parallel page shards for large documents (one process per shard,
+          output stitched back in page order)
+        - Page selection: only the selected pages are loaded and extracted
     
     Implementation Notes:
         - Uses get_text("text", sort=True) for sorted block extraction
@@ -67,14 +118,49 @@ class PdfReader(AbstractFileReader):
         >>> reader = PdfReader()
         >>> text = reader.read(Path("document.pdf"))
         >>> print(text[:200])
+        
+        >>> # Shard documents of 100+ pages across 8 processes
+        >>> reader = PdfReader(parallel_threshold=100, workers=8)
+        
+        >>> # Only pages 10-20 and 45 (markers keep original page numbers)
+        >>> reader = PdfReader(pages="10-20,45")
     """
     
+    # PDF header (%PDF-1.x / %PDF-2.0)
+    signatures = (b"%PDF-",)
+    
+    def __init__(self, pages: Optional[str] = None,
+                 parallel_threshold: Optional[int] = DEFAULT_PARALLEL_THRESHOLD,
+                 workers: Optional[int] = None):
+        """
+        Configure page selection and page-parallel extraction.
+        
+        Args:
+            pages: Page selection, e.g. "10-20,45" (1-based, inclusive;
+                None = all pages). Pages beyond the document are ignored.
+            parallel_threshold: Minimum number of pages to extract for
+                sharded extraction (None disables it)
+            workers: Worker processes for sharded extraction
+                (default: os.cpu_count())
+        
+        Raises:
+            ValueError: If the page selection is malformed
+        """
+        self.pages = pages
+        self._page_spans = parse_ranges(pages) if pages else None
+        self.parallel_threshold = parallel_threshold
+        self.workers = workers or os.cpu_count() or 1
+    
     @classmethod
     def get_extension(cls) -> str:
         """Return supported extension: 'pdf'"""
         return "pdf"
     
-    def read(self, filepath: Path) -> str:
+    def options(self) -> Dict[str, Any]:
+        """Page selection changes output; parallelism does not."""
+        return {"pages": self.pages} if self.pages else {}
+    
+    def read(self, filepath: Source) -> str:
         """
         Extract all text from a PDF file.
         
@@ -88,8 +174,106 @@ class PdfReader(AbstractFileReader):
             FileNotFoundError: If file doesn't exist
             CorruptedFileError: If file is corrupted, invalid, or password-protected
         """
+        return "".join(self.stream(filepath))
+    
+    def iter_read(self, filepath: Source) -> Iterator[str]:
+        """
+        Extract text from a PDF file one page at a time.
+        
+        Args:
+            filepath: Path to PDF file
+            
+        Yields:
+            Page markers and page texts (concatenation equals read())
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        # Join plain strings: join_parts() would rebuild every Part
+        yield from iter_joined(part.text for part in count_parts(self._iter_parts(filepath)))
+    
+    def iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """
+        Extract a PDF as page markers and "page" parts ({"page": n}).
+        
+        Args:
+            filepath: Path to PDF file
+            
+        Yields:
+            Parts whose texts concatenate to read()
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        yield from join_parts(self._iter_parts(filepath))
+    
+    def _iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """Yield the parts of iter_parts() before separators are joined in."""
         validate_file_exists(filepath)
         
+        with phase("open"):
+            doc = self._open(filepath)
+        
+        try:
+            page_numbers = self._selected_pages(doc.page_count)
+            if AbstractFileReader.limits is not None:
+                AbstractFileReader.limits.check_pages(len(page_numbers))
+            # Workers reopen the file: in-memory PDFs are read here
+            if in_memory(filepath) is None and self._should_parallelize(len(page_numbers)):
+                pages = self._iter_pages_parallel(file_path(filepath), page_numbers)
+            else:
+                pages = self._iter_pages(doc, page_numbers)
+            yield from self._page_parts(pages)
+        finally:
+            # Always close document to free resources (also runs when
+            # the consumer stops iterating early)
+            doc.close()
+    
+    def probe(self, filepath: Source) -> DocumentInfo:
+        """
+        Report page count, encryption, text layer and a word estimate.
+        
+        Opening a PDF reads only its cross-reference table and page tree;
+        the text layer and word count are estimated from PROBE_SAMPLE_PAGES
+        evenly spread pages, so probing costs the same for 10 or 10,000
+        pages. Password-protected PDFs report their page count only.
+        
+        Args:
+            filepath: Path to PDF file
+            
+        Returns:
+            DocumentInfo with pages, encrypted, text_layer and words
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If the PDF cannot be opened
+        """
+        info = super().probe(filepath)
+        doc = self._open(filepath)
+        try:
+            info.pages = doc.page_count
+            info.encrypted = bool(doc.needs_pass or doc.is_encrypted)
+            if not doc.needs_pass:
+                sampled = sample_pages(doc.page_count, PROBE_SAMPLE_PAGES)
+                words = sum(len(doc[index].get_text("text").split()) for index in sampled)
+                if sampled:
+                    info.text_layer = words > 0
+                    info.words = round(words * doc.page_count / len(sampled))
+        finally:
+            doc.close()
+        return info
+    
+    @staticmethod
+    def _open(filepath: Source) -> 'pymupdf.Document':
+        """
+        Open a PDF with PyMuPDF (parses the xref table, not the pages).
+        
+        Raises:
+            ImportError: If PyMuPDF is not installed
+            CorruptedFileError: If the file is not a readable PDF
+        """
         # Lazy import to avoid forcing dependency
         try:
             import pymupdf
@@ -99,9 +283,14 @@ class PdfReader(AbstractFileReader):
                 "Use: uv run --with pymupdf python your_script.py"
             ) from e
         
-        # Open PDF file
+        # Open PDF file (in-memory content is parsed in place)
+        data = in_memory(filepath)
         try:
-            doc = pymupdf.open(str(filepath))
+            if data is not None:
+                # bytes as is; other buffers (mmap, bytearray) as a view
+                stream = data if isinstance(data, bytes) else memoryview(data)
+                return pymupdf.open(stream=stream, filetype="pdf")
+            return pymupdf.open(str(file_path(filepath)))
         except pymupdf.FileDataError as e:
             raise CorruptedFileError(
                 f"Invalid PDF structure - file may be corrupted: {e}"
@@ -118,23 +307,114 @@ class PdfReader(AbstractFileReader):
             raise CorruptedFileError(
                 f"Failed to open PDF file: {e}"
             ) from e
+    
+    def _selected_pages(self, page_count: int) -> List[int]:
+        """
+        Resolve the page selection against the document's page count.
         
-        try:
-            text_parts = []
+        Returns:
+            1-based page numbers to extract, in order
+        """
+        if self._page_spans is None:
+            return list(range(1, page_count + 1))
+        return resolve_ranges(self._page_spans, page_count)
+    
+    def _should_parallelize(self, page_count: int) -> bool:
+        """
+        Decide whether sharded extraction is worth the process overhead.
+        
+        Never nests pools: inside a worker process (e.g. batch mode) the
+        document is extracted sequentially. Previews (head()) are too:
+        they stop after a few pages.
+        """
+        return (
+            self.parallel_threshold is not None
+            and page_count >= self.parallel_threshold
+            and self.workers > 1
+            and multiprocessing.parent_process() is None
+            and not previewing()
+        )
+    
+    @staticmethod
+    def _page_parts(pages: Iterator[Tuple[int, str]]) -> Iterator[Part]:
+        """
+        Render pages as a "=== PAGE n ===" marker followed by the page text.
+        
+        Args:
+            pages: (1-based page number, text) of non-empty pages
+            
+        Yields:
+            Marker part, then the page part, for each page
+        """
+        for page_num, page_text in pages:
+            yield Part(f"\n=== PAGE {page_num} ===\n")
+            yield Part(page_text, "page", {"page": page_num})
+    
+    def _iter_pages_parallel(self, filepath: Path,
+                             page_numbers: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield non-empty pages, extracting page shards in parallel.
+        
+        Shards are submitted up front and consumed in order, so output is
+        identical to sequential extraction. Workers get this process's
+        resource limits; a worker dying or failing raises
+        CorruptedFileError.
+        
+        Args:
+            filepath: PDF file path (reopened by each worker)
+            page_numbers: 1-based page numbers to extract, in order
             
-            # Extract text from each page
-            for page_num, page in enumerate(doc, start=1):
-                # Extract text with natural reading order
-                # sort=True ensures left-to-right, top-to-bottom ordering
-                page_text = page.get_text("text", sort=True)
-                
-                # Skip empty pages
-                if page_text.strip():
-                    text_parts.append(f"\n=== PAGE {page_num} ===\n")
-                    text_parts.append(page_text)
+        Yields:
+            (page number, text) of each non-empty page
             
-            return "\n".join(text_parts)
+        Raises:
+            CorruptedFileError: If a worker dies or fails unexpectedly
+        """
+        shard_count = self.workers * _SHARDS_PER_WORKER
+        shard_size = max(_MIN_SHARD_PAGES, math.ceil(len(page_numbers) / shard_count))
+        shards = [
+            page_numbers[start:start + shard_size]
+            for start in range(0, len(page_numbers), shard_size)
+        ]
         
+        workers = min(self.workers, len(shards))
+        executor = worker_pool(workers)
+        completed = False
+        try:
+            futures = [
+                executor.submit(_extract_page_shard, str(filepath), shard)
+                for shard in shards
+            ]
+            for future in futures:
+                for page_num, page_text in worker_result(future, filepath):
+                    # Skip empty pages
+                    if page_text.strip():
+                        yield page_num, page_text
+            completed = True
         finally:
-            # Always close document to free resources
-            doc.close()
+            # Early termination or error: drop shards that have not
+            # started and do not wait for the running ones
+            executor.shutdown(wait=completed, cancel_futures=True)
+    
+    def _iter_pages(self, doc, page_numbers: List[int]) -> Iterator[Tuple[int, str]]:
+        """
+        Yield the text of each non-empty page.
+        
+        Args:
+            doc: Open pymupdf Document
+            page_numbers: 1-based page numbers to extract, in order
+            
+        Yields:
+            (page number, text) of each non-empty page
+        """
+        for page_num in page_numbers:
+            # Load only selected pages (pymupdf parses pages lazily)
+            page = doc.load_page(page_num - 1)
+            
+            # Extract text with natural reading order
+            # sort=True ensures left-to-right, top-to-bottom ordering
+            page_text = page.get_text("text", sort=True)
+            
+            # Skip empty pages
+            if page_text.strip():
+                yield page_num, page_text
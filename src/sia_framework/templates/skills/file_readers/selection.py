@@ -0,0 +1,113 @@
+"""
+Selection Specs - Page / Row / Block Range Parsing
+
+Parses the user-facing selection syntax shared by readers and CLIs so that
+readers can skip content outside the selection instead of extracting it.
+
+Syntax (all numbers 1-based, ranges inclusive):
+    Ranges (pages):  "10-20,45"   "3"   "50-" (to the end)
+    Span (rows):     "100:200"    "100:" (to the end)   ":50"   "7"
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+
+Invariant:
+    resolve_ranges(parse_ranges(spec), n) ⊆ {1..n} ∧ sorted ∧ unique
+"""
+
+from typing import List, Optional, Tuple
+
+# (first, last) inclusive, 1-based; last=None means "to the end"
+Span = Tuple[int, Optional[int]]
+
+
+def _parse_number(text: str, spec: str) -> int:
+    """Parse a positive 1-based number, with an error naming the spec."""
+    try:
+        number = int(text)
+    except ValueError:
+        raise ValueError(f"Invalid selection '{spec}': '{text}' is not a number") from None
+    if number < 1:
+        raise ValueError(f"Invalid selection '{spec}': numbers start at 1")
+    return number
+
+
+def _check_order(first: int, last: Optional[int], spec: str) -> Span:
+    """Reject descending ranges such as 20-10."""
+    if last is not None and last < first:
+        raise ValueError(f"Invalid selection '{spec}': {first} is after {last}")
+    return first, last
+
+
+def parse_ranges(spec: str) -> List[Span]:
+    """
+    Parse a comma-separated list of numbers and ranges.
+    
+    Args:
+        spec: e.g. "10-20,45" or "50-"
+        
+    Returns:
+        Spans in the order given
+        
+    Raises:
+        ValueError: If the spec is empty or malformed
+    """
+    spans = []
+    for item in spec.replace(" ", "").split(","):
+        if not item:
+            continue
+        if "-" in item:
+            first_text, last_text = item.split("-", 1)
+            first = _parse_number(first_text, spec) if first_text else 1
+            last = _parse_number(last_text, spec) if last_text else None
+            spans.append(_check_order(first, last, spec))
+        else:
+            number = _parse_number(item, spec)
+            spans.append((number, number))
+    if not spans:
+        raise ValueError(f"Invalid selection '{spec}': nothing selected")
+    return spans
+
+
+def parse_span(spec: str) -> Span:
+    """
+    Parse a single "first:last" span (either side may be omitted).
+    
+    Args:
+        spec: e.g. "100:200", "100:", ":50" or "7"
+        
+    Returns:
+        (first, last) span
+        
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    spec = spec.strip()
+    if ":" not in spec:
+        number = _parse_number(spec, spec)
+        return number, number
+    first_text, last_text = spec.split(":", 1)
+    first = _parse_number(first_text, spec) if first_text else 1
+    last = _parse_number(last_text, spec) if last_text else None
+    return _check_order(first, last, spec)
+
+
+def resolve_ranges(spans: List[Span], count: int) -> List[int]:
+    """
+    Expand spans to the sorted, unique numbers that exist in a document.
+    
+    Numbers beyond count are ignored, so "1-1000" on a 20-page PDF
+    selects pages 1-20.
+    
+    Args:
+        spans: Parsed spans
+        count: Number of available items (pages)
+        
+    Returns:
+        Sorted 1-based numbers within [1, count]
+    """
+    selected = set()
+    for first, last in spans:
+        stop = count if last is None else min(last, count)
+        selected.update(range(first, stop + 1))
+    return sorted(selected)
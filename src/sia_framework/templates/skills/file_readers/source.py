@@ -0,0 +1,245 @@
+"""
+Document Sources - Files on Disk or Content in Memory
+
+Readers extract from a Path or a DocumentSource. A DocumentSource names a
+document and holds either its path or its content, so documents that
+never touch the disk (archive members, uploads, stdin) go through the
+same readers, sniffing, cache, limits and profiler as files.
+
+Content is any buffer - bytes, bytearray, memoryview or mmap - and is
+never copied as a whole:
+
+- zipfile, openpyxl and python-docx open as_input(source): the path, or
+  a seekable reader over the buffer (BytesIO shares bytes objects)
+- PyMuPDF parses the buffer in place (pymupdf.open(stream=...))
+- Sniffing, cache keys and ZIP checks read the buffer directly
+- from_fileobj() maps regular files (mmap) and takes BytesIO buffers as
+  they are; only pipes and other streams are read into memory
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Adapter (one interface over paths and buffers)
+
+Invariant:
+    str(source) = source.label
+    ∧ (source.path is None) ⟺ (source.data is not None)
+"""
+
+import io
+import mmap
+import sys
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Optional, Union
+
+# In-memory content types DocumentSource holds without copying
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class DocumentSource:
+    """
+    A document to extract: a file on disk or a buffer in memory.
+    
+    Stands in for a Path wherever readers take one: str() is the label
+    shown in errors, records and profiles, and name/suffix (taken from
+    the label) select the reader. A buffer must not change while a
+    reader uses it.
+    
+    Example:
+        >>> source = DocumentSource.from_bytes(request.body, "upload.pdf")
+        >>> text = AbstractFileReader.get_reader(source).read(source)
+        
+    Attributes:
+        label: Display name (a path, or e.g. "bundle.zip!/docs/a.pdf")
+        path: File on disk, or None for in-memory content
+        data: Content buffer, or None for files
+    """
+    
+    __slots__ = ("label", "path", "data")
+    
+    def __init__(self, label: str, path: Optional[Path] = None,
+                 data: Optional[Buffer] = None):
+        if (path is None) == (data is None):
+            raise ValueError("DocumentSource takes exactly one of path and data")
+        self.label = label
+        self.path = path
+        self.data = data
+    
+    @classmethod
+    def from_path(cls, path: Union[str, Path]) -> 'DocumentSource':
+        """Wrap a file on disk (opened only by the reader)."""
+        path = Path(path)
+        return cls(str(path), path=path)
+    
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview],
+                   label: str) -> 'DocumentSource':
+        """
+        Wrap content held in memory (not copied).
+        
+        Args:
+            data: Document content (a memoryview must be contiguous)
+            label: Display name; its extension selects the reader
+                (content sniffing still applies)
+        """
+        if isinstance(data, memoryview):
+            data = data.cast("B")
+        return cls(label, data=data)
+    
+    @classmethod
+    def from_mmap(cls, mapping: mmap.mmap, label: str) -> 'DocumentSource':
+        """Wrap a memory-mapped file (the caller keeps it open while reading)."""
+        return cls(label, data=mapping)
+    
+    @classmethod
+    def from_fileobj(cls, fileobj: BinaryIO,
+                     label: Optional[str] = None) -> 'DocumentSource':
+        """
+        Wrap an open binary file object without writing it anywhere.
+        
+        Regular files are memory-mapped and BytesIO objects lend their
+        buffer, so neither is copied; other streams (pipes, sockets,
+        uploads) are read into memory. Seekable objects are taken from
+        the start, streams from their current position.
+        
+        Args:
+            fileobj: Binary file object (left open)
+            label: Display name (default: the object's name, if any)
+        """
+        if label is None:
+            name = getattr(fileobj, "name", None)
+            label = name if isinstance(name, str) else "<stream>"
+        if isinstance(fileobj, io.BytesIO):
+            return cls(label, data=fileobj.getbuffer())
+        if isinstance(fileobj, (io.FileIO, io.BufferedReader)):
+            try:
+                return cls(label, data=mmap.mmap(fileobj.fileno(), 0, access=mmap.ACCESS_READ))
+            except (OSError, ValueError):
+                pass  # Pipe, terminal or empty file: read it
+        if fileobj.seekable():
+            fileobj.seek(0)
+        return cls(label, data=fileobj.read())
+    
+    @classmethod
+    def from_stdin(cls, label: str = "<stdin>") -> 'DocumentSource':
+        """Wrap standard input (mapped when redirected from a file)."""
+        return cls.from_fileobj(sys.stdin.buffer, label)
+    
+    @property
+    def name(self) -> str:
+        """Final component of the label, e.g. "a.pdf"."""
+        if self.path is not None:
+            return self.path.name
+        return PurePosixPath(self.label).name
+    
+    @property
+    def suffix(self) -> str:
+        """Extension of the label, with its dot (e.g. ".pdf")."""
+        if self.path is not None:
+            return self.path.suffix
+        return PurePosixPath(self.label).suffix
+    
+    def size(self) -> int:
+        """Content size in bytes."""
+        if self.data is not None:
+            return len(self.data)
+        return self.path.stat().st_size
+    
+    def open(self) -> BinaryIO:
+        """Open the content for reading (the caller closes it)."""
+        if self.data is None:
+            return open(self.path, "rb")
+        if isinstance(self.data, bytes):
+            return io.BytesIO(self.data)  # Shares the bytes object
+        return io.BufferedReader(_BufferReader(self.data))
+    
+    def __str__(self) -> str:
+        return self.label
+    
+    def __repr__(self) -> str:
+        kind = "path" if self.path is not None else f"{len(self.data)} bytes"
+        return f"DocumentSource({self.label!r}, {kind})"
+
+
+class _BufferReader(io.RawIOBase):
+    """
+    Seekable read-only file over a buffer, with its own position.
+    
+    Reads slice the buffer rather than holding a memoryview of it, so an
+    mmap can be closed even if a library never closes this file.
+    """
+    
+    def __init__(self, buffer: Buffer):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def seekable(self) -> bool:
+        return True
+    
+    def readinto(self, target) -> int:
+        start = min(self._position, len(self._buffer))
+        end = min(start + len(target), len(self._buffer))
+        target[:end - start] = self._buffer[start:end]
+        self._position = end
+        return end - start
+    
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        if offset < 0:
+            raise ValueError("negative seek position")
+        self._position = offset
+        return offset
+    
+    def tell(self) -> int:
+        return self._position
+
+
+# What readers accept
+Source = Union[Path, DocumentSource]
+
+
+def in_memory(filepath: Source) -> Optional[Buffer]:
+    """Return the content of an in-memory source, None for files."""
+    if isinstance(filepath, DocumentSource):
+        return filepath.data
+    return None
+
+
+def file_path(filepath: Source) -> Path:
+    """
+    Return the file behind a source.
+    
+    Raises:
+        ValueError: If the source is held in memory
+    """
+    if isinstance(filepath, DocumentSource):
+        if filepath.path is None:
+            raise ValueError(f"{filepath} is held in memory, not on disk")
+        return filepath.path
+    return filepath
+
+
+def as_source(filepath: Union[str, Source]) -> DocumentSource:
+    """Wrap a path in a DocumentSource (sources are returned unchanged)."""
+    if isinstance(filepath, DocumentSource):
+        return filepath
+    return DocumentSource.from_path(filepath)
+
+
+def as_input(filepath: Source) -> Union[str, BinaryIO]:
+    """
+    Return what file-based libraries (zipfile, openpyxl, python-docx) open.
+    
+    Returns:
+        The path as a string for files, a file object over the content
+        (not copied) for in-memory sources
+    """
+    if in_memory(filepath) is not None:
+        return filepath.open()
+    return str(file_path(filepath))
@@ -2,12 +2,29 @@
 """
 Universal File Reader CLI - Auto-detect and extract text from documents
 
-Supports: DOCX, XLSX, PDF (auto-detected by extension)
+Supports: DOCX, XLSX, PDF (auto-detected by extension and content: files
+with a missing or wrong extension are identified by their leading bytes)
 
 Usage:
     uv run skills/read_file.py <filepath>
     uv run skills/read_file.py --list-formats
     uv run skills/read_file.py --format pdf <file.txt>
+    uv run skills/read_file.py <file> [--pages R | --sheet NAME | --rows A:B | --range A:B]
+    uv run skills/read_file.py --recursive <dir> [--workers N] [--output-dir DIR]
+    uv run skills/read_file.py --files-from <list.txt|-> [--unordered]
+    uv run skills/read_file.py --sync <src_dir> <out_dir> [--workers N]
+    uv run skills/read_file.py <file> --chunk-size N [--overlap M] [--jsonl]
+    uv run skills/read_file.py <file> --jsonl
+    uv run skills/read_file.py --serve [--socket PATH] | --stop
+    uv run skills/read_file.py <file|dir> [--timeout S] [--max-memory-mb N] [--max-pages N] ...
+    uv run skills/read_file.py <file> --profile [text|json]
+    uv run skills/read_file.py <file> --probe [text|json]
+    uv run skills/read_file.py <file|dir> --max-chars N | --head
+    uv run skills/read_file.py <bundle.zip|bundle.tar.gz> [--max-archive-mb N]
+    uv run skills/read_file.py <bundle.zip!/member/path> [options]
+    uv run skills/read_file.py - [options] < document
+    uv run skills/read_file.py <file|dir> --strip-boilerplate
+    uv run skills/read_file.py --cache-stats
     uv run skills/read_file.py --help
     uv run skills/read_file.py --version
 
@@ -16,10 +33,147 @@ Examples:
     uv run skills/read_file.py data.xlsx > data.txt
     uv run skills/read_file.py --list-formats
     uv run skills/read_file.py --format docx corrupted.bin 2>/dev/null
+    uv run skills/read_file.py --recursive docs/ > corpus.txt
+    uv run skills/read_file.py --recursive docs/ --output-dir text/ --workers 8
+    find . -name '*.pdf' | uv run skills/read_file.py --files-from - --unordered
+    uv run skills/read_file.py --sync .sia/knowledge .sia/text
+    uv run skills/read_file.py report.pdf --pages 10-20,45
+    uv run skills/read_file.py budget.xlsx --sheet Budget --rows 1:50
+    uv run skills/read_file.py erp_export.xlsx --max-empty-rows 1000
+    uv run skills/read_file.py report.pdf --chunk-size 2000 --overlap 200 --jsonl
+    uv run skills/read_file.py budget.xlsx --jsonl > budget.jsonl
+    uv run skills/read_file.py --serve &    # later calls are forwarded to it
+    uv run skills/read_file.py -r inbox/ --timeout 60 --max-memory-mb 2048 --max-zip-ratio 100
+    uv run skills/read_file.py big.xlsx --profile --no-cache > /dev/null
+    uv run skills/read_file.py --recursive inbox/ --probe json > inbox.jsonl
+    uv run skills/read_file.py huge.xlsx --head
+    uv run skills/read_file.py bundle.zip > bundle.txt
+    uv run skills/read_file.py 'bundle.tar.gz!/docs/report.pdf' --pages 1-5
+    curl -s https://example.com/report.pdf | uv run skills/read_file.py -
+    uv run skills/read_file.py report.pdf --strip-boilerplate --chunk-size 2000
+
+Batch Mode:
+    --recursive and --files-from extract many files in one process pool.
+    Without --output-dir, all texts are written to stdout, each preceded
+    by a delimiter line: === FILE: <path> ===
+    With --output-dir, one <name>.txt file is written per input.
+
+Incremental Sync:
+    --sync SRC_DIR OUT_DIR writes <relative path>.txt into OUT_DIR for every
+    supported file under SRC_DIR, recording size, mtime_ns, content hash and
+    reader version in OUT_DIR/.sia-sync-manifest.json. Later runs extract
+    only new or changed files (or files whose reader changed), delete
+    outputs of removed files, and print a summary of what was skipped.
+
+Chunking:
+    --chunk-size N splits the text into chunks of at most N characters
+    (or --tokenizer words / tiktoken[:ENCODING] units), cutting at page and
+    sheet markers, paragraph breaks and line breaks in that order of
+    preference. --overlap M repeats up to M units of trailing context at
+    the start of the next chunk. Chunks are written with a delimiter line
+    (=== CHUNK n ===), or with --jsonl as one JSON object per line:
+    {"path", "index", "start", "end", "size", "text"} (character offsets
+    into the extracted text; index is 0-based).
+
+Structured Records:
+    --jsonl without --chunk-size writes one JSON object per page (PDF),
+    sheet row (XLSX), paragraph, table, header or footer (DOCX):
+    {"path", "kind", <location>, "start", "end", "text"}, where location
+    is "page"; "sheet" and "row"; "block"; or "section" and "type". Offsets
+    point into the plain-text output, and text carries no markers.
+
+Reader Daemon:
+    --serve imports the reader libraries once and listens on
+    .sia/run/reader.sock (or --socket PATH) until --stop, SIGTERM or Ctrl-C.
+    While it runs, every read_file.py call forwards its arguments to it
+    before importing anything heavy: the daemon forks a warm child that
+    writes straight to the caller's stdout/stderr, and the call exits with
+    the child's exit code. --no-daemon runs locally regardless. The client
+    needs only the standard library, so `python3 read_file.py ...` also
+    skips uv environment resolution while the daemon is up.
+
+Resource Limits:
+    --timeout S, --max-memory-mb N, --max-pages N, --max-rows N,
+    --max-output-mb N and --max-zip-ratio R bound the work spent on each
+    document. A document exceeding a limit fails with an error (exit 1);
+    in batch and sync modes it is reported and the other files go on.
+    The memory cap limits each worker's address space (RLIMIT_AS, Unix);
+    the ZIP ratio (uncompressed/compressed size of DOCX/XLSX packages) is
+    checked before parsing. Oversized documents extracted earlier may
+    still be served from the cache; page and row limits then do not apply.
+
+Reader Options (single file only):
+    --pages 10-20,45        PDF pages (1-based ranges; "50-" = to the end)
+    --sheet NAME            XLSX sheet by name (or --sheet-index N, 1-based)
+    --rows A:B              XLSX rows within each selected sheet
+    --max-empty-rows N      XLSX: end a sheet after N consecutive empty rows
+    --range A:B             DOCX body blocks (paragraphs and tables)
+    --engine ENGINE         XLSX (fast|openpyxl) or DOCX (fast|python-docx)
+                            extraction engine (same output; default fast)
+    Content outside the selection is never parsed. An option the
+    detected format does not support is an error (exit 1).
+
+Extraction Cache:
+    Extracted text is cached under .sia/cache/extract/, keyed by file
+    content hash + reader version, with LRU eviction beyond --cache-max-mb.
+    Re-reading an unchanged document skips parsing entirely.
+    --no-cache bypasses the cache; --cache-stats reports usage (to stdout
+    when used alone, to stderr after an extraction).
+
+Profiling:
+    --profile prints where the time went to stderr after the extraction:
+    wall-clock milliseconds per phase (validate, cache, open, extract,
+    output) and counters (pages, rows, paragraphs, table rows, chunks,
+    bytes emitted). --profile json prints the same as one JSON object.
+    Add --no-cache to profile the readers rather than a cache hit.
+
+Previews:
+    --max-chars N prints only the first N characters of the text; --head
+    is --max-chars 4000. The reader stops at the cap - no further page,
+    row or block is parsed and the document is closed - so previewing a
+    500 MB workbook costs about as much as previewing a small one.
+    Previews bypass the extraction cache and work in batch mode too.
+
+Archives:
+    A .zip or .tar (.tar.gz, .tgz, .tar.bz2, .tar.xz) bundle given as the
+    filepath is read without unpacking it: every member with a supported
+    extension is decompressed into memory and extracted, with a delimiter
+    line per member: === FILE: bundle.zip!/docs/a.pdf ===. Bundles inside
+    the bundle are expanded too. BUNDLE!/MEMBER names a single member
+    (nested: outer.zip!/inner.tar!/a.pdf), which then behaves like a
+    file: reader options, --jsonl, --probe and previews apply. DOCX/XLSX
+    are told apart from bundles by their [Content_Types].xml. At most
+    --max-archive-mb (default 1024) MB are decompressed per bundle.
+
+Standard Input:
+    A filepath of '-' reads the document from stdin, identified by its
+    content (or --format). Redirected files are memory-mapped; pipes are
+    read into memory. No temporary file is written. Archives and every
+    single-file option work as for files.
+
+Boilerplate Stripping:
+    --strip-boilerplate drops running headers, footers and page numbers
+    repeated across pages: lines at the top and bottom of PDF pages and
+    DOCX header/footer entries that recur (digits ignored) on at least 3
+    pages. The first occurrence is kept. Repeats are counted in a fixed-
+    size sketch, so memory does not grow with the document. The bytes
+    saved are reported to stderr. Applies to text and chunk output in
+    single-file, batch and archive modes; DOCX body text and XLSX rows
+    are never touched.
+
+Probing:
+    --probe prints document metadata instead of text, reading only what
+    each format stores up front: page count, encryption, text layer and a
+    word estimate (PDF: page tree plus a few sampled pages), sheet names
+    and declared dimensions (XLSX), page and word counts saved in
+    docProps/app.xml (DOCX). It takes milliseconds regardless of size and
+    works on single files, --recursive and --files-from. --probe json
+    writes one JSON object per file.
 
 Exit Codes:
     0 - Success (text extracted or --list-formats executed)
-    1 - File error (not found, corrupted, unsupported format)
+    1 - File error (not found, corrupted, unsupported format;
+        in batch mode: at least one file failed)
     2 - Unexpected error
 
 Domain: Skills (Infrastructure)
@@ -27,14 +181,60 @@ Pattern: CLI Facade (Adapter) + Registry (Auto-discovery)
 REQ-011: File Reader Skills System
 QUANT-011-005: Universal CLI Implementation
 """
+import importlib.util
+import json
 import sys
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+
+def forward_to_daemon(argv: List[str]) -> Optional[int]:
+    """
+    Run this command in a warm --serve daemon, if one is listening.
+    
+    file_readers/daemon.py needs only the standard library and is loaded
+    on its own, so a forwarded call never imports the readers.
+    
+    Returns:
+        The daemon's exit code, or None to run locally
+    """
+    if any(flag in argv for flag in ("--serve", "--stop", "--no-daemon")):
+        return None
+    spec = importlib.util.spec_from_file_location(
+        "_reader_daemon", Path(__file__).parent / "file_readers" / "daemon.py"
+    )
+    daemon = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(daemon)
+    return daemon.forward(argv, daemon.socket_path_from_argv(argv))
+
+
+# Forward before the reader imports below: that is the cost being saved
+if __name__ == "__main__":
+    forwarded_exit_code = forward_to_daemon(sys.argv[1:])
+    if forwarded_exit_code is not None:
+        sys.exit(forwarded_exit_code)
 
 # Add file_readers module to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from file_readers.archive import (DEFAULT_MAX_ARCHIVE_BYTES, is_archive,
+                                  is_member_path, iter_archive, read_member)
 from file_readers.base import (AbstractFileReader, FileReaderError,
                                UnsupportedFormatError)
+from file_readers.batch import extract_many, iter_files
+from file_readers.boilerplate import BoilerplateFilter
+from file_readers.cache import (DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES,
+                                ExtractionCache)
+from file_readers.chunking import Chunk, Chunker, get_tokenizer
+from file_readers.daemon import (DEFAULT_SOCKET_PATH, DaemonRunningError,
+                                 serve, stop, warm_up)
+from file_readers.jsonl import write_jsonl
+from file_readers.limits import ResourceLimits, apply_memory_limit
+from file_readers.source import DocumentSource, Source
+from file_readers.sync import sync
+
+# Characters printed by --head
+DEFAULT_HEAD_CHARS = 4000
 
 
 def list_formats() -> None:
@@ -51,41 +251,487 @@ def list_formats() -> None:
         print("No file readers registered")
 
 
-def main() -> int:
-    """Main entry point for Universal File Reader CLI"""
-    import argparse
+def iter_listed_paths(source: str) -> Iterator[Path]:
+    """
+    Yield paths listed one per line in a file (or stdin if source is '-').
     
-    parser = argparse.ArgumentParser(
-        description="Universal file reader with auto-detection (DOCX, XLSX, PDF)",
-        epilog="Part of SIA Framework - File Reader Skills System"
-    )
-    parser.add_argument(
-        "filepath",
-        nargs="?",
-        help="Path to file to read (required unless --list-formats)"
-    )
-    parser.add_argument(
-        "--format",
-        help="Force specific format (overrides auto-detection). Example: --format pdf"
-    )
-    parser.add_argument(
-        "--list-formats",
-        action="store_true",
-        help="List all supported file formats and exit"
-    )
-    parser.add_argument(
-        "--version",
-        action="version",
-        version="read_file 1.0.0 (SIA Framework)"
+    Blank lines are ignored and surrounding whitespace is stripped.
+    """
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in stream:
+            line = line.strip()
+            if line:
+                yield Path(line)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def output_path_for(path: Path, output_dir: Path, root: Optional[Path]) -> Path:
+    """
+    Compute the per-file output path for batch mode.
+    
+    Inputs found by --recursive mirror their layout relative to the walked
+    directory; listed inputs keep their own (anchor-stripped) path so files
+    with the same name in different directories never collide.
+    """
+    if root is not None:
+        relative = path.relative_to(root)
+    else:
+        relative = Path(*path.parts[1:]) if path.is_absolute() else path
+    return output_dir / relative.parent / f"{relative.name}.txt"
+
+
+def reader_options(args) -> Dict[str, Any]:
+    """
+    Collect the selection/engine flags that were given as reader options.
+    
+    Option names match the reader constructors, so AbstractFileReader.get_reader()
+    rejects options the detected format does not support.
+    """
+    options = {
+        "pages": args.pages,
+        "sheet": args.sheet,
+        "sheet_index": args.sheet_index,
+        "rows": args.rows,
+        "block_range": args.block_range,
+        "engine": args.engine,
+        "max_empty_rows": args.max_empty_rows,
+    }
+    return {name: value for name, value in options.items() if value is not None}
+
+
+def make_limits(args) -> Optional[ResourceLimits]:
+    """
+    Build the resource limits requested by --timeout/--max-* flags.
+    
+    Returns:
+        ResourceLimits, or None if no limit was given
+        
+    Raises:
+        ValueError: For non-positive limits
+    """
+    limits = {
+        "timeout": args.timeout,
+        "max_memory_mb": args.max_memory_mb,
+        "max_pages": args.max_pages,
+        "max_rows": args.max_rows,
+        "max_output_bytes": (
+            None if args.max_output_mb is None else int(args.max_output_mb * 1024 * 1024)
+        ),
+        "max_zip_ratio": args.max_zip_ratio,
+    }
+    if all(value is None for value in limits.values()):
+        return None
+    return ResourceLimits(**limits)
+
+
+def archive_budget(args) -> int:
+    """Bytes that may be decompressed from one archive (--max-archive-mb)."""
+    if args.max_archive_mb is None:
+        return DEFAULT_MAX_ARCHIVE_BYTES
+    return int(args.max_archive_mb * 1024 * 1024)
+
+
+def open_named_source(filepath: str, max_bytes: int) -> Source:
+    """
+    Resolve a filepath argument to what readers take.
+    
+    Args:
+        filepath: A file, an archive member (bundle.zip!/docs/a.pdf) or
+            '-' for standard input
+        max_bytes: Decompression budget for a member's archives
+        
+    Returns:
+        The file's Path, or an in-memory DocumentSource
+        
+    Raises:
+        FileNotFoundError, ValueError, FileReaderError: If the archive
+            or member cannot be read
+    """
+    if filepath == "-":
+        return DocumentSource.from_stdin()
+    if is_member_path(filepath):
+        return read_member(filepath, max_bytes)
+    return Path(filepath)
+
+
+def iter_named_sources(filepath: str, max_bytes: int,
+                       expand: bool = True) -> Iterator[Source]:
+    """
+    Yield the documents a filepath argument names.
+    
+    Args:
+        filepath: As for open_named_source(); an archive stands for all
+            its documents when expand is set
+        max_bytes: Decompression budget per archive
+        expand: Expand archives (False when --format forces a reader)
+        
+    Yields:
+        The named document, or the members of the named archive
+        
+    Raises:
+        FileNotFoundError, ValueError, FileReaderError: If the archive
+            or member cannot be read (raised while iterating)
+    """
+    source = open_named_source(filepath, max_bytes)
+    if expand and is_archive(source):
+        yield from iter_archive(source, max_bytes)
+    else:
+        yield source
+
+
+def make_chunker(args) -> Optional[Chunker]:
+    """
+    Build the chunker requested by --chunk-size/--overlap/--tokenizer.
+    
+    Returns:
+        Chunker, or None if --chunk-size was not given
+        
+    Raises:
+        ValueError: For invalid sizes or an unknown tokenizer
+        ImportError: If the tokenizer's library is not installed
+    """
+    if args.chunk_size is None:
+        return None
+    return Chunker(args.chunk_size, args.overlap, get_tokenizer(args.tokenizer))
+
+
+def write_chunks(path: Source, chunks: Iterable[Chunk], jsonl: bool) -> None:
+    """Write chunks to stdout as delimited text or JSON Lines."""
+    if jsonl:
+        write_jsonl({
+            "path": str(path),
+            "index": chunk.index,
+            "start": chunk.start,
+            "end": chunk.end,
+            "size": chunk.size,
+            "text": chunk.text,
+        } for chunk in chunks)
+        return
+    for chunk in chunks:
+        sys.stdout.write(f"\n=== CHUNK {chunk.index + 1} ===\n")
+        sys.stdout.write(chunk.text)
+
+
+def run_batch(args, chunker: Optional[Chunker] = None,
+              boilerplate: Optional[BoilerplateFilter] = None) -> int:
+    """
+    Run batch extraction (--recursive / --files-from).
+    
+    Failures are reported to stderr per file and never abort the batch.
+    Boilerplate is stripped here, from each result's text.
+    
+    Returns:
+        Exit code: 0 if all files succeeded, 1 if any file failed,
+        2 if any failure was unexpected
+    """
+    if args.recursive:
+        root = Path(args.filepath)
+        paths = iter_files(root)
+    else:
+        root = None
+        paths = iter_listed_paths(args.files_from)
+    
+    output_dir = Path(args.output_dir) if args.output_dir else None
+    exit_code = 0
+    cache = AbstractFileReader.cache
+    
+    results = extract_many(
+        paths,
+        workers=args.workers,
+        ordered=not args.unordered,
+        fmt=args.format,
+        max_chars=args.max_chars,
     )
+    for result in results:
+        if cache is not None and result.cache_hit is not None:
+            # Workers keep their own counters; fold them into the parent's
+            if result.cache_hit:
+                cache.hits += 1
+            else:
+                cache.misses += 1
+        
+        if not result.ok:
+            prefix = "Unexpected error" if result.unexpected else "Error"
+            sys.stderr.write(f"{prefix}: {result.path}: {result.error}\n")
+            exit_code = max(exit_code, 2 if result.unexpected else 1)
+            continue
+        
+        text = result.text
+        if boilerplate is not None:
+            text = "".join(boilerplate.filter([text]))
+        if output_dir is not None:
+            target = output_path_for(result.path, output_dir, root)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(text, encoding="utf-8")
+        elif chunker is not None:
+            if not args.jsonl:
+                sys.stdout.write(f"\n=== FILE: {result.path} ===\n")
+            write_chunks(result.path, chunker.chunks([text]), args.jsonl)
+        else:
+            sys.stdout.write(f"\n=== FILE: {result.path} ===\n")
+            sys.stdout.write(text)
     
-    args = parser.parse_args()
+    return exit_code
+
+
+def run_archive(args, archive: Source, chunker: Optional[Chunker], records: bool,
+                boilerplate: Optional[BoilerplateFilter] = None) -> int:
+    """
+    Extract every supported document of a ZIP/TAR bundle, in memory.
     
-    # Handle --list-formats (no filepath required)
-    if args.list_formats:
-        list_formats()
+    Members are written like batch results (delimited text, chunks or
+    records). A failing member is reported to stderr and the others go
+    on; an unreadable archive or an exhausted decompression budget stops
+    the walk.
+    
+    Returns:
+        Exit code: 0 if all members succeeded, 1 if any member (or the
+        archive) failed, 2 if any failure was unexpected
+    """
+    if reader_options(args):
+        sys.stderr.write("Error: reader options apply to a single file, not a whole "
+                         "archive (name a member: BUNDLE!/MEMBER)\n")
+        return 1
+    
+    exit_code = 0
+    try:
+        for member in iter_archive(archive, archive_budget(args)):
+            try:
+                reader = AbstractFileReader.get_reader(member)
+                if records:
+                    write_jsonl(record.to_dict() for record in reader.iter_records(member))
+                    continue
+                if args.max_chars is not None:
+                    text = reader.head(member, args.max_chars)
+                else:
+                    text = "".join(reader.stream(member))
+                if boilerplate is not None:
+                    text = "".join(boilerplate.filter([text]))
+            except (UnsupportedFormatError, ValueError, FileReaderError) as e:
+                sys.stderr.write(f"Error: {member}: {e}\n")
+                exit_code = max(exit_code, 1)
+                continue
+            except Exception as e:
+                sys.stderr.write(f"Unexpected error: {member}: {type(e).__name__}: {e}\n")
+                exit_code = 2
+                continue
+            
+            if chunker is not None:
+                if not args.jsonl:
+                    sys.stdout.write(f"\n=== FILE: {member} ===\n")
+                write_chunks(member, chunker.chunks([text]), args.jsonl)
+            else:
+                sys.stdout.write(f"\n=== FILE: {member} ===\n")
+                sys.stdout.write(text)
+    except (FileNotFoundError, FileReaderError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return max(exit_code, 1)
+    return exit_code
+
+
+def run_probe(args) -> int:
+    """
+    Print document metadata (--probe) for a file, directory or list.
+    
+    Failures are reported to stderr per file and never stop the listing.
+    
+    Returns:
+        Exit code: 0 if all files were probed, 1 if any file failed,
+        2 if any failure was unexpected
+    """
+    if args.recursive:
+        paths = iter_files(Path(args.filepath))
+    elif args.files_from:
+        paths = iter_listed_paths(args.files_from)
+    else:
+        paths = iter_named_sources(args.filepath, archive_budget(args),
+                                   expand=not args.format)
+    
+    exit_code = 0
+    try:
+        for path in paths:
+            try:
+                if args.format:
+                    reader = AbstractFileReader.get_reader(
+                        Path(path.name).with_suffix(f".{args.format}"), sniff=False)
+                else:
+                    reader = AbstractFileReader.get_reader(path)
+                info = reader.probe(path)
+            except (FileNotFoundError, UnsupportedFormatError, ValueError, FileReaderError) as e:
+                sys.stderr.write(f"Error: {path}: {e}\n")
+                exit_code = max(exit_code, 1)
+                continue
+            except Exception as e:
+                sys.stderr.write(f"Unexpected error: {path}: {type(e).__name__}: {e}\n")
+                exit_code = 2
+                continue
+            if args.probe == "json":
+                write_jsonl([info.to_dict()])
+            else:
+                print(info.format_text(), flush=True)
+    except (FileNotFoundError, ValueError, FileReaderError) as e:
+        # The archive (or member path) itself is unreadable
+        sys.stderr.write(f"Error: {e}\n")
+        exit_code = max(exit_code, 1)
+    return exit_code
+
+
+def run_sync(args) -> int:
+    """
+    Run incremental sync (--sync SRC_DIR OUT_DIR).
+    
+    Failures are reported to stderr per file; the summary goes to stdout.
+    
+    Returns:
+        Exit code: 0 if all files succeeded, 1 if any file failed,
+        2 if any failure was unexpected
+    """
+    source_dir, output_dir = (Path(directory) for directory in args.sync)
+    report = sync(source_dir, output_dir, workers=args.workers)
+    
+    exit_code = 0
+    for result in report.failed:
+        prefix = "Unexpected error" if result.unexpected else "Error"
+        sys.stderr.write(f"{prefix}: {result.path}: {result.error}\n")
+        exit_code = max(exit_code, 2 if result.unexpected else 1)
+    print(report.format())
+    return exit_code
+
+
+def run_daemon(args) -> int:
+    """
+    Run the reader daemon (--serve) or stop it (--stop).
+    
+    Returns:
+        Exit code: 0 on a clean shutdown or stop, 1 if a daemon is already
+        running (--serve) or none is running (--stop)
+    """
+    socket_path = Path(args.socket)
+    if args.stop:
+        if not stop(socket_path):
+            sys.stderr.write(f"Error: no reader daemon listening on {socket_path}\n")
+            return 1
         return 0
     
+    warm = warm_up()
+    
+    def announce() -> None:
+        sys.stderr.write(
+            f"Reader daemon listening on {socket_path} "
+            f"(preloaded: {', '.join(warm) or 'none'}; stop with --stop)\n"
+        )
+    
+    try:
+        serve(lambda argv: main(argv, forwarded=True), socket_path, on_ready=announce)
+    except DaemonRunningError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def run(args, boilerplate: Optional[BoilerplateFilter] = None) -> int:
+    """
+    Run extraction for parsed arguments (single file, batch or sync).
+    
+    Args:
+        args: Parsed command line
+        boilerplate: Filter applied to extracted text (--strip-boilerplate)
+    """
+    # Chunking options are checked before any file is opened
+    if args.chunk_size is None and (args.overlap or args.tokenizer != "chars"):
+        sys.stderr.write("Error: --overlap and --tokenizer require --chunk-size\n")
+        return 1
+    if args.max_archive_mb is not None and args.max_archive_mb <= 0:
+        sys.stderr.write("Error: --max-archive-mb must be positive\n")
+        return 1
+    if args.probe:
+        if (args.sync or args.chunk_size is not None or args.jsonl or args.output_dir
+                or args.profile or args.max_chars is not None or args.strip_boilerplate
+                or reader_options(args)):
+            sys.stderr.write("Error: --probe prints metadata only (not with --sync, "
+                             "--chunk-size, --jsonl, --output-dir, --profile, "
+                             "--max-chars, --strip-boilerplate or reader options)\n")
+            return 1
+        if args.recursive and args.files_from:
+            sys.stderr.write("Error: --recursive and --files-from are mutually exclusive\n")
+            return 1
+        if not (args.filepath or args.files_from):
+            sys.stderr.write("Error: --probe requires a filepath (or --files-from)\n")
+            return 1
+        try:
+            return run_probe(args)
+        except NotADirectoryError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+    records = args.jsonl and args.chunk_size is None
+    if records and (args.sync or args.recursive or args.files_from):
+        sys.stderr.write("Error: structured records (--jsonl without --chunk-size) "
+                         "are for single files\n")
+        return 1
+    if args.max_chars is not None:
+        if args.max_chars < 1:
+            sys.stderr.write("Error: --max-chars must be positive\n")
+            return 1
+        if args.sync or records:
+            sys.stderr.write("Error: --max-chars/--head preview the text "
+                             "(not with --sync or structured records)\n")
+            return 1
+    if args.profile and (records or args.sync or args.recursive or args.files_from):
+        sys.stderr.write("Error: --profile is for single-file text extraction "
+                         "(not batch, sync or structured records)\n")
+        return 1
+    if args.chunk_size is not None and (args.sync or args.output_dir):
+        sys.stderr.write("Error: --chunk-size writes to stdout (not with --sync or --output-dir)\n")
+        return 1
+    if args.strip_boilerplate and (records or args.sync):
+        sys.stderr.write("Error: --strip-boilerplate filters text output "
+                         "(not with --sync or structured records)\n")
+        return 1
+    try:
+        chunker = make_chunker(args)
+    except (ValueError, ImportError) as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    
+    # Sync mode: incremental extraction of a directory tree
+    if args.sync:
+        if args.filepath or args.recursive or args.files_from or args.format:
+            sys.stderr.write(
+                "Error: --sync takes only SRC_DIR OUT_DIR "
+                "(no filepath, --recursive, --files-from or --format)\n"
+            )
+            return 1
+        if reader_options(args):
+            sys.stderr.write("Error: reader options apply to a single file, not sync mode\n")
+            return 1
+        try:
+            return run_sync(args)
+        except NotADirectoryError as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+    
+    # Batch mode: many files through one process pool
+    if args.recursive or args.files_from:
+        if args.recursive and args.files_from:
+            sys.stderr.write("Error: --recursive and --files-from are mutually exclusive\n")
+            return 1
+        if args.recursive and not args.filepath:
+            sys.stderr.write("Error: --recursive requires a directory path\n")
+            return 1
+        if reader_options(args):
+            sys.stderr.write("Error: reader options apply to a single file, not batch mode\n")
+            return 1
+        try:
+            return run_batch(args, chunker, boilerplate)
+        except (NotADirectoryError, FileNotFoundError) as e:
+            sys.stderr.write(f"Error: {e}\n")
+            return 1
+    
     # Validate filepath is provided for read operations
     if not args.filepath:
         sys.stderr.write("Error: filepath is required (unless --list-formats is used)\n")
@@ -93,23 +739,40 @@ def main() -> int:
         return 1
     
     try:
-        filepath = Path(args.filepath)
+        options = reader_options(args)
+        # A file, or in memory: an archive member or standard input
+        filepath = open_named_source(args.filepath, archive_budget(args))
+        if not args.format and is_archive(filepath):
+            return run_archive(args, filepath, chunker, records, boilerplate)
         
         # Get reader: either forced format or auto-detect
         if args.format:
             # Force specific format by creating a virtual path with the desired extension
             # This allows format override without modifying the actual file
-            virtual_path = filepath.with_suffix(f".{args.format}")
-            reader = AbstractFileReader.get_reader(virtual_path)
+            virtual_path = Path(filepath.name).with_suffix(f".{args.format}")
+            reader = AbstractFileReader.get_reader(virtual_path, sniff=False, **options)
         else:
-            # Auto-detect based on file extension
-            reader = AbstractFileReader.get_reader(filepath)
+            # Auto-detect from the extension, confirmed by content sniffing
+            reader = AbstractFileReader.get_reader(filepath, **options)
         
-        # Read the ACTUAL file (not the virtual path used for selection)
-        text = reader.read(filepath)
-        
-        # Output text to stdout
-        print(text, end='')
+        # Read the ACTUAL file (not the virtual path used for selection),
+        # streaming text to stdout chunk by chunk (from cache when warm)
+        if records:
+            # Structure is not cached: records always come from the reader
+            write_jsonl(record.to_dict() for record in reader.iter_records(filepath))
+        else:
+            if args.max_chars is not None:
+                # Preview: the reader stops once the cap is reached
+                chunks = [reader.head(filepath, args.max_chars)]
+            else:
+                chunks = reader.stream(filepath)
+            if boilerplate is not None:
+                chunks = boilerplate.filter(chunks)
+            if chunker is not None:
+                write_chunks(filepath, chunker.chunks(chunks), args.jsonl)
+            else:
+                for chunk in chunks:
+                    sys.stdout.write(chunk)
         return 0
         
     except FileNotFoundError as e:
@@ -120,6 +783,11 @@ def main() -> int:
         sys.stderr.write(f"Error: {e}\n")
         return 1
         
+    except ValueError as e:
+        # Malformed selection spec or option unsupported by the format
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+        
     except FileReaderError as e:
         # Catches CorruptedFileError and other reader-specific errors
         sys.stderr.write(f"Error: {e}\n")
@@ -131,5 +799,327 @@ def main() -> int:
         return 2
 
 
+def main(argv: Optional[List[str]] = None, forwarded: bool = False) -> int:
+    """
+    Main entry point for Universal File Reader CLI
+    
+    Args:
+        argv: Arguments (default: sys.argv[1:])
+        forwarded: True when running a request inside the reader daemon
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Universal file reader with auto-detection (DOCX, XLSX, PDF)",
+        epilog="Part of SIA Framework - File Reader Skills System"
+    )
+    parser.add_argument(
+        "filepath",
+        nargs="?",
+        help="Path to file to read ('-' for stdin, BUNDLE!/MEMBER for an "
+             "archive member), or directory with --recursive "
+             "(required unless --list-formats or --files-from)"
+    )
+    parser.add_argument(
+        "--format",
+        help="Force specific format (overrides auto-detection). Example: --format pdf"
+    )
+    parser.add_argument(
+        "--list-formats",
+        action="store_true",
+        help="List all supported file formats and exit"
+    )
+    parser.add_argument(
+        "-r", "--recursive",
+        action="store_true",
+        help="Treat filepath as a directory and extract every supported file in it"
+    )
+    parser.add_argument(
+        "--files-from",
+        metavar="LIST",
+        help="Extract files listed one per line in LIST ('-' reads the list from stdin)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for batch and sync modes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="Batch mode: emit results as they complete instead of in input order"
+    )
+    parser.add_argument(
+        "--output-dir",
+        metavar="DIR",
+        help="Batch mode: write one .txt file per input into DIR instead of stdout"
+    )
+    parser.add_argument(
+        "--sync",
+        nargs=2,
+        metavar=("SRC_DIR", "OUT_DIR"),
+        help="Incrementally extract SRC_DIR into OUT_DIR, re-extracting only "
+             "new or changed files and removing outputs of deleted ones"
+    )
+    selection = parser.add_argument_group("reader options (single file)")
+    selection.add_argument(
+        "--pages",
+        metavar="RANGES",
+        help="PDF: only extract these pages, e.g. 10-20,45 or 50- (1-based)"
+    )
+    sheet_group = selection.add_mutually_exclusive_group()
+    sheet_group.add_argument(
+        "--sheet",
+        metavar="NAME",
+        help="XLSX: only extract the sheet with this name"
+    )
+    sheet_group.add_argument(
+        "--sheet-index",
+        type=int,
+        metavar="N",
+        help="XLSX: only extract the N-th sheet (1-based)"
+    )
+    selection.add_argument(
+        "--rows",
+        metavar="A:B",
+        help="XLSX: only extract rows A to B of each selected sheet"
+    )
+    selection.add_argument(
+        "--max-empty-rows",
+        type=int,
+        metavar="N",
+        help="XLSX: stop reading a sheet after N consecutive empty rows "
+             "(for exports declaring a huge used range)"
+    )
+    selection.add_argument(
+        "--range",
+        dest="block_range",
+        metavar="A:B",
+        help="DOCX: only extract body blocks A to B (paragraphs and tables)"
+    )
+    selection.add_argument(
+        "--engine",
+        choices=("fast", "openpyxl", "python-docx"),
+        help="XLSX/DOCX: extraction engine (default: fast; output is identical)"
+    )
+    chunking = parser.add_argument_group("chunking")
+    chunking.add_argument(
+        "--chunk-size",
+        type=int,
+        metavar="N",
+        help="Split the text into chunks of at most N tokenizer units, "
+             "preferring page/sheet, paragraph and line boundaries"
+    )
+    chunking.add_argument(
+        "--overlap",
+        type=int,
+        default=0,
+        metavar="M",
+        help="Repeat up to M units of trailing context in the next chunk (default: 0)"
+    )
+    chunking.add_argument(
+        "--tokenizer",
+        default="chars",
+        metavar="NAME",
+        help="Chunk size unit: chars, words or tiktoken[:ENCODING] (default: chars)"
+    )
+    chunking.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Write JSON Lines: chunks (with --chunk-size), otherwise one "
+             "record per page / sheet row / paragraph / table with its "
+             "location and character offsets"
+    )
+    preview = parser.add_argument_group("preview").add_mutually_exclusive_group()
+    preview.add_argument(
+        "--max-chars",
+        type=int,
+        metavar="N",
+        help="Extract only the first N characters; the reader stops "
+             "(and closes the document) there"
+    )
+    preview.add_argument(
+        "--head",
+        action="store_const",
+        const=DEFAULT_HEAD_CHARS,
+        dest="max_chars",
+        help=f"Preview: same as --max-chars {DEFAULT_HEAD_CHARS}"
+    )
+    parser.add_argument(
+        "--strip-boilerplate",
+        action="store_true",
+        help="Drop headers, footers and page numbers repeated across pages "
+             "(PDF pages, DOCX header/footer entries); bytes saved go to stderr"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-extract; do not read or write the extraction cache"
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Report extraction cache usage (alone: print and exit)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Extraction cache directory (default: {DEFAULT_CACHE_DIR})"
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Extraction cache byte budget in MB; least recently used "
+             "entries are evicted beyond it (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--probe",
+        nargs="?",
+        const="text",
+        choices=("text", "json"),
+        help="Print document metadata (pages, sheets and dimensions, word "
+             "estimate, encryption, text layer) instead of extracting text"
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="text",
+        choices=("text", "json"),
+        help="Print per-phase timings and counters of the extraction to "
+             "stderr (text, the default, or json)"
+    )
+    limits = parser.add_argument_group("resource limits (per document)")
+    limits.add_argument(
+        "--timeout",
+        type=float,
+        metavar="S",
+        help="Fail a document whose extraction takes longer than S seconds"
+    )
+    limits.add_argument(
+        "--max-memory-mb",
+        type=int,
+        metavar="N",
+        help="Cap the address space of each extracting process at N MB (Unix)"
+    )
+    limits.add_argument(
+        "--max-pages",
+        type=int,
+        metavar="N",
+        help="Fail PDFs with more than N pages to extract"
+    )
+    limits.add_argument(
+        "--max-rows",
+        type=int,
+        metavar="N",
+        help="Fail XLSX workbooks with more than N rows to extract"
+    )
+    limits.add_argument(
+        "--max-output-mb",
+        type=float,
+        metavar="N",
+        help="Fail documents whose extracted text exceeds N MB"
+    )
+    limits.add_argument(
+        "--max-zip-ratio",
+        type=float,
+        metavar="R",
+        help="Fail DOCX/XLSX packages that decompress to more than R times "
+             "their compressed size (ZIP bombs)"
+    )
+    limits.add_argument(
+        "--max-archive-mb",
+        type=float,
+        metavar="N",
+        help="Stop reading a ZIP/TAR bundle once its members have decompressed "
+             f"to N MB in total (default: {DEFAULT_MAX_ARCHIVE_BYTES // (1024 * 1024)})"
+    )
+    daemon = parser.add_argument_group("reader daemon")
+    daemon_mode = daemon.add_mutually_exclusive_group()
+    daemon_mode.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the readers loaded and serve read_file.py calls on a Unix "
+             "socket (runs in the foreground; calls are forwarded automatically)"
+    )
+    daemon_mode.add_argument(
+        "--stop",
+        action="store_true",
+        help="Stop the running reader daemon"
+    )
+    daemon.add_argument(
+        "--socket",
+        default=str(DEFAULT_SOCKET_PATH),
+        metavar="PATH",
+        help=f"Reader daemon socket (default: {DEFAULT_SOCKET_PATH})"
+    )
+    daemon.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run locally even if a reader daemon is listening"
+    )
+    parser.add_argument(
+        "--version",
+        action="version",
+        version="read_file 1.0.0 (SIA Framework)"
+    )
+    
+    args = parser.parse_args(argv)
+    
+    if args.serve or args.stop:
+        if forwarded:
+            sys.stderr.write("Error: --serve and --stop cannot run inside the daemon\n")
+            return 1
+        return run_daemon(args)
+    
+    # Handle --list-formats (no filepath required)
+    if args.list_formats:
+        list_formats()
+        return 0
+    
+    try:
+        limits = make_limits(args)
+    except ValueError as e:
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+    if limits is not None:
+        AbstractFileReader.set_limits(limits)
+        # Pool workers cap themselves; in-process extraction is capped here
+        pooled = (args.recursive or args.files_from or args.sync) and args.workers != 1
+        if not pooled:
+            apply_memory_limit(limits.max_memory_mb)
+    
+    if not args.no_cache:
+        AbstractFileReader.set_cache(ExtractionCache(
+            root=Path(args.cache_dir),
+            max_bytes=args.cache_max_mb * 1024 * 1024,
+        ))
+    
+    # --cache-stats alone: report and exit
+    if args.cache_stats and not (args.filepath or args.files_from or args.sync):
+        if args.no_cache:
+            print("Extraction cache disabled (--no-cache)")
+        else:
+            print(AbstractFileReader.cache.stats().format())
+        return 0
+    
+    profiles = []
+    if args.profile:
+        AbstractFileReader.set_profiler(profiles.append)
+    boilerplate = BoilerplateFilter() if args.strip_boilerplate else None
+    exit_code = run(args, boilerplate)
+    for profile in profiles:
+        if args.profile == "json":
+            sys.stderr.write(json.dumps(profile.to_dict()) + "\n")
+        else:
+            sys.stderr.write(profile.format() + "\n")
+    if boilerplate is not None and boilerplate.stats.bytes_in:
+        sys.stderr.write(boilerplate.stats.format() + "\n")
+    if args.cache_stats and AbstractFileReader.cache is not None:
+        sys.stderr.write(AbstractFileReader.cache.stats().format() + "\n")
+    return exit_code
+
+
 if __name__ == "__main__":
     sys.exit(main())
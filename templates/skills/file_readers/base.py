@@ -5,6 +5,17 @@ This module provides the foundation for the file reader system, implementing:
 - AbstractFileReader: Base class with auto-discovery registry
 - Error hierarchy: FileReaderError, CorruptedFileError
 - Registry pattern: Automatic registration of concrete readers
+- Lookup cache: concrete registry filtered once per registry change,
+  option-less readers shared as singletons
+- Content sniffing: magic bytes (and a ZIP package's [Content_Types].xml)
+  select the reader when the extension is missing or wrong
+- Structured output: iter_parts() tags output with its source location;
+  iter_records() turns it into records with character offsets
+- Probing: probe() reports document metadata without extracting text
+- Previews: head() stops the reader (and closes the document) once
+  enough text has been extracted
+- Sources: every method taking a file path also takes a DocumentSource,
+  so in-memory documents (archive members, uploads, stdin) need no files
 
 Domain: Skills (Infrastructure)
 Bounded Context: File Processing
@@ -14,11 +25,34 @@ Invariant:
     AbstractFileReader.registry = {}
     ∧ ∀ subclass: subclass.__abstractmethods__ = ∅ ⇒ subclass ∈ registry
     ∧ registry.get(extension) → Reader | None
+    ∧ _get_concrete_registry() rebuilt ⟺ registry.version changed
 """
 
+import inspect
+import os
+import re
+import struct
+import threading
+import zipfile
+import zlib
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Type
+from typing import (TYPE_CHECKING, Any, ClassVar, Dict, FrozenSet, Iterable,
+                    Iterator, List, NamedTuple, Optional, Pattern, Tuple,
+                    Type)
+
+from .probe import DocumentInfo
+from .profiling import phase, track
+from .source import Source, as_input, as_source, file_path, in_memory
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    
+    from .cache import ExtractionCache
+    from .limits import ResourceLimits
+    from .profiling import ProfileHook
 
 # ============================================================================
 # ERROR HIERARCHY
@@ -56,10 +90,131 @@ class UnsupportedFormatError(FileReaderError):
     pass
 
 
+class ResourceLimitExceeded(FileReaderError):
+    """
+    Raised when extracting a file exceeds a configured resource limit.
+    
+    Examples:
+        - Extraction runs past the per-document timeout
+        - Too many pages, rows or bytes of output
+        - ZIP package expanding far beyond its size (ZIP bomb)
+        - Memory cap reached
+    
+    See limits.ResourceLimits.
+    """
+    pass
+
+
+# ============================================================================
+# STRUCTURED OUTPUT
+# ============================================================================
+
+class Part(NamedTuple):
+    """
+    A fragment of streamed reader output, tagged with the unit it renders.
+    
+    Attributes:
+        text: Output text exactly as it appears in read()
+        kind: Source unit ("page", "row", "paragraph", "table", "header",
+            "footer", "document"), or None for markers and separators
+        location: Where the unit is in the document, e.g. {"page": 3} or
+            {"sheet": "Budget", "row": 12}
+        lead: Leading characters of text that are layout (separators,
+            labels such as "[HEADER_S1] ") rather than unit content
+    """
+    text: str
+    kind: Optional[str] = None
+    location: Optional[Dict[str, Any]] = None
+    lead: int = 0
+
+
+@dataclass
+class Record:
+    """
+    One structural unit of a document's extracted text.
+    
+    Attributes:
+        path: Document path
+        kind: Unit type ("page", "row", "paragraph", "table", ...)
+        location: Unit position (page, sheet and row, block, section, ...)
+        start: Character offset of the unit's text in read() output
+        end: Character offset just past it
+        text: The unit's text (read() output[start:end])
+    """
+    path: str
+    kind: str
+    location: Dict[str, Any]
+    start: int
+    end: int
+    text: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Flat JSON-ready dict: location keys sit beside the offsets."""
+        return {
+            "path": self.path,
+            "kind": self.kind,
+            **self.location,
+            "start": self.start,
+            "end": self.end,
+            "text": self.text,
+        }
+
+
 # ============================================================================
 # ABSTRACT BASE CLASS + REGISTRY
 # ============================================================================
 
+class ReaderRegistry(dict):
+    """
+    Extension -> reader class mapping that counts its own modifications.
+    
+    Every mutation bumps version, so lookups can cache anything derived
+    from the registry (the concrete-class filter, reader singletons) and
+    rebuild it only when a reader registers or the mapping is edited
+    directly (as tests do when isolating the registry).
+    
+    Attributes:
+        version: Incremented on every modification
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+    
+    def __ior__(self, other):
+        result = super().__ior__(other)
+        self.version += 1
+        return result
+    
+    def clear(self):
+        super().clear()
+        self.version += 1
+    
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+    
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+    
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+    
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+
 class AbstractFileReader(ABC):
     """
     Abstract base class for file readers with auto-discovery registry.
@@ -72,6 +227,13 @@ class AbstractFileReader(ABC):
         - Concrete readers auto-register via __init_subclass__
         - Registry is a class-level dict: {extension: ReaderClass}
         - Non-concrete classes (partial implementations) are NOT registered
+        - Lookups are O(1): the concrete-class filter is cached until the
+          registry changes, and get_reader() without options returns one
+          shared instance per stateless reader class
+        - Readers declare signatures (magic-byte prefixes) and, for ZIP
+          packages, zip_content_types; get_reader() sniffs the first
+          SNIFF_BYTES of a file when its extension is missing or names a
+          format whose signature does not match
     
     Example:
         >>> class TxtReader(AbstractFileReader):
@@ -88,9 +250,35 @@ class AbstractFileReader(ABC):
     
     Attributes:
         registry: Class-level dict mapping extensions to reader classes
+        stateless: True if an instance keeps no per-read state, so
+            get_reader() may share one instance (set False otherwise)
+        signatures: Byte prefixes identifying this format (empty = not
+            sniffable; the extension alone selects the reader)
+        zip_content_types: Main-part content types that identify this format
+            among ZIP packages sharing the PK signature
+        reader_version: Output format version; bump when a reader's output
+            changes so cached extractions are invalidated
+        cache: Shared extraction cache (None = caching disabled)
+        limits: Per-document resource limits (None = unlimited)
+        profiler: Hook receiving a Profile per extraction (None = off)
     """
     
-    registry: Dict[str, Type['AbstractFileReader']] = {}
+    registry: Dict[str, Type['AbstractFileReader']] = ReaderRegistry()
+    stateless: ClassVar[bool] = True
+    signatures: ClassVar[Tuple[bytes, ...]] = ()
+    zip_content_types: ClassVar[Tuple[str, ...]] = ()
+    reader_version: ClassVar[str] = "1.0.0"
+    cache: ClassVar[Optional['ExtractionCache']] = None
+    limits: ClassVar[Optional['ResourceLimits']] = None
+    profiler: ClassVar[Optional['ProfileHook']] = None
+    
+    # Lookup caches, valid while (id(registry), registry.version) is unchanged
+    _lookup_key: ClassVar[Optional[Tuple[int, int]]] = None
+    _concrete_registry: ClassVar[Dict[str, Type['AbstractFileReader']]] = {}
+    _instances: ClassVar[Dict[Type['AbstractFileReader'], 'AbstractFileReader']] = {}
+    # Signature table: one alternation over all prefixes -> candidate readers
+    _signature_pattern: ClassVar[Optional[Pattern[bytes]]] = None
+    _signature_readers: ClassVar[Dict[bytes, List[Type['AbstractFileReader']]]] = {}
     
     def __init_subclass__(cls, **kwargs):
         """
@@ -119,7 +307,7 @@ class AbstractFileReader(ABC):
             pass
     
     @abstractmethod
-    def read(self, filepath: Path) -> str:
+    def read(self, filepath: Source) -> str:
         """
         Extract text content from a file.
         
@@ -136,6 +324,316 @@ class AbstractFileReader(ABC):
         """
         pass
     
+    def iter_read(self, filepath: Source) -> Iterator[str]:
+        """
+        Extract text content from a file as a stream of chunks.
+        
+        Concatenating every chunk yields exactly read(filepath). Concrete
+        readers override this to yield pages, sheet rows or body blocks as
+        they are parsed, so peak memory depends on the largest chunk rather
+        than on the size of the document. The default implementation yields
+        read() as a single chunk, so readers that only implement read()
+        still work with streaming consumers.
+        
+        Args:
+            filepath: Path to the file to read
+            
+        Yields:
+            Consecutive fragments of the extracted text
+            
+        Raises:
+            Same as read(), raised when iteration starts
+        """
+        yield self.read(filepath)
+    
+    def iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """
+        Extract text as parts tagged with their source location.
+        
+        Concatenating the part texts yields exactly read(filepath).
+        Readers with document structure override this and derive
+        iter_read() from it; the default wraps the whole text in a single
+        "document" part.
+        
+        Args:
+            filepath: Path to the file to read
+            
+        Yields:
+            Consecutive Parts of the extracted text
+            
+        Raises:
+            Same as read(), raised when iteration starts
+        """
+        yield Part("".join(self.iter_read(filepath)), "document", {})
+    
+    def iter_records(self, filepath: Source) -> Iterator[Record]:
+        """
+        Extract one record per page, sheet row, paragraph, table, header...
+        
+        Records carry their location and character offsets into read()
+        output, so indexers need not parse the text markers. Consecutive
+        parts of the same unit (e.g. the rows of a DOCX table) form one
+        record. Records are always extracted (the text cache is not used).
+        
+        Args:
+            filepath: Path to the file to read
+            
+        Yields:
+            Records in document order
+            
+        Raises:
+            Same as read(), raised when iteration starts
+        """
+        path = str(filepath)
+        offset = 0
+        current: Optional[Part] = None  # Unit being collected
+        start = 0
+        texts: List[str] = []
+        
+        for part in self.iter_parts(filepath):
+            if current is not None and (
+                part.kind != current.kind or part.location != current.location
+            ):
+                text = "".join(texts)[current.lead:]
+                if text:
+                    yield Record(path, current.kind, current.location,
+                                 start, start + len(text), text)
+                current = None
+            if part.kind is not None:
+                if current is None:
+                    current, start, texts = part, offset + part.lead, []
+                texts.append(part.text)
+            offset += len(part.text)
+        
+        if current is not None:
+            text = "".join(texts)[current.lead:]
+            if text:
+                yield Record(path, current.kind, current.location,
+                             start, start + len(text), text)
+    
+    def stream(self, filepath: Source) -> Iterator[str]:
+        """
+        Extract text as chunks, served from the extraction cache if enabled.
+        
+        With no cache configured this is iter_read(). With a cache, a hit
+        yields the cached text as a single chunk; a miss streams iter_read()
+        while writing the chunks into a new cache entry, which is only
+        committed if extraction runs to completion.
+        
+        With resource limits configured, the stream is watched by
+        ResourceLimits.watch() (timeout, output size, ZIP ratio). With a
+        profiler hook installed, phase timings and counters are recorded
+        and passed to the hook when the stream ends (see profiling.py).
+        
+        Args:
+            filepath: Path to the file to read
+            
+        Yields:
+            Consecutive fragments of the extracted text
+            
+        Raises:
+            ResourceLimitExceeded: If a configured limit is exceeded
+        """
+        yield from self._guarded(filepath, self._stream(filepath))
+    
+    def head(self, filepath: Source, max_chars: int) -> str:
+        """
+        Extract the first max_chars characters of the text.
+        
+        The reader stops as soon as the cap is reached: no further page,
+        row or block is parsed and the document is closed, so previewing
+        a huge document costs about as much as previewing a small one.
+        The extraction cache is bypassed (keying a cache entry hashes the
+        whole file); resource limits and the profiler still apply.
+        
+        Args:
+            filepath: Path to the file to read
+            max_chars: Characters to return at most
+            
+        Returns:
+            read(filepath)[:max_chars]
+            
+        Raises:
+            ValueError: If max_chars is not positive
+            Same as read()
+        """
+        if max_chars < 1:
+            raise ValueError("max_chars must be positive")
+        texts: List[str] = []
+        remaining = max_chars
+        chunks = self._guarded(filepath, self.iter_read(filepath))
+        previous = previewing()
+        _preview.active = True
+        try:
+            for chunk in chunks:
+                text = chunk[:remaining]
+                texts.append(text)
+                remaining -= len(text)
+                if remaining == 0:
+                    break
+        finally:
+            _preview.active = previous
+            # Runs the readers' cleanup (closing the document) right away
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+        return "".join(texts)
+    
+    def _guarded(self, filepath: Source, chunks: Iterator[str]) -> Iterator[str]:
+        """Apply the configured resource limits and profiler to a chunk stream."""
+        limits = AbstractFileReader.limits
+        if limits is not None:
+            chunks = limits.watch(self, filepath, chunks)
+        profiler = AbstractFileReader.profiler
+        if profiler is not None:
+            chunks = track(self, filepath, chunks, profiler)
+        return chunks
+    
+    def _stream(self, filepath: Source) -> Iterator[str]:
+        """stream() without limits or profiling: iter_read() through the cache."""
+        cache = AbstractFileReader.cache
+        if cache is None:
+            yield from self.iter_read(filepath)
+            return
+        
+        validate_file_exists(filepath)
+        with phase("cache"):
+            key = cache.key_for(filepath, self)
+            cached = cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+        
+        with cache.writer(key) as sink:
+            for chunk in self.iter_read(filepath):
+                sink.write(chunk)
+                yield chunk
+    
+    async def aread(self, filepath: Source, *, timeout: Optional[float] = None,
+                    executor: Optional['Executor'] = None) -> str:
+        """
+        Extract text without blocking the event loop.
+        
+        read() runs in an executor (default: the shared thread pool from
+        aio.shared_executor()). Cancelling the awaiting task (or a timeout)
+        cancels the extraction if it has not started yet; one already
+        running in a thread finishes in the background and is discarded.
+        
+        Args:
+            filepath: Path to the file to read
+            timeout: Seconds to wait (None = no limit)
+            executor: Executor to run read() in (a process pool requires a
+                picklable reader, which the bundled readers are)
+            
+        Returns:
+            Extracted text, identical to read()
+            
+        Raises:
+            asyncio.TimeoutError: If extraction exceeds timeout
+            FileNotFoundError, FileReaderError: As raised by read()
+        """
+        import asyncio
+        
+        from .aio import shared_executor
+        
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor or shared_executor(), self.read, filepath)
+        return await asyncio.wait_for(future, timeout)
+    
+    def probe(self, filepath: Source) -> DocumentInfo:
+        """
+        Report a document's metadata without extracting its text.
+        
+        The default knows only the format and file size; readers override
+        this to add what their format's metadata tells cheaply (page
+        count, sheet dimensions, word estimate, encryption, text layer).
+        Selection options are ignored: the whole document is described.
+        
+        Args:
+            filepath: Path to the file to probe
+            
+        Returns:
+            DocumentInfo (fields the reader cannot answer are None)
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If the document's metadata is unreadable
+        """
+        validate_file_exists(filepath)
+        return DocumentInfo(
+            path=str(filepath),
+            format=self.get_extension(),
+            size_bytes=as_source(filepath).size(),
+        )
+    
+    def options(self) -> Dict[str, Any]:
+        """
+        Return the options that change this reader's output.
+        
+        Readers with selection or formatting options override this so
+        that differently configured extractions never share cache entries.
+        Options that only affect speed (e.g. worker counts) are excluded.
+        
+        Returns:
+            Option name -> value (empty for option-less readers)
+        """
+        return {}
+    
+    def cache_token(self) -> str:
+        """
+        Identify this reader's output for cache keys.
+        
+        Returns:
+            Reader class name, reader_version and output-affecting options
+        """
+        token = f"{type(self).__name__}:{self.reader_version}"
+        options = self.options()
+        if options:
+            token += ":" + ",".join(f"{k}={options[k]!r}" for k in sorted(options))
+        return token
+    
+    @classmethod
+    def set_cache(cls, cache: Optional['ExtractionCache']) -> None:
+        """
+        Enable (or disable with None) the shared extraction cache.
+        
+        Once set, every reader's stream() - and therefore read() of the
+        bundled readers - goes through the cache transparently.
+        
+        Args:
+            cache: ExtractionCache instance, or None to disable caching
+        """
+        AbstractFileReader.cache = cache
+    
+    @classmethod
+    def set_limits(cls, limits: Optional['ResourceLimits']) -> None:
+        """
+        Enable (or disable with None) per-document resource limits.
+        
+        Once set, every reader's stream() and head() - and therefore
+        read() - raises ResourceLimitExceeded instead of running past a
+        limit. The memory cap is process-wide; apply it with
+        limits.apply_memory_limit().
+        
+        Args:
+            limits: ResourceLimits instance, or None to disable limits
+        """
+        AbstractFileReader.limits = limits
+    
+    @classmethod
+    def set_profiler(cls, profiler: Optional['ProfileHook']) -> None:
+        """
+        Install (or remove with None) a hook receiving extraction profiles.
+        
+        Once set, every reader's stream() and head() - and therefore
+        read() - records phase timings and counters, and calls the hook
+        with the Profile when the stream ends. See also profiling.collect().
+        
+        Args:
+            profiler: Callable taking a profiling.Profile, or None
+        """
+        AbstractFileReader.profiler = profiler
+    
     @classmethod
     @abstractmethod
     def get_extension(cls) -> str:
@@ -148,7 +646,7 @@ class AbstractFileReader(ABC):
         pass
     
     @classmethod
-    def supports(cls, filepath: Path) -> bool:
+    def supports(cls, filepath: Source) -> bool:
         """
         Check if this reader supports the given file.
         
@@ -168,35 +666,129 @@ class AbstractFileReader(ABC):
         
         This is needed because __init_subclass__ runs before ABCMeta sets
         __abstractmethods__, so we register all classes and filter later.
+        The filtered dict is built once and reused until the registry is
+        modified (or replaced); treat it as read-only.
         
         Returns:
             Dict mapping extensions to concrete reader classes only
         """
+        registry = AbstractFileReader.registry
+        version = getattr(registry, "version", None)
+        if version is None:
+            # A plain dict was assigned: changes cannot be detected
+            return cls._filter_concrete(registry)
+        
+        key = (id(registry), version)
+        if AbstractFileReader._lookup_key != key:
+            concrete = cls._filter_concrete(registry)
+            AbstractFileReader._concrete_registry = concrete
+            AbstractFileReader._instances = {}
+            cls._compile_signatures(concrete)
+            AbstractFileReader._lookup_key = key
+        return AbstractFileReader._concrete_registry
+    
+    @staticmethod
+    def _filter_concrete(
+        registry: Dict[str, Type['AbstractFileReader']],
+    ) -> Dict[str, Type['AbstractFileReader']]:
+        """Drop classes that still have abstract methods."""
         return {
             ext: reader_cls
-            for ext, reader_cls in cls.registry.items()
+            for ext, reader_cls in registry.items()
             if not reader_cls.__abstractmethods__  # Empty set means concrete
         }
     
+    @staticmethod
+    def _compile_signatures(
+        concrete: Dict[str, Type['AbstractFileReader']],
+    ) -> None:
+        """Precompile the signature table for the current registry."""
+        readers: Dict[bytes, List[Type['AbstractFileReader']]] = {}
+        for reader_cls in concrete.values():
+            for signature in reader_cls.signatures:
+                candidates = readers.setdefault(signature, [])
+                if reader_cls not in candidates:
+                    candidates.append(reader_cls)
+        
+        pattern = None
+        if readers:
+            # Longest first so a more specific prefix wins
+            alternatives = sorted(readers, key=len, reverse=True)
+            pattern = re.compile(b"|".join(re.escape(sig) for sig in alternatives))
+        AbstractFileReader._signature_readers = readers
+        AbstractFileReader._signature_pattern = pattern
+    
     @classmethod
-    def get_reader(cls, filepath: Path) -> 'AbstractFileReader':
+    def sniff(cls, filepath: Source) -> Optional[Type['AbstractFileReader']]:
+        """
+        Identify a file's reader from its content.
+        
+        Matches the first SNIFF_BYTES against the registered signatures.
+        When several readers share a signature (DOCX and XLSX are both ZIP
+        packages), the package's [Content_Types].xml decides.
+        
+        Args:
+            filepath: File to inspect
+            
+        Returns:
+            Matching reader class, or None if the file is unreadable or
+            matches no signature
+        """
+        cls._get_concrete_registry()  # Recompiles signatures if stale
+        pattern = AbstractFileReader._signature_pattern
+        if pattern is None:
+            return None
+        try:
+            head = read_head(filepath)
+        except OSError:
+            return None
+        
+        match = pattern.match(head)
+        if match is None:
+            return None
+        candidates = AbstractFileReader._signature_readers[match.group()]
+        if len(candidates) == 1 and not candidates[0].zip_content_types:
+            return candidates[0]
+        
+        content_types = zip_content_types(filepath, head)
+        for reader_cls in candidates:
+            if content_types.intersection(reader_cls.zip_content_types):
+                return reader_cls
+        # Shared signature, no known content type: a generic reader, if any
+        generic = [c for c in candidates if not c.zip_content_types]
+        return generic[0] if len(generic) == 1 else None
+    
+    @classmethod
+    def get_reader(cls, filepath: Source, *, sniff: bool = True,
+                   **options: Any) -> 'AbstractFileReader':
         """
         Get the appropriate reader instance for a file.
         
         Uses the registry to find a reader that supports the file's extension.
+        If the extension is missing or unknown, or its reader declares
+        signatures, the file content is sniffed: a match overrides the
+        extension, so misnamed files reach the right parser. Files that
+        cannot be read or match nothing keep the extension's reader.
+        Without options, stateless readers are shared: repeated calls return
+        the same instance (do not mutate it).
         
         Args:
             filepath: Path to the file
+            sniff: Inspect file content (False forces the extension, as
+                --format does)
+            **options: Reader constructor options (e.g. pages="1-5" for PDF)
             
         Returns:
             Instance of the appropriate reader class
             
         Raises:
             UnsupportedFormatError: If no reader supports this extension
+            ValueError: If the reader does not accept the given options
         
         Example:
             >>> reader = AbstractFileReader.get_reader(Path("doc.pdf"))
             >>> text = reader.read(Path("doc.pdf"))
+            >>> reader = AbstractFileReader.get_reader(Path("doc.pdf"), pages="10-20")
         """
         suffix = filepath.suffix
         # Handle files with no extension (suffix will be empty string)
@@ -206,6 +798,12 @@ class AbstractFileReader(ABC):
         concrete_registry = cls._get_concrete_registry()
         reader_class = concrete_registry.get(extension)
         
+        # Only readers with signatures can be confirmed (or contradicted)
+        if sniff and (reader_class is None or reader_class.signatures):
+            sniffed = cls.sniff(filepath)
+            if sniffed is not None:
+                reader_class = sniffed
+        
         if not reader_class:
             supported = ', '.join(sorted(concrete_registry.keys()))
             # Format extension with dot for display (except for empty extension)
@@ -218,7 +816,25 @@ class AbstractFileReader(ABC):
                 f"Supported formats: {supported}"
             )
         
-        return reader_class()
+        if options:
+            try:
+                inspect.signature(reader_class).bind(**options)
+            except TypeError:
+                raise ValueError(
+                    f"{reader_class.__name__} does not accept option(s): "
+                    f"{', '.join(sorted(options))}"
+                ) from None
+            return reader_class(**options)
+        
+        if not reader_class.stateless:
+            return reader_class()
+        
+        # Default-configured stateless readers are interchangeable
+        instances = AbstractFileReader._instances
+        reader = instances.get(reader_class)
+        if reader is None:
+            reader = instances[reader_class] = reader_class()
+        return reader
     
     @classmethod
     def list_supported_formats(cls) -> list[str]:
@@ -236,26 +852,236 @@ class AbstractFileReader(ABC):
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def validate_file_exists(filepath: Path) -> None:
+# Set while head() consumes a reader's stream in this thread
+_preview = threading.local()
+
+
+def previewing() -> bool:
+    """
+    Tell whether the current extraction is a head() preview.
+    
+    Readers use this to skip work that only pays off for complete
+    extractions (e.g. sharding a PDF's pages across processes).
     """
-    Validate that a file exists and is readable.
+    return getattr(_preview, "active", False)
+
+
+def iter_joined(parts: Iterable[str], separator: str = "\n") -> Iterator[str]:
+    """
+    Stream the equivalent of separator.join(parts) without building it.
+    
+    Each part after the first is yielded with the separator prepended, so
+    consumers see one chunk per part and "".join() of the output equals
+    separator.join(parts).
     
     Args:
-        filepath: Path to validate
+        parts: Text fragments (consumed lazily)
+        separator: String placed between consecutive parts
+        
+    Yields:
+        First part as-is, then separator + part for each following part
+    """
+    first = True
+    for part in parts:
+        if first:
+            first = False
+            yield part
+        else:
+            yield separator + part
+
+
+def join_parts(parts: Iterable[Part], separator: str = "\n") -> Iterator[Part]:
+    """
+    iter_joined() for Parts: separators become part of each following lead.
+    
+    Args:
+        parts: Tagged fragments (consumed lazily)
+        separator: String placed between consecutive parts
+        
+    Yields:
+        First part as-is, then each following part with the separator
+        prepended to its text and counted in its lead
+    """
+    first = True
+    for part in parts:
+        if first:
+            first = False
+            yield part
+        else:
+            yield Part(separator + part.text, part.kind, part.location,
+                       part.lead + len(separator))
+
+
+# Bytes read to identify a file; also enough for [Content_Types].xml in
+# packages that store it first (as Word does)
+SNIFF_BYTES = 8192
+
+# Heads kept for reuse (validate_file_exists, hash_file) after sniffing
+_HEAD_MEMO_SIZE = 256
+_head_memo: 'OrderedDict[Tuple[str, int, int], bytes]' = OrderedDict()
+_head_memo_lock = threading.Lock()
+
+_ZIP_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_ZIP_LOCAL_SIGNATURE = b"PK\x03\x04"
+_CONTENT_TYPE_ATTRIBUTE = re.compile(rb'ContentType="([^"]+)"')
+
+
+def _head_key(filepath: Path) -> Tuple[str, int, int]:
+    """Identify a file version by path, size and modification time."""
+    stat = os.stat(filepath)
+    return os.fspath(filepath), stat.st_size, stat.st_mtime_ns
+
+
+def read_head(filepath: Source) -> bytes:
+    """
+    Read (once) the first SNIFF_BYTES of a file.
+    
+    The bytes are remembered per file version so the reader path can reuse
+    them instead of opening the file again: validate_file_exists() skips
+    its readability probe and hash_file() hashes small files from memory.
+    
+    Args:
+        filepath: File to read (in-memory sources are sliced instead)
+        
+    Returns:
+        Up to SNIFF_BYTES leading bytes
         
     Raises:
-        FileNotFoundError: If file doesn't exist
-        PermissionError: If file exists but cannot be read
+        OSError: If the file cannot be read
     """
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    data = in_memory(filepath)
+    if data is not None:
+        return bytes(data[:SNIFF_BYTES])
+    filepath = file_path(filepath)
+    key = _head_key(filepath)
+    with _head_memo_lock:
+        head = _head_memo.get(key)
+        if head is not None:
+            _head_memo.move_to_end(key)
+            return head
     
-    if not filepath.is_file():
-        raise ValueError(f"Path is not a file: {filepath}")
+    with open(filepath, 'rb') as f:
+        head = f.read(SNIFF_BYTES)
     
-    # Test read permission by attempting to open
+    with _head_memo_lock:
+        _head_memo[key] = head
+        if len(_head_memo) > _HEAD_MEMO_SIZE:
+            _head_memo.popitem(last=False)
+    return head
+
+
+def cached_head(filepath: Source) -> Optional[bytes]:
+    """
+    Return the head read by read_head() if the file is unchanged since.
+    
+    Args:
+        filepath: File to look up
+        
+    Returns:
+        Remembered leading bytes, or None (never reads the file)
+    """
+    data = in_memory(filepath)
+    if data is not None:
+        return bytes(data[:SNIFF_BYTES])
     try:
-        with open(filepath, 'rb'):
-            pass
-    except PermissionError as e:
-        raise PermissionError(f"Cannot read file: {filepath}") from e
+        key = _head_key(file_path(filepath))
+    except OSError:
+        return None
+    with _head_memo_lock:
+        return _head_memo.get(key)
+
+
+def _content_types_from_head(head: bytes) -> Optional[bytes]:
+    """
+    Find [Content_Types].xml among the local file entries inside head.
+    
+    Returns:
+        Uncompressed XML, or None if it is not fully inside head
+    """
+    offset = 0
+    while offset + _ZIP_LOCAL_HEADER.size <= len(head):
+        (signature, _, flags, method, _, _, _, compressed_size, _,
+         name_length, extra_length) = _ZIP_LOCAL_HEADER.unpack_from(head, offset)
+        if signature != _ZIP_LOCAL_SIGNATURE or flags & 0x08:
+            return None  # Sizes unknown (data descriptor): cannot skip entry
+        start = offset + _ZIP_LOCAL_HEADER.size
+        name = head[start:start + name_length]
+        data_start = start + name_length + extra_length
+        data_end = data_start + compressed_size
+        if data_end > len(head):
+            return None
+        if name == b"[Content_Types].xml":
+            data = head[data_start:data_end]
+            if method == zipfile.ZIP_STORED:
+                return data
+            if method == zipfile.ZIP_DEFLATED:
+                try:
+                    return zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+                except zlib.error:
+                    return None
+            return None
+        offset = data_end
+    return None
+
+
+def zip_content_types(filepath: Source, head: bytes) -> FrozenSet[str]:
+    """
+    Collect the content types declared by a ZIP package.
+    
+    Reads [Content_Types].xml from the already-read head when the package
+    stores it first; otherwise opens the archive's central directory.
+    
+    Args:
+        filepath: ZIP package
+        head: Leading bytes of the file (from read_head)
+        
+    Returns:
+        ContentType values of all Default/Override entries (empty if the
+        file is not a readable OPC package)
+    """
+    xml = _content_types_from_head(head)
+    if xml is None:
+        try:
+            with zipfile.ZipFile(as_input(filepath)) as archive:
+                xml = archive.read("[Content_Types].xml")
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return frozenset()
+    return frozenset(
+        value.decode('utf-8', 'replace')
+        for value in _CONTENT_TYPE_ATTRIBUTE.findall(xml)
+    )
+
+
+def validate_file_exists(filepath: Source) -> None:
+    """
+    Validate that a file exists and is readable, without opening it.
+    
+    Readability is checked with os.access(), so validation adds no open
+    of its own. Files on disk are still opened separately by the content
+    sniff in get_reader() (read_head(), plus the ZIP directory when the
+    head does not hold [Content_Types].xml) before the reader opens them.
+    In-memory sources are always valid.
+    
+    Args:
+        filepath: Path to validate
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        PermissionError: If file exists but cannot be read
+    """
+    if in_memory(filepath) is not None:
+        return
+    filepath = file_path(filepath)
+    with phase("validate"):
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+        
+        if not filepath.is_file():
+            raise ValueError(f"Path is not a file: {filepath}")
+        
+        # Already read by get_reader()'s sniffing, so it is readable
+        if cached_head(filepath) is not None:
+            return
+        
+        if not os.access(filepath, os.R_OK):
+            raise PermissionError(f"Cannot read file: {filepath}")
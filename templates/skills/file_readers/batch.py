@@ -0,0 +1,451 @@
+"""
+Batch Extraction - Process Pool Fan-out for Document Corpora
+
+Extracts text from many files in a single interpreter, amortizing
+interpreter startup, `uv` environment resolution and library imports
+across the whole corpus instead of paying them once per document.
+
+Features:
+- Directory walking (recursive) filtered to registered extensions
+- Process pool of reader workers (configurable worker count)
+- Ordered (input order) or unordered (completion order) results
+- Bounded number of in-flight tasks (memory independent of corpus size)
+- Per-file error capture (one bad file never aborts the batch)
+- Crashed workers (segfault, OOM kill) fail only their own file: the pool
+  is rebuilt and the remaining files are resubmitted
+- The per-document timeout is also enforced from the parent: a worker
+  overrunning it (e.g. stuck in C code) is killed and replaced
+- Workers share the parent's extraction cache configuration
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Pipeline (fan-out / fan-in)
+
+Invariant:
+    ∀ path ∈ paths: |{r ∈ extract_many(paths) : r.path = path}| = 1
+    ∧ ordered ⇒ results follow input order
+"""
+
+import os
+import time
+from concurrent.futures import (FIRST_COMPLETED, Future, ProcessPoolExecutor,
+                                TimeoutError, wait)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .base import AbstractFileReader, CorruptedFileError, FileReaderError
+from .cache import ExtractionCache
+from .limits import ResourceLimits, apply_memory_limit
+
+# In-flight tasks per worker: keeps workers busy without queueing the
+# whole corpus (and its results) in memory at once.
+_TASKS_PER_WORKER = 4
+
+# Seconds a worker may overrun the per-document timeout before the parent
+# kills it; the worker's own limit check normally reports first
+_KILL_GRACE = 2.0
+
+_CRASHED = "Worker process died while extracting (crash or out-of-memory kill)"
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of extracting a single file in a batch.
+    
+    Attributes:
+        path: Input path (as submitted)
+        text: Extracted text (None if extraction failed)
+        error: Error message (None if extraction succeeded)
+        unexpected: True if the error was not a file/reader error
+        cache_hit: Whether the text came from the extraction cache
+            (None if caching is disabled)
+    """
+    path: Path
+    text: Optional[str] = None
+    error: Optional[str] = None
+    unexpected: bool = False
+    cache_hit: Optional[bool] = None
+    
+    @property
+    def ok(self) -> bool:
+        """True if text was extracted successfully."""
+        return self.error is None
+
+
+def _extract_one(path: Path, fmt: Optional[str] = None,
+                 max_chars: Optional[int] = None) -> BatchResult:
+    """
+    Extract a single file (worker entry point).
+    
+    Must stay a module-level function so it can be pickled and sent
+    to pool workers.
+    
+    Args:
+        path: File to extract
+        fmt: Forced format (extension without dot), or None to auto-detect
+        max_chars: Extract only this many leading characters (head())
+    
+    Returns:
+        BatchResult with either text or error populated
+    """
+    cache = AbstractFileReader.cache
+    hits_before = cache.hits if cache is not None else 0
+    try:
+        selector = path.with_suffix(f".{fmt}") if fmt else path
+        reader = AbstractFileReader.get_reader(selector, sniff=fmt is None)
+        text = reader.read(path) if max_chars is None else reader.head(path, max_chars)
+        # Previews bypass the cache
+        use_cache = cache is not None and max_chars is None
+        cache_hit = cache.hits > hits_before if use_cache else None
+        return BatchResult(path=path, text=text, cache_hit=cache_hit)
+    except (FileNotFoundError, PermissionError, ValueError, FileReaderError) as e:
+        return BatchResult(path=path, error=str(e))
+    except Exception as e:
+        return BatchResult(
+            path=path,
+            error=f"{type(e).__name__}: {e}",
+            unexpected=True
+        )
+
+
+def _init_worker(cache: Optional[ExtractionCache],
+                 limits: Optional[ResourceLimits] = None) -> None:
+    """
+    Pool initializer: share the parent's cache and limit configuration.
+    
+    Needed for 'spawn'/'forkserver' start methods, where workers import
+    the package fresh instead of inheriting the parent's class state.
+    The memory cap is applied here, so it bounds each worker process.
+    """
+    AbstractFileReader.set_cache(cache)
+    AbstractFileReader.set_limits(limits)
+    if limits is not None:
+        apply_memory_limit(limits.max_memory_mb)
+
+
+@dataclass
+class _Task:
+    """A file submitted to the pool (index = position in the input)."""
+    index: int
+    path: Path
+    future: Future
+    deadline: Optional[float]
+
+
+class _WorkerPool:
+    """
+    Process pool that can be killed and rebuilt in the middle of a batch.
+    
+    ProcessPoolExecutor cannot stop a single worker, and one dying worker
+    breaks the whole executor: every task still in it fails with
+    BrokenProcessPool. The caller decides which of those tasks to
+    resubmit; the next submit() starts a fresh executor.
+    """
+    
+    def __init__(self, workers: int, fmt: Optional[str],
+                 max_chars: Optional[int], timeout: Optional[float]):
+        self.workers = workers
+        self.fmt = fmt
+        self.max_chars = max_chars
+        self.timeout = timeout
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def submit(self, index: int, path: Path) -> _Task:
+        """Submit one file; its deadline counts from now."""
+        if self._executor is None:
+            self._executor = worker_pool(self.workers)
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout + _KILL_GRACE
+        future = self._executor.submit(_extract_one, path, self.fmt, self.max_chars)
+        return _Task(index, path, future, deadline)
+    
+    def kill(self) -> None:
+        """Kill every worker; unfinished tasks fail with BrokenProcessPool."""
+        if self._executor is None:
+            return
+        # No public API terminates the workers of a ProcessPoolExecutor
+        for process in list((self._executor._processes or {}).values()):
+            process.kill()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+    
+    def close(self) -> None:
+        """Let running tasks finish, drop queued ones and stop the workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+def _timed_out(path: Path, timeout: float) -> BatchResult:
+    """Result of a file whose worker was killed for overrunning the timeout."""
+    return BatchResult(
+        path=path,
+        error=f"Extraction exceeded the {timeout:g}s time limit (worker killed)",
+    )
+
+
+def _run_isolated(path: Path, fmt: Optional[str], max_chars: Optional[int],
+                  timeout: Optional[float]) -> BatchResult:
+    """
+    Extract one file in a worker of its own.
+    
+    Used for the files that were in a pool when a worker died: run alone,
+    a file that crashes its worker again is the culprit, the others
+    extract normally.
+    """
+    pool = _WorkerPool(1, fmt, max_chars, timeout)
+    try:
+        task = pool.submit(0, path)
+        wait_for = None if task.deadline is None else task.deadline - time.monotonic()
+        try:
+            return task.future.result(timeout=wait_for)
+        except BrokenProcessPool:
+            return BatchResult(path=path, error=_CRASHED, unexpected=True)
+        except TimeoutError:
+            pool.kill()
+            return _timed_out(path, timeout)
+    finally:
+        pool.close()
+
+
+def worker_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Process pool whose workers share this process's cache and limits.
+    
+    Also used by readers that split one document across processes (PDF
+    page shards, XLSX sheets), so their workers get the resource limits
+    and memory cap under 'spawn' as well.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(AbstractFileReader.cache, AbstractFileReader.limits),
+    )
+
+
+def worker_result(future: Future, filepath: Any) -> Any:
+    """
+    Return the result of a worker extracting part of a document.
+    
+    Reader errors (including ResourceLimitExceeded) pass through; a dead
+    worker (crash, out-of-memory kill) and library exceptions become
+    CorruptedFileError, so callers report them like any unreadable file.
+    
+    Args:
+        future: Worker task
+        filepath: Document being extracted (for the message)
+        
+    Raises:
+        FileReaderError: If the worker failed
+    """
+    try:
+        return future.result()
+    except FileReaderError:
+        raise
+    except BrokenProcessPool as e:
+        raise CorruptedFileError(
+            f"Worker process died while extracting {filepath} (crash or out-of-memory kill)"
+        ) from e
+    except Exception as e:
+        raise CorruptedFileError(
+            f"Failed to extract {filepath}: {type(e).__name__}: {e}"
+        ) from e
+
+
+def iter_files(root: Path, recursive: bool = True) -> Iterator[Path]:
+    """
+    Yield files under a directory that have a registered reader.
+    
+    Files are yielded in sorted order so batch output is deterministic.
+    Hidden files and directories (leading dot) are skipped.
+    
+    Args:
+        root: Directory to walk
+        recursive: Descend into subdirectories
+    
+    Yields:
+        Paths of supported files
+    
+    Raises:
+        NotADirectoryError: If root is not a directory
+    """
+    for dirpath, name in walk_supported(root, recursive):
+        yield Path(dirpath) / name
+
+
+def walk_supported(
+    root: Path,
+    recursive: bool = True,
+    extensions: Optional[Iterable[str]] = None,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a directory like iter_files(), as plain (dirpath, name) strings.
+    
+    Avoids building Path objects, for callers that touch every file of a
+    large corpus (e.g. sync's stat-only change detection).
+    
+    Args:
+        root: Directory to walk
+        recursive: Descend into subdirectories
+        extensions: Extensions to yield, lower case without dot
+            (default: the registered reader formats)
+    
+    Yields:
+        (directory path, file name) of matching files, in sorted order
+    
+    Raises:
+        NotADirectoryError: If root is not a directory
+    """
+    if not root.is_dir():
+        raise NotADirectoryError(f"Not a directory: {root}")
+    
+    if extensions is None:
+        extensions = AbstractFileReader.list_supported_formats()
+    supported = set(extensions)
+    
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Prune in place so os.walk skips hidden directories entirely
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+        for name in sorted(filenames):
+            if name.startswith('.'):
+                continue
+            extension = os.path.splitext(name)[1].lstrip('.').lower()
+            if extension in supported:
+                yield dirpath, name
+        if not recursive:
+            break
+
+
+def extract_many(
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    fmt: Optional[str] = None,
+    max_chars: Optional[int] = None,
+) -> Iterator[BatchResult]:
+    """
+    Extract text from many files using a process pool.
+    
+    Paths are consumed lazily and at most `workers * 4` tasks (`workers`
+    with a timeout limit) are in flight at any time, so generator inputs
+    (directory walks, stdin) are streamed rather than materialized.
+    
+    A worker that dies fails only the file it was extracting, and with a
+    timeout limit the parent kills workers that overrun it (see
+    _extract_pooled()); workers=1 has neither safeguard.
+    
+    Args:
+        paths: Files to extract
+        workers: Worker processes (default: os.cpu_count()).
+            1 runs in-process without a pool.
+        ordered: Yield results in input order (True) or completion order (False)
+        fmt: Force a format for every file (extension without dot)
+        max_chars: Preview mode: extract only the first max_chars
+            characters of each file, stopping its reader there
+    
+    Yields:
+        One BatchResult per input path
+    
+    Example:
+        >>> for result in extract_many(iter_files(Path("docs")), workers=8):
+        ...     if result.ok:
+        ...         print(result.path, len(result.text))
+    """
+    workers = workers or os.cpu_count() or 1
+    
+    if workers <= 1:
+        for path in paths:
+            yield _extract_one(Path(path), fmt, max_chars)
+        return
+    
+    yield from _extract_pooled(paths, workers, ordered, fmt, max_chars)
+
+
+def _extract_pooled(
+    paths: Iterable[Path],
+    workers: int,
+    ordered: bool,
+    fmt: Optional[str],
+    max_chars: Optional[int],
+) -> Iterator[BatchResult]:
+    """
+    extract_many() over a process pool that survives dying workers.
+    
+    When a worker dies (segfault, OOM kill, address-space cap inside C
+    code), every file in the pool fails with BrokenProcessPool; each is
+    re-run alone (_run_isolated()), so only the culprit is reported as
+    failed, and the batch goes on with a fresh pool. With a timeout
+    configured, a file still running timeout + _KILL_GRACE seconds after
+    submission gets a timeout error and the pool is killed; the other
+    files it held are resubmitted.
+    """
+    limits = AbstractFileReader.limits
+    timeout = limits.timeout if limits is not None else None
+    # With a timeout, every task starts as soon as it is submitted, so
+    # its deadline can be counted from submission
+    max_in_flight = workers if timeout is not None else workers * _TASKS_PER_WORKER
+    pool = _WorkerPool(workers, fmt, max_chars, timeout)
+    path_iter = iter(paths)
+    running: List[_Task] = []
+    finished: Dict[int, BatchResult] = {}
+    submitted = yielded = 0
+    
+    try:
+        while True:
+            while submitted - yielded < max_in_flight:
+                path = next(path_iter, None)
+                if path is None:
+                    break
+                running.append(pool.submit(submitted, Path(path)))
+                submitted += 1
+            if not running:
+                break
+            
+            deadlines = [task.deadline for task in running if task.deadline is not None]
+            wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            wait([task.future for task in running], timeout=wait_for,
+                 return_when=FIRST_COMPLETED)
+            
+            now = time.monotonic()
+            crashed: List[_Task] = []
+            overran: List[_Task] = []
+            pending: List[_Task] = []
+            for task in running:
+                if task.future.done():
+                    try:
+                        finished[task.index] = task.future.result()
+                    except BrokenProcessPool:
+                        crashed.append(task)
+                elif task.deadline is not None and now > task.deadline:
+                    overran.append(task)
+                else:
+                    pending.append(task)
+            running = pending
+            
+            if crashed or overran:
+                pool.kill()
+                for task in overran:
+                    finished[task.index] = _timed_out(task.path, timeout)
+                for task in crashed:
+                    finished[task.index] = _run_isolated(task.path, fmt, max_chars, timeout)
+                # Files that only shared the killed pool start over
+                running = []
+                for task in pending:
+                    future = task.future
+                    if future.done() and not future.cancelled() and future.exception() is None:
+                        finished[task.index] = future.result()
+                    else:
+                        running.append(pool.submit(task.index, task.path))
+            
+            if ordered:
+                while yielded in finished:
+                    yield finished.pop(yielded)
+                    yielded += 1
+            else:
+                for index in list(finished):
+                    yield finished.pop(index)
+                    yielded += 1
+    finally:
+        pool.close()
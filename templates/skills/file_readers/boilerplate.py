@@ -0,0 +1,271 @@
+"""
+Boilerplate - Stripping Repeated Headers, Footers and Page Numbers
+
+A long PDF repeats its running header, footer and page number on every
+page, and a DOCX with many sections repeats the same header/footer entry
+per section. This filter drops those repeats from a reader's text stream.
+
+Candidates are the lines boilerplate can occupy:
+
+- The first and last EDGE_LINES non-blank lines of each PDF page (between
+  === PAGE n === markers), leaving at least the middle line of a short
+  page out
+- DOCX header/footer entries ("[HEADER_S2] ...", one line each)
+
+Everything else (DOCX body, XLSX rows, markers, blank lines) passes
+through untouched. A candidate is normalised (whitespace collapsed,
+digits replaced by '#', so "Page 7 of 400" matches "Page 8 of 400") and
+counted once per page in a Count-Min sketch: a fixed table of
+SKETCH_DEPTH x SKETCH_WIDTH counters whose estimates never undercount,
+so memory does not grow with the document or the number of distinct
+lines. A line seen on at least min_repeats pages is boilerplate: its
+first occurrence is kept and the repeats are dropped.
+
+The first `warmup` pages are held back until they are counted, so a
+header repeated from page 1 is dropped from page 2 on; after that the
+filter streams page by page. Memory stays bounded by the warmup pages,
+the current page and the sketch.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Pipeline Stage (stream → filtered stream)
+
+Invariant:
+    output = input without the dropped candidate lines (order kept)
+    ∧ stats.bytes_in - stats.bytes_out = UTF-8 size of the dropped lines
+"""
+
+import hashlib
+import re
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
+
+from .chunking import _SECTION_MARKER, _iter_lines
+
+# Non-blank lines at the top and bottom of a page that may be boilerplate
+EDGE_LINES = 3
+
+# Pages a line must appear on to be boilerplate
+DEFAULT_MIN_REPEATS = 3
+
+# Pages held back (and counted) before the first one is emitted
+DEFAULT_WARMUP = 8
+
+# Count-Min sketch shape: 4 x 4096 32-bit counters (64 KiB)
+SKETCH_WIDTH = 4096
+SKETCH_DEPTH = 4
+
+# Longer lines are body text, never boilerplate
+_MAX_CANDIDATE_CHARS = 200
+
+_PAGE_MARKER = re.compile(r"=== PAGE \d+ ===\n?")
+_HEADER_FOOTER = re.compile(r"\[(?:FIRST_PAGE_|EVEN_PAGE_)?(?:HEADER|FOOTER)_S\d+\] ")
+_DIGITS = re.compile(r"\d+")
+_SPACE = re.compile(r"\s+")
+
+# Lines of one page or entry, each with its candidate key (None: kept)
+_Section = List[Tuple[str, Optional[str]]]
+
+
+@dataclass
+class BoilerplateStats:
+    """
+    What a BoilerplateFilter removed, over all the text it filtered.
+    
+    Attributes:
+        lines_dropped: Repeated lines removed
+        bytes_in: UTF-8 bytes of the text received
+        bytes_out: UTF-8 bytes of the text emitted
+    """
+    lines_dropped: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    
+    @property
+    def bytes_saved(self) -> int:
+        """UTF-8 bytes removed."""
+        return self.bytes_in - self.bytes_out
+    
+    def format(self) -> str:
+        """Human-readable one-line summary."""
+        share = f"{self.bytes_saved / self.bytes_in:.1%}" if self.bytes_in else "n/a"
+        return (
+            f"Boilerplate: {self.lines_dropped} lines dropped, "
+            f"{self.bytes_saved / 1024:.1f} KB of {self.bytes_in / 1024:.1f} KB "
+            f"saved ({share})"
+        )
+
+
+class _CountMinSketch:
+    """Approximate counts in fixed memory (estimates never undercount)."""
+    
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH):
+        self.width = width
+        self._rows = [array("I", [0]) * width for _ in range(depth)]
+    
+    def _cells(self, key: str) -> List[int]:
+        """One counter index per row (double hashing of a 128-bit digest)."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        step = int.from_bytes(digest[8:], "little") | 1
+        return [(first + row * step) % self.width for row in range(len(self._rows))]
+    
+    def estimate(self, key: str) -> int:
+        """Upper bound of the count of key."""
+        return min(row[cell] for row, cell in zip(self._rows, self._cells(key)))
+    
+    def add(self, key: str) -> int:
+        """
+        Count key once and return its new estimate.
+        
+        Conservative update: only the counters at the minimum grow, which
+        keeps collisions from inflating other keys' estimates.
+        """
+        cells = self._cells(key)
+        count = min(row[cell] for row, cell in zip(self._rows, cells)) + 1
+        for row, cell in zip(self._rows, cells):
+            if row[cell] < count:
+                row[cell] = count
+        return count
+
+
+class BoilerplateFilter:
+    """
+    Drop lines repeated across pages from streamed reader output.
+    
+    Each filter() call is one document with its own sketch; stats add up
+    over all calls, so one filter can serve a whole batch.
+    
+    Example:
+        >>> strip = BoilerplateFilter()
+        >>> for text in strip.filter(reader.stream(path)):
+        ...     sys.stdout.write(text)
+        >>> print(strip.stats.format())
+    """
+    
+    def __init__(
+        self,
+        min_repeats: int = DEFAULT_MIN_REPEATS,
+        edge_lines: int = EDGE_LINES,
+        warmup: int = DEFAULT_WARMUP,
+    ):
+        """
+        Initialize the filter.
+        
+        Args:
+            min_repeats: Pages a line must appear on to be dropped
+            edge_lines: Non-blank lines at each end of a page considered
+            warmup: Pages counted before the first is emitted
+            
+        Raises:
+            ValueError: If min_repeats < 2, or edge_lines or warmup < 1
+        """
+        if min_repeats < 2:
+            raise ValueError(f"min_repeats must be at least 2, got {min_repeats}")
+        if edge_lines < 1 or warmup < 1:
+            raise ValueError("edge_lines and warmup must be at least 1")
+        self.min_repeats = min_repeats
+        self.edge_lines = edge_lines
+        self.warmup = warmup
+        self.stats = BoilerplateStats()
+    
+    def filter(self, parts: Iterable[str]) -> Iterator[str]:
+        """
+        Filter a text given as consecutive parts (e.g. reader.stream()).
+        
+        Args:
+            parts: Text fragments, consumed lazily; their boundaries do not
+                matter
+                
+        Yields:
+            The text without boilerplate repeats, one page (or line
+            outside pages) at a time
+        """
+        sketch = _CountMinSketch()
+        held: List[Tuple[_Section, Set[str]]] = []
+        held_pages = 0
+        
+        for section in self._iter_sections(_iter_lines(parts)):
+            keys = {key for _, key in section if key is not None}
+            if held_pages < self.warmup:
+                if not keys and not held:
+                    yield from self._emit(section, set())
+                    continue
+                for key in keys:
+                    sketch.add(key)
+                held.append((section, keys))
+                if keys:
+                    held_pages += 1
+                    if held_pages == self.warmup:
+                        yield from self._release(held, sketch)
+                        held = []
+                continue
+            # Past the warmup, a key's count so far includes this page
+            drop = {key for key in keys if sketch.add(key) >= self.min_repeats}
+            yield from self._emit(section, drop)
+        
+        yield from self._release(held, sketch)
+    
+    def _release(self, held: List[Tuple[_Section, Set[str]]],
+                 sketch: _CountMinSketch) -> Iterator[str]:
+        """Emit the warmup pages, keeping each repeat's first occurrence."""
+        seen: Set[str] = set()
+        for section, keys in held:
+            drop = {key for key in keys
+                    if key in seen and sketch.estimate(key) >= self.min_repeats}
+            seen |= keys
+            yield from self._emit(section, drop)
+    
+    def _emit(self, section: _Section, drop: Set[str]) -> Iterator[str]:
+        """Yield a section without its dropped lines, updating stats."""
+        kept = []
+        for line, key in section:
+            size = len(line.encode("utf-8"))
+            self.stats.bytes_in += size
+            if key is not None and key in drop:
+                self.stats.lines_dropped += 1
+                continue
+            self.stats.bytes_out += size
+            kept.append(line)
+        if kept:
+            yield "".join(kept)
+    
+    def _iter_sections(self, lines: Iterable[str]) -> Iterator[_Section]:
+        """Group lines into pages, header/footer entries and other lines."""
+        page: Optional[List[str]] = None
+        for line in lines:
+            bare = line.lstrip("\n")
+            if _SECTION_MARKER.fullmatch(bare):
+                if page is not None:
+                    yield self._page_section(page)
+                if _PAGE_MARKER.fullmatch(bare):
+                    page = [line]
+                else:
+                    page = None
+                    yield [(line, None)]
+            elif page is not None:
+                page.append(line)
+            elif _HEADER_FOOTER.match(bare):
+                yield [(line, _candidate_key(line))]
+            else:
+                yield [(line, None)]
+        if page is not None:
+            yield self._page_section(page)
+    
+    def _page_section(self, page: List[str]) -> _Section:
+        """Key the edge lines of a page (marker first, then its text)."""
+        content = [index for index in range(1, len(page)) if page[index].strip()]
+        # Zones never meet: a page keeps at least its middle line
+        edge = min(self.edge_lines, (len(content) - 1) // 2)
+        edges = set(content[:edge] + content[len(content) - edge:])
+        return [(line, _candidate_key(line) if index in edges else None)
+                for index, line in enumerate(page)]
+
+
+def _candidate_key(line: str) -> Optional[str]:
+    """Normalised form of a candidate line (None if too long to be one)."""
+    text = _SPACE.sub(" ", line.strip())
+    if len(text) > _MAX_CANDIDATE_CHARS:
+        return None
+    return _DIGITS.sub("#", text)
@@ -0,0 +1,285 @@
+"""
+Extraction Cache - Content-Addressed On-Disk Text Cache
+
+Stores extracted text keyed by the file's content hash plus the reader
+that produced it, so re-reading an unchanged document costs one hash and
+one file read instead of a full PyMuPDF/openpyxl/python-docx parse.
+
+Features:
+- Content-addressed keys (renames/copies of a file share one entry)
+- Reader class + reader version in the key (upgrades invalidate entries)
+- Atomic writes (temp file + rename), safe across batch worker processes
+- LRU eviction under a byte budget (entry mtime = last access time);
+  puts keep a running byte total and only rescan the directory when it
+  crosses the budget, so N puts cost O(N) stat calls, not O(N²)
+
+Layout:
+    .sia/cache/extract/<key[:2]>/<key>.txt
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Cache-Aside (read-through via AbstractFileReader.stream)
+
+Invariant:
+    cache.get(key_for(f, r)) ∈ {None, r.read(f)}
+    ∧ Σ size(entries) ≤ max_bytes (after every put)
+"""
+
+import hashlib
+import os
+import tempfile
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+from .base import SNIFF_BYTES, cached_head
+from .source import Source, file_path, in_memory
+
+if TYPE_CHECKING:
+    from .base import AbstractFileReader
+
+DEFAULT_CACHE_DIR = Path(".sia") / "cache" / "extract"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Eviction frees space down to this share of the budget, so a full cache
+# rescans once per few puts rather than on every put
+_EVICT_TO = 0.9
+
+# Read size for hashing: large enough to keep syscall overhead negligible
+_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+def hash_file(filepath: Source) -> str:
+    """
+    Compute the SHA-256 content hash of a file.
+    
+    Args:
+        filepath: File to hash (or in-memory DocumentSource)
+    
+    Returns:
+        Hex digest of the file content
+    """
+    data = in_memory(filepath)
+    if data is not None:
+        return hashlib.sha256(data).hexdigest()
+    digest = hashlib.sha256()
+    # Files shorter than the sniffed head were read completely already
+    head = cached_head(filepath)
+    if head is not None and len(head) < SNIFF_BYTES:
+        digest.update(head)
+        return digest.hexdigest()
+    
+    with open(file_path(filepath), 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """
+    Snapshot of cache usage.
+    
+    Attributes:
+        entries: Number of cached extractions on disk
+        total_bytes: Bytes used by cached extractions
+        max_bytes: Configured byte budget
+        hits: Lookups served from the cache (this instance)
+        misses: Lookups that required extraction (this instance)
+        evictions: Entries removed to honour the budget (this instance)
+    """
+    entries: int
+    total_bytes: int
+    max_bytes: int
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    
+    def format(self) -> str:
+        """Human-readable one-line summary."""
+        lookups = self.hits + self.misses
+        hit_rate = f"{self.hits / lookups:.0%}" if lookups else "n/a"
+        return (
+            f"Extraction cache: {self.entries} entries, "
+            f"{self.total_bytes / 1024 / 1024:.1f} MB / "
+            f"{self.max_bytes / 1024 / 1024:.1f} MB, "
+            f"hits={self.hits} misses={self.misses} "
+            f"(hit rate {hit_rate}), evictions={self.evictions}"
+        )
+
+
+class ExtractionCache:
+    """
+    Content-addressed, size-bounded LRU cache of extracted text.
+    
+    Entries are plain UTF-8 text files, written and read without newline
+    translation so they hold exactly the extracted text. A hit refreshes the entry's mtime,
+    which is what eviction orders by, so the least recently *used* entries
+    are removed first when a put pushes the cache over its budget.
+    
+    Example:
+        >>> cache = ExtractionCache(max_bytes=256 * 1024 * 1024)
+        >>> AbstractFileReader.set_cache(cache)
+        >>> text = AbstractFileReader.get_reader(path).read(path)  # miss
+        >>> text = AbstractFileReader.get_reader(path).read(path)  # hit
+    
+    Attributes:
+        root: Cache directory
+        max_bytes: Byte budget for all entries
+    """
+    
+    def __init__(self, root: Path = DEFAULT_CACHE_DIR,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # Bytes on disk as of the last scan plus this instance's puts
+        # (None until the first put scans); other processes' writes are
+        # picked up by the rescan that follows crossing the budget
+        self._total: Optional[int] = None
+    
+    def key_for(self, filepath: Source, reader: 'AbstractFileReader') -> str:
+        """
+        Build the cache key for a file as extracted by a given reader.
+        
+        Args:
+            filepath: Source document
+            reader: Reader that will (or did) extract it
+        
+        Returns:
+            Hex key combining content hash and reader identity
+        """
+        content_hash = hash_file(filepath)
+        identity = f"{content_hash}:{reader.cache_token()}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        """Sharded entry location (keeps directories small)."""
+        return self.root / key[:2] / f"{key}.txt"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return cached text for a key, or None on a miss.
+        
+        A hit marks the entry as recently used.
+        """
+        entry = self._entry_path(key)
+        try:
+            # newline='': extracted text may hold '\r' (e.g. XLSX cells)
+            with open(entry, encoding='utf-8', newline='') as f:
+                text = f.read()
+        except (FileNotFoundError, UnicodeDecodeError):
+            self.misses += 1
+            return None
+        
+        try:
+            os.utime(entry)  # LRU bookkeeping
+        except OSError:
+            pass  # Entry evicted concurrently; the text is still valid
+        self.hits += 1
+        return text
+    
+    def put(self, key: str, text: str) -> None:
+        """Store text for a key (atomic), then enforce the byte budget."""
+        with self.writer(key) as sink:
+            sink.write(text)
+    
+    @contextmanager
+    def writer(self, key: str) -> Iterator[IO[str]]:
+        """
+        Stream text into a new entry.
+        
+        The entry only becomes visible if the block completes without an
+        exception; partial output (errors, early termination) is discarded.
+        
+        Yields:
+            Writable text stream
+        """
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=entry.parent, suffix='.tmp')
+        committed = False
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='') as sink:
+                yield sink
+            os.replace(tmp_name, entry)
+            committed = True
+        finally:
+            if not committed:
+                try:
+                    os.unlink(tmp_name)
+                except FileNotFoundError:
+                    pass
+        self._account(entry)
+    
+    def _account(self, entry: Path) -> None:
+        """Add a new entry to the running total; evict once over budget."""
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self._scan())
+        else:
+            try:
+                self._total += entry.stat().st_size
+            except FileNotFoundError:
+                pass  # Evicted concurrently
+        if self._total > self.max_bytes:
+            self._evict()
+    
+    def _scan(self) -> List[Tuple[float, int, Path]]:
+        """List (mtime, size, path) for every committed entry."""
+        entries = []
+        if not self.root.is_dir():
+            return entries
+        for shard in os.scandir(self.root):
+            if not shard.is_dir():
+                continue
+            for item in os.scandir(shard.path):
+                if not item.name.endswith('.txt'):
+                    continue
+                try:
+                    stat = item.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, Path(item.path)))
+        return entries
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries once over the byte budget."""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            target = self.max_bytes * _EVICT_TO
+            for _, size, path in sorted(entries):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    continue  # Already evicted by another process
+                self.evictions += 1
+                total -= size
+                if total <= target:
+                    break
+        self._total = total
+    
+    def stats(self) -> CacheStats:
+        """Return current usage and this instance's hit/miss counters."""
+        entries = self._scan()
+        self._total = sum(size for _, size, _ in entries)
+        return CacheStats(
+            entries=len(entries),
+            total_bytes=self._total,
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+    
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for _, _, path in self._scan():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        self._total = 0
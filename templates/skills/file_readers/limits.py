@@ -0,0 +1,302 @@
+"""
+Resource Limits - Watchdog for Pathological Documents
+
+A malformed or malicious file (deeply nested PDF objects, a ZIP bomb
+named .xlsx, a sheet with millions of rows) must not hold a batch worker
+forever. Limits are configured once and checked on every extraction:
+
+- timeout: wall-clock seconds per document (checked between pages/rows;
+  in a process's main thread an interval timer also interrupts a single
+  long step that returns to Python). Neither can stop a reader stuck in
+  C code, so batch extraction also enforces it from the parent process,
+  killing and replacing a worker that overruns it
+- max_memory_mb: address-space cap (setrlimit RLIMIT_AS) for processes
+  dedicated to extraction (CLI, batch workers); allocations beyond it fail
+- max_pages / max_rows: PDF pages and XLSX rows extracted per document
+- max_output_bytes: UTF-8 size of the extracted text
+- max_zip_ratio: uncompressed/compressed size of ZIP-based formats
+  (DOCX, XLSX), checked from the ZIP directory before parsing
+
+Exceeding a limit raises ResourceLimitExceeded, a FileReaderError, so batch
+extraction records it per file and moves on.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Guard (Watchdog) around the extraction stream
+
+Invariant:
+    limits set ⇒ ∀ f: stream(f) yields ≤ max_output_bytes of text
+    within ≈ timeout seconds, or raises ResourceLimitExceeded
+"""
+
+import signal
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+from .base import CorruptedFileError, ResourceLimitExceeded
+from .source import Source, as_input
+
+if TYPE_CHECKING:
+    from .base import AbstractFileReader
+
+# Members smaller than this are not judged by their own ratio: tiny
+# repetitive XML parts compress extremely well without being a threat
+_MIN_MEMBER_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """
+    Per-document extraction limits (None = unlimited).
+    
+    Attributes:
+        timeout: Wall-clock seconds per document
+        max_memory_mb: Address-space cap in MB for extraction processes
+            (applied by apply_memory_limit(), not per document)
+        max_pages: PDF pages extracted per document
+        max_rows: XLSX rows extracted per document (all sheets)
+        max_output_bytes: UTF-8 bytes of extracted text per document
+        max_zip_ratio: Uncompressed/compressed size ratio of ZIP packages,
+            for the whole archive and for each member of 1 MiB or more
+            
+    Example:
+        >>> AbstractFileReader.set_limits(ResourceLimits(timeout=60, max_zip_ratio=100))
+    """
+    timeout: Optional[float] = None
+    max_memory_mb: Optional[int] = None
+    max_pages: Optional[int] = None
+    max_rows: Optional[int] = None
+    max_output_bytes: Optional[int] = None
+    max_zip_ratio: Optional[float] = None
+    
+    def __post_init__(self):
+        for limit in fields(self):
+            value = getattr(self, limit.name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{limit.name} must be positive, got {value}")
+    
+    def check_pages(self, count: int) -> None:
+        """
+        Check the number of PDF pages selected for extraction.
+        
+        Raises:
+            ResourceLimitExceeded: If count exceeds max_pages
+        """
+        if self.max_pages is not None and count > self.max_pages:
+            raise ResourceLimitExceeded(
+                f"Document has {count} pages to extract (limit: {self.max_pages})"
+            )
+    
+    def check_rows(self, count: int) -> None:
+        """
+        Check the number of XLSX rows extracted so far.
+        
+        Raises:
+            ResourceLimitExceeded: If count exceeds max_rows
+        """
+        if self.max_rows is not None and count > self.max_rows:
+            raise ResourceLimitExceeded(
+                f"Workbook has more than {self.max_rows} rows (limit: {self.max_rows})"
+            )
+    
+    def check_zip(self, filepath: Source) -> None:
+        """
+        Reject ZIP packages that decompress far beyond their size.
+        
+        Only the ZIP directory is read. Declared sizes bound what zipfile
+        will actually inflate (a member inflating past its declared size
+        fails its CRC check), so they can be trusted here.
+        
+        Args:
+            filepath: ZIP-based document
+            
+        Raises:
+            ResourceLimitExceeded: If the archive or a large member
+                exceeds max_zip_ratio
+            CorruptedFileError: If the file is not a valid ZIP archive
+        """
+        if self.max_zip_ratio is None:
+            return
+        try:
+            with zipfile.ZipFile(as_input(filepath)) as archive:
+                members = archive.infolist()
+        except zipfile.BadZipFile as e:
+            raise CorruptedFileError(f"Invalid ZIP package: {e}") from e
+        
+        for member in members:
+            if member.file_size >= _MIN_MEMBER_BYTES:
+                self._check_ratio(member.file_size, member.compress_size, member.filename)
+        self._check_ratio(
+            sum(member.file_size for member in members),
+            sum(member.compress_size for member in members),
+            "archive",
+        )
+    
+    def _check_ratio(self, uncompressed: int, compressed: int, what: str) -> None:
+        """Raise if uncompressed/compressed exceeds max_zip_ratio."""
+        ratio = uncompressed / max(compressed, 1)
+        if ratio > self.max_zip_ratio:
+            raise ResourceLimitExceeded(
+                f"ZIP {what} expands {ratio:.0f}x ({compressed} -> {uncompressed} bytes; "
+                f"limit: {self.max_zip_ratio:g}x) - possible ZIP bomb"
+            )
+    
+    def watch(self, reader: 'AbstractFileReader', filepath: Source,
+              chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Stream a reader's output under the timeout, output and ZIP limits.
+        
+        Args:
+            reader: Reader producing the chunks (ZIP-based if it declares
+                zip_content_types)
+            filepath: Document being extracted
+            chunks: The reader's text stream (consumed lazily)
+            
+        Yields:
+            The chunks, unchanged
+            
+        Raises:
+            ResourceLimitExceeded: When a limit is exceeded, or when the
+                reader runs out of memory
+        """
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        alarm = _Alarm(self.timeout) if self.timeout is not None else None
+        size = 0
+        try:
+            if alarm is not None:
+                alarm.start()
+            if reader.zip_content_types:
+                self.check_zip(filepath)
+            for chunk in alarm.guard(chunks) if alarm is not None else chunks:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise self._timed_out()
+                if self.max_output_bytes is not None:
+                    size += len(chunk) if chunk.isascii() else len(chunk.encode("utf-8"))
+                    if size > self.max_output_bytes:
+                        raise ResourceLimitExceeded(
+                            f"Extracted text exceeds {self.max_output_bytes} bytes"
+                        )
+                yield chunk
+        except ResourceLimitExceeded:
+            raise
+        except Exception as e:
+            # A reader may wrap the interruption in its own error type
+            if deadline is not None and time.monotonic() > deadline:
+                raise self._timed_out() from e
+            if _caused_by_memory_error(e):
+                raise ResourceLimitExceeded(
+                    f"Out of memory while extracting {filepath.name}"
+                ) from e
+            raise
+        finally:
+            if alarm is not None:
+                alarm.stop()
+    
+    def _timed_out(self) -> ResourceLimitExceeded:
+        return ResourceLimitExceeded(f"Extraction exceeded the {self.timeout:g}s time limit")
+
+
+class _Alarm:
+    """
+    Interval timer raising ResourceLimitExceeded in the main thread.
+    
+    Only armed in the main thread of a process whose SIGALRM is otherwise
+    unused (e.g. batch workers, the CLI); elsewhere watch() relies on its
+    deadline checks between chunks. The timer only interrupts the reader
+    while it produces a chunk (see guard()), never the consumer's code.
+    Its handler runs between bytecodes, so a call stuck in C code is
+    only stopped by extract_many() killing the worker.
+    """
+    
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._previous = None
+        self._armed = False
+        self._producing = False
+        self._expired_idle = False
+    
+    def guard(self, chunks: Iterable[str]) -> Iterator[str]:
+        """Yield chunks, marking the time spent producing each one."""
+        iterator = iter(chunks)
+        while True:
+            if self._expired_idle:
+                raise self._error()
+            self._producing = True
+            try:
+                chunk = next(iterator, None)
+            finally:
+                self._producing = False
+            if chunk is None:
+                return
+            yield chunk
+    
+    def start(self) -> None:
+        if not hasattr(signal, "setitimer") \
+                or threading.current_thread() is not threading.main_thread() \
+                or signal.getsignal(signal.SIGALRM) not in (signal.SIG_DFL, None) \
+                or signal.getitimer(signal.ITIMER_REAL)[0] > 0:
+            return
+        self._previous = signal.signal(signal.SIGALRM, self._expired)
+        signal.setitimer(signal.ITIMER_REAL, self.timeout)
+        self._armed = True
+    
+    def stop(self) -> None:
+        if self._armed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous)
+            self._armed = False
+    
+    def _expired(self, signum, frame) -> None:
+        # Expiring between chunks is reported when the next one is requested
+        if not self._producing:
+            self._expired_idle = True
+            return
+        raise self._error()
+    
+    def _error(self) -> ResourceLimitExceeded:
+        return ResourceLimitExceeded(f"Extraction exceeded the {self.timeout:g}s time limit")
+
+
+def _caused_by_memory_error(error: BaseException) -> bool:
+    """True if error is, or was raised while handling, a MemoryError."""
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, MemoryError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def apply_memory_limit(max_memory_mb: Optional[int]) -> bool:
+    """
+    Cap this process's address space (RLIMIT_AS), e.g. in a batch worker.
+    
+    Allocations beyond the cap fail with MemoryError instead of exhausting
+    the machine; watch() reports them as ResourceLimitExceeded. Child
+    processes inherit the cap. The limit is on virtual memory, which
+    RSS never exceeds (RLIMIT_RSS is not enforced by Linux).
+    
+    Args:
+        max_memory_mb: Cap in MB (None = leave unlimited)
+        
+    Returns:
+        True if the cap was applied, False if unsupported (no resource
+        module, e.g. on Windows) or not requested
+    """
+    if max_memory_mb is None:
+        return False
+    try:
+        import resource
+    except ImportError:
+        return False
+    
+    limit = max_memory_mb * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+    return True
@@ -0,0 +1,192 @@
+"""
+Probe - Document Metadata Without Extraction
+
+Answers "is this file worth extracting?" in milliseconds, whatever the
+document's size. AbstractFileReader.probe() returns a DocumentInfo built
+from metadata only:
+
+- PDF: cross-reference table and page tree (page count, encryption); the
+  text layer and word estimate come from a few sampled pages
+- XLSX: xl/workbook.xml (sheet names), each sheet's <dimension>
+  element (read up to <sheetData>) and its size in the ZIP directory
+- DOCX: docProps/app.xml (pages and words as last saved by the
+  authoring application)
+
+Encrypted Office documents are OLE compound files rather than ZIP
+packages; they are reported as encrypted instead of failing.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Value Object (DocumentInfo)
+
+Invariant:
+    probe(f) never parses page content streams, worksheet rows or the
+    document body (except the sampled PDF pages)
+"""
+
+import re
+import zipfile
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from xml.etree.ElementTree import ParseError, fromstring
+
+from .source import Source, as_source
+
+# Compound File Binary header: password-protected DOCX/XLSX (and legacy .doc/.xls)
+OLE_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+
+_APP_PROPERTIES = "docProps/app.xml"
+_APP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
+
+_CELL_REF = re.compile(r"\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+
+@dataclass
+class SheetInfo:
+    """
+    Declared size of one worksheet.
+    
+    Attributes:
+        name: Sheet name
+        dimension: Used range as declared by the writer (e.g. "A1:F200"),
+            None if the sheet declares none (or is a chartsheet)
+        rows: Rows spanned by the dimension
+        columns: Columns spanned by the dimension
+        xml_bytes: Uncompressed size of the worksheet XML (a size hint
+            when no dimension is declared)
+    """
+    name: str
+    dimension: Optional[str] = None
+    rows: Optional[int] = None
+    columns: Optional[int] = None
+    xml_bytes: Optional[int] = None
+
+
+@dataclass
+class DocumentInfo:
+    """
+    Metadata of a document, gathered without extracting it.
+    
+    Fields a format cannot answer cheaply are None.
+    
+    Attributes:
+        path: Document path
+        format: Reader format (extension without dot)
+        size_bytes: File size
+        encrypted: Password-protected or encrypted (other fields may
+            then be unknown)
+        pages: Page count (PDF: page tree; DOCX: docProps/app.xml)
+        sheets: Worksheets in workbook order (XLSX)
+        words: Word count estimate (PDF: sampled pages; DOCX:
+            docProps/app.xml)
+        text_layer: PDF pages carry extractable text (False suggests a
+            scanned document needing OCR)
+    """
+    path: str
+    format: str
+    size_bytes: int
+    encrypted: bool = False
+    pages: Optional[int] = None
+    sheets: List[SheetInfo] = field(default_factory=list)
+    words: Optional[int] = None
+    text_layer: Optional[bool] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form."""
+        return asdict(self)
+    
+    def format_text(self) -> str:
+        """Human-readable summary, one field per line (unknowns omitted)."""
+        lines = [f"{self.path} ({self.format}, {self.size_bytes} bytes)"]
+        lines.append(f"  encrypted: {'yes' if self.encrypted else 'no'}")
+        if self.pages is not None:
+            lines.append(f"  pages: {self.pages}")
+        if self.words is not None:
+            lines.append(f"  words: ~{self.words}")
+        if self.text_layer is not None:
+            lines.append(f"  text layer: {'yes' if self.text_layer else 'no'}")
+        for sheet in self.sheets:
+            line = f"  sheet: {sheet.name}"
+            if sheet.rows is not None:
+                line += f" {sheet.dimension} ({sheet.rows} rows x {sheet.columns} columns)"
+            if sheet.xml_bytes is not None:
+                line += f", {sheet.xml_bytes} bytes of XML"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+def is_ole_file(filepath: Source) -> bool:
+    """True if the file is an OLE compound file (e.g. an encrypted DOCX/XLSX)."""
+    with as_source(filepath).open() as f:
+        return f.read(len(OLE_SIGNATURE)) == OLE_SIGNATURE
+
+
+def has_encrypted_members(archive: zipfile.ZipFile) -> bool:
+    """True if any ZIP member is encrypted (ZIP-level password)."""
+    return any(member.flag_bits & 0x1 for member in archive.infolist())
+
+
+def read_app_properties(archive: zipfile.ZipFile) -> Dict[str, int]:
+    """
+    Read the numeric extended properties of an OOXML package.
+    
+    Args:
+        archive: Open DOCX/XLSX/PPTX package
+        
+    Returns:
+        Property name -> value for integer properties such as Pages,
+        Words, Characters and Paragraphs; empty if the package has no
+        (parsable) docProps/app.xml
+    """
+    try:
+        root = fromstring(archive.read(_APP_PROPERTIES))
+    except (KeyError, ParseError):
+        return {}
+    properties = {}
+    for element in root:
+        name = element.tag.replace(f"{{{_APP_NS}}}", "")
+        text = (element.text or "").strip()
+        if text.isdigit():
+            properties[name] = int(text)
+    return properties
+
+
+def dimension_size(ref: Optional[str]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Count the rows and columns spanned by a dimension reference.
+    
+    Args:
+        ref: Range such as "A1:F200" or a single cell such as "A1"
+        
+    Returns:
+        (rows, columns), or (None, None) if ref is missing or malformed
+    """
+    if not ref:
+        return None, None
+    corners = []
+    for cell in ref.split(":", 1):
+        match = _CELL_REF.match(cell.strip())
+        if match is None:
+            return None, None
+        letters, row = match.groups()
+        column = 0
+        for letter in letters.upper():
+            column = column * 26 + ord(letter) - ord("A") + 1
+        corners.append((int(row), column))
+    (first_row, first_column), (last_row, last_column) = corners[0], corners[-1]
+    return abs(last_row - first_row) + 1, abs(last_column - first_column) + 1
+
+
+def sample_pages(page_count: int, samples: int) -> List[int]:
+    """
+    Pick up to samples evenly spread 0-based page indexes.
+    
+    Always includes the first and last page when more than one page is
+    sampled.
+    """
+    if page_count <= samples:
+        return list(range(page_count))
+    if samples == 1:
+        return [0]
+    step = (page_count - 1) / (samples - 1)
+    return sorted({round(index * step) for index in range(samples)})
@@ -0,0 +1,249 @@
+"""
+Profiling - Per-Phase Timings and Counters of an Extraction
+
+Answers "where does the time go?" for one document. With a profiler hook
+installed (AbstractFileReader.set_profiler()), every stream() - and so
+every read() - records:
+
+- phases (exclusive wall-clock seconds):
+    validate  validate_file_exists()
+    cache     extraction cache key hashing and lookup
+    open      importing the library and opening the document
+    extract   parsing and text extraction (everything else in the reader)
+    output    the consumer's time between chunks (joining, stdout writes)
+- counters: units emitted by the reader (pages, rows, paragraphs,
+  table_rows, headers, footers), chunks and UTF-8 bytes
+
+When the stream ends, the Profile is passed to the hook. Without a hook
+nothing is recorded: phase() returns a shared no-op context.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Observer (profiler hook) + Decorator (timed stream)
+
+Invariant:
+    profile.total = Σ profile.phases ≈ wall-clock time of the stream
+    (from the first chunk request to the last chunk consumed)
+"""
+
+import contextlib
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (TYPE_CHECKING, Any, Callable, ContextManager, Dict,
+                    Iterable, Iterator, List, Optional)
+
+if TYPE_CHECKING:
+    from .base import AbstractFileReader, Part
+    from .source import Source
+
+# Display order of the standard phases
+PHASES = ("validate", "cache", "open", "extract", "output")
+
+# Part kind -> counter name
+_UNIT_COUNTERS = {
+    "page": "pages",
+    "row": "rows",
+    "paragraph": "paragraphs",
+    "table": "table_rows",
+    "header": "headers",
+    "footer": "footers",
+}
+
+# Profile of the extraction running in this thread (set while a chunk is
+# being produced)
+_state = threading.local()
+
+_NO_PHASE = contextlib.nullcontext()
+
+# Receives each finished Profile
+ProfileHook = Callable[['Profile'], None]
+
+
+@dataclass
+class Profile:
+    """
+    Timings and counters of one document's extraction.
+    
+    Attributes:
+        path: Document path
+        reader: Reader class name
+        phases: Phase name -> exclusive seconds (see PHASES)
+        counters: Counter name -> count (units, chunks, bytes)
+    """
+    path: str
+    reader: str
+    phases: Dict[str, float] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    _stack: List[List[Any]] = field(default_factory=list, repr=False)
+    
+    @property
+    def total(self) -> float:
+        """Seconds spent in all phases."""
+        return sum(self.phases.values())
+    
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Attribute the time spent in the block to a phase.
+        
+        Phases nest: time in an inner phase is not counted for the outer
+        one. The block must not yield (phases cannot span a chunk).
+        """
+        now = time.perf_counter()
+        if self._stack:
+            outer = self._stack[-1]
+            self.phases[outer[0]] = self.phases.get(outer[0], 0.0) + now - outer[1]
+        frame = [name, now]
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self.phases[name] = self.phases.get(name, 0.0) + now - frame[1]
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = now
+    
+    def add(self, name: str, seconds: float) -> None:
+        """Add seconds to a phase."""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form: seconds per phase, counters, total."""
+        return {
+            "path": self.path,
+            "reader": self.reader,
+            "total_seconds": round(self.total, 6),
+            "phases": {name: round(seconds, 6) for name, seconds in self._ordered()},
+            "counters": dict(self._ordered_counters()),
+        }
+    
+    def format(self) -> str:
+        """Human-readable breakdown: one line per phase, then counters."""
+        total = self.total
+        lines = [f"Profile: {self.path} ({self.reader}), total {total * 1000:.1f} ms"]
+        for name, seconds in self._ordered():
+            share = seconds / total if total else 0.0
+            lines.append(f"  {name:<10} {seconds * 1000:>10.1f} ms {share:>6.1%}")
+        if self.counters:
+            lines.append("  " + ", ".join(f"{name}: {value}" for name, value in self._ordered_counters()))
+        return "\n".join(lines)
+    
+    def _ordered(self) -> List[tuple]:
+        """Phases in PHASES order, then any custom phases."""
+        rank = {name: index for index, name in enumerate(PHASES)}
+        return sorted(self.phases.items(), key=lambda item: rank.get(item[0], len(rank)))
+    
+    def _ordered_counters(self) -> List[tuple]:
+        """Unit counters first, then chunks and bytes."""
+        return sorted(self.counters.items(), key=lambda item: item[0] in ("chunks", "bytes"))
+
+
+def phase(name: str) -> ContextManager[None]:
+    """
+    Time a block as a phase of the extraction being profiled, if any.
+    
+    Readers wrap document-level steps (opening, validation) in this; it
+    costs one attribute lookup when profiling is off.
+    
+    Example:
+        >>> with phase("open"):
+        ...     doc = pymupdf.open(str(filepath))
+    """
+    profile = getattr(_state, "profile", None)
+    if profile is None:
+        return _NO_PHASE
+    return profile.phase(name)
+
+
+def count_parts(parts: Iterable['Part']) -> Iterable['Part']:
+    """
+    Count the units (pages, rows, paragraphs, ...) of a reader's parts.
+    
+    Returns parts unchanged when no extraction is being profiled, so
+    readers can wrap their part streams unconditionally.
+    """
+    profile = getattr(_state, "profile", None)
+    if profile is None:
+        return parts
+    return _counted(parts, profile)
+
+
+def _counted(parts: Iterable['Part'], profile: Profile) -> Iterator['Part']:
+    counters = profile.counters
+    for part in parts:
+        if part.kind is not None:
+            name = _UNIT_COUNTERS.get(part.kind, part.kind + "s")
+            counters[name] = counters.get(name, 0) + 1
+        yield part
+
+
+def track(reader: 'AbstractFileReader', filepath: 'Source', chunks: Iterable[str],
+          hook: ProfileHook) -> Iterator[str]:
+    """
+    Profile a reader's chunk stream and pass the Profile to hook at the end.
+    
+    Time inside the stream is "extract" unless a nested phase() claims
+    it; time between chunks (the consumer's) is "output". The hook is
+    called when the stream is exhausted, fails or is closed.
+    
+    Args:
+        reader: Reader producing the chunks
+        filepath: Document being extracted
+        chunks: The reader's text stream (consumed lazily)
+        hook: Receives the finished Profile
+        
+    Yields:
+        The chunks, unchanged
+    """
+    profile = Profile(str(filepath), type(reader).__name__)
+    iterator = iter(chunks)
+    consumed_from = None
+    try:
+        while True:
+            if consumed_from is not None:
+                profile.add("output", time.perf_counter() - consumed_from)
+            previous = getattr(_state, "profile", None)
+            _state.profile = profile
+            try:
+                with profile.phase("extract"):
+                    chunk = next(iterator, None)
+            finally:
+                _state.profile = previous
+            if chunk is None:
+                return
+            profile.count("chunks")
+            profile.count("bytes", len(chunk) if chunk.isascii() else len(chunk.encode("utf-8")))
+            consumed_from = time.perf_counter()
+            yield chunk
+    finally:
+        hook(profile)
+
+
+@contextlib.contextmanager
+def collect(profiles: Optional[List[Profile]] = None) -> Iterator[List[Profile]]:
+    """
+    Collect the Profiles of extractions run inside the block.
+    
+    Installs a profiler hook appending to a list and restores the
+    previous hook on exit.
+    
+    Example:
+        >>> with collect() as profiles:
+        ...     reader.read(Path("report.pdf"))
+        >>> print(profiles[0].format())
+    """
+    from .base import AbstractFileReader
+    
+    collected = [] if profiles is None else profiles
+    previous = AbstractFileReader.profiler
+    AbstractFileReader.set_profiler(collected.append)
+    try:
+        yield collected
+    finally:
+        AbstractFileReader.set_profiler(previous)
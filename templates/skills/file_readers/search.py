@@ -0,0 +1,333 @@
+"""
+Search Index - Incremental SQLite FTS5 Index of the Knowledge Base
+
+Indexes the markdown knowledge base (.sia/knowledge, .sia/requirements)
+together with documents extracted through the file readers, so agents can
+find the relevant file with one ranked query instead of reading every file.
+
+- Full-text search with BM25 ranking and highlighted snippets (SQLite FTS5,
+  standard library only)
+- Incremental updates: a file is re-indexed only when its size, mtime or
+  reader version changed; removed files leave the index
+- Plain-text files (.md, .markdown, .txt) are read directly; other
+  supported formats are extracted in a process pool
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Repository (SQLite) + Pipeline (diff → extract → index)
+
+Invariant:
+    after update(root): ∀ f ∈ indexable(root) extracted without error:
+        f ∈ index ∧ body(f) = text(f)
+    ∧ ∀ f ∈ index: f ∈ indexable(root)
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .base import AbstractFileReader
+from .batch import extract_many, walk_supported
+
+DEFAULT_INDEX_PATH = Path(".sia") / "cache" / "search.sqlite3"
+
+# Directories indexed by default, relative to the project root
+DEFAULT_DIRECTORIES = (
+    Path(".sia") / "knowledge",
+    Path(".sia") / "requirements",
+)
+
+# Read as UTF-8 text instead of through a file reader
+TEXT_EXTENSIONS = frozenset({"md", "markdown", "txt"})
+
+# Bumped when the schema changes; older indexes are rebuilt
+SCHEMA_VERSION = 1
+
+# Reader identity recorded for plain-text files
+_TEXT_READER = "text"
+
+# Matches in the path count this much more than matches in the body
+_PATH_WEIGHT = 4.0
+
+# Documents written per transaction
+_COMMIT_EVERY = 1000
+
+_SCHEMA = f"""
+CREATE TABLE documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    reader TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE content USING fts5(
+    path, body, tokenize = 'unicode61 remove_diacritics 2'
+);
+INSERT INTO content(content, rank) VALUES ('rank', 'bm25({_PATH_WEIGHT}, 1.0)');
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+
+@dataclass
+class SearchHit:
+    """
+    One search result.
+    
+    Attributes:
+        path: Document path relative to the indexed root (POSIX)
+        score: BM25 relevance (higher is better)
+        snippet: Matching excerpt, matches wrapped in ** **
+    """
+    path: str
+    score: float
+    snippet: str
+
+
+@dataclass
+class IndexReport:
+    """
+    Outcome of an index update.
+    
+    Attributes:
+        added: Documents indexed for the first time
+        updated: Documents re-indexed because they changed
+        unchanged: Documents skipped because size and mtime matched
+        removed: Documents dropped because their file is gone
+        failed: (path, error) of files that could not be extracted
+    """
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    failed: List[Tuple[str, str]] = field(default_factory=list)
+    
+    def format(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Index: {self.added} added, {self.updated} updated, "
+            f"{self.unchanged} unchanged, {self.removed} removed, "
+            f"{len(self.failed)} failed"
+        )
+
+
+def to_match_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query matching all of its words.
+    
+    Each word is quoted, so punctuation (user-012, C++, "AND") is taken
+    literally; a trailing * keeps prefix matching (auth* finds
+    authentication).
+    
+    Args:
+        query: Free-text query
+        
+    Returns:
+        FTS5 MATCH expression
+        
+    Raises:
+        ValueError: If the query has no words
+    """
+    terms = []
+    for word in query.split():
+        prefix = word.endswith("*") and len(word) > 1
+        word = word.rstrip("*")
+        if word:
+            quoted = '"' + word.replace('"', '""') + '"'
+            terms.append(quoted + "*" if prefix else quoted)
+    if not terms:
+        raise ValueError("Search query is empty")
+    return " ".join(terms)
+
+
+def _reader_tokens() -> Dict[str, str]:
+    """Indexable extension -> identity of the reader that extracts it."""
+    tokens = {extension: _TEXT_READER for extension in TEXT_EXTENSIONS}
+    for extension in AbstractFileReader.list_supported_formats():
+        if extension not in tokens:
+            reader = AbstractFileReader.get_reader(Path(f"x.{extension}"), sniff=False)
+            tokens[extension] = reader.cache_token()
+    return tokens
+
+
+class SearchIndex:
+    """
+    Full-text index of a project's knowledge files, stored in SQLite.
+    
+    Example:
+        >>> with SearchIndex(Path(".sia/cache/search.sqlite3")) as index:
+        ...     index.update(Path("."))
+        ...     for hit in index.search("token refresh", top=5):
+        ...         print(hit.path, hit.snippet)
+    """
+    
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH):
+        """
+        Open (or create) an index database.
+        
+        An index written with another schema version is rebuilt empty.
+        
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(self.path)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self._connection:
+                self._connection.execute("DROP TABLE IF EXISTS documents")
+                self._connection.execute("DROP TABLE IF EXISTS content")
+            self._connection.executescript(_SCHEMA)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
+    
+    def __enter__(self) -> 'SearchIndex':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        """Number of indexed documents."""
+        return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+    
+    def update(
+        self,
+        root: Path,
+        directories: Iterable[Path] = DEFAULT_DIRECTORIES,
+        workers: Optional[int] = None,
+    ) -> IndexReport:
+        """
+        Bring the index up to date with the files under root/directories.
+        
+        Only new and changed files are read. Files that fail to extract
+        are dropped from the index, so they are retried on the next update.
+        Missing directories are skipped.
+        
+        Args:
+            root: Project root; indexed paths are stored relative to it
+            directories: Directories to index, relative to root
+            workers: Worker processes for reader extraction
+                (default: CPU count)
+                
+        Returns:
+            IndexReport of what was added, updated and removed
+        """
+        tokens = _reader_tokens()
+        known: Dict[str, Tuple[int, int, int, str]] = {
+            row[0]: row[1:] for row in self._connection.execute(
+                "SELECT path, id, size, mtime_ns, reader FROM documents"
+            )
+        }
+        report = IndexReport()
+        seen = set()
+        texts: List[Tuple[str, os.stat_result, str]] = []
+        extracted: Dict[Path, Tuple[str, os.stat_result, str]] = {}
+        
+        for directory in directories:
+            base = root / directory
+            if not base.is_dir():
+                continue
+            # Walked paths start with base as written (Path(".") / "sia"
+            # is "sia"): slice it off and prepend its path relative to root
+            base_length = len(os.path.join(os.fspath(base), ""))
+            base_relative = base.relative_to(root).as_posix()
+            prefix = "" if base_relative == "." else base_relative + "/"
+            for dirpath, name in walk_supported(base, extensions=tokens):
+                path = os.path.join(dirpath, name)
+                relative = prefix + path[base_length:].replace(os.sep, "/")
+                seen.add(relative)
+                stat = os.stat(path)
+                token = tokens[os.path.splitext(name)[1].lstrip(".").lower()]
+                entry = known.get(relative)
+                if entry is not None and entry[1:] == (stat.st_size, stat.st_mtime_ns, token):
+                    report.unchanged += 1
+                elif token == _TEXT_READER:
+                    texts.append((relative, stat, path))
+                else:
+                    extracted[Path(path)] = (relative, stat, token)
+        
+        with self._connection:
+            for relative in set(known) - seen:
+                self._delete(known[relative][0])
+                report.removed += 1
+        
+        batch = []
+        for relative, stat, path in texts:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                batch.append((relative, stat, _TEXT_READER, f.read()))
+            batch = self._flush(batch, known, report)
+        if extracted:
+            for result in extract_many(extracted, workers=workers, ordered=False):
+                relative, stat, token = extracted[result.path]
+                if result.ok:
+                    batch.append((relative, stat, token, result.text))
+                    batch = self._flush(batch, known, report)
+                    continue
+                report.failed.append((relative, result.error))
+                if relative in known:
+                    with self._connection:
+                        self._delete(known.pop(relative)[0])
+        self._flush(batch, known, report, force=True)
+        return report
+    
+    def search(self, query: str, top: int = 10, raw: bool = False) -> List[SearchHit]:
+        """
+        Find the documents best matching a query.
+        
+        Args:
+            query: Words that must all occur (see to_match_query()), or
+                an FTS5 query (AND/OR/NOT, "phrases", NEAR, prefix*) if raw
+            top: Maximum number of hits
+            raw: Pass the query to FTS5 unchanged
+            
+        Returns:
+            Hits ordered by decreasing BM25 score
+            
+        Raises:
+            ValueError: If the query is empty or not valid FTS5 syntax
+        """
+        match = query if raw else to_match_query(query)
+        try:
+            rows = self._connection.execute(
+                "SELECT path, rank, snippet(content, 1, '**', '**', '…', 16) "
+                "FROM content WHERE content MATCH ? ORDER BY rank LIMIT ?",
+                (match, top),
+            ).fetchall()
+        except sqlite3.OperationalError as e:
+            raise ValueError(f"Invalid search query '{query}': {e}") from e
+        return [SearchHit(path, -rank, snippet) for path, rank, snippet in rows]
+    
+    def _delete(self, document_id: int) -> None:
+        """Remove a document and its text (inside a transaction)."""
+        self._connection.execute("DELETE FROM documents WHERE id = ?", (document_id,))
+        self._connection.execute("DELETE FROM content WHERE rowid = ?", (document_id,))
+    
+    def _flush(self, batch: list, known: Dict[str, tuple], report: IndexReport,
+               force: bool = False) -> list:
+        """Write (relative, stat, reader, text) entries once the batch is full."""
+        if not batch or (len(batch) < _COMMIT_EVERY and not force):
+            return batch
+        with self._connection:
+            for relative, stat, reader, text in batch:
+                entry = known.get(relative)
+                if entry is not None:
+                    self._delete(entry[0])
+                    report.updated += 1
+                else:
+                    report.added += 1
+                cursor = self._connection.execute(
+                    "INSERT INTO documents (path, size, mtime_ns, reader) VALUES (?, ?, ?, ?)",
+                    (relative, stat.st_size, stat.st_mtime_ns, reader),
+                )
+                self._connection.execute(
+                    "INSERT INTO content (rowid, path, body) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, relative, text),
+                )
+        return []
@@ -0,0 +1,290 @@
+"""
+Incremental Sync - Manifest-backed Corpus Extraction
+
+Keeps an output directory of extracted texts in step with a source
+directory, re-extracting only what changed since the previous run:
+
+- New files, changed files and files whose reader changed (reader_version
+  bump) are extracted
+- Unchanged files (same size and mtime_ns) are skipped from a stat alone
+- Touched files (new mtime, same SHA-256) are skipped after one hash
+- Outputs of files removed from the source are deleted
+- Files edited while the sync runs are not recorded, so the next run
+  extracts them again
+
+State lives in a JSON manifest inside the output directory recording, per
+source file: size, mtime_ns, content hash and the reader identity
+(cache_token) that produced its text. A no-change run costs one stat per
+file, so large corpora re-sync in seconds.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Pipeline (diff → extract → commit manifest)
+
+Invariant:
+    after sync(src, out): ∀ f ∈ supported(src) extracted without error:
+        out/f.txt = read(f) ∧ manifest[f] = (size, mtime_ns, sha256, reader)
+    ∧ ∀ f ∈ manifest: f ∈ src
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .base import AbstractFileReader, UnsupportedFormatError
+from .batch import BatchResult, extract_many, walk_supported
+from .cache import hash_file
+
+MANIFEST_NAME = ".sia-sync-manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """
+    Recorded state of one extracted source file.
+    
+    Attributes:
+        size: File size in bytes at extraction time
+        mtime_ns: Modification time (nanoseconds) at extraction time
+        sha256: Content hash at extraction time
+        reader: cache_token() of the reader that produced the text
+    """
+    size: int
+    mtime_ns: int
+    sha256: str
+    reader: str
+
+
+@dataclass
+class SyncReport:
+    """
+    Outcome of a sync run.
+    
+    Attributes:
+        extracted: Source paths (re-)extracted in this run
+        unchanged: Files skipped because size and mtime matched
+        touched: Files skipped because only their mtime changed
+        removed: Relative paths whose outputs were deleted
+        failed: Results of files that could not be extracted
+    """
+    extracted: List[Path] = field(default_factory=list)
+    unchanged: int = 0
+    touched: int = 0
+    removed: List[str] = field(default_factory=list)
+    failed: List[BatchResult] = field(default_factory=list)
+    
+    @property
+    def skipped(self) -> int:
+        """Files not re-extracted because their content was unchanged."""
+        return self.unchanged + self.touched
+    
+    def format(self) -> str:
+        """Human-readable one-line summary."""
+        return (
+            f"Sync: {len(self.extracted)} extracted, {self.skipped} skipped "
+            f"({self.unchanged} unchanged, {self.touched} touched), "
+            f"{len(self.removed)} removed, {len(self.failed)} failed"
+        )
+
+
+def load_manifest(output_dir: Path) -> Dict[str, ManifestEntry]:
+    """
+    Load the manifest of an output directory.
+    
+    A missing, unreadable or incompatible manifest yields an empty one, so
+    the next sync simply re-extracts everything.
+    
+    Args:
+        output_dir: Sync output directory
+        
+    Returns:
+        Relative source path (POSIX) -> entry
+    """
+    try:
+        with open(output_dir / MANIFEST_NAME, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != MANIFEST_VERSION:
+            return {}
+        return {
+            relative: ManifestEntry(**entry)
+            for relative, entry in data["files"].items()
+        }
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def save_manifest(output_dir: Path, manifest: Dict[str, ManifestEntry]) -> None:
+    """
+    Write the manifest atomically (temp file + rename).
+    
+    Args:
+        output_dir: Sync output directory
+        manifest: Relative source path (POSIX) -> entry
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    for relative in sorted(manifest):
+        entry = manifest[relative]
+        files[relative] = {
+            "size": entry.size,
+            "mtime_ns": entry.mtime_ns,
+            "sha256": entry.sha256,
+            "reader": entry.reader,
+        }
+    # dumps() runs the C encoder; dump() encodes chunk by chunk in Python
+    text = json.dumps({"version": MANIFEST_VERSION, "files": files}, separators=(",", ":"))
+    fd, temp_path = tempfile.mkstemp(dir=output_dir, prefix=".manifest-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, output_dir / MANIFEST_NAME)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _output_path(output_dir: Path, relative: str) -> Path:
+    """Output text file for a source path relative to the source root."""
+    return output_dir / f"{relative}.txt"
+
+
+def _iter_relative(source_dir: Path) -> Iterator[Tuple[str, str]]:
+    """Yield (path, POSIX path relative to source_dir) of supported files."""
+    prefix_length = len(os.path.join(os.fspath(source_dir), ""))
+    for dirpath, name in walk_supported(source_dir):
+        path = os.path.join(dirpath, name)
+        relative = path[prefix_length:]
+        yield path, relative if os.sep == "/" else relative.replace(os.sep, "/")
+
+
+def _current_reader_tokens() -> Dict[str, str]:
+    """Reader class name -> cache_token() of its default configuration."""
+    tokens = {}
+    for extension in AbstractFileReader.list_supported_formats():
+        reader = AbstractFileReader.get_reader(Path(f"x.{extension}"), sniff=False)
+        tokens[type(reader).__name__] = reader.cache_token()
+    return tokens
+
+
+def _is_current(entry: ManifestEntry, tokens: Dict[str, str]) -> bool:
+    """True if the reader that produced an entry is still at that version."""
+    return tokens.get(entry.reader.split(":", 1)[0]) == entry.reader
+
+
+def _remove_output(output_dir: Path, relative: str) -> None:
+    """Delete an output file and any directories it leaves empty."""
+    target = _output_path(output_dir, relative)
+    try:
+        target.unlink()
+    except FileNotFoundError:
+        pass
+    parent = target.parent
+    while parent != output_dir:
+        try:
+            parent.rmdir()  # Only succeeds when empty
+        except OSError:
+            break
+        parent = parent.parent
+
+
+def sync(
+    source_dir: Path,
+    output_dir: Path,
+    workers: Optional[int] = None,
+) -> SyncReport:
+    """
+    Bring output_dir up to date with the supported files in source_dir.
+    
+    Outputs mirror the source layout as <relative path>.txt. Files that fail
+    to extract lose any previous output and manifest entry, so they are
+    retried on the next run. The manifest is saved even if the run is
+    interrupted, keeping the work already done.
+    
+    Args:
+        source_dir: Directory to extract (walked recursively)
+        output_dir: Directory receiving texts and the manifest
+        workers: Worker processes for extraction (default: CPU count)
+        
+    Returns:
+        SyncReport of what was extracted, skipped and removed
+        
+    Raises:
+        NotADirectoryError: If source_dir is not a directory
+        
+    Example:
+        >>> report = sync(Path(".sia/knowledge"), Path(".sia/text"))
+        >>> print(report.format())
+    """
+    manifest = load_manifest(output_dir)
+    tokens = _current_reader_tokens()
+    report = SyncReport()
+    seen = set()
+    pending: Dict[Path, os.stat_result] = {}
+    output_root = os.fspath(output_dir)
+    
+    # Plain strings: this loop runs for every source file on every sync
+    for path, relative in _iter_relative(source_dir):
+        seen.add(relative)
+        stat = os.stat(path)
+        entry = manifest.get(relative)
+        
+        if entry is not None and _is_current(entry, tokens) \
+                and entry.size == stat.st_size \
+                and os.path.exists(os.path.join(output_root, f"{relative}.txt")):
+            if entry.mtime_ns == stat.st_mtime_ns:
+                report.unchanged += 1
+                continue
+            if hash_file(Path(path)) == entry.sha256:
+                entry.mtime_ns = stat.st_mtime_ns
+                report.touched += 1
+                continue
+        pending[Path(path)] = stat
+    
+    for relative in sorted(set(manifest) - seen):
+        _remove_output(output_dir, relative)
+        del manifest[relative]
+        report.removed.append(relative)
+    
+    if not (pending or report.touched or report.removed) \
+            and (output_dir / MANIFEST_NAME).exists():
+        return report  # Nothing changed: keep the manifest as it is
+    
+    try:
+        for result in extract_many(pending, workers=workers, ordered=False):
+            relative = result.path.relative_to(source_dir).as_posix()
+            if not result.ok:
+                _remove_output(output_dir, relative)
+                manifest.pop(relative, None)
+                report.failed.append(result)
+                continue
+            
+            target = _output_path(output_dir, relative)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text(result.text, encoding="utf-8")
+            
+            report.extracted.append(result.path)
+            stat = pending[result.path]
+            try:
+                reader = AbstractFileReader.get_reader(result.path)
+                sha256 = hash_file(result.path)
+                # Same size and mtime after hashing as before extraction:
+                # the text and the hash are of the same content
+                current = os.stat(result.path)
+            except (UnsupportedFormatError, FileNotFoundError):
+                continue  # Registry or file changed mid-run; retry next time
+            if (current.st_size, current.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                continue  # Edited during the sync; extract it again next time
+            manifest[relative] = ManifestEntry(
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                sha256=sha256,
+                reader=reader.cache_token(),
+            )
+    finally:
+        save_manifest(output_dir, manifest)
+    
+    return report
@@ -0,0 +1,555 @@
+"""
+Fast XLSX Engine - Streaming SpreadsheetML Parser
+
+Reads worksheet XML straight out of the ZIP container with
+xml.etree.ElementTree.iterparse and drops every row once it has been
+converted, instead of building an openpyxl cell object per cell. Rows come
+out exactly as XlsxReader's openpyxl engine renders them:
+- Shared strings, inline strings, booleans, error codes, cached formula values
+- Numbers cast like openpyxl (int / float) before str()
+- Date-styled serials converted with openpyxl's own number-format helpers
+- Rows clipped to the sheet <dimension> (rows and columns beyond it
+  dropped) and trimmed after their last non-empty cell
+
+Memory and CPU follow the content, not the declared dimension: a sheet
+claiming A1:XFD1048576 costs what its written cells cost. Only cells
+present in the XML are converted, empty trailing columns are never
+allocated, and a run of empty rows can end the sheet early
+(max_empty_rows).
+
+Finished rows (and shared strings) are cleared and detached from the tree
+as soon as they are converted, so memory per row stays fixed however long
+the sheet is. The shared string table is parsed only as far as the rows
+read so far reference it, so reading the first rows of a huge workbook
+(XlsxReader.head()) does not load all of its strings.
+
+Everything that can make the engine unsuitable (not a ZIP package, missing
+workbook part, chartsheets, unparsable dimensions) is detected in
+FastWorkbook.open(), before any text is produced, and raised as
+UnsupportedWorkbook so the caller can fall back to openpyxl.
+
+Domain: Skills (Infrastructure)
+Bounded Context: File Processing
+Pattern: Strategy (alternative XLSX extraction engine)
+
+Dependencies:
+    - openpyxl: only its pure helpers (date formats, coordinates)
+
+Invariant:
+    FastWorkbook.iter_rows(s) ≡ trim([str(v) or "" for v in row])
+        for non-empty rows of openpyxl read-only iter_rows(values_only=True)
+        of s, where trim drops trailing "" cells
+"""
+
+import posixpath
+import zipfile
+from typing import IO, Dict, Iterator, List, Optional, Set, Tuple
+from xml.etree.ElementTree import Element, ParseError, fromstring, iterparse
+
+from .base import CorruptedFileError
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CONTENT_TYPES_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+_ROW = f"{{{_MAIN_NS}}}row"
+_CELL = f"{{{_MAIN_NS}}}c"
+_VALUE = f"{{{_MAIN_NS}}}v"
+_TEXT = f"{{{_MAIN_NS}}}t"
+_RUN = f"{{{_MAIN_NS}}}r"
+_INLINE_STRING = f"{{{_MAIN_NS}}}is"
+_STRING_ITEM = f"{{{_MAIN_NS}}}si"
+_SHEET_DATA = f"{{{_MAIN_NS}}}sheetData"
+_DIMENSION = f"{{{_MAIN_NS}}}dimension"
+
+# Main part content types, in the order openpyxl looks for them
+_WORKBOOK_TYPES = (
+    "application/vnd.ms-excel.template.macroEnabled.main+xml",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.template.main+xml",
+    "application/vnd.ms-excel.sheet.macroEnabled.main+xml",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml",
+)
+_SHARED_STRING_TABLE = f"{{{_MAIN_NS}}}sst"
+_SHARED_STRINGS_TYPE = (
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"
+)
+_STYLES_PATH = "xl/styles.xml"
+
+_DIGITS = "0123456789"
+
+
+class UnsupportedWorkbook(Exception):
+    """The fast engine cannot reproduce openpyxl's output for this file."""
+
+
+def _cast_number(text: str):
+    """Convert a numeric cell value like openpyxl does (int unless float syntax)."""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _string_content(element: Element) -> str:
+    """Plain text of a <si>/<is> string: its <t> plus rich-text run texts."""
+    parts = []
+    plain = element.find(_TEXT)
+    if plain is not None and plain.text is not None:
+        parts.append(plain.text)
+    for run in element.iterfind(_RUN):
+        text = run.findtext(_TEXT)
+        if text is not None:
+            parts.append(text)
+    return "".join(parts)
+
+
+def _iter_detached(source: IO[bytes], parent_tag: str, tag: str) -> Iterator[Element]:
+    """
+    Stream the complete `tag` children of a `parent_tag` element, freeing each.
+    
+    An element is yielded at its end tag, then cleared and removed from its
+    parent once the caller resumes; clear() alone would leave an empty
+    element per item attached to the tree. Start events only locate the
+    parent.
+    
+    Raises:
+        ParseError: If the XML is malformed
+    """
+    parent = None
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if parent is None and element.tag == parent_tag:
+                parent = element
+        elif element.tag == tag:
+            yield element
+            element.clear()
+            # The parser runs ahead of the events, so later siblings may
+            # already be attached; finished ones leave from the front
+            if parent is not None and len(parent) and parent[0] is element:
+                del parent[0]
+
+
+def _parse_row_number(text: str) -> int:
+    """Row numbers are integers, but some writers emit "3.0"."""
+    try:
+        return int(text)
+    except ValueError:
+        value = float(text)
+        if not value.is_integer():
+            raise
+        return int(value)
+
+
+class FastWorkbook:
+    """
+    Read-only view of an XLSX package that streams worksheet rows.
+    
+    Use FastWorkbook.open(); always close() the workbook (the ZIP file stays
+    open while rows are streamed).
+    
+    Example:
+        >>> workbook = FastWorkbook.open(Path("export.xlsx"))
+        >>> try:
+        ...     for cells in workbook.iter_rows(workbook.sheetnames[0]):
+        ...         print("\\t".join(cells))
+        ... finally:
+        ...     workbook.close()
+        
+    Attributes:
+        sheetnames: Worksheet names in workbook order
+    """
+    
+    def __init__(self, archive: zipfile.ZipFile, metadata_only: bool = False):
+        self._archive = archive
+        self._metadata_only = metadata_only
+        self.sheetnames: List[str] = []
+        self._sheet_paths: Dict[str, str] = {}
+        self._dimension_refs: Dict[str, Optional[str]] = {}
+        self._shared_strings: List[str] = []
+        self._pending_strings: Optional[Iterator[str]] = None
+        self._date_styles: Set[int] = set()
+        self._timedelta_styles: Set[int] = set()
+        self._dimensions: Dict[str, Optional[Tuple[int, int, int, int]]] = {}
+        self._epoch = None
+        self._columns: Dict[str, int] = {}
+    
+    @classmethod
+    def open(cls, filepath, metadata_only: bool = False) -> 'FastWorkbook':
+        """
+        Open a workbook and load its sheet list, shared strings and styles.
+        
+        Args:
+            filepath: Path to the XLSX file, or a binary file object
+            metadata_only: Load only the sheet list and each sheet's
+                dimension reference (dimension_ref()); rows cannot be
+                read. Needs no openpyxl, and chartsheets are listed
+                (without a dimension) instead of rejected.
+            
+        Returns:
+            Open FastWorkbook
+            
+        Raises:
+            UnsupportedWorkbook: If the file should be read with openpyxl
+                instead (also raised for anything openpyxl would reject,
+                so its error messages are preserved)
+        """
+        try:
+            archive = zipfile.ZipFile(filepath)
+        except (zipfile.BadZipFile, OSError) as e:
+            raise UnsupportedWorkbook(str(e)) from e
+        
+        workbook = cls(archive, metadata_only)
+        try:
+            workbook._load()
+        except UnsupportedWorkbook:
+            workbook.close()
+            raise
+        except (KeyError, ValueError, ParseError, zipfile.BadZipFile) as e:
+            workbook.close()
+            raise UnsupportedWorkbook(str(e)) from e
+        return workbook
+    
+    def close(self) -> None:
+        """Close the underlying ZIP file."""
+        if self._pending_strings is not None:
+            self._pending_strings.close()
+            self._pending_strings = None
+        self._archive.close()
+    
+    def dimension_ref(self, sheet_name: str) -> Optional[str]:
+        """Declared <dimension ref> of a sheet (e.g. "A1:F200"), if any."""
+        return self._dimension_refs[sheet_name]
+    
+    def part_size(self, sheet_name: str) -> Optional[int]:
+        """Uncompressed size of a worksheet's XML (None for chartsheets)."""
+        path = self._sheet_paths.get(sheet_name)
+        return None if path is None else self._archive.getinfo(path).file_size
+    
+    def _load(self) -> None:
+        """Resolve package parts the way openpyxl's ExcelReader does."""
+        overrides = self._content_type_overrides()
+        workbook_path = next(
+            (part for content_type in _WORKBOOK_TYPES
+             for part, part_type in overrides if part_type == content_type),
+            None,
+        )
+        if workbook_path is None:
+            raise UnsupportedWorkbook("No workbook part override")
+        
+        workbook_xml = fromstring(self._archive.read(workbook_path))
+        rels = self._relationships(workbook_path)
+        available = set(self._archive.namelist())
+        for sheet in workbook_xml.iter(f"{{{_MAIN_NS}}}sheet"):
+            rel_id = sheet.get(f"{{{_DOC_REL_NS}}}id")
+            if not rel_id:
+                continue  # openpyxl drops invalid sheet entries
+            rel_type, target = rels[rel_id]
+            if target not in available:
+                continue
+            name = sheet.get("name")
+            if "chartsheet" in rel_type:
+                if not self._metadata_only:
+                    raise UnsupportedWorkbook("Workbook contains chartsheets")
+                self.sheetnames.append(name)
+                self._dimension_refs[name] = None
+                continue
+            self.sheetnames.append(name)
+            self._sheet_paths[name] = target
+            self._dimension_refs[name] = self._read_dimension_ref(target)
+        if self._metadata_only:
+            return
+        
+        from openpyxl.utils.datetime import CALENDAR_MAC_1904, WINDOWS_EPOCH
+        
+        properties = workbook_xml.find(f"{{{_MAIN_NS}}}workbookPr")
+        date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+        self._epoch = CALENDAR_MAC_1904 if date1904 else WINDOWS_EPOCH
+        for name, ref in self._dimension_refs.items():
+            self._dimensions[name] = self._parse_dimensions(ref)
+        
+        strings_path = next(
+            (part for part, part_type in overrides if part_type == _SHARED_STRINGS_TYPE),
+            None,
+        )
+        if strings_path is not None:
+            self._pending_strings = self._iter_shared_strings(
+                self._archive.open(strings_path))
+        
+        if _STYLES_PATH in available:
+            self._read_styles()
+    
+    def _content_type_overrides(self) -> List[Tuple[str, str]]:
+        """(part name without leading slash, content type) from [Content_Types].xml."""
+        root = fromstring(self._archive.read("[Content_Types].xml"))
+        return [
+            (override.get("PartName", "").lstrip("/"), override.get("ContentType"))
+            for override in root.iter(f"{{{_CONTENT_TYPES_NS}}}Override")
+        ]
+    
+    def _relationships(self, part: str) -> Dict[str, Tuple[str, str]]:
+        """Map relationship id -> (type, archive path) for a package part."""
+        folder, name = posixpath.split(part)
+        rels_path = posixpath.join(folder, "_rels", f"{name}.rels")
+        root = fromstring(self._archive.read(rels_path))
+        rels = {}
+        for rel in root.iter(f"{{{_PKG_REL_NS}}}Relationship"):
+            target = rel.get("Target", "")
+            if rel.get("TargetMode") == "External":
+                continue
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join(folder, target))
+            rels[rel.get("Id")] = (rel.get("Type", ""), target)
+        return rels
+    
+    @staticmethod
+    def _iter_shared_strings(source: IO[bytes]) -> Iterator[str]:
+        """Stream the shared string table, freeing each <si> after use."""
+        with source:
+            for element in _iter_detached(source, _SHARED_STRING_TABLE, _STRING_ITEM):
+                yield _string_content(element).replace("x005F_", "")
+    
+    def _shared_string(self, index: int) -> str:
+        """
+        Look up a shared string, parsing the table up to it if needed.
+        
+        Writers store strings in order of first use, so the table is
+        parsed roughly in step with the rows.
+        
+        Raises:
+            CorruptedFileError: If the shared string table is malformed
+            IndexError: If the table has no such entry
+        """
+        strings = self._shared_strings
+        pending = self._pending_strings
+        if pending is not None:
+            try:
+                while len(strings) <= index:
+                    text = next(pending, None)
+                    if text is None:
+                        self._pending_strings = None
+                        break
+                    strings.append(text)
+            except ParseError as e:
+                raise CorruptedFileError(f"Invalid shared strings table: {e}") from e
+        return strings[index]
+    
+    def _read_styles(self) -> None:
+        """Index the cell styles (cellXfs) whose number format is a date or duration."""
+        from openpyxl.styles.numbers import (BUILTIN_FORMATS, is_date_format,
+                                             is_timedelta_format)
+        
+        root = fromstring(self._archive.read(_STYLES_PATH))
+        custom = {}
+        for num_fmt in root.iter(f"{{{_MAIN_NS}}}numFmt"):
+            custom[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode")
+        
+        cell_xfs = root.find(f"{{{_MAIN_NS}}}cellXfs")
+        if cell_xfs is None:
+            return
+        for index, xf in enumerate(cell_xfs.iterfind(f"{{{_MAIN_NS}}}xf")):
+            num_fmt_id = int(xf.get("numFmtId", 0))
+            fmt = custom.get(num_fmt_id, BUILTIN_FORMATS.get(num_fmt_id))
+            if is_date_format(fmt):
+                self._date_styles.add(index)
+            if is_timedelta_format(fmt):
+                self._timedelta_styles.add(index)
+    
+    def _read_dimension_ref(self, sheet_path: str) -> Optional[str]:
+        """
+        Read a sheet's declared <dimension ref>.
+        
+        Only the XML before <sheetData> is parsed.
+        
+        Returns:
+            Reference such as "A1:F200" ("" if the element has none), or
+            None if the sheet declares no dimension
+        """
+        with self._archive.open(sheet_path) as source:
+            for _, element in iterparse(source, events=("start",)):
+                if element.tag == _DIMENSION:
+                    return element.get("ref", "")
+                if element.tag == _SHEET_DATA:
+                    return None
+        return None
+    
+    @staticmethod
+    def _parse_dimensions(ref: Optional[str]) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Convert a dimension reference to (min_col, min_row, max_col, max_row).
+        
+        Raises:
+            UnsupportedWorkbook: If the dimension reference is malformed
+        """
+        from openpyxl.utils.cell import range_boundaries
+        
+        if ref is None:
+            return None
+        try:
+            return range_boundaries(ref)
+        except (TypeError, ValueError) as e:
+            raise UnsupportedWorkbook(f"Bad dimension: {e}") from e
+    
+    def _column_index(self, letters: str) -> int:
+        """1-based index of a column such as "AB" (memoized in _columns)."""
+        from openpyxl.utils.cell import column_index_from_string
+        
+        index = self._columns[letters] = column_index_from_string(letters)
+        return index
+    
+    def _cell_text(self, cell: Element) -> str:
+        """Render one <c> element as str(openpyxl value), "" for no value."""
+        data_type = cell.get("t", "n")
+        if data_type == "inlineStr":
+            inline = cell.find(_INLINE_STRING)
+            return _string_content(inline) if inline is not None else ""
+        
+        value = cell.findtext(_VALUE)
+        if not value:
+            return ""
+        if data_type == "n":
+            number = _cast_number(value)
+            style = cell.get("s")
+            style_id = int(style) if style else 0
+            if style_id in self._date_styles:
+                from openpyxl.utils.datetime import from_excel
+                try:
+                    return str(from_excel(number, self._epoch,
+                                          timedelta=style_id in self._timedelta_styles))
+                except (OverflowError, ValueError):
+                    return "#VALUE!"
+            return str(number)
+        if data_type == "s":
+            index = int(value)
+            if index < len(self._shared_strings):
+                return self._shared_strings[index]
+            return self._shared_string(index)
+        if data_type == "b":
+            return str(bool(int(value)))
+        if data_type == "d":
+            from openpyxl.utils.datetime import from_ISO8601
+            return str(from_ISO8601(value))
+        return value  # "str" (formula result), "e" (error code), unknown types
+    
+    def iter_rows(self, sheet_name: str, min_row: Optional[int] = None,
+                  max_row: Optional[int] = None,
+                  max_empty_rows: Optional[int] = None) -> Iterator[List[str]]:
+        """
+        Stream a worksheet's rows as lists of cell strings.
+        
+        See iter_numbered_rows(), which also yields each row's number.
+        
+        Args:
+            sheet_name: Worksheet to read
+            min_row: First row number to yield (1-based)
+            max_row: Last row number to read (default: declared last row)
+            max_empty_rows: Stop after this many consecutive empty rows
+            
+        Yields:
+            One list of cell strings per non-empty row
+            
+        Raises:
+            CorruptedFileError: If the worksheet XML is malformed
+        """
+        for _, cells in self.iter_numbered_rows(sheet_name, min_row, max_row,
+                                                max_empty_rows):
+            yield cells
+    
+    def iter_numbered_rows(self, sheet_name: str, min_row: Optional[int] = None,
+                           max_row: Optional[int] = None,
+                           max_empty_rows: Optional[int] = None,
+                           ) -> Iterator[Tuple[int, List[str]]]:
+        """
+        Stream a worksheet's non-empty rows as (row number, cell strings).
+        
+        Mirrors openpyxl's read-only iter_rows(values_only=True) with
+        trailing empty cells trimmed: rows are clipped to the declared
+        column count and end at their last non-empty cell; rows past the
+        declared last row are not read. Rows before min_row are skipped
+        without converting their cells. Rows absent from the XML or
+        without a value are not yielded.
+        
+        Args:
+            sheet_name: Worksheet to read
+            min_row: First row number to yield (1-based)
+            max_row: Last row number to read (default: declared last row)
+            max_empty_rows: Stop once the row number passes the last
+                non-empty row (or min_row - 1) by more than this; rows
+                absent from the XML count as empty
+            
+        Yields:
+            (1-based row number, cell strings) per non-empty row
+            
+        Raises:
+            CorruptedFileError: If the worksheet XML is malformed
+        """
+        dimensions = self._dimensions[sheet_name]
+        max_col = None
+        if dimensions is not None:
+            max_col = dimensions[2]
+            max_row = max_row or dimensions[3]
+        next_row = min_row or 1
+        last_content = next_row - 1
+        row_number = 0
+        
+        with self._archive.open(self._sheet_paths[sheet_name]) as source:
+            try:
+                # Each row arrives complete and is freed once converted
+                for element in _iter_detached(source, _SHEET_DATA, _ROW):
+                    number = element.get("r")
+                    row_number = _parse_row_number(number) if number else row_number + 1
+                    if max_row is not None and row_number > max_row:
+                        break
+                    if max_empty_rows is not None and row_number - last_content > max_empty_rows:
+                        break
+                    if row_number >= next_row:
+                        next_row = row_number + 1
+                        cells = self._row_cells(element, max_col)
+                        if cells:
+                            last_content = row_number
+                            yield row_number, cells
+            except ParseError as e:
+                raise CorruptedFileError(
+                    f"Invalid XLSX worksheet XML in '{sheet_name}': {e}"
+                ) from e
+    
+    def _row_cells(self, row: Element, max_col: Optional[int]) -> List[str]:
+        """
+        Place a <row>'s cells by column, up to its last non-empty cell.
+        
+        The list is sized by the last cell with a value, so trailing empty
+        (e.g. styled) cells and the declared width are never allocated.
+        
+        Returns:
+            Cell strings ("" for gaps), or [] if the row has no value
+        """
+        placed = []
+        column = 0
+        columns = self._columns
+        for cell in row:
+            if cell.tag != _CELL:
+                continue
+            coordinate = cell.get("r")
+            if coordinate:
+                letters = coordinate.rstrip(_DIGITS)
+                column = columns.get(letters) or self._column_index(letters)
+            else:
+                column += 1
+            placed.append((column, cell))
+        if not placed:
+            return []
+        
+        # Without a dimension a row ends at its last cell (as in openpyxl)
+        width = placed[-1][0] if max_col is None else max_col
+        values = {}
+        for column, cell in placed:
+            if column <= width:
+                values[column] = self._cell_text(cell)
+        used = max((column for column, text in values.items() if text), default=0)
+        
+        cells = [""] * used
+        for column, text in values.items():
+            if column <= used:
+                cells[column - 1] = text
+        return cells
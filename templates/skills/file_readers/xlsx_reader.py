@@ -5,6 +5,16 @@ Extracts text from XLSX files including:
 - All worksheets (sheets)
 - Cell values in row-major order
 - Formatted output with sheet names
+- Rows trimmed after their last non-empty cell, so output and cost follow
+  the content rather than the declared used range (ERP exports often
+  declare A1:XFD1048576)
+- Large multi-sheet workbooks extracted one sheet per worker process
+
+Engines:
+- "fast" (default): streams worksheet XML with iterparse (see xlsx_fast),
+  falling back to openpyxl for workbooks it does not handle
+- "openpyxl": openpyxl read-only mode
+Both engines produce identical text.
 
 Domain: Skills (Infrastructure)
 Bounded Context: File Processing
@@ -22,14 +32,73 @@ REQ-011: File Reader Skills System
 QUANT-011-003: Concrete Readers Implementation
 """
 
+import multiprocessing
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterator, List,
+                    Optional, Tuple)
 
-from .base import AbstractFileReader, CorruptedFileError, validate_file_exists
+from .base import (AbstractFileReader, CorruptedFileError, FileReaderError,
+                   Part, iter_joined, join_parts, previewing,
+                   validate_file_exists)
+from .batch import worker_pool, worker_result
+from .probe import DocumentInfo, SheetInfo, dimension_size, is_ole_file
+from .profiling import count_parts, phase
+from .selection import parse_span
+from .source import Source, as_input, file_path, in_memory
+from .xlsx_fast import FastWorkbook, UnsupportedWorkbook
 
 if TYPE_CHECKING:
     from openpyxl import Workbook
 
+# Extraction engines; "fast" falls back to "openpyxl" when needed
+ENGINES = ("fast", "openpyxl")
+
+# Sheets are extracted in parallel when the worksheet XML outside the
+# largest selected sheet (the time parallelism can save) reaches this size
+DEFAULT_PARALLEL_THRESHOLD = 16 * 1024 * 1024
+
+
+def _extract_sheet(path: str, sheet_name: str,
+                   options: Dict[str, Any]) -> List[Tuple[int, str]]:
+    """
+    Extract one sheet in a worker process.
+    
+    Each worker opens the workbook itself: openpyxl and FastWorkbook
+    objects cannot be shared across processes. Only the assigned sheet
+    is parsed. The resource limits apply to the sheet here (rows in
+    _iter_workbook_parts(), output size and timeout through watch()),
+    so an oversized sheet fails before it is built up and sent back;
+    the parent checks the workbook as a whole.
+    
+    Args:
+        path: XLSX file path
+        sheet_name: Sheet to extract
+        options: Row selection, engine and max_empty_rows of the parent reader
+        
+    Returns:
+        (row number, row text) of the sheet's non-empty rows
+        
+    Raises:
+        ResourceLimitExceeded: If the sheet alone exceeds a limit
+    """
+    reader = XlsxReader(sheet=sheet_name, parallel_threshold=None, **options)
+    rows: List[Tuple[int, str]] = []
+    
+    def iter_row_texts() -> Iterator[str]:
+        for part in reader._iter_parts(Path(path)):
+            if part.kind == "row":
+                rows.append((part.location["row"], part.text))
+                yield part.text
+    
+    texts = iter_row_texts()
+    limits = AbstractFileReader.limits
+    if limits is not None:
+        texts = limits.watch(reader, Path(path), texts)
+    for _ in texts:
+        pass
+    return rows
+
 
 class XlsxReader(AbstractFileReader):
     """
@@ -43,7 +112,13 @@ class XlsxReader(AbstractFileReader):
         - Data-only mode (evaluates formulas to values)
         - Tab-separated cell values per row
         - Sheet names preserved as section headers
-        - Empty rows skipped
+        - Empty rows skipped, trailing empty cells trimmed
+        - Optional stop after a run of empty rows (max_empty_rows)
+        - Parallel sheets for large workbooks (one process per sheet,
+          output reassembled in workbook order)
+        - Streaming extraction (iter_read yields one row at a time)
+        - Sheet / row selection: unselected worksheets are never parsed
+        - Fast engine: no per-cell objects, rows cleared as they stream
     
     Implementation Notes:
         - Uses read_only=True for large file support
@@ -62,14 +137,93 @@ class XlsxReader(AbstractFileReader):
         >>> reader = XlsxReader()
         >>> text = reader.read(Path("spreadsheet.xlsx"))
         >>> print(text[:200])
+        
+        >>> # Rows 2-500 of the "Budget" sheet only
+        >>> reader = XlsxReader(sheet="Budget", rows="2:500")
+        
+        >>> # Force the openpyxl engine
+        >>> reader = XlsxReader(engine="openpyxl")
+        
+        >>> # End each sheet after 1000 consecutive empty rows
+        >>> reader = XlsxReader(max_empty_rows=1000)
+        
+        >>> # Sheets in parallel once 4 MB of XML is outside the largest
+        >>> reader = XlsxReader(parallel_threshold=4 * 1024 * 1024, workers=8)
     """
     
+    # 1.1.0: trailing empty cells trimmed (no trailing tabs)
+    reader_version = "1.1.0"
+    
+    # OPC (ZIP) package whose main part is a workbook (as openpyxl accepts)
+    signatures = (b"PK\x03\x04",)
+    zip_content_types = (
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.template.main+xml",
+        "application/vnd.ms-excel.sheet.macroEnabled.main+xml",
+        "application/vnd.ms-excel.template.macroEnabled.main+xml",
+    )
+    
+    def __init__(self, sheet: Optional[str] = None,
+                 sheet_index: Optional[int] = None,
+                 rows: Optional[str] = None,
+                 engine: str = "fast",
+                 max_empty_rows: Optional[int] = None,
+                 parallel_threshold: Optional[int] = DEFAULT_PARALLEL_THRESHOLD,
+                 workers: Optional[int] = None):
+        """
+        Configure sheet and row selection, the engine and parallel sheets.
+        
+        Args:
+            sheet: Extract only the sheet with this name
+            sheet_index: Extract only the sheet at this position
+                (1-based, workbook order)
+            rows: Row span "first:last" (1-based sheet row numbers,
+                inclusive; either side may be omitted)
+            engine: "fast" (iterparse, openpyxl fallback) or "openpyxl"
+            max_empty_rows: Stop reading a sheet after this many
+                consecutive empty rows (default: read to the end)
+            parallel_threshold: Uncompressed worksheet XML bytes outside
+                the largest selected sheet from which sheets are extracted
+                in parallel (None disables it)
+            workers: Worker processes for parallel sheets
+                (default: os.cpu_count())
+        
+        Raises:
+            ValueError: If both sheet and sheet_index are given, the
+                row span is malformed, max_empty_rows < 1, or
+                the engine is unknown
+        """
+        if sheet is not None and sheet_index is not None:
+            raise ValueError("Use either sheet or sheet_index, not both")
+        if sheet_index is not None and sheet_index < 1:
+            raise ValueError("sheet_index starts at 1")
+        if engine not in ENGINES:
+            raise ValueError(
+                f"Unknown XLSX engine '{engine}'. Choose from: {', '.join(ENGINES)}"
+            )
+        if max_empty_rows is not None and max_empty_rows < 1:
+            raise ValueError(f"max_empty_rows must be at least 1, got {max_empty_rows}")
+        self.sheet = sheet
+        self.sheet_index = sheet_index
+        self.rows = rows
+        self._row_span = parse_span(rows) if rows else None
+        self.engine = engine
+        self.max_empty_rows = max_empty_rows
+        self.parallel_threshold = parallel_threshold
+        self.workers = workers or os.cpu_count() or 1
+    
+    def options(self) -> Dict[str, Any]:
+        """Sheet, row and empty-run limits change output (engine and parallelism do not)."""
+        options = {"sheet": self.sheet, "sheet_index": self.sheet_index, "rows": self.rows,
+                   "max_empty_rows": self.max_empty_rows}
+        return {name: value for name, value in options.items() if value is not None}
+    
     @classmethod
     def get_extension(cls) -> str:
         """Return supported extension: 'xlsx'"""
         return "xlsx"
     
-    def read(self, filepath: Path) -> str:
+    def read(self, filepath: Source) -> str:
         """
         Extract all text from an XLSX file.
         
@@ -83,88 +237,346 @@ class XlsxReader(AbstractFileReader):
             FileNotFoundError: If file doesn't exist
             CorruptedFileError: If file is corrupted, invalid, or password-protected
         """
+        return "".join(self.stream(filepath))
+    
+    def iter_read(self, filepath: Source) -> Iterator[str]:
+        """
+        Extract text from an XLSX file one row at a time.
+        
+        Args:
+            filepath: Path to XLSX file
+            
+        Yields:
+            Sheet headers and tab-separated rows (concatenation equals read())
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        # Join plain strings: join_parts() would rebuild every Part
+        yield from iter_joined(part.text for part in count_parts(self._iter_parts(filepath)))
+    
+    def iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """
+        Extract an XLSX file as sheet headers and "row" parts.
+        
+        Row locations are {"sheet": name, "row": n} with the worksheet's
+        own 1-based row number.
+        
+        Args:
+            filepath: Path to XLSX file
+            
+        Yields:
+            Parts whose texts concatenate to read()
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If file is corrupted, invalid, or password-protected
+        """
+        yield from join_parts(self._iter_parts(filepath))
+    
+    def _iter_parts(self, filepath: Source) -> Iterator[Part]:
+        """Yield the parts of iter_parts() before separators are joined in."""
         validate_file_exists(filepath)
         
-        # Lazy import to avoid forcing dependency
-        try:
-            from openpyxl import load_workbook
-            from openpyxl.utils.exceptions import InvalidFileException
-        except ImportError as e:
-            raise ImportError(
-                "openpyxl not installed. "
-                "Use: uv run --with openpyxl python your_script.py"
-            ) from e
-        
-        # Open XLSX file in read-only mode
-        try:
-            workbook = load_workbook(
-                str(filepath),
-                read_only=True,   # Memory-efficient streaming mode
-                data_only=True    # Get formula values, not formulas
-            )
-        except InvalidFileException as e:
-            raise CorruptedFileError(
-                f"Invalid XLSX structure - file may be corrupted: {e}"
-            ) from e
-        except Exception as e:
-            # Detect password-protected files
-            error_msg = str(e).lower()
-            if "password" in error_msg or "encrypted" in error_msg:
+        # Workers reopen the file: in-memory workbooks are read here
+        sizes = self._parallel_sheet_sizes(filepath) if in_memory(filepath) is None else None
+        if sizes is not None:
+            yield from self._iter_sheets_parallel(file_path(filepath), sizes)
+            return
+        
+        if self.engine == "fast":
+            try:
+                with phase("open"):
+                    fast_workbook = FastWorkbook.open(as_input(filepath))
+            except UnsupportedWorkbook:
+                fast_workbook = None  # Fall through to openpyxl
+            if fast_workbook is not None:
+                try:
+                    yield from self._iter_workbook_parts(
+                        fast_workbook.sheetnames,
+                        lambda name: self._iter_fast_sheet_rows(fast_workbook, name),
+                    )
+                finally:
+                    fast_workbook.close()
+                return
+        
+        with phase("open"):
+            # Lazy import to avoid forcing dependency
+            try:
+                from openpyxl import load_workbook
+                from openpyxl.utils.exceptions import InvalidFileException
+            except ImportError as e:
+                raise ImportError(
+                    "openpyxl not installed. "
+                    "Use: uv run --with openpyxl python your_script.py"
+                ) from e
+            
+            # Open XLSX file in read-only mode
+            try:
+                workbook = load_workbook(
+                    as_input(filepath),
+                    read_only=True,   # Memory-efficient streaming mode
+                    data_only=True    # Get formula values, not formulas
+                )
+            except InvalidFileException as e:
+                raise CorruptedFileError(
+                    f"Invalid XLSX structure - file may be corrupted: {e}"
+                ) from e
+            except Exception as e:
+                # Detect password-protected files
+                error_msg = str(e).lower()
+                if "password" in error_msg or "encrypted" in error_msg:
+                    raise CorruptedFileError(
+                        "Password-protected XLSX files are not supported"
+                    ) from e
+                # Generic error handling
                 raise CorruptedFileError(
-                    "Password-protected XLSX files are not supported"
+                    f"Failed to open XLSX file: {e}"
                 ) from e
-            # Generic error handling
-            raise CorruptedFileError(
-                f"Failed to open XLSX file: {e}"
-            ) from e
         
         try:
-            text_parts = []
-            
-            # Process all sheets
-            for sheet_name in workbook.sheetnames:
-                sheet = workbook[sheet_name]
-                
-                # Add sheet header
-                text_parts.append(f"\n=== SHEET: {sheet_name} ===\n")
-                
-                # Extract rows
-                sheet_content = self._extract_sheet_text(sheet)
-                if sheet_content:
-                    text_parts.append(sheet_content)
-            
-            return "\n".join(text_parts)
+            yield from self._iter_workbook_parts(
+                workbook.sheetnames,
+                lambda name: self._iter_sheet_rows(workbook[name]),
+            )
+        finally:
+            # Always close workbook to free resources (also runs when
+            # the consumer stops iterating early)
+            workbook.close()
+    
+    def probe(self, filepath: Source) -> DocumentInfo:
+        """
+        Report sheet names and declared dimensions, and encryption.
         
+        Reads [Content_Types].xml, xl/workbook.xml and each worksheet up
+        to its <dimension> element; no cell is parsed, so probing costs
+        the same for 10 or 10 million rows. Dimensions are as declared by
+        the writer (usually exact; trailing empty rows may be included;
+        streaming writers may omit them, leaving the XML size as a hint).
+        Password-protected workbooks are OLE files, reported as encrypted.
+        
+        Args:
+            filepath: Path to XLSX file
+            
+        Returns:
+            DocumentInfo with sheets and encrypted
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            CorruptedFileError: If the workbook structure is unreadable
+        """
+        info = super().probe(filepath)
+        if is_ole_file(filepath):
+            info.encrypted = True
+            return info
+        try:
+            workbook = FastWorkbook.open(as_input(filepath), metadata_only=True)
+        except UnsupportedWorkbook as e:
+            raise CorruptedFileError(f"Failed to read XLSX structure: {e}") from e
+        try:
+            for name in workbook.sheetnames:
+                ref = workbook.dimension_ref(name) or None
+                rows, columns = dimension_size(ref)
+                info.sheets.append(SheetInfo(name, ref, rows, columns,
+                                             workbook.part_size(name)))
         finally:
-            # Always close workbook to free resources
             workbook.close()
+        return info
     
-    def _extract_sheet_text(self, sheet) -> str:
+    def _iter_workbook_parts(
+        self,
+        sheetnames: List[str],
+        iter_sheet_rows: Callable[[str], Iterator[Tuple[int, str]]],
+    ) -> Iterator[Part]:
         """
-        Extract text from a worksheet.
+        Yield sheet headers followed by that sheet's non-empty rows.
         
         Args:
-            sheet: openpyxl Worksheet object
+            sheetnames: Sheet names in workbook order
+            iter_sheet_rows: Engine-specific (row number, row text)
+                extractor for a sheet name
+            
+        Yields:
+            "=== SHEET: name ===" header, then one "row" part per row
+            
+        Raises:
+            ResourceLimitExceeded: If more rows than limits.max_rows are
+                extracted
+        """
+        limits = AbstractFileReader.limits
+        check_rows = limits is not None and limits.max_rows is not None
+        rows = 0
+        
+        # Process selected sheets (worksheet XML is only parsed when iterated)
+        for sheet_name in self._selected_sheets(sheetnames):
+            # Add sheet header
+            yield Part(f"\n=== SHEET: {sheet_name} ===\n")
             
+            # Extract rows
+            for row_number, row_text in iter_sheet_rows(sheet_name):
+                if check_rows:
+                    rows += 1
+                    limits.check_rows(rows)
+                yield Part(row_text, "row", {"sheet": sheet_name, "row": row_number})
+    
+    def _parallel_sheet_sizes(self, filepath: Source) -> Optional[Dict[str, int]]:
+        """
+        Decide whether parallel sheets are worth the process overhead.
+        
+        A run takes at least as long as its largest sheet, so only the XML
+        of the other selected sheets can be saved; it must reach
+        parallel_threshold. Sizes come from the ZIP directory (nothing is
+        parsed). Never nests pools: inside a worker process (e.g. batch
+        mode) and for previews (head()) sheets are read sequentially.
+        
         Returns:
-            Tab-separated rows of text
-        """
-        rows_text = []
-        
-        # Use iter_rows with values_only for performance
-        for row in sheet.iter_rows(values_only=True):
-            # Convert all cells to strings, handling None values
-            row_values = []
-            for cell in row:
-                if cell is not None:
-                    # Convert to string, preserving numbers and dates
-                    row_values.append(str(cell))
-                else:
-                    row_values.append("")
-            
-            # Join with tabs and skip completely empty rows
+            Uncompressed XML size of every sheet, in workbook order, if
+            the selected sheets should be extracted in parallel; else None
+        """
+        if (self.parallel_threshold is None or self.workers < 2
+                or multiprocessing.parent_process() is not None or previewing()):
+            return None
+        with phase("open"):
+            try:
+                workbook = FastWorkbook.open(str(file_path(filepath)), metadata_only=True)
+            except UnsupportedWorkbook:
+                return None  # Sequential extraction handles (or reports) it
+            try:
+                sizes = {name: workbook.part_size(name) or 0 for name in workbook.sheetnames}
+            finally:
+                workbook.close()
+        selected = [sizes[name] for name in self._selected_sheets(list(sizes))]
+        if len(selected) < 2 or sum(selected) - max(selected) < self.parallel_threshold:
+            return None
+        return sizes
+    
+    def _iter_sheets_parallel(self, filepath: Path, sizes: Dict[str, int]) -> Iterator[Part]:
+        """
+        Yield the workbook's parts, extracting each sheet in a worker process.
+        
+        Sheets are submitted largest first, so the longest one starts at
+        once, and consumed in workbook order, so output is identical to
+        sequential extraction. Workers get this process's resource limits.
+        
+        Args:
+            filepath: XLSX file path (reopened by each worker)
+            sizes: Uncompressed XML size of every sheet, in workbook order
+            
+        Yields:
+            Parts as _iter_workbook_parts() yields them
+            
+        Raises:
+            ResourceLimitExceeded: If a sheet or the workbook exceeds a limit
+            CorruptedFileError: If a worker dies or fails unexpectedly
+        """
+        sheets = self._selected_sheets(list(sizes))
+        options = {"rows": self.rows, "engine": self.engine,
+                   "max_empty_rows": self.max_empty_rows}
+        executor = worker_pool(min(self.workers, len(sheets)))
+        completed = False
+        try:
+            futures = {
+                name: executor.submit(_extract_sheet, str(filepath), name, options)
+                for name in sorted(sheets, key=lambda name: sizes[name], reverse=True)
+            }
+            yield from self._iter_workbook_parts(
+                list(sizes),
+                lambda name: iter(worker_result(futures[name], filepath)),
+            )
+            completed = True
+        finally:
+            # Early termination or error: drop sheets that have not
+            # started and do not wait for the running ones
+            executor.shutdown(wait=completed, cancel_futures=True)
+    
+    def _selected_sheets(self, sheetnames: List[str]) -> List[str]:
+        """
+        Resolve the sheet selection against the workbook's sheets.
+        
+        Args:
+            sheetnames: Sheet names in workbook order
+            
+        Returns:
+            Names of the sheets to extract
+            
+        Raises:
+            FileReaderError: If the selected sheet does not exist
+        """
+        if self.sheet is not None:
+            if self.sheet not in sheetnames:
+                raise FileReaderError(
+                    f"Sheet not found: '{self.sheet}'. "
+                    f"Available sheets: {', '.join(sheetnames)}"
+                )
+            return [self.sheet]
+        if self.sheet_index is not None:
+            if self.sheet_index > len(sheetnames):
+                raise FileReaderError(
+                    f"Sheet index {self.sheet_index} out of range: "
+                    f"workbook has {len(sheetnames)} sheet(s)"
+                )
+            return [sheetnames[self.sheet_index - 1]]
+        return sheetnames
+    
+    def _iter_sheet_rows(self, sheet) -> Iterator[Tuple[int, str]]:
+        """
+        Extract text from a worksheet row by row.
+        
+        Args:
+            sheet: openpyxl Worksheet object
+            
+        Yields:
+            (row number, tab-separated row text); completely empty rows
+            skipped, trailing empty cells trimmed
+        """
+        min_row, max_row = self._row_span or (None, None)
+        last_content = (min_row or 1) - 1
+        
+        # Use iter_rows with values_only for performance; rows after
+        # max_row are never parsed. Read-only sheets fill gaps with empty
+        # rows, so row numbers count up from min_row.
+        rows = sheet.iter_rows(min_row=min_row, max_row=max_row, values_only=True)
+        for row_number, row in enumerate(rows, start=min_row or 1):
+            if (self.max_empty_rows is not None
+                    and row_number - last_content > self.max_empty_rows):
+                break
+            
+            # Rows are padded to the declared width: find the last value
+            # before converting anything
+            end = len(row)
+            while end and (row[end - 1] is None or row[end - 1] == ""):
+                end -= 1
+            if not end:
+                continue
+            last_content = row_number
+            
+            # Convert cells to strings (preserving numbers and dates),
+            # handling None values
+            row_values = ["" if cell is None else str(cell) for cell in row[:end]]
+            
+            # Join with tabs and skip rows with only whitespace
             row_text = "\t".join(row_values)
-            if row_text.strip():  # Skip rows with only whitespace
-                rows_text.append(row_text)
+            if row_text.strip():
+                yield row_number, row_text
+    
+    def _iter_fast_sheet_rows(self, workbook: FastWorkbook,
+                              sheet_name: str) -> Iterator[Tuple[int, str]]:
+        """
+        Extract text from a worksheet row by row with the fast engine.
         
-        return "\n".join(rows_text)
+        Args:
+            workbook: Open FastWorkbook
+            sheet_name: Worksheet to read
+            
+        Yields:
+            (row number, tab-separated row text); completely empty rows
+            skipped, trailing empty cells trimmed
+        """
+        min_row, max_row = self._row_span or (None, None)
+        rows = workbook.iter_numbered_rows(sheet_name, min_row=min_row, max_row=max_row,
+                                           max_empty_rows=self.max_empty_rows)
+        for row_number, cells in rows:
+            row_text = "\t".join(cells)
+            if row_text.strip():  # Skip rows with only whitespace
+                yield row_number, row_text
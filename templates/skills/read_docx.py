@@ -4,12 +4,25 @@ DOCX File Reader CLI - Extract text from Microsoft Word documents
 
 Usage:
     uv run skills/read_docx.py <file.docx>
+    uv run skills/read_docx.py <file.docx> --range A:B
+    uv run skills/read_docx.py <file.docx> --engine fast|python-docx
     uv run skills/read_docx.py --help
     uv run skills/read_docx.py --version
 
 Examples:
     uv run skills/read_docx.py report.docx > report.txt
     uv run skills/read_docx.py document.docx 2>/dev/null
+    uv run skills/read_docx.py manual.docx --range 10:40
+
+Selection:
+    --range A:B extracts body blocks A to B only (paragraphs and tables in
+    document order, 1-based, inclusive, either side optional). Headers and
+    footers are omitted when a range is given.
+
+Engines:
+    --engine fast (default) streams the document XML directly and falls
+    back to python-docx for files it does not handle; --engine python-docx
+    always uses python-docx. Both produce identical text.
 
 Exit Codes:
     0 - Success (text extracted)
@@ -28,7 +41,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from file_readers.base import FileReaderError
-from file_readers.docx_reader import DocxReader
+from file_readers.docx_reader import ENGINES, DocxReader
 
 
 def main() -> int:
@@ -43,6 +56,18 @@ def main() -> int:
         "filepath",
         help="Path to DOCX file to read"
     )
+    parser.add_argument(
+        "--range",
+        dest="block_range",
+        metavar="A:B",
+        help="Only extract body blocks A to B (1-based, inclusive)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="fast",
+        help="Extraction engine (default: %(default)s)"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -53,17 +78,21 @@ def main() -> int:
     
     try:
         filepath = Path(args.filepath)
-        reader = DocxReader()
-        text = reader.read(filepath)
-        
-        # Output text to stdout
-        print(text, end='')
+        reader = DocxReader(block_range=args.block_range, engine=args.engine)
+        # Stream text to stdout chunk by chunk as it is extracted
+        for chunk in reader.iter_read(filepath):
+            sys.stdout.write(chunk)
         return 0
         
     except FileNotFoundError as e:
         sys.stderr.write(f"Error: {e}\n")
         return 1
         
+    except ValueError as e:
+        # Malformed selection spec
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+        
     except FileReaderError as e:
         # Catches CorruptedFileError and other reader-specific errors
         sys.stderr.write(f"Error: {e}\n")
@@ -4,12 +4,26 @@ PDF File Reader CLI - Extract text from PDF documents
 
 Usage:
     uv run skills/read_pdf.py <file.pdf>
+    uv run skills/read_pdf.py <file.pdf> [--workers N] [--parallel-threshold PAGES]
+    uv run skills/read_pdf.py <file.pdf> --pages RANGES
     uv run skills/read_pdf.py --help
     uv run skills/read_pdf.py --version
 
 Examples:
     uv run skills/read_pdf.py report.pdf > report.txt
     uv run skills/read_pdf.py document.pdf 2>/dev/null
+    uv run skills/read_pdf.py filing.pdf --workers 8 > filing.txt
+    uv run skills/read_pdf.py filing.pdf --pages 10-20,45 > excerpt.txt
+
+Large Documents:
+    PDFs with at least --parallel-threshold pages (default 200) are split
+    into page shards extracted by --workers processes (default: CPU count)
+    and stitched back together in page order. --parallel-threshold 0
+    disables sharding.
+
+Page Selection:
+    --pages takes 1-based page numbers and inclusive ranges, e.g.
+    "10-20,45" or "50-" (to the end). Unselected pages are never loaded.
 
 Exit Codes:
     0 - Success (text extracted)
@@ -28,7 +42,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from file_readers.base import FileReaderError
-from file_readers.pdf_reader import PdfReader
+from file_readers.pdf_reader import DEFAULT_PARALLEL_THRESHOLD, PdfReader
 
 
 def main() -> int:
@@ -43,6 +57,25 @@ def main() -> int:
         "filepath",
         help="Path to PDF file to read"
     )
+    parser.add_argument(
+        "--pages",
+        metavar="RANGES",
+        help="Only extract these pages, e.g. 10-20,45 or 50- (1-based)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for large documents (default: CPU count)"
+    )
+    parser.add_argument(
+        "--parallel-threshold",
+        type=int,
+        default=DEFAULT_PARALLEL_THRESHOLD,
+        metavar="PAGES",
+        help="Minimum page count for parallel extraction; 0 disables "
+             "(default: %(default)s)"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -53,17 +86,25 @@ def main() -> int:
     
     try:
         filepath = Path(args.filepath)
-        reader = PdfReader()
-        text = reader.read(filepath)
-        
-        # Output text to stdout
-        print(text, end='')
+        reader = PdfReader(
+            pages=args.pages,
+            parallel_threshold=args.parallel_threshold or None,
+            workers=args.workers,
+        )
+        # Stream text to stdout chunk by chunk as it is extracted
+        for chunk in reader.iter_read(filepath):
+            sys.stdout.write(chunk)
         return 0
         
     except FileNotFoundError as e:
         sys.stderr.write(f"Error: {e}\n")
         return 1
         
+    except ValueError as e:
+        # Malformed selection spec
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+        
     except FileReaderError as e:
         # Catches CorruptedFileError and other reader-specific errors
         sys.stderr.write(f"Error: {e}\n")
@@ -4,12 +4,25 @@ XLSX File Reader CLI - Extract text from Microsoft Excel spreadsheets
 
 Usage:
     uv run skills/read_xlsx.py <file.xlsx>
+    uv run skills/read_xlsx.py <file.xlsx> [--sheet NAME | --sheet-index N] [--rows A:B]
+    uv run skills/read_xlsx.py <file.xlsx> --engine fast|openpyxl
     uv run skills/read_xlsx.py --help
     uv run skills/read_xlsx.py --version
 
 Examples:
     uv run skills/read_xlsx.py data.xlsx > data.txt
     uv run skills/read_xlsx.py spreadsheet.xlsx 2>/dev/null
+    uv run skills/read_xlsx.py ledger.xlsx --sheet Q3 --rows 100:200
+
+Selection:
+    --sheet/--sheet-index (1-based) restrict extraction to one sheet;
+    --rows A:B (1-based, inclusive, either side optional) restricts rows.
+    Unselected sheets are never parsed.
+
+Engines:
+    --engine fast (default) streams the worksheet XML directly and falls
+    back to openpyxl for workbooks it does not handle; --engine openpyxl
+    always uses openpyxl. Both produce identical text.
 
 Exit Codes:
     0 - Success (text extracted)
@@ -28,7 +41,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from file_readers.base import FileReaderError
-from file_readers.xlsx_reader import XlsxReader
+from file_readers.xlsx_reader import ENGINES, XlsxReader
 
 
 def main() -> int:
@@ -43,6 +56,29 @@ def main() -> int:
         "filepath",
         help="Path to XLSX file to read"
     )
+    sheet_group = parser.add_mutually_exclusive_group()
+    sheet_group.add_argument(
+        "--sheet",
+        metavar="NAME",
+        help="Only extract the sheet with this name"
+    )
+    sheet_group.add_argument(
+        "--sheet-index",
+        type=int,
+        metavar="N",
+        help="Only extract the N-th sheet (1-based)"
+    )
+    parser.add_argument(
+        "--rows",
+        metavar="A:B",
+        help="Only extract rows A to B of each selected sheet (1-based, inclusive)"
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENGINES,
+        default="fast",
+        help="Extraction engine (default: %(default)s)"
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -53,17 +89,26 @@ def main() -> int:
     
     try:
         filepath = Path(args.filepath)
-        reader = XlsxReader()
-        text = reader.read(filepath)
-        
-        # Output text to stdout
-        print(text, end='')
+        reader = XlsxReader(
+            sheet=args.sheet,
+            sheet_index=args.sheet_index,
+            rows=args.rows,
+            engine=args.engine,
+        )
+        # Stream text to stdout chunk by chunk as it is extracted
+        for chunk in reader.iter_read(filepath):
+            sys.stdout.write(chunk)
         return 0
         
     except FileNotFoundError as e:
         sys.stderr.write(f"Error: {e}\n")
         return 1
         
+    except ValueError as e:
+        # Malformed selection spec
+        sys.stderr.write(f"Error: {e}\n")
+        return 1
+        
     except FileReaderError as e:
         # Catches CorruptedFileError and other reader-specific errors
         sys.stderr.write(f"Error: {e}\n")
@@ -0,0 +1,111 @@
+"""
+Unit Tests for the File Reader Benchmarks
+
+Tests coverage:
+- Corpus generation is deterministic and matches its manifest
+- Measurements report consistent throughput and memory fields
+- Isolated suite runs record the environment
+- Comparison flags throughput drops and memory growth beyond thresholds
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (corpus tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.corpus import CorpusSpec, generate_corpus, load_corpus
+from benchmarks.measure import measure, run_suite
+
+TINY = CorpusSpec(pdf_pages=3, xlsx_rows=60, xlsx_cols=4, xlsx_sheets=2,
+                  docx_paragraphs=30, docx_tables=2, docx_table_rows=3,
+                  docx_sections=2)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Tiny generated corpus."""
+    for module in ("pymupdf", "openpyxl", "docx"):
+        pytest.importorskip(module)
+    generate_corpus(tmp_path / "corpus", TINY)
+    return tmp_path / "corpus"
+
+
+def results(**metrics):
+    """Results document with one measurement per id -> (mb_per_s, peak_rss_mb)."""
+    return {"results": [
+        {"id": name, "mb_per_s": speed, "peak_rss_mb": rss}
+        for name, (speed, rss) in metrics.items()
+    ]}
+
+
+class TestCorpus:
+    """Test corpus generation."""
+    
+    def test_deterministic(self, corpus, tmp_path):
+        """The same spec produces byte-identical documents."""
+        generate_corpus(tmp_path / "again", TINY)
+        for corpus_file in load_corpus(corpus):
+            first = (corpus / corpus_file.name).read_bytes()
+            assert first == (tmp_path / "again" / corpus_file.name).read_bytes()
+    
+    def test_manifest_matches_documents(self, corpus):
+        """The manifest records each file's work units and size."""
+        files = {f.format: f for f in load_corpus(corpus)}
+        assert (files["pdf"].unit, files["pdf"].units) == ("pages", 3)
+        assert (files["xlsx"].unit, files["xlsx"].units) == ("rows", 120)
+        assert (files["docx"].unit, files["docx"].units) == ("blocks", 32)
+        assert files["pdf"].bytes == (corpus / files["pdf"].name).stat().st_size
+    
+    def test_invalid_spec(self):
+        """Sizes must be positive."""
+        with pytest.raises(ValueError, match="pdf_pages"):
+            CorpusSpec(pdf_pages=0)
+
+
+class TestMeasure:
+    """Test measurements."""
+    
+    def test_measure_fields(self, corpus):
+        """Throughput derives from the best time; text was extracted."""
+        corpus_file = next(f for f in load_corpus(corpus) if f.format == "xlsx")
+        result = measure(corpus, corpus_file, "openpyxl", repeat=2)
+        assert result.id == f"{corpus_file.name}:openpyxl"
+        assert result.chars > 0
+        assert result.best_seconds <= result.median_seconds
+        assert result.units_per_s == pytest.approx(120 / result.best_seconds, rel=0.01)
+        assert result.peak_rss_mb >= result.baseline_rss_mb > 0
+    
+    def test_isolated_suite(self, corpus):
+        """Each variant of the selected formats runs in a child interpreter."""
+        suite = run_suite(corpus, repeat=1, formats=["docx"])
+        assert [r["variant"] for r in suite["results"]] == ["fast", "python-docx"]
+        assert suite["corpus"]["docx_paragraphs"] == 30
+        assert suite["environment"]["reader_versions"]["docx"]
+
+
+class TestCompare:
+    """Test regression detection."""
+    
+    def test_flags_beyond_threshold(self):
+        """Slower throughput or more memory beyond the threshold is a regression."""
+        comparison = compare(
+            results(a=(10.0, 100.0), b=(10.0, 100.0), c=(10.0, 100.0)),
+            results(a=(9.5, 105.0), b=(8.0, 100.0), c=(12.0, 120.0)),
+            threshold=0.10,
+        )
+        flagged = {(change.id, change.metric) for change in comparison.regressions}
+        assert flagged == {("b", "mb_per_s"), ("c", "peak_rss_mb")}
+        assert "2 regression(s)" in comparison.format()
+    
+    def test_separate_rss_threshold(self):
+        """Memory growth can be allowed more slack than throughput."""
+        comparison = compare(results(a=(10.0, 100.0)), results(a=(10.0, 120.0)),
+                             threshold=0.05, rss_threshold=0.25)
+        assert comparison.regressions == []
+    
+    def test_unmatched_ids_listed(self):
+        """Measurements in only one file are reported, not flagged."""
+        comparison = compare(results(a=(1.0, 1.0)), results(b=(1.0, 1.0)))
+        assert (comparison.missing, comparison.added) == (["a"], ["b"])
+        assert comparison.regressions == []
@@ -0,0 +1,69 @@
+"""
+Shared fixtures for file_readers tests.
+
+Sample documents are generated on the fly with the same libraries the
+readers use, so tests needing them are skipped when a library is missing.
+"""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def sample_pdf(tmp_path) -> Path:
+    """Three-page PDF with an empty second page."""
+    pymupdf = pytest.importorskip("pymupdf")
+    path = tmp_path / "sample.pdf"
+    doc = pymupdf.open()
+    for text in ("First page text", "", "Third page text"):
+        page = doc.new_page()
+        if text:
+            page.insert_text((72, 72), text)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def sample_xlsx(tmp_path) -> Path:
+    """Workbook with two populated sheets and one empty sheet."""
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "sample.xlsx"
+    workbook = openpyxl.Workbook()
+    budget = workbook.active
+    budget.title = "Budget"
+    budget.append(["Item", "Cost", None, "Notes"])
+    budget.append(["Rent", 1200, None, None])
+    budget.append([None, None, None, None])
+    budget.append(["Power", 75.5, None, "estimate"])
+    workbook.create_sheet("Empty")
+    other = workbook.create_sheet("Other")
+    other["A1"] = "hello"
+    other["C3"] = "world"
+    workbook.save(str(path))
+    workbook.close()
+    return path
+
+
+@pytest.fixture
+def sample_docx(tmp_path) -> Path:
+    """Document with paragraphs, a merged-cell table, header and footer."""
+    docx = pytest.importorskip("docx")
+    path = tmp_path / "sample.docx"
+    document = docx.Document()
+    document.add_paragraph("Title paragraph")
+    document.add_paragraph("")
+    table = document.add_table(rows=3, cols=3)
+    table.cell(0, 0).merge(table.cell(0, 1)).text = "merged"
+    table.cell(0, 2).text = "x"
+    table.cell(1, 0).text = "a"
+    table.cell(1, 1).text = "b1"
+    table.cell(1, 1).add_paragraph("b2")
+    table.cell(2, 2).text = "z"
+    document.add_paragraph("Closing paragraph")
+    section = document.sections[0]
+    section.header.paragraphs[0].text = "Running header"
+    section.footer.paragraphs[0].text = "Running footer"
+    document.save(str(path))
+    return path
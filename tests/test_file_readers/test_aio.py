@@ -0,0 +1,174 @@
+"""
+Unit Tests for the Async Reader API
+
+Tests coverage:
+- AbstractFileReader.aread() matches read() and honours timeouts
+- aread_many() completion order, bounded concurrency, shared semaphores
+- Per-file timeouts and errors reported as BatchResults
+- Timed-out extractions hold their slot until the worker finishes
+- Cancellation when the consumer stops early
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (no external dependencies except the docx sample)
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.aio import aread_many, shared_executor
+from templates.skills.file_readers.base import AbstractFileReader
+from templates.skills.file_readers.docx_reader import DocxReader
+
+
+async def collect(iterator):
+    """Drain an async iterator into a list."""
+    return [item async for item in iterator]
+
+
+@pytest.fixture
+def slow_reader():
+    """Register a reader for .slow files that sleeps for the file's content."""
+    original_registry = AbstractFileReader.registry.copy()
+    
+    class SlowReader(AbstractFileReader):
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        calls = 0
+        
+        @classmethod
+        def get_extension(cls) -> str:
+            return "slow"
+        
+        def read(self, filepath: Path) -> str:
+            cls = type(self)
+            with cls.lock:
+                cls.calls += 1
+                cls.running += 1
+                cls.peak = max(cls.peak, cls.running)
+            try:
+                time.sleep(float(filepath.read_text()))
+            finally:
+                with cls.lock:
+                    cls.running -= 1
+            return filepath.stem
+    
+    yield SlowReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+def slow_files(tmp_path: Path, delays) -> list:
+    """Create one .slow file per delay, named f0, f1, ..."""
+    paths = []
+    for index, delay in enumerate(delays):
+        path = tmp_path / f"f{index}.slow"
+        path.write_text(str(delay))
+        paths.append(path)
+    return paths
+
+
+class TestAread:
+    """Test single-file async extraction."""
+    
+    def test_matches_read(self, sample_docx):
+        """aread() returns exactly what read() returns."""
+        reader = DocxReader()
+        assert asyncio.run(reader.aread(sample_docx)) == reader.read(sample_docx)
+    
+    def test_timeout(self, tmp_path, slow_reader):
+        """A slow extraction raises asyncio.TimeoutError."""
+        path, = slow_files(tmp_path, [0.5])
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(slow_reader().aread(path, timeout=0.05))
+    
+    def test_event_loop_not_blocked(self, tmp_path, slow_reader):
+        """Other coroutines keep running while a file is extracted."""
+        path, = slow_files(tmp_path, [0.2])
+        ticks = []
+        
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+        
+        async def main():
+            await asyncio.gather(slow_reader().aread(path), ticker())
+        
+        asyncio.run(main())
+        assert len(ticks) == 5 and ticks[-1] - ticks[0] < 0.15
+
+
+class TestAreadMany:
+    """Test concurrent async extraction."""
+    
+    def test_completion_order(self, tmp_path, slow_reader):
+        """Results arrive as they finish, not in input order."""
+        paths = slow_files(tmp_path, [0.3, 0.0, 0.1])
+        results = asyncio.run(collect(aread_many(paths, concurrency=3)))
+        assert [r.text for r in results] == ["f1", "f2", "f0"]
+        assert all(r.ok for r in results)
+    
+    def test_concurrency_is_bounded(self, tmp_path, slow_reader):
+        """No more than `concurrency` extractions run at once."""
+        paths = slow_files(tmp_path, [0.05] * 8)
+        results = asyncio.run(collect(aread_many(paths, concurrency=2)))
+        assert len(results) == 8
+        assert slow_reader.peak <= 2
+    
+    def test_shared_semaphore(self, tmp_path, slow_reader):
+        """A semaphore shared by two calls caps them together."""
+        paths = slow_files(tmp_path, [0.05] * 6)
+        
+        async def main():
+            semaphore = asyncio.Semaphore(2)
+            return await asyncio.gather(
+                collect(aread_many(paths[:3], concurrency=3, semaphore=semaphore)),
+                collect(aread_many(paths[3:], concurrency=3, semaphore=semaphore)),
+            )
+        
+        first, second = asyncio.run(main())
+        assert len(first) + len(second) == 6
+        assert slow_reader.peak <= 2
+    
+    def test_timeouts_and_errors_are_per_file(self, tmp_path, slow_reader):
+        """A timeout or a missing file fails that file only."""
+        paths = slow_files(tmp_path, [0.5, 0.0]) + [tmp_path / "missing.slow"]
+        results = asyncio.run(collect(aread_many(paths, timeout=0.1)))
+        by_name = {r.path.name: r for r in results}
+        assert by_name["f1.slow"].text == "f1"
+        assert "Timed out" in by_name["f0.slow"].error
+        assert not by_name["missing.slow"].ok
+    
+    def test_timed_out_work_keeps_its_slot(self, tmp_path, slow_reader):
+        """An abandoned extraction still counts until its worker finishes."""
+        paths = slow_files(tmp_path, [0.3, 0.0, 0.0])
+        results = asyncio.run(collect(aread_many(paths, concurrency=1, timeout=0.05)))
+        assert "Timed out" in results[0].error
+        assert slow_reader.peak == 1
+    
+    def test_early_exit_cancels_queued_work(self, tmp_path, slow_reader):
+        """Leaving the loop early cancels extractions not yet started."""
+        paths = slow_files(tmp_path, [0.05] * 10)
+        
+        async def first_only():
+            async for result in aread_many(paths, concurrency=1):
+                return result
+        
+        result = asyncio.run(first_only())
+        assert result.ok
+        assert slow_reader.calls <= 2
+    
+    def test_invalid_concurrency(self, tmp_path):
+        """concurrency must be positive."""
+        with pytest.raises(ValueError, match="concurrency"):
+            asyncio.run(collect(aread_many([tmp_path / "a.pdf"], concurrency=0)))
+    
+    def test_unknown_executor_kind(self):
+        """Only thread and process executors are available."""
+        with pytest.raises(ValueError, match="Unknown executor kind"):
+            shared_executor("fiber")
@@ -0,0 +1,254 @@
+"""
+Unit Tests for In-Memory Sources and Archive Bundles
+
+Tests coverage:
+- DocumentSource: readers, sniffing, probing, cache and limits work on
+  bytes exactly as on files
+- is_archive(): ZIP/TAR bundles vs DOCX/XLSX packages
+- iter_archive(): member selection, nested bundles, decompression budget
+- read_member(): BUNDLE!/MEMBER paths, nested and missing members
+- read_file.py on bundles and member paths
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.archive import (MAX_NESTING, is_archive,
+                                                   iter_archive, read_member,
+                                                   split_member_path)
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                CorruptedFileError,
+                                                ResourceLimitExceeded)
+from templates.skills.file_readers.cache import ExtractionCache
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.limits import ResourceLimits
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.source import DocumentSource
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+
+def in_memory(path: Path, label: str = None) -> DocumentSource:
+    return DocumentSource.from_bytes(path.read_bytes(), label or f"upload/{path.name}")
+
+
+@pytest.fixture
+def bundle(tmp_path, sample_pdf, sample_xlsx, sample_docx) -> Path:
+    """bundle.zip: a PDF, a skipped text file and a nested tar.gz (XLSX, DOCX)."""
+    nested = io.BytesIO()
+    with tarfile.open(fileobj=nested, mode="w:gz") as archive:
+        archive.add(sample_xlsx, "./sheets/data.xlsx")
+        archive.add(sample_docx, "letter.docx")
+    path = tmp_path / "bundle.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.write(sample_pdf, "docs/report.pdf")
+        archive.writestr("docs/", "")
+        archive.writestr("notes.txt", "not a document")
+        archive.writestr("inner.tar.gz", nested.getvalue())
+    return path
+
+
+class TestDocumentSource:
+    """Test that in-memory documents read like files."""
+    
+    @pytest.mark.parametrize("reader, fixture", [
+        (PdfReader(), "sample_pdf"),
+        (XlsxReader(engine="fast"), "sample_xlsx"),
+        (XlsxReader(engine="openpyxl"), "sample_xlsx"),
+        (DocxReader(engine="fast"), "sample_docx"),
+        (DocxReader(engine="python-docx"), "sample_docx"),
+    ])
+    def test_same_text_as_file(self, reader, fixture, request):
+        """Every reader and engine extracts the same text from bytes."""
+        path = request.getfixturevalue(fixture)
+        assert reader.read(in_memory(path)) == reader.read(path)
+    
+    def test_records_carry_label(self, sample_xlsx):
+        """Records and errors name the source by its label."""
+        source = in_memory(sample_xlsx, "bundle.zip!/data.xlsx")
+        records = list(XlsxReader().iter_records(source))
+        assert records and all(record.path == "bundle.zip!/data.xlsx" for record in records)
+    
+    def test_content_sniffed(self, sample_docx):
+        """A label without a known extension is identified by content."""
+        source = in_memory(sample_docx, "attachment")
+        assert isinstance(AbstractFileReader.get_reader(source), DocxReader)
+    
+    def test_probe(self, sample_pdf):
+        """Probing reports the content size."""
+        info = PdfReader().probe(in_memory(sample_pdf))
+        assert (info.size_bytes, info.pages) == (sample_pdf.stat().st_size, 3)
+    
+    def test_cache_shared_with_file(self, sample_docx, tmp_path):
+        """Keys are content hashes: bytes hit the entry the file created."""
+        cache = ExtractionCache(root=tmp_path / "cache")
+        AbstractFileReader.set_cache(cache)
+        try:
+            DocxReader().read(sample_docx)
+            DocxReader().read(in_memory(sample_docx))
+        finally:
+            AbstractFileReader.set_cache(None)
+        assert (cache.misses, cache.hits) == (1, 1)
+    
+    def test_zip_ratio_checked(self, sample_xlsx):
+        """ZIP limits inspect in-memory packages too."""
+        AbstractFileReader.set_limits(ResourceLimits(max_zip_ratio=1.01))
+        try:
+            with pytest.raises(ResourceLimitExceeded, match="possible ZIP bomb"):
+                XlsxReader().read(in_memory(sample_xlsx))
+        finally:
+            AbstractFileReader.set_limits(None)
+    
+    def test_pdf_not_sharded(self, sample_pdf, monkeypatch):
+        """Workers reopen files by path, so in-memory PDFs stay in process."""
+        def fail(*args):
+            raise AssertionError("sharded an in-memory PDF")
+        monkeypatch.setattr(PdfReader, "_iter_pages_parallel", fail)
+        reader = PdfReader(parallel_threshold=1, workers=4)
+        assert reader.read(in_memory(sample_pdf)) == PdfReader().read(sample_pdf)
+    
+    def test_corrupted_bytes(self):
+        """Invalid content fails like an invalid file."""
+        with pytest.raises(CorruptedFileError):
+            PdfReader().read(DocumentSource.from_bytes(b"%PDF-1.4 garbage", "bad.pdf"))
+    
+    def test_needs_path_or_data(self):
+        """A source holds exactly one of a path and content."""
+        with pytest.raises(ValueError):
+            DocumentSource("x.pdf")
+
+
+class TestArchives:
+    """Test bundle detection, member walks and the decompression budget."""
+    
+    def test_is_archive(self, bundle, sample_docx, sample_xlsx, sample_pdf, tmp_path):
+        """Bundles are archives; OOXML packages and PDFs are documents."""
+        tarball = tmp_path / "b.tar.bz2"
+        with tarfile.open(tarball, "w:bz2") as archive:
+            archive.add(sample_pdf, "a.pdf")
+        assert is_archive(bundle) and is_archive(tarball)
+        assert not any(is_archive(path) for path in (sample_docx, sample_xlsx, sample_pdf))
+        assert not is_archive(tmp_path / "missing.zip")
+    
+    def test_members_in_archive_order(self, bundle):
+        """Supported members are yielded; nested bundles are expanded."""
+        labels = [str(member) for member in iter_archive(bundle)]
+        assert labels == [
+            f"{bundle}!/docs/report.pdf",
+            f"{bundle}!/inner.tar.gz!/sheets/data.xlsx",
+            f"{bundle}!/inner.tar.gz!/letter.docx",
+        ]
+    
+    def test_members_read_like_files(self, bundle, sample_pdf):
+        """Members are complete in-memory copies."""
+        member = next(iter_archive(bundle))
+        assert member.path is None
+        assert PdfReader().read(member) == PdfReader().read(sample_pdf)
+    
+    def test_budget(self, bundle, sample_pdf):
+        """Decompression stops before the member that would exceed it."""
+        members = iter_archive(bundle, max_bytes=sample_pdf.stat().st_size + 10)
+        assert str(next(members)).endswith("report.pdf")
+        with pytest.raises(ResourceLimitExceeded, match="inner.tar.gz"):
+            next(members)
+    
+    def test_nesting_limit(self, sample_pdf, tmp_path):
+        """Bundles nested deeper than MAX_NESTING are refused."""
+        data = sample_pdf.read_bytes()
+        name = "a.pdf"
+        for level in range(MAX_NESTING + 1):
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w") as archive:
+                archive.writestr(name, data)
+            data, name = buffer.getvalue(), f"level{level}.zip"
+        path = tmp_path / "deep.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr(name, data)
+        with pytest.raises(ResourceLimitExceeded, match="nested"):
+            list(iter_archive(path))
+    
+    def test_truncated_tar(self, sample_pdf, tmp_path):
+        """A member cut short is a corrupted archive, not an unexpected error."""
+        buffer = io.BytesIO()
+        with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+            archive.add(sample_pdf, "report.pdf")
+        path = tmp_path / "trunc.tgz"
+        path.write_bytes(buffer.getvalue()[:len(buffer.getvalue()) // 2])
+        with pytest.raises(CorruptedFileError, match="trunc.tgz!/report.pdf"):
+            list(iter_archive(path))
+        with pytest.raises(CorruptedFileError, match="trunc.tgz!/report.pdf"):
+            read_member(f"{path}!/report.pdf")
+    
+    def test_read_nested_member(self, bundle, sample_docx):
+        """BUNDLE!/MEMBER paths reach into nested bundles."""
+        member = read_member(f"{bundle}!/inner.tar.gz!/letter.docx")
+        assert str(member) == f"{bundle}!/inner.tar.gz!/letter.docx"
+        assert DocxReader().read(member) == DocxReader().read(sample_docx)
+    
+    def test_missing_member(self, bundle):
+        """An unknown member is reported as not found."""
+        with pytest.raises(FileNotFoundError, match="missing.pdf"):
+            read_member(f"{bundle}!/missing.pdf")
+    
+    def test_member_of_document(self, bundle):
+        """Only bundles have members."""
+        with pytest.raises(CorruptedFileError, match="Not a ZIP or TAR"):
+            read_member(f"{bundle}!/docs/report.pdf!/page1")
+    
+    def test_split_member_path(self):
+        """Member paths split at every separator; empty names are invalid."""
+        assert split_member_path("a.zip!/b.tar!/c/d.pdf") == (Path("a.zip"), ["b.tar", "c/d.pdf"])
+        with pytest.raises(ValueError):
+            split_member_path("a.zip!/")
+
+
+class TestCli:
+    """Test read_file.py on bundles and member paths."""
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-daemon", "--no-cache", *args],
+            capture_output=True, text=True,
+        )
+    
+    def test_bundle(self, bundle):
+        """Each member is printed after a delimiter line."""
+        result = self.run(str(bundle))
+        assert result.returncode == 0
+        assert result.stdout.count("=== FILE: ") == 3
+        assert f"=== FILE: {bundle}!/inner.tar.gz!/letter.docx ===" in result.stdout
+    
+    def test_member_with_reader_options(self, bundle, sample_pdf):
+        """A member path takes reader options like a file."""
+        result = self.run(f"{bundle}!/docs/report.pdf", "--pages", "2")
+        expected = PdfReader(pages="2").read(sample_pdf)
+        assert (result.returncode, result.stdout) == (0, expected)
+    
+    def test_bundle_rejects_reader_options(self, bundle):
+        """Selections apply to one document, not to a whole bundle."""
+        result = self.run(str(bundle), "--pages", "1")
+        assert result.returncode == 1
+        assert "BUNDLE!/MEMBER" in result.stderr
+    
+    def test_budget_exceeded(self, bundle):
+        """Running out of budget is an error after the members before it."""
+        result = self.run(str(bundle), "--max-archive-mb", "0.004")
+        assert result.returncode == 1
+        assert "decompress to more than" in result.stderr
+    
+    def test_probe_bundle(self, bundle):
+        """--probe describes every member."""
+        result = self.run(str(bundle), "--probe", "json")
+        infos = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [info["format"] for info in infos] == ["pdf", "xlsx", "docx"]
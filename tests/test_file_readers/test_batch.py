@@ -0,0 +1,160 @@
+"""
+Unit Tests for Batch Extraction
+
+Tests coverage:
+- Directory walking filtered to registered extensions
+- In-process extraction (workers=1) and per-file error capture
+- Process pool extraction (ordered and unordered)
+- A crashing worker fails only its own file; the batch goes on
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (pool tests require PyMuPDF)
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                validate_file_exists)
+from templates.skills.file_readers.batch import extract_many, iter_files
+
+
+@pytest.fixture
+def txt_reader():
+    """Register a plain-text reader for the duration of a test."""
+    original_registry = AbstractFileReader.registry.copy()
+    AbstractFileReader.registry.clear()
+    
+    class TxtReader(AbstractFileReader):
+        @classmethod
+        def get_extension(cls) -> str:
+            return "txt"
+        
+        def read(self, filepath: Path) -> str:
+            validate_file_exists(filepath)
+            return filepath.read_text(encoding="utf-8")
+    
+    yield TxtReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Create a small directory tree of text and unsupported files."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "a.txt").write_text("alpha")
+    (tmp_path / "sub" / "b.txt").write_text("beta")
+    (tmp_path / ".hidden" / "c.txt").write_text("hidden")
+    (tmp_path / "notes.md").write_text("unsupported")
+    return tmp_path
+
+
+class TestIterFiles:
+    """Test directory walking."""
+    
+    def test_recursive_walk_filters_supported(self, txt_reader, corpus):
+        """Only registered extensions are yielded, hidden dirs skipped."""
+        files = list(iter_files(corpus))
+        assert files == [corpus / "a.txt", corpus / "sub" / "b.txt"]
+    
+    def test_non_recursive_walk(self, txt_reader, corpus):
+        """recursive=False stays in the top-level directory."""
+        assert list(iter_files(corpus, recursive=False)) == [corpus / "a.txt"]
+    
+    def test_not_a_directory_raises(self, txt_reader, corpus):
+        """Walking a file raises NotADirectoryError."""
+        with pytest.raises(NotADirectoryError):
+            list(iter_files(corpus / "a.txt"))
+
+
+class TestExtractManyInProcess:
+    """Test extract_many() without a process pool."""
+    
+    def test_results_in_input_order(self, txt_reader, corpus):
+        """Results follow input order and carry extracted text."""
+        paths = [corpus / "sub" / "b.txt", corpus / "a.txt"]
+        results = list(extract_many(paths, workers=1))
+        
+        assert [r.path for r in results] == paths
+        assert [r.text for r in results] == ["beta", "alpha"]
+        assert all(r.ok for r in results)
+    
+    def test_errors_do_not_abort_batch(self, txt_reader, corpus):
+        """Missing and unsupported files are reported per file."""
+        paths = [corpus / "missing.txt", corpus / "notes.md", corpus / "a.txt"]
+        results = list(extract_many(paths, workers=1))
+        
+        assert not results[0].ok
+        assert "File not found" in results[0].error
+        assert not results[1].ok
+        assert "Unsupported file format" in results[1].error
+        assert results[2].text == "alpha"
+        assert not any(r.unexpected for r in results)
+    
+    def test_forced_format(self, txt_reader, corpus):
+        """fmt overrides extension-based reader selection."""
+        results = list(extract_many([corpus / "notes.md"], workers=1, fmt="txt"))
+        assert results[0].text == "unsupported"
+
+
+class TestExtractManyPool:
+    """Test extract_many() with a process pool (real PDF reader)."""
+    
+    @pytest.fixture
+    def pdf_corpus(self, tmp_path):
+        """Create several single-page PDFs."""
+        pymupdf = pytest.importorskip("pymupdf")
+        paths = []
+        for i in range(6):
+            doc = pymupdf.open()
+            page = doc.new_page()
+            page.insert_text((72, 72), f"document {i}")
+            path = tmp_path / f"doc{i}.pdf"
+            doc.save(str(path))
+            doc.close()
+            paths.append(path)
+        return paths
+    
+    def test_ordered_pool(self, pdf_corpus):
+        """Ordered pool results match input order."""
+        results = list(extract_many(pdf_corpus, workers=2))
+        
+        assert [r.path for r in results] == pdf_corpus
+        for i, result in enumerate(results):
+            assert result.ok, result.error
+            assert f"document {i}" in result.text
+    
+    def test_unordered_pool_returns_every_file(self, pdf_corpus):
+        """Unordered pool yields exactly one result per input."""
+        results = list(extract_many(pdf_corpus, workers=2, ordered=False))
+        
+        assert sorted(r.path for r in results) == sorted(pdf_corpus)
+        assert all(r.ok for r in results)
+    
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_crashed_worker_fails_only_its_file(self, txt_reader, corpus, ordered):
+        """A worker dying mid-file is reported; the pool is rebuilt."""
+        def read(self, filepath: Path) -> str:
+            if filepath.name.startswith("crash"):
+                os._exit(1)
+            return filepath.read_text(encoding="utf-8")
+        txt_reader.read = read
+        paths = []
+        for index in range(8):
+            name = "crash.txt" if index == 2 else f"doc{index}.txt"
+            (corpus / name).write_text(f"text {index}")
+            paths.append(corpus / name)
+        
+        results = list(extract_many(paths, workers=2, ordered=ordered))
+        by_path = {result.path: result for result in results}
+        
+        assert sorted(by_path) == sorted(paths)
+        crashed = by_path.pop(corpus / "crash.txt")
+        assert "Worker process died" in crashed.error and crashed.unexpected
+        assert all(result.ok for result in by_path.values())
+        if ordered:
+            assert [result.path for result in results] == paths
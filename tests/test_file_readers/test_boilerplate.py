@@ -0,0 +1,199 @@
+"""
+Unit Tests for Boilerplate Stripping
+
+Tests coverage:
+- Running headers, footers and page numbers are dropped after their
+  first occurrence; body lines and non-page text pass through
+- Warmup: repeats are dropped from page 2 on; fragment boundaries and
+  page count do not change the result
+- DOCX header/footer entries repeated across sections
+- Count-Min sketch never undercounts; stats account for every byte
+- read_file.py --strip-boilerplate
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, python-docx)
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.boilerplate import (BoilerplateFilter,
+                                                       _CountMinSketch)
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+BODY = ["Revenue grew in the northern region.", "Margins held steady.",
+        "The board approved the plan.", "Audit findings were minor.",
+        "Hiring slowed in spring.", "Capital spending rose."]
+
+
+def page_text(number: int, pages: int = 12) -> str:
+    """One page: header, two body lines, page number footer."""
+    return (f"\n=== PAGE {number} ===\n"
+            f"ACME Corp Annual Report\n"
+            f"{BODY[number % len(BODY)]}\n{BODY[(number + 1) % len(BODY)]} ({number})\n"
+            f"Page {number} of {pages}\n")
+
+
+def document(pages: int = 12) -> str:
+    return "".join(page_text(number, pages) for number in range(1, pages + 1))
+
+
+def strip(text: str, **kwargs) -> str:
+    return "".join(BoilerplateFilter(**kwargs).filter([text]))
+
+
+@pytest.fixture
+def report_pdf(tmp_path) -> Path:
+    """Twelve pages with a running header and a "Page n of 12" footer."""
+    pymupdf = pytest.importorskip("pymupdf")
+    path = tmp_path / "report.pdf"
+    doc = pymupdf.open()
+    for number in range(1, 13):
+        page = doc.new_page()
+        page.insert_text((72, 40), "ACME Corp Annual Report")
+        page.insert_text((72, 200), f"{BODY[number % 6]}\n{BODY[(number + 1) % 6]}")
+        page.insert_text((72, 800), f"Page {number} of 12")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestFilter:
+    """Test which lines are dropped."""
+    
+    def test_repeats_dropped_first_kept(self):
+        """Header and page numbers survive only on page 1."""
+        text = strip(document())
+        assert text.count("ACME Corp Annual Report") == 1
+        assert text.count(" of 12") == 1
+        assert text.startswith(page_text(1))
+        assert text.count("=== PAGE") == 12
+    
+    def test_body_untouched(self):
+        """Body lines differing beyond digits are kept on every page."""
+        text = strip(document())
+        for number in range(1, 13):
+            assert f"{BODY[(number + 1) % len(BODY)]} ({number})\n" in text
+    
+    def test_below_threshold_kept(self):
+        """A line on fewer than min_repeats pages is not boilerplate."""
+        text = document(2)
+        assert strip(text) == text
+        assert strip(text, min_repeats=2).count("ACME") == 1
+    
+    def test_past_warmup(self):
+        """Pages after the warmup are filtered as they stream."""
+        text = strip(document(30), warmup=3)
+        assert text.count("ACME Corp Annual Report") == 1
+        assert text.count(" of 30") == 1
+    
+    def test_fragment_boundaries(self):
+        """Output does not depend on how the input is split."""
+        text = document()
+        pieces = [text[start:start + 7] for start in range(0, len(text), 7)]
+        assert "".join(BoilerplateFilter().filter(pieces)) == strip(text)
+    
+    def test_middle_line_protected(self):
+        """Every line of a short page is never a candidate."""
+        text = "".join(f"\n=== PAGE {n} ===\nHeader\nItem {n}\nFooter\n" for n in range(1, 6))
+        assert strip(text).count("Item") == 5
+    
+    def test_text_outside_pages(self):
+        """Sheets and DOCX bodies pass through, however repetitive."""
+        text = "=== SHEET: Budget ===\n" + "Total\t1\n" * 20 + "Paragraph\n" * 20
+        assert strip(text) == text
+    
+    def test_header_footer_entries(self):
+        """Repeated DOCX section headers keep only the first section's."""
+        text = "Body\n\n" + "\n".join(
+            f"[HEADER_S{n}] Confidential\n[FOOTER_S{n}] Page {n}" for n in range(1, 5)
+        )
+        result = strip(text)
+        assert result.count("Confidential") == 1 and result.count("[FOOTER_S") == 1
+        assert result.startswith("Body\n\n[HEADER_S1] Confidential\n")
+    
+    def test_invalid_options(self):
+        """One occurrence is never boilerplate."""
+        with pytest.raises(ValueError, match="min_repeats"):
+            BoilerplateFilter(min_repeats=1)
+
+
+class TestSketchAndStats:
+    """Test the frequency sketch and byte accounting."""
+    
+    def test_never_undercounts(self):
+        """Estimates bound true counts from above, even when crowded."""
+        sketch = _CountMinSketch(width=64, depth=2)
+        for key in range(500):
+            for _ in range(key % 4 + 1):
+                sketch.add(str(key))
+        assert all(sketch.estimate(str(key)) >= key % 4 + 1 for key in range(500))
+    
+    def test_stats(self):
+        """Stats add up over documents and match the output."""
+        text = document()
+        boilerplate = BoilerplateFilter()
+        outputs = ["".join(boilerplate.filter([text])) for _ in range(2)]
+        assert outputs[0] == outputs[1]  # Each document has its own sketch
+        stats = boilerplate.stats
+        assert stats.bytes_in == 2 * len(text.encode())
+        assert stats.bytes_out == 2 * len(outputs[0].encode())
+        assert stats.lines_dropped == 2 * 22
+        assert "44 lines dropped" in stats.format()
+
+
+class TestReaders:
+    """Test the filter on real reader output."""
+    
+    def test_pdf(self, report_pdf):
+        """Running header and footer appear once in the filtered text."""
+        text = "".join(BoilerplateFilter().filter(PdfReader().stream(report_pdf)))
+        assert text.count("ACME Corp Annual Report") == 1
+        assert text.count(" of 12") == 1
+        assert text.count("Margins held steady.") == 4
+    
+    def test_docx_sections(self, tmp_path):
+        """Unlinked identical headers of later sections are dropped."""
+        docx = pytest.importorskip("docx")
+        path = tmp_path / "sections.docx"
+        document = docx.Document()
+        for number in range(4):
+            section = document.sections[0] if number == 0 else document.add_section()
+            document.add_paragraph(f"Chapter {number + 1}")
+            section.header.is_linked_to_previous = False
+            section.header.paragraphs[0].text = "Internal use only"
+        document.save(str(path))
+        original = DocxReader().read(path)
+        text = "".join(BoilerplateFilter().filter([original]))
+        assert original.count("Internal use only") == 4
+        assert text.count("Internal use only") == 1
+        assert all(f"Chapter {n}" in text for n in range(1, 5))
+
+
+class TestCli:
+    """Test read_file.py --strip-boilerplate."""
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-daemon", "--no-cache", *args],
+            capture_output=True, text=True,
+        )
+    
+    def test_strip(self, report_pdf):
+        """Filtered text goes to stdout, the savings to stderr."""
+        result = self.run(str(report_pdf), "--strip-boilerplate")
+        assert result.returncode == 0
+        assert result.stdout.count("ACME Corp Annual Report") == 1
+        assert "Boilerplate: 22 lines dropped" in result.stderr
+    
+    def test_records_rejected(self, report_pdf):
+        """Records keep their offsets into the unfiltered text."""
+        result = self.run(str(report_pdf), "--strip-boilerplate", "--jsonl")
+        assert result.returncode == 1
+        assert "structured records" in result.stderr
@@ -0,0 +1,202 @@
+"""
+Unit Tests for the Extraction Cache
+
+Tests coverage:
+- Content-addressed keys (content, reader class, reader version)
+- Read-through caching via AbstractFileReader.stream()
+- Partial extractions are never committed
+- LRU eviction under a byte budget
+- Usage statistics
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (no external dependencies)
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                validate_file_exists)
+from templates.skills.file_readers.cache import ExtractionCache, hash_file
+
+
+@pytest.fixture
+def counting_reader():
+    """Register a text reader that counts how often it really extracts."""
+    original_registry = AbstractFileReader.registry.copy()
+    original_cache = AbstractFileReader.cache
+    AbstractFileReader.registry.clear()
+    
+    class TxtReader(AbstractFileReader):
+        calls = 0
+        
+        @classmethod
+        def get_extension(cls) -> str:
+            return "txt"
+        
+        def read(self, filepath: Path) -> str:
+            return "".join(self.stream(filepath))
+        
+        def iter_read(self, filepath: Path):
+            validate_file_exists(filepath)
+            TxtReader.calls += 1
+            for line in filepath.read_text(encoding="utf-8").splitlines(True):
+                yield line
+    
+    yield TxtReader
+    AbstractFileReader.set_cache(original_cache)
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+@pytest.fixture
+def cache(tmp_path, counting_reader):
+    """Enable a cache in a temporary directory."""
+    cache = ExtractionCache(root=tmp_path / "cache")
+    AbstractFileReader.set_cache(cache)
+    return cache
+
+
+def make_file(tmp_path: Path, name: str, content: str) -> Path:
+    path = tmp_path / name
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+class TestCacheKeys:
+    """Test content-addressed key construction."""
+    
+    def test_same_content_same_key(self, tmp_path, cache, counting_reader):
+        """Copies of a file share a key regardless of path."""
+        reader = counting_reader()
+        a = make_file(tmp_path, "a.txt", "same")
+        b = make_file(tmp_path, "b.txt", "same")
+        assert cache.key_for(a, reader) == cache.key_for(b, reader)
+    
+    def test_content_change_changes_key(self, tmp_path, cache, counting_reader):
+        """Editing a file produces a new key."""
+        reader = counting_reader()
+        path = make_file(tmp_path, "a.txt", "v1")
+        key_v1 = cache.key_for(path, reader)
+        path.write_text("v2")
+        assert cache.key_for(path, reader) != key_v1
+    
+    def test_reader_version_changes_key(self, tmp_path, cache, counting_reader):
+        """Bumping reader_version invalidates previous entries."""
+        path = make_file(tmp_path, "a.txt", "text")
+        key_v1 = cache.key_for(path, counting_reader())
+        
+        class UpgradedReader(counting_reader):
+            reader_version = "2.0.0"
+        
+        assert cache.key_for(path, UpgradedReader()) != key_v1
+    
+    def test_hash_file_matches_hashlib(self, tmp_path):
+        """hash_file() is a plain SHA-256 of the content."""
+        import hashlib
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"x" * 3_000_000)
+        assert hash_file(path) == hashlib.sha256(b"x" * 3_000_000).hexdigest()
+
+
+class TestReadThrough:
+    """Test transparent caching through stream()/read()."""
+    
+    def test_second_read_is_served_from_cache(self, tmp_path, cache, counting_reader):
+        """A warm read does not call the extractor again."""
+        path = make_file(tmp_path, "doc.txt", "line 1\nline 2\n")
+        reader = AbstractFileReader.get_reader(path)
+        
+        assert reader.read(path) == "line 1\nline 2\n"
+        assert reader.read(path) == "line 1\nline 2\n"
+        assert counting_reader.calls == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+    
+    def test_no_cache_always_extracts(self, tmp_path, counting_reader):
+        """With caching disabled every read extracts."""
+        AbstractFileReader.set_cache(None)
+        path = make_file(tmp_path, "doc.txt", "text")
+        reader = counting_reader()
+        reader.read(path)
+        reader.read(path)
+        assert counting_reader.calls == 2
+    
+    def test_partial_stream_not_committed(self, tmp_path, cache, counting_reader):
+        """Stopping a stream early leaves no cache entry behind."""
+        path = make_file(tmp_path, "doc.txt", "a\nb\nc\n")
+        reader = counting_reader()
+        
+        stream = reader.stream(path)
+        assert next(stream) == "a\n"
+        stream.close()
+        
+        assert cache.stats().entries == 0
+        assert reader.read(path) == "a\nb\nc\n"
+        assert cache.stats().entries == 1
+    
+    def test_carriage_returns_round_trip(self, tmp_path, cache):
+        """Entries keep '\r\n' and '\r' (no newline translation)."""
+        text = "cell line1\r\nline2\rline3\n"
+        cache.put("ff" * 32, text)
+        assert cache.get("ff" * 32) == text
+    
+    def test_missing_file_raises(self, tmp_path, cache, counting_reader):
+        """Missing files still raise FileNotFoundError with cache enabled."""
+        with pytest.raises(FileNotFoundError, match="File not found"):
+            counting_reader().read(tmp_path / "missing.txt")
+
+
+class TestEviction:
+    """Test LRU eviction under the byte budget."""
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Oldest-accessed entries are evicted first."""
+        cache = ExtractionCache(root=tmp_path / "cache", max_bytes=250)
+        cache.put("aa" * 32, "a" * 100)
+        cache.put("bb" * 32, "b" * 100)
+        
+        # Age both entries, then touch "a" so "b" becomes the LRU entry
+        for key in ("aa" * 32, "bb" * 32):
+            os.utime(cache._entry_path(key), (1_000, 1_000))
+        assert cache.get("aa" * 32) == "a" * 100
+        
+        cache.put("cc" * 32, "c" * 100)
+        
+        assert cache.get("bb" * 32) is None
+        assert cache.get("aa" * 32) == "a" * 100
+        assert cache.get("cc" * 32) == "c" * 100
+        assert cache.evictions == 1
+    
+    def test_puts_do_not_rescan(self, tmp_path, monkeypatch):
+        """Only the first put and puts crossing the budget scan the directory."""
+        cache = ExtractionCache(root=tmp_path / "cache", max_bytes=1000)
+        scans = []
+        original = cache._scan
+        monkeypatch.setattr(cache, "_scan", lambda: scans.append(1) or original())
+        for index in range(30):
+            cache.put(f"{index:02d}" * 32, "x" * 100)
+        
+        # First put, then every other put once full (evicted to 90%)
+        assert len(scans) == 11
+        assert cache.evictions == 20
+        assert cache.stats().total_bytes == 1000
+    
+    def test_stats_report_usage(self, tmp_path):
+        """stats() reports entries, bytes and budget."""
+        cache = ExtractionCache(root=tmp_path / "cache", max_bytes=10_000)
+        cache.put("dd" * 32, "x" * 42)
+        stats = cache.stats()
+        
+        assert stats.entries == 1
+        assert stats.total_bytes == 42
+        assert stats.max_bytes == 10_000
+        assert "1 entries" in stats.format()
+    
+    def test_clear_removes_entries(self, tmp_path):
+        """clear() empties the cache."""
+        cache = ExtractionCache(root=tmp_path / "cache")
+        cache.put("ee" * 32, "text")
+        cache.clear()
+        assert cache.stats().entries == 0
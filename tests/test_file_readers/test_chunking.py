@@ -0,0 +1,162 @@
+"""
+Unit Tests for Chunking
+
+Tests coverage:
+- Size bound, verbatim slices and offsets for arbitrary stream splits
+- Preferred boundaries: section markers, paragraphs, lines
+- Overlap (whole lines, never across section markers)
+- Long lines split at whitespace, long words cut
+- Cost linear in the text, whatever the chunk size
+- Tokenizers and option validation
+- Chunking reader output
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader test requires PyMuPDF)
+"""
+
+import pytest
+
+from templates.skills.file_readers.chunking import (Chunker, count_words,
+                                                    get_tokenizer)
+from templates.skills.file_readers.pdf_reader import PdfReader
+
+PAGED_TEXT = (
+    "\n=== PAGE 1 ===\n\nFirst paragraph line one.\nLine two.\n\n"
+    "Second paragraph.\n\n=== PAGE 2 ===\n\nPage two text.\nMore text.\n"
+)
+
+
+def check_chunks(text: str, chunks, chunk_size: int) -> None:
+    """Chunks are in order, within size, verbatim and cover the text."""
+    position = 0
+    for index, chunk in enumerate(chunks):
+        assert chunk.index == index
+        assert chunk.size <= chunk_size
+        assert chunk.text == text[chunk.start:chunk.end]
+        assert chunk.start <= position < chunk.end
+        position = chunk.end
+    assert position == len(text)
+
+
+def split_every(text: str, step: int) -> list:
+    """Split text into fragments of `step` characters."""
+    return [text[i:i + step] for i in range(0, len(text), step)]
+
+
+class TestBoundaries:
+    """Test where chunks are cut."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 20, 45, 200])
+    @pytest.mark.parametrize("step", [1, 5, 1000])
+    def test_invariants_hold_for_any_split(self, chunk_size, step):
+        """Fragment boundaries of the stream never change the result."""
+        chunker = Chunker(chunk_size, overlap=chunk_size // 3)
+        chunks = list(chunker.chunks(split_every(PAGED_TEXT, step)))
+        check_chunks(PAGED_TEXT, chunks, chunk_size)
+        assert chunks == list(chunker.chunks([PAGED_TEXT]))
+    
+    def test_prefers_section_marker(self):
+        """A page marker wins over a later line break."""
+        chunks = list(Chunker(80).chunks([PAGED_TEXT]))
+        assert chunks[1].text.startswith("=== PAGE 2 ===")
+    
+    def test_prefers_paragraph_over_line(self):
+        """A paragraph break wins over a later line break."""
+        text = "aaaa aaaa\nbbbb\n\ncccc cccc\ndddd\neeee\n"
+        chunks = list(Chunker(30).chunks([text]))
+        assert chunks[0].text == "aaaa aaaa\nbbbb\n\n"
+    
+    def test_marker_kept_with_its_content(self):
+        """A section marker never ends a chunk on its own."""
+        text = "x" * 15 + "\n=== SHEET: Data ===\n\n1\t2\n"
+        chunks = list(Chunker(25).chunks([text]))
+        assert not any(c.text.rstrip().endswith("===") for c in chunks)
+        check_chunks(text, chunks, 25)
+    
+    def test_long_line_split_at_whitespace(self):
+        """A line longer than a chunk is split between words."""
+        text = "word " * 20
+        chunks = list(Chunker(22).chunks([text]))
+        check_chunks(text, chunks, 22)
+        assert all(c.text.startswith("word") for c in chunks)
+    
+    def test_long_word_cut(self):
+        """A word longer than a chunk is cut into pieces."""
+        chunks = list(Chunker(4).chunks(["abcdefghij"]))
+        assert [c.text for c in chunks] == ["abcd", "efgh", "ij"]
+    
+    @pytest.mark.parametrize("chunk_size", [100, 4000])
+    def test_buffer_not_resummed(self, monkeypatch, chunk_size):
+        """Lines are summed a bounded number of times, not once per line buffered."""
+        summed = []
+        original = Chunker._size
+        monkeypatch.setattr(Chunker, "_size",
+                            staticmethod(lambda units: summed.append(len(units)) or original(units)))
+        text = "12\t34\n" * 20_000
+        check_chunks(text, list(Chunker(chunk_size, overlap=chunk_size // 10).chunks([text])),
+                     chunk_size)
+        assert sum(summed) < 20_000
+    
+    def test_empty_text(self):
+        """No text, no chunks."""
+        assert list(Chunker(10).chunks([])) == []
+        assert list(Chunker(10).chunks([""])) == []
+
+
+class TestOverlap:
+    """Test repeated context between chunks."""
+    
+    def test_trailing_lines_repeated(self):
+        """The next chunk starts with whole trailing lines of the previous one."""
+        text = "".join(f"line {n}\n" for n in range(10))
+        chunks = list(Chunker(28, overlap=14).chunks([text]))
+        check_chunks(text, chunks, 28)
+        assert chunks[0].text.endswith("line 2\nline 3\n")
+        assert chunks[1].text.startswith("line 2\nline 3\n")
+    
+    def test_no_overlap_across_sections(self):
+        """A new page starts a fresh chunk, without the previous page's tail."""
+        chunks = list(Chunker(80, overlap=30).chunks([PAGED_TEXT]))
+        assert chunks[1].text.startswith("=== PAGE 2 ===")
+    
+    def test_overlap_shed_when_it_does_not_fit(self):
+        """Overlap gives way to content rather than breaking the size bound."""
+        text = "short\n" + "x" * 20 + "\n"
+        chunks = list(Chunker(21, overlap=10).chunks([text]))
+        check_chunks(text, chunks, 21)
+
+
+class TestTokenizers:
+    """Test size units and validation."""
+    
+    def test_word_tokenizer(self):
+        """Sizes are counted in words."""
+        text = "one two three\nfour five\nsix seven eight nine\n"
+        chunks = list(Chunker(5, tokenizer=count_words).chunks([text]))
+        assert [c.size for c in chunks] == [5, 4]
+        check_chunks(text, chunks, 5)
+    
+    def test_get_tokenizer(self):
+        """Tokenizers are resolved by name."""
+        assert get_tokenizer("chars")("abc") == 3
+        assert get_tokenizer("words")("a b c") == 3
+        with pytest.raises(ValueError, match="Unknown tokenizer"):
+            get_tokenizer("bytes")
+    
+    @pytest.mark.parametrize("chunk_size, overlap", [(0, 0), (10, 10), (10, -1)])
+    def test_invalid_sizes(self, chunk_size, overlap):
+        """chunk_size must be positive and overlap smaller than it."""
+        with pytest.raises(ValueError):
+            Chunker(chunk_size, overlap)
+
+
+class TestReaderOutput:
+    """Test chunking streamed reader output."""
+    
+    def test_pdf_pages(self, sample_pdf):
+        """Chunks of a PDF reassemble to read() and start at page markers."""
+        reader = PdfReader()
+        text = reader.read(sample_pdf)
+        chunks = list(Chunker(60).chunks(reader.stream(sample_pdf)))
+        check_chunks(text, chunks, 60)
+        assert all("=== PAGE" in c.text for c in chunks)
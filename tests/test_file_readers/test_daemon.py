@@ -0,0 +1,126 @@
+"""
+Unit Tests for the Reader Daemon
+
+Tests coverage:
+- Forwarded requests write to the caller's stdout/stderr and return the
+  handler's exit code
+- Requests run in the caller's working directory
+- SystemExit and unexpected exceptions map to exit codes
+- No daemon (or a stale socket file) means "run locally"
+- A second daemon on the same socket is refused; stop() shuts it down
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (Unix only; daemon runs in a forked process)
+"""
+
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+import pytest
+
+from templates.skills.file_readers.daemon import (DEFAULT_SOCKET_PATH,
+                                                  DaemonRunningError, forward,
+                                                  serve, socket_path_from_argv,
+                                                  stop)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="reader daemon requires fork and Unix sockets"
+)
+
+
+def echo_handler(argv):
+    """Test handler: echo arguments and cwd; the first argument selects the outcome."""
+    print(f"argv={' '.join(argv)}")
+    print(f"cwd={os.getcwd()}")
+    sys.stderr.write("to stderr\n")
+    if argv[0] == "exit":
+        sys.exit(int(argv[1]))
+    if argv[0] == "crash":
+        raise RuntimeError("handler bug")
+    return int(argv[0])
+
+
+def listening(socket_path) -> bool:
+    """True once the daemon accepts connections."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    """Serve echo_handler on a socket in tmp_path; yield the socket path."""
+    socket_path = tmp_path / "r.sock"
+    process = multiprocessing.get_context("fork").Process(
+        target=serve, args=(echo_handler, socket_path)
+    )
+    process.start()
+    deadline = time.monotonic() + 10
+    while not listening(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield socket_path
+    stop(socket_path)
+    process.join(timeout=10)
+    if process.is_alive():
+        process.terminate()
+
+
+class TestForward:
+    """Test running requests in the daemon."""
+    
+    def test_output_and_exit_code(self, daemon, capfd):
+        """Output reaches the caller's streams; the exit code is returned."""
+        assert forward(["3", "a b"], daemon) == 3
+        captured = capfd.readouterr()
+        assert "argv=3 a b\n" in captured.out
+        assert captured.err == "to stderr\n"
+    
+    def test_runs_in_caller_cwd(self, daemon, capfd, tmp_path, monkeypatch):
+        """Relative paths resolve against the caller's working directory."""
+        (tmp_path / "work").mkdir()
+        monkeypatch.chdir(tmp_path / "work")
+        assert forward(["0"], daemon) == 0
+        assert f"cwd={tmp_path / 'work'}\n" in capfd.readouterr().out
+    
+    def test_system_exit_and_crash(self, daemon, capfd):
+        """sys.exit() codes pass through; unexpected errors exit 2 with a traceback."""
+        assert forward(["exit", "5"], daemon) == 5
+        assert forward(["crash"], daemon) == 2
+        assert "RuntimeError: handler bug" in capfd.readouterr().err
+    
+    def test_no_daemon_runs_locally(self, tmp_path):
+        """A missing or stale socket means the caller runs the command itself."""
+        assert forward(["0"], tmp_path / "missing.sock") is None
+        stale = tmp_path / "stale.sock"
+        stale.touch()
+        assert forward(["0"], stale) is None
+
+
+class TestLifecycle:
+    """Test starting and stopping the daemon."""
+    
+    def test_second_daemon_refused(self, daemon):
+        """Only one daemon listens on a socket."""
+        with pytest.raises(DaemonRunningError):
+            serve(echo_handler, daemon)
+    
+    def test_stop_removes_socket(self, daemon):
+        """stop() shuts the daemon down and its socket goes away."""
+        assert stop(daemon)
+        deadline = time.monotonic() + 10
+        while daemon.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not daemon.exists()
+        assert not stop(daemon)
+    
+    def test_socket_path_from_argv(self):
+        """--socket selects the socket; the default is under .sia/run."""
+        assert str(socket_path_from_argv(["a.pdf", "--socket", "x.sock"])) == "x.sock"
+        assert str(socket_path_from_argv(["--socket=y.sock"])) == "y.sock"
+        assert socket_path_from_argv(["a.pdf"]) == DEFAULT_SOCKET_PATH
@@ -0,0 +1,162 @@
+"""
+Unit Tests for the Fast DOCX Engine
+
+Tests coverage:
+- Output equivalence with the python-docx engine
+- Hand-written WordprocessingML: merged cells, run content, nested blocks,
+  multiple sections
+- Block range selection through both engines
+- Fallback to python-docx for unsupported or invalid files
+- Engine option validation
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (requires python-docx)
+"""
+
+import re
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import CorruptedFileError
+from templates.skills.file_readers.docx_fast import (FastDocument,
+                                                     UnsupportedDocument)
+from templates.skills.file_readers.docx_reader import DocxReader
+
+docx = pytest.importorskip("docx")
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# {section} is replaced with the sample document's own body w:sectPr
+BODY_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<w:document xmlns:w="{w}" xmlns:r="{r}"><w:body>
+<w:p><w:r><w:t xml:space="preserve"> Tab</w:t><w:tab/><w:t>and</w:t><w:br/><w:t>wrap</w:t></w:r></w:p>
+<w:p><w:r><w:t>page</w:t><w:br w:type="page"/><w:t>break</w:t><w:noBreakHyphen/><w:cr/></w:r><w:hyperlink r:id="rIdX"><w:r><w:t>link</w:t></w:r></w:hyperlink></w:p>
+<w:sdt><w:sdtContent><w:p><w:r><w:t>content control</w:t></w:r></w:p></w:sdtContent></w:sdt>
+<w:tbl><w:tblGrid><w:gridCol/><w:gridCol/><w:gridCol/></w:tblGrid>
+<w:tr><w:tc><w:tcPr><w:vMerge w:val="restart"/></w:tcPr><w:p><w:r><w:t>tall</w:t></w:r></w:p></w:tc>
+<w:tc><w:tcPr><w:gridSpan w:val="2"/></w:tcPr><w:p><w:r><w:t>wide</w:t></w:r></w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>nested</w:t></w:r></w:p></w:tc></w:tr></w:tbl></w:tc></w:tr>
+<w:tr><w:tc><w:tcPr><w:vMerge/></w:tcPr><w:p/></w:tc><w:tc><w:p><w:r><w:t>b</w:t></w:r></w:p></w:tc><w:tc><w:p/></w:tc></w:tr>
+<w:tr><w:tc><w:tcPr><w:vMerge/></w:tcPr><w:p/></w:tc><w:tc><w:tcPr><w:gridSpan w:val="2"/><w:vMerge w:val="restart"/></w:tcPr><w:p><w:r><w:t>block</w:t></w:r></w:p></w:tc></w:tr>
+<w:tr><w:trPr><w:gridBefore w:val="1"/></w:trPr><w:tc><w:tcPr><w:gridSpan w:val="2"/><w:vMerge/></w:tcPr><w:p/></w:tc></w:tr>
+</w:tbl>
+<w:p><w:pPr><w:sectPr><w:headerReference w:type="first" r:id="{header}"/></w:sectPr></w:pPr><w:r><w:t>end of section one</w:t></w:r></w:p>
+<w:p/>
+<w:p><w:r><w:t>last</w:t></w:r></w:p>
+{section}
+</w:body></w:document>"""
+
+
+def read_both(path: Path, **options):
+    """Extract with both engines."""
+    fast = DocxReader(engine="fast", **options).read(path)
+    reference = DocxReader(engine="python-docx", **options).read(path)
+    return fast, reference
+
+
+@pytest.fixture
+def handwritten_docx(tmp_path, sample_docx) -> Path:
+    """Sample document whose body is replaced with hand-written XML."""
+    path = tmp_path / "handwritten.docx"
+    with zipfile.ZipFile(sample_docx) as source, zipfile.ZipFile(path, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "word/document.xml":
+                original = data.decode()
+                section = re.findall(r"<w:sectPr.*?</w:sectPr>", original, re.S)[-1]
+                header = re.search(r'headerReference w:type="default" r:id="(\w+)"',
+                                   section).group(1)
+                data = BODY_XML.format(w=W_NS, r=R_NS, header=header,
+                                       section=section).encode()
+            target.writestr(item, data)
+    return path
+
+
+class TestEquivalence:
+    """Test that both engines produce identical text."""
+    
+    def test_sample_document(self, sample_docx):
+        """The shared sample document extracts identically."""
+        fast, reference = read_both(sample_docx)
+        assert fast == reference
+        assert "[HEADER_S1] Running header" in fast
+    
+    def test_handwritten_xml(self, handwritten_docx):
+        """Run content, merged cells, nested blocks and sections match."""
+        fast, reference = read_both(handwritten_docx)
+        assert fast == reference
+        assert "Tab\tand\nwrap" in fast
+        assert "pagebreak-\nlink" in fast
+        assert "content control" not in fast  # Not a direct body block
+        assert "tall\twide\twide\ntall\tb\ntall\tblock\tblock\nblock\tblock" in fast
+        assert "[FIRST_PAGE_HEADER_S1] Running header" in fast
+        assert "[HEADER_S2] Running header" in fast
+    
+    @pytest.mark.parametrize("block_range", ["1:2", "3:3", "4:", ":1", "6:9"])
+    def test_block_range(self, handwritten_docx, block_range):
+        """Block selection behaves the same in both engines."""
+        fast, reference = read_both(handwritten_docx, block_range=block_range)
+        assert fast == reference
+    
+    def test_large_document(self, tmp_path):
+        """Many blocks stream identically (blocks are released as they go)."""
+        path = tmp_path / "large.docx"
+        document = docx.Document()
+        table = document.add_table(rows=0, cols=3)
+        for index in range(500):
+            document.add_paragraph(f"paragraph {index}" if index % 4 else "")
+            cells = table.add_row().cells
+            cells[index % 3].text = f"cell {index}"
+        document.save(str(path))
+        
+        fast, reference = read_both(path)
+        assert fast == reference
+
+
+class TestFallback:
+    """Test fallback to python-docx for files the fast engine skips."""
+    
+    def test_not_a_zip_is_unsupported(self, tmp_path):
+        """Non-ZIP input is left to python-docx (and its error messages)."""
+        path = tmp_path / "fake.docx"
+        path.write_bytes(b"not a zip file")
+        with pytest.raises(UnsupportedDocument):
+            FastDocument.open(path)
+        with pytest.raises(CorruptedFileError):
+            DocxReader(engine="fast").read(path)
+    
+    def test_non_word_package_is_unsupported(self, sample_xlsx):
+        """Packages without a Word main part fall back (python-docx rejects them)."""
+        with pytest.raises(UnsupportedDocument):
+            FastDocument.open(sample_xlsx)
+        with pytest.raises(CorruptedFileError):
+            DocxReader(engine="fast").read(sample_xlsx)
+    
+    def test_corrupt_document_xml(self, tmp_path, sample_docx):
+        """Malformed body XML is reported as a corrupted file."""
+        path = tmp_path / "broken.docx"
+        with zipfile.ZipFile(sample_docx) as source, zipfile.ZipFile(path, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "word/document.xml":
+                    data = data[:len(data) // 2]
+                target.writestr(item, data)
+        
+        with pytest.raises(CorruptedFileError, match="document XML"):
+            DocxReader(engine="fast").read(path)
+
+
+class TestEngineOption:
+    """Test engine selection."""
+    
+    def test_unknown_engine_raises(self):
+        """Only known engines are accepted."""
+        with pytest.raises(ValueError, match="Unknown DOCX engine"):
+            DocxReader(engine="turbo")
+    
+    def test_engine_not_in_cache_token(self):
+        """Engines share cache entries because their output is identical."""
+        assert DocxReader(engine="fast").cache_token() == DocxReader(engine="python-docx").cache_token()
@@ -0,0 +1,241 @@
+"""
+Unit Tests for Resource Limits
+
+Tests coverage:
+- ZIP packages exceeding the decompression ratio are rejected before parsing
+- Page, row and output-size limits on the bundled readers
+- Timeouts between chunks and inside a single slow step
+- Memory exhaustion under the address-space cap becomes ResourceLimitExceeded
+- Batch extraction reports the failing file and keeps going; workers
+  stuck where the in-worker timeout cannot interrupt them are killed
+- Limit validation; no limits means unchanged output
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx;
+memory test requires Linux)
+"""
+
+import signal
+import sys
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                ResourceLimitExceeded,
+                                                validate_file_exists)
+from templates.skills.file_readers.batch import extract_many
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.limits import ResourceLimits
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+
+@pytest.fixture
+def limits():
+    """Install resource limits for a test; removed afterwards."""
+    def install(**kwargs) -> ResourceLimits:
+        AbstractFileReader.set_limits(ResourceLimits(**kwargs))
+        return AbstractFileReader.limits
+    
+    yield install
+    AbstractFileReader.set_limits(None)
+
+
+@pytest.fixture
+def slow_reader():
+    """Register a .slow reader whose file holds seconds to sleep per chunk."""
+    original_registry = AbstractFileReader.registry.copy()
+    AbstractFileReader.registry.clear()
+    
+    class SlowReader(AbstractFileReader):
+        @classmethod
+        def get_extension(cls) -> str:
+            return "slow"
+        
+        def read(self, filepath: Path) -> str:
+            return "".join(self.stream(filepath))
+        
+        def iter_read(self, filepath: Path) -> Iterator[str]:
+            validate_file_exists(filepath)
+            delay = float(filepath.read_text())
+            for index in range(3):
+                time.sleep(delay)
+                yield f"chunk {index}\n"
+    
+    yield SlowReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+@pytest.fixture
+def hungry_reader():
+    """Register a .mem reader allocating the number of MB in its file."""
+    original_registry = AbstractFileReader.registry.copy()
+    AbstractFileReader.registry.clear()
+    
+    class HungryReader(AbstractFileReader):
+        @classmethod
+        def get_extension(cls) -> str:
+            return "mem"
+        
+        def read(self, filepath: Path) -> str:
+            return "".join(self.stream(filepath))
+        
+        def iter_read(self, filepath: Path) -> Iterator[str]:
+            validate_file_exists(filepath)
+            buffer = bytearray(int(filepath.read_text()) * 1024 * 1024)
+            yield f"{len(buffer)} bytes\n"
+    
+    yield HungryReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+class TestZipRatio:
+    """Test the decompression ratio check for ZIP-based formats."""
+    
+    def test_zip_bomb_rejected(self, limits, sample_xlsx, tmp_path):
+        """A package with a huge, highly compressible member fails before parsing."""
+        bomb = tmp_path / "bomb.xlsx"
+        bomb.write_bytes(sample_xlsx.read_bytes())
+        with zipfile.ZipFile(bomb, "a", zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("xl/media/padding.bin", bytes(64 * 1024 * 1024))
+        limits(max_zip_ratio=100)
+        with pytest.raises(ResourceLimitExceeded, match="xl/media/padding.bin.*ZIP bomb"):
+            XlsxReader().read(bomb)
+    
+    def test_normal_packages_pass(self, limits, sample_xlsx, sample_docx):
+        """Ordinary documents stay well below a generous ratio."""
+        limits(max_zip_ratio=100)
+        assert "Rent" in XlsxReader().read(sample_xlsx)
+        assert "Closing paragraph" in DocxReader().read(sample_docx)
+
+
+class TestCountLimits:
+    """Test page, row and output-size limits."""
+    
+    def test_max_pages(self, limits, sample_pdf):
+        """PDFs with more selected pages than allowed fail up front."""
+        limits(max_pages=2)
+        with pytest.raises(ResourceLimitExceeded, match="3 pages"):
+            PdfReader().read(sample_pdf)
+        assert "Third page" in PdfReader(pages="3").read(sample_pdf)
+    
+    @pytest.mark.parametrize("engine", ["fast", "openpyxl"])
+    def test_max_rows(self, limits, sample_xlsx, engine):
+        """Rows are counted across sheets with either engine."""
+        limits(max_rows=4)
+        with pytest.raises(ResourceLimitExceeded, match="more than 4 rows"):
+            XlsxReader(engine=engine).read(sample_xlsx)
+        limits(max_rows=5)
+        assert "world" in XlsxReader(engine=engine).read(sample_xlsx)
+    
+    def test_max_output_bytes(self, limits, sample_docx):
+        """Extracted text beyond the byte budget fails."""
+        size = len(DocxReader().read(sample_docx).encode("utf-8"))
+        limits(max_output_bytes=size)
+        assert len(DocxReader().read(sample_docx)) == size
+        limits(max_output_bytes=size - 1)
+        with pytest.raises(ResourceLimitExceeded, match="exceeds"):
+            DocxReader().read(sample_docx)
+
+
+class TestTimeout:
+    """Test the per-document wall-clock limit."""
+    
+    def test_timeout_between_chunks(self, limits, slow_reader, tmp_path, monkeypatch):
+        """Without the interval timer the deadline is checked per chunk."""
+        monkeypatch.delattr("signal.setitimer")
+        path = tmp_path / "a.slow"
+        path.write_text("0.2")
+        limits(timeout=0.3)
+        with pytest.raises(ResourceLimitExceeded, match="0.3s time limit"):
+            slow_reader().read(path)
+    
+    def test_timeout_interrupts_slow_step(self, limits, slow_reader, tmp_path):
+        """The interval timer interrupts a step that outlasts the timeout."""
+        path = tmp_path / "a.slow"
+        path.write_text("30")
+        limits(timeout=0.2)
+        started = time.monotonic()
+        with pytest.raises(ResourceLimitExceeded, match="time limit"):
+            slow_reader().read(path)
+        assert time.monotonic() - started < 5
+    
+    def test_timer_released(self, limits, slow_reader, tmp_path):
+        """The timer is disarmed after extraction, even after a failure."""
+        import signal
+        path = tmp_path / "a.slow"
+        for delay in ("0", "30"):
+            path.write_text(delay)
+            limits(timeout=0.2)
+            try:
+                slow_reader().read(path)
+            except ResourceLimitExceeded:
+                assert delay == "30"
+            assert signal.getitimer(signal.ITIMER_REAL)[0] == 0
+            assert signal.getsignal(signal.SIGALRM) == signal.SIG_DFL
+
+
+class TestBatch:
+    """Test limits in batch extraction."""
+    
+    def test_batch_continues_after_limit(self, limits, slow_reader, tmp_path):
+        """The failing document is reported and the others are extracted."""
+        for name, delay in (("a", "0"), ("b", "30"), ("c", "0")):
+            (tmp_path / f"{name}.slow").write_text(delay)
+        limits(timeout=0.2)
+        results = list(extract_many(sorted(tmp_path.glob("*.slow")), workers=1))
+        assert [result.ok for result in results] == [True, False, True]
+        assert "time limit" in results[1].error
+        assert not results[1].unexpected
+    
+    @pytest.mark.skipif(not sys.platform.startswith("linux"),
+                        reason="address-space cap relies on Linux RLIMIT_AS")
+    def test_memory_cap_in_workers(self, limits, hungry_reader, tmp_path):
+        """An allocation beyond the worker's cap fails only that document."""
+        (tmp_path / "a.mem").write_text("1")
+        (tmp_path / "b.mem").write_text("4096")
+        limits(max_memory_mb=2048)
+        results = list(extract_many(sorted(tmp_path.glob("*.mem")), workers=2))
+        assert results[0].text == f"{1024 * 1024} bytes\n"
+        assert "Out of memory" in results[1].error
+    
+    
+    def test_stuck_worker_killed(self, limits, slow_reader, tmp_path):
+        """A worker that never returns to the watchdog is killed from the parent."""
+        def iter_read(self, filepath: Path) -> Iterator[str]:
+            # Like a call stuck in C code: no SIGALRM, no check between chunks
+            signal.signal(signal.SIGALRM, signal.SIG_IGN)
+            time.sleep(float(filepath.read_text()))
+            yield "done\n"
+        slow_reader.iter_read = iter_read
+        for name, delay in (("a", "0"), ("b", "60"), ("c", "0"), ("d", "0")):
+            (tmp_path / f"{name}.slow").write_text(delay)
+        limits(timeout=0.5)
+        
+        started = time.monotonic()
+        results = list(extract_many(sorted(tmp_path.glob("*.slow")), workers=2))
+        
+        assert time.monotonic() - started < 20
+        assert [result.ok for result in results] == [True, False, True, True]
+        assert "time limit (worker killed)" in results[1].error
+        assert not results[1].unexpected
+
+
+class TestResourceLimits:
+    """Test limit configuration."""
+    
+    def test_non_positive_rejected(self):
+        """Limits must be positive."""
+        with pytest.raises(ValueError, match="max_pages must be positive"):
+            ResourceLimits(max_pages=0)
+    
+    def test_no_limits_unchanged(self, sample_pdf):
+        """Without limits, extraction is not watched."""
+        assert AbstractFileReader.limits is None
+        assert "First page text" in PdfReader().read(sample_pdf)
@@ -0,0 +1,86 @@
+"""
+Unit Tests for PdfReader
+
+Tests coverage:
+- Parallel page-shard extraction matches sequential output
+- Sharding heuristic (threshold, worker count)
+- Dead or failing shard workers raise CorruptedFileError
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (requires PyMuPDF)
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers import pdf_reader
+from templates.skills.file_readers.base import CorruptedFileError
+from templates.skills.file_readers.pdf_reader import PdfReader
+
+
+def crashing_shard(path, page_numbers):
+    """Shard worker killed mid-extraction (segfault, OOM kill)."""
+    os._exit(1)
+
+
+def failing_shard(path, page_numbers):
+    """Shard worker hitting a library error."""
+    raise RuntimeError("cannot parse page")
+
+
+@pytest.fixture
+def long_pdf(tmp_path) -> Path:
+    """40-page PDF where every fifth page is blank."""
+    pymupdf = pytest.importorskip("pymupdf")
+    path = tmp_path / "long.pdf"
+    doc = pymupdf.open()
+    for index in range(40):
+        page = doc.new_page()
+        if index % 5:
+            page.insert_text((72, 72), f"Body of page {index + 1}")
+            page.insert_text((300, 72), f"Right column {index + 1}")
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestParallelExtraction:
+    """Test sharded extraction across worker processes."""
+    
+    def test_parallel_output_identical_to_sequential(self, long_pdf):
+        """Shards are stitched back in page order with the same markers."""
+        sequential = PdfReader(parallel_threshold=None).read(long_pdf)
+        parallel = PdfReader(parallel_threshold=10, workers=3).read(long_pdf)
+        
+        assert parallel == sequential
+        assert "=== PAGE 40 ===" in parallel
+        assert "=== PAGE 6 ===" not in parallel  # blank page skipped
+    
+    def test_early_close_stops_parallel_extraction(self, long_pdf):
+        """Closing the stream early does not raise or hang."""
+        stream = PdfReader(parallel_threshold=10, workers=2).iter_read(long_pdf)
+        assert next(stream) == "\n=== PAGE 2 ===\n"
+        stream.close()
+    
+    @pytest.mark.parametrize("shard, message", [
+        (crashing_shard, "Worker process died"),
+        (failing_shard, "RuntimeError: cannot parse page"),
+    ])
+    def test_worker_failure_is_reader_error(self, long_pdf, monkeypatch, shard, message):
+        """Pool and library failures surface as CorruptedFileError."""
+        monkeypatch.setattr(pdf_reader, "_extract_page_shard", shard)
+        with pytest.raises(CorruptedFileError, match=message):
+            PdfReader(parallel_threshold=10, workers=2).read(long_pdf)
+    
+    @pytest.mark.parametrize("threshold, workers, pages, expected", [
+        (None, 8, 1000, False),  # Disabled
+        (200, 8, 199, False),    # Below threshold
+        (200, 8, 200, True),     # At threshold
+        (200, 1, 5000, False),   # Single worker
+    ])
+    def test_should_parallelize(self, threshold, workers, pages, expected):
+        """Sharding only kicks in for large documents with spare workers."""
+        reader = PdfReader(parallel_threshold=threshold, workers=workers)
+        assert reader._should_parallelize(pages) is expected
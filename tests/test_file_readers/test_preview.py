@@ -0,0 +1,197 @@
+"""
+Unit Tests for Preview Extraction (head)
+
+Tests coverage:
+- head() equals the start of read() for every reader and engine
+- The reader stops and closes the document once the cap is reached
+- Previews bypass the cache and never shard PDF pages
+- The XLSX fast engine parses shared strings only as far as needed
+- Batch previews and read_file.py --max-chars / --head
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                CorruptedFileError)
+from templates.skills.file_readers.batch import extract_many
+from templates.skills.file_readers.cache import ExtractionCache
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.xlsx_fast import FastWorkbook
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+
+@pytest.fixture
+def counting_reader():
+    """Register a .count reader yielding 100 chunks and recording cleanup."""
+    original_registry = AbstractFileReader.registry.copy()
+    AbstractFileReader.registry.clear()
+    
+    class CountingReader(AbstractFileReader):
+        produced = 0
+        closed = False
+        
+        @classmethod
+        def get_extension(cls) -> str:
+            return "count"
+        
+        def read(self, filepath: Path) -> str:
+            return "".join(self.stream(filepath))
+        
+        def iter_read(self, filepath: Path) -> Iterator[str]:
+            try:
+                for index in range(100):
+                    CountingReader.produced += 1
+                    yield f"chunk{index:02d};"
+            finally:
+                CountingReader.closed = True
+    
+    yield CountingReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+SHARED_STRINGS_OVERRIDE = (
+    b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+    b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>'
+)
+
+
+def strings_workbook(path: Path, source: Path, count: int, truncate: bool = False) -> Path:
+    """Copy of source whose first sheet has one shared string per row."""
+    rows = "".join(
+        f'<row r="{n + 1}"><c r="A{n + 1}" t="s"><v>{n}</v></c></row>' for n in range(count)
+    )
+    sheet = ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             f'<dimension ref="A1:A{count}"/><sheetData>{rows}</sheetData></worksheet>')
+    table = ('<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+             + "".join(f"<si><t>text {n}</t></si>" for n in range(count)) + "</sst>")
+    if truncate:
+        table = table[:len(table) // 2]
+    with zipfile.ZipFile(source) as original, zipfile.ZipFile(path, "w") as target:
+        for item in original.infolist():
+            data = original.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = sheet.encode()
+            elif item.filename == "[Content_Types].xml":
+                data = data.replace(b"</Types>", SHARED_STRINGS_OVERRIDE)
+            target.writestr(item, data)
+        target.writestr("xl/sharedStrings.xml", table)
+    return path
+
+
+@pytest.fixture
+def strings_xlsx(tmp_path, sample_xlsx) -> Path:
+    """Workbook with 1000 distinct shared strings, one per row."""
+    return strings_workbook(tmp_path / "strings.xlsx", sample_xlsx, 1000)
+
+
+class TestHead:
+    """Test head() output and early termination."""
+    
+    @pytest.mark.parametrize("reader, fixture", [
+        (PdfReader(), "sample_pdf"),
+        (XlsxReader(engine="fast"), "sample_xlsx"),
+        (XlsxReader(engine="openpyxl"), "sample_xlsx"),
+        (DocxReader(engine="fast"), "sample_docx"),
+        (DocxReader(engine="python-docx"), "sample_docx"),
+    ])
+    @pytest.mark.parametrize("max_chars", [1, 25, 10_000])
+    def test_prefix_of_read(self, reader, fixture, max_chars, request):
+        """head() is read() cut at max_chars (whole text if shorter)."""
+        path = request.getfixturevalue(fixture)
+        assert reader.head(path, max_chars) == reader.read(path)[:max_chars]
+    
+    def test_stops_reader(self, counting_reader, tmp_path):
+        """Chunks after the cap are never produced; cleanup runs at once."""
+        path = tmp_path / "a.count"
+        path.write_text("")
+        assert counting_reader().head(path, 20) == "chunk00;chunk01;chun"
+        assert counting_reader.produced == 3
+        assert counting_reader.closed
+    
+    def test_invalid_cap(self, sample_pdf):
+        """The cap must be positive."""
+        with pytest.raises(ValueError, match="max_chars"):
+            PdfReader().head(sample_pdf, 0)
+    
+    def test_cache_bypassed(self, sample_pdf, tmp_path):
+        """Previews neither hash the file for a cache key nor store entries."""
+        cache = ExtractionCache(root=tmp_path / "cache")
+        AbstractFileReader.set_cache(cache)
+        try:
+            PdfReader().head(sample_pdf, 10)
+        finally:
+            AbstractFileReader.set_cache(None)
+        assert (cache.hits, cache.misses, cache.stats().entries) == (0, 0, 0)
+    
+    def test_pdf_preview_is_sequential(self, sample_pdf, monkeypatch):
+        """Page sharding is skipped for previews."""
+        def fail(*args):
+            raise AssertionError("sharded a preview")
+        monkeypatch.setattr(PdfReader, "_iter_pages_parallel", fail)
+        reader = PdfReader(parallel_threshold=1, workers=4)
+        assert reader.head(sample_pdf, 30) == PdfReader().read(sample_pdf)[:30]
+
+
+class TestLazySharedStrings:
+    """Test on-demand parsing of the XLSX shared string table."""
+    
+    def test_first_rows_parse_few_strings(self, strings_xlsx):
+        """Reading the first row does not load the whole table."""
+        workbook = FastWorkbook.open(strings_xlsx)
+        try:
+            first = next(workbook.iter_rows(workbook.sheetnames[0]))
+            assert first == ["text 0"]
+            assert len(workbook._shared_strings) < 100
+        finally:
+            workbook.close()
+    
+    def test_full_read_unchanged(self, strings_xlsx):
+        """Both engines still agree on the complete text."""
+        assert (XlsxReader(engine="fast").read(strings_xlsx)
+                == XlsxReader(engine="openpyxl").read(strings_xlsx))
+    
+    def test_malformed_table(self, sample_xlsx, tmp_path):
+        """A truncated table is reported as a corrupted file."""
+        path = strings_workbook(tmp_path / "broken.xlsx", sample_xlsx, 1000, truncate=True)
+        with pytest.raises(CorruptedFileError, match="shared strings"):
+            XlsxReader(engine="fast").read(path)
+
+
+class TestBatchAndCli:
+    """Test previews in batch mode and on the command line."""
+    
+    def test_extract_many(self, sample_pdf, sample_docx):
+        """Each batch result holds only the preview."""
+        results = list(extract_many([sample_pdf, sample_docx], workers=1, max_chars=12))
+        assert [len(result.text) for result in results] == [12, 12]
+        assert all(result.cache_hit is None for result in results)
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-daemon", *args],
+            capture_output=True, text=True,
+        )
+    
+    def test_max_chars(self, sample_docx):
+        """--max-chars prints exactly the first N characters."""
+        result = self.run(str(sample_docx), "--max-chars", "15")
+        assert (result.returncode, result.stdout) == (0, "Title paragraph")
+    
+    def test_head_rejected_with_sync(self, tmp_path):
+        """Sync outputs must stay complete."""
+        result = self.run("--sync", str(tmp_path), str(tmp_path / "out"), "--head")
+        assert result.returncode == 1
+        assert "--max-chars" in result.stderr
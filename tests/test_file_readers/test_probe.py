@@ -0,0 +1,168 @@
+"""
+Unit Tests for Metadata Probing
+
+Tests coverage:
+- PDF: page count, text layer and word estimate; encrypted and image-only PDFs
+- XLSX: sheet names, declared dimensions and XML sizes; encrypted workbooks
+- DOCX: page and word counts from docProps/app.xml
+- Dimension parsing and page sampling helpers
+- read_file.py --probe text and JSON output
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import json
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.probe import (OLE_SIGNATURE,
+                                                 dimension_size, sample_pages)
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+
+def encrypted_office_file(path: Path) -> Path:
+    """Stand-in for a password-protected DOCX/XLSX (an OLE container)."""
+    path.write_bytes(OLE_SIGNATURE + b"\0" * 504)
+    return path
+
+
+class TestPdf:
+    """Test PDF probing."""
+    
+    def test_text_pdf(self, sample_pdf):
+        """Pages come from the page tree; words are extrapolated from samples."""
+        info = PdfReader().probe(sample_pdf)
+        assert (info.format, info.pages, info.encrypted) == ("pdf", 3, False)
+        assert info.text_layer is True
+        assert info.words == 6
+        assert info.size_bytes == sample_pdf.stat().st_size
+    
+    def test_image_only_pdf(self, tmp_path):
+        """Pages without text report no text layer."""
+        pymupdf = pytest.importorskip("pymupdf")
+        path = tmp_path / "scan.pdf"
+        doc = pymupdf.open()
+        doc.new_page().draw_rect(pymupdf.Rect(10, 10, 100, 100))
+        doc.save(str(path))
+        doc.close()
+        info = PdfReader().probe(path)
+        assert (info.pages, info.text_layer, info.words) == (1, False, 0)
+    
+    def test_encrypted_pdf(self, tmp_path):
+        """Password-protected PDFs report their page count only."""
+        pymupdf = pytest.importorskip("pymupdf")
+        path = tmp_path / "locked.pdf"
+        doc = pymupdf.open()
+        doc.new_page().insert_text((72, 72), "secret")
+        doc.save(str(path), encryption=pymupdf.PDF_ENCRYPT_AES_256,
+                 user_pw="user", owner_pw="owner")
+        doc.close()
+        info = PdfReader().probe(path)
+        assert (info.encrypted, info.pages, info.text_layer) == (True, 1, None)
+
+
+class TestXlsx:
+    """Test XLSX probing."""
+    
+    def test_sheets(self, sample_xlsx):
+        """Each sheet reports its declared dimension and XML size."""
+        info = XlsxReader().probe(sample_xlsx)
+        sheets = [(s.name, s.dimension, s.rows, s.columns) for s in info.sheets]
+        assert sheets == [
+            ("Budget", "A1:D4", 4, 4),
+            ("Empty", "A1:A1", 1, 1),
+            ("Other", "A1:C3", 3, 3),
+        ]
+        assert all(sheet.xml_bytes > 0 for sheet in info.sheets)
+        assert (info.pages, info.words) == (None, None)
+    
+    def test_encrypted(self, tmp_path):
+        """An OLE container named .xlsx is reported as encrypted."""
+        info = XlsxReader().probe(encrypted_office_file(tmp_path / "locked.xlsx"))
+        assert info.encrypted is True
+        assert info.sheets == []
+
+
+class TestDocx:
+    """Test DOCX probing."""
+    
+    def test_app_properties(self, sample_docx, tmp_path):
+        """Pages and words come from docProps/app.xml."""
+        path = tmp_path / "counted.docx"
+        with zipfile.ZipFile(sample_docx) as source, zipfile.ZipFile(path, "w") as target:
+            for member in source.infolist():
+                data = source.read(member)
+                if member.filename == "docProps/app.xml":
+                    data = data.replace(b"<Pages>1</Pages>", b"<Pages>12</Pages>")
+                    data = data.replace(b"<Words>0</Words>", b"<Words>3400</Words>")
+                target.writestr(member, data)
+        info = DocxReader().probe(path)
+        assert (info.pages, info.words, info.encrypted) == (12, 3400, False)
+    
+    def test_zero_words_unknown(self, sample_docx):
+        """A template's zero word count is not reported as a count."""
+        assert DocxReader().probe(sample_docx).words is None
+    
+    def test_encrypted(self, tmp_path):
+        """An OLE container named .docx is reported as encrypted."""
+        info = DocxReader().probe(encrypted_office_file(tmp_path / "locked.docx"))
+        assert info.encrypted is True
+
+
+class TestHelpers:
+    """Test dimension parsing and page sampling."""
+    
+    @pytest.mark.parametrize("ref, size", [
+        ("A1:F200", (200, 6)),
+        ("B2", (1, 1)),
+        ("$A$1:$AA$10", (10, 27)),
+        ("nonsense", (None, None)),
+        (None, (None, None)),
+    ])
+    def test_dimension_size(self, ref, size):
+        """Ranges count inclusive rows and columns."""
+        assert dimension_size(ref) == size
+    
+    def test_sample_pages(self):
+        """Samples are spread from the first to the last page."""
+        assert sample_pages(2, 3) == [0, 1]
+        assert sample_pages(1000, 3) == [0, 500, 999]
+
+
+class TestCli:
+    """Test read_file.py --probe."""
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-cache", "--no-daemon", *args],
+            capture_output=True, text=True,
+        )
+    
+    def test_text(self, sample_xlsx):
+        """Metadata replaces the extracted text."""
+        result = self.run(str(sample_xlsx), "--probe")
+        assert result.returncode == 0
+        assert "sheet: Budget A1:D4 (4 rows x 4 columns)" in result.stdout
+        assert "Rent" not in result.stdout
+    
+    def test_json_directory(self, sample_pdf, sample_docx):
+        """--recursive --probe json writes one object per file."""
+        result = self.run("--recursive", str(sample_pdf.parent), "--probe", "json")
+        assert result.returncode == 0
+        infos = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [info["format"] for info in infos] == ["docx", "pdf"]
+        assert infos[1]["pages"] == 3
+    
+    def test_rejects_reader_options(self, sample_pdf):
+        """Probing describes the whole document."""
+        result = self.run(str(sample_pdf), "--probe", "--pages", "1")
+        assert result.returncode == 1
@@ -0,0 +1,170 @@
+"""
+Unit Tests for Extraction Profiling
+
+Tests coverage:
+- Each bundled reader reports validate/open/extract phases and unit counters
+- Consumer time between chunks is attributed to the output phase
+- Cache lookups are timed; a cache hit skips the reader phases
+- The hook receives the profile of failed and abandoned extractions
+- Nested phases are exclusive; nothing is recorded without a hook
+- read_file.py --profile prints text or JSON to stderr
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                CorruptedFileError)
+from templates.skills.file_readers.cache import ExtractionCache
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.profiling import (Profile, collect,
+                                                     count_parts, phase)
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+
+class TestReaders:
+    """Test the profiles of the bundled readers."""
+    
+    def test_pdf(self, sample_pdf):
+        """Pages with text are counted and the standard phases are timed."""
+        with collect() as profiles:
+            text = PdfReader().read(sample_pdf)
+        [profile] = profiles
+        assert (profile.path, profile.reader) == (str(sample_pdf), "PdfReader")
+        assert {"validate", "open", "extract"} <= set(profile.phases)
+        assert profile.counters["pages"] == 2
+        assert profile.counters["bytes"] == len(text.encode("utf-8"))
+        assert profile.total == pytest.approx(sum(profile.phases.values()))
+    
+    @pytest.mark.parametrize("engine", ["fast", "openpyxl"])
+    def test_xlsx_rows(self, sample_xlsx, engine):
+        """Both XLSX engines count the same rows."""
+        with collect() as profiles:
+            XlsxReader(engine=engine).read(sample_xlsx)
+        assert profiles[0].counters["rows"] == 5
+        assert profiles[0].phases["open"] > 0
+    
+    @pytest.mark.parametrize("engine", ["fast", "python-docx"])
+    def test_docx_blocks(self, sample_docx, engine):
+        """DOCX counts paragraphs, table rows, headers and footers."""
+        with collect() as profiles:
+            DocxReader(engine=engine).read(sample_docx)
+        counters = profiles[0].counters
+        assert (counters["paragraphs"], counters["table_rows"]) == (2, 3)
+        assert (counters["headers"], counters["footers"]) == (1, 1)
+
+
+class TestPhases:
+    """Test phase attribution."""
+    
+    def test_consumer_time_is_output(self, sample_pdf):
+        """Time the consumer spends between chunks is not extraction time."""
+        with collect() as profiles:
+            for _ in PdfReader().stream(sample_pdf):
+                time.sleep(0.01)
+        phases = profiles[0].phases
+        assert phases["output"] >= 0.04
+        assert phases["extract"] < phases["output"]
+    
+    def test_cache_hit(self, sample_pdf, tmp_path):
+        """A cache hit is timed as cache; the reader does not open the file."""
+        AbstractFileReader.set_cache(ExtractionCache(root=tmp_path / "cache"))
+        try:
+            PdfReader().read(sample_pdf)
+            with collect() as profiles:
+                PdfReader().read(sample_pdf)
+        finally:
+            AbstractFileReader.set_cache(None)
+        assert "cache" in profiles[0].phases
+        assert "open" not in profiles[0].phases
+        assert "pages" not in profiles[0].counters
+    
+    def test_nested_phases_are_exclusive(self):
+        """Time in an inner phase is not counted for the outer one."""
+        profile = Profile("x", "Reader")
+        with profile.phase("outer"):
+            with profile.phase("inner"):
+                time.sleep(0.02)
+        assert profile.phases["inner"] >= 0.02
+        assert profile.phases["outer"] < 0.01
+    
+    def test_off_without_hook(self):
+        """Without a profiled extraction, helpers are no-ops."""
+        parts = iter(())
+        assert count_parts(parts) is parts
+        with phase("open"):
+            pass
+        assert AbstractFileReader.profiler is None
+
+
+class TestHook:
+    """Test hook delivery."""
+    
+    def test_failed_extraction(self, tmp_path):
+        """A failing document still produces a profile."""
+        broken = tmp_path / "broken.pdf"
+        broken.write_bytes(b"%PDF-1.4 not really")
+        with collect() as profiles:
+            with pytest.raises(CorruptedFileError):
+                PdfReader().read(broken)
+        assert profiles[0].phases["open"] > 0
+    
+    def test_abandoned_stream(self, sample_pdf):
+        """Closing a stream early delivers the partial profile."""
+        with collect() as profiles:
+            chunks = PdfReader().stream(sample_pdf)
+            next(chunks)
+            chunks.close()
+        assert profiles[0].counters["chunks"] == 1
+    
+    def test_collect_restores_hook(self):
+        """collect() reinstates the previous hook."""
+        seen = []
+        AbstractFileReader.set_profiler(seen.append)
+        try:
+            with collect():
+                pass
+            assert AbstractFileReader.profiler == seen.append
+        finally:
+            AbstractFileReader.set_profiler(None)
+
+
+class TestCli:
+    """Test read_file.py --profile."""
+    
+    def run(self, *args):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-cache", "--no-daemon", *args],
+            capture_output=True, text=True,
+        )
+    
+    def test_text(self, sample_pdf):
+        """The breakdown goes to stderr; stdout holds only the text."""
+        result = self.run(str(sample_pdf), "--profile")
+        assert result.returncode == 0
+        assert "Profile:" not in result.stdout
+        assert "pages: 2" in result.stderr
+    
+    def test_json(self, sample_pdf):
+        """--profile json prints one JSON object."""
+        result = self.run(str(sample_pdf), "--profile", "json")
+        profile = json.loads(result.stderr)
+        assert profile["counters"]["pages"] == 2
+        assert set(profile["phases"]) >= {"validate", "open", "extract", "output"}
+    
+    def test_batch_rejected(self, sample_pdf):
+        """Profiling is for single files."""
+        result = self.run("--recursive", str(sample_pdf.parent), "--profile")
+        assert result.returncode == 1
+        assert "--profile" in result.stderr
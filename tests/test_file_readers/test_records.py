@@ -0,0 +1,137 @@
+"""
+Unit Tests for Structured Records
+
+Tests coverage:
+- Record offsets point into read() output for PDF, XLSX and DOCX
+- Locations: pages, sheet rows (with gaps), blocks, header/footer sections
+- Multi-part units (DOCX tables) merge into one record
+- Default single "document" record for readers without structure
+- join_parts() leads and buffered JSON Lines output
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader, Part,
+                                                join_parts)
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.jsonl import write_jsonl
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+
+def records_of(reader, path):
+    """Records of a file, checked against read() output."""
+    text = reader.read(path)
+    records = list(reader.iter_records(path))
+    for record in records:
+        assert text[record.start:record.end] == record.text
+    assert "".join(part.text for part in reader.iter_parts(path)) == text
+    return records
+
+
+class TestReaderRecords:
+    """Test records produced by the concrete readers."""
+    
+    def test_pdf_pages(self, sample_pdf):
+        """One record per non-empty page, without the page marker."""
+        records = records_of(PdfReader(), sample_pdf)
+        assert [(r.kind, r.location) for r in records] == [
+            ("page", {"page": 1}), ("page", {"page": 3}),
+        ]
+        assert records[0].text == "First page text"
+    
+    @pytest.mark.parametrize("engine", ["fast", "openpyxl"])
+    def test_xlsx_rows(self, sample_xlsx, engine):
+        """Rows keep their sheet row numbers, skipping empty rows."""
+        records = records_of(XlsxReader(engine=engine), sample_xlsx)
+        assert [(r.location["sheet"], r.location["row"]) for r in records] == [
+            ("Budget", 1), ("Budget", 2), ("Budget", 4), ("Other", 1), ("Other", 3),
+        ]
+        assert records[2].text == "Power\t75.5\t\testimate"
+    
+    def test_xlsx_row_span(self, sample_xlsx):
+        """Row numbers stay absolute when a row span is selected."""
+        records = records_of(XlsxReader(sheet="Budget", rows="2:"), sample_xlsx)
+        assert [r.location["row"] for r in records] == [2, 4]
+    
+    @pytest.mark.parametrize("engine", ["fast", "python-docx"])
+    def test_docx_blocks(self, sample_docx, engine):
+        """Paragraphs and whole tables are records; labels stay out of headers."""
+        records = records_of(DocxReader(engine=engine), sample_docx)
+        assert [(r.kind, r.location) for r in records] == [
+            ("paragraph", {"block": 1}),
+            ("table", {"block": 3}),
+            ("paragraph", {"block": 4}),
+            ("header", {"section": 1, "type": "default"}),
+            ("footer", {"section": 1, "type": "default"}),
+        ]
+        assert records[1].text == "merged\tmerged\tx\na\tb1 b2\nz"
+        assert records[3].text == "Running header"
+    
+    def test_to_dict_is_flat(self, sample_pdf):
+        """Location keys sit beside path, kind and offsets."""
+        record = records_of(PdfReader(), sample_pdf)[0]
+        assert record.to_dict() == {
+            "path": str(sample_pdf), "kind": "page", "page": 1,
+            "start": record.start, "end": record.end, "text": "First page text",
+        }
+
+
+class TestDefaultRecords:
+    """Test the base-class fallback."""
+    
+    def test_unstructured_reader_yields_document(self, tmp_path):
+        """A reader overriding only read() yields one document record."""
+        class PlainReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "plain"
+            
+            def read(self, filepath: Path) -> str:
+                return "whole text"
+        
+        try:
+            records = list(PlainReader().iter_records(tmp_path / "a.plain"))
+        finally:
+            AbstractFileReader.registry.pop("plain", None)
+        assert [(r.kind, r.location, r.start, r.text) for r in records] == [
+            ("document", {}, 0, "whole text"),
+        ]
+    
+    def test_join_parts_counts_separator_in_lead(self):
+        """Separators join the following part's text and lead."""
+        parts = list(join_parts([Part("a", "row", {"row": 1}),
+                                 Part("b", "row", {"row": 2}, lead=1)]))
+        assert parts == [Part("a", "row", {"row": 1}),
+                         Part("\nb", "row", {"row": 2}, lead=2)]
+
+
+class TestWriteJsonl:
+    """Test buffered JSON Lines output."""
+    
+    def test_lines_round_trip(self):
+        """Every object becomes one UTF-8 line, across buffer flushes."""
+        objects = [{"n": n, "text": "é\n€"} for n in range(50)]
+        stream = io.BytesIO()
+        assert write_jsonl(objects, stream, buffer_size=64) == 50
+        lines = stream.getvalue().decode("utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == objects
+        assert "é" in lines[0]
+    
+    def test_written_lines_kept_on_error(self):
+        """Lines produced before an error still reach the stream."""
+        def objects():
+            yield {"n": 1}
+            raise RuntimeError("reader failed")
+        
+        stream = io.BytesIO()
+        with pytest.raises(RuntimeError):
+            write_jsonl(objects(), stream)
+        assert stream.getvalue() == b'{"n": 1}\n'
@@ -6,16 +6,19 @@ Tests coverage:
 - Registry lookup by extension
 - get_reader() factory method
 - UnsupportedFormatError handling
+- Lookup cache: concrete registry reuse, singletons, O(1) microbenchmark
 
 Domain: Skills (Infrastructure)
 Test Level: Unit (no external dependencies)
 """
 
+import timeit
 from pathlib import Path
 
 import pytest
 
 from templates.skills.file_readers.base import (AbstractFileReader,
+                                                ReaderRegistry,
                                                 UnsupportedFormatError)
 
 
@@ -269,3 +272,114 @@ class TestRegistryIntegration:
         # Can still create new instances
         reader2 = AbstractFileReader.get_reader(Path("file.tmp"))
         assert isinstance(reader2, TempReader)
+
+
+class TestLookupCache:
+    """Test caching of the concrete registry and reader instances."""
+    
+    @pytest.fixture(autouse=True)
+    def isolate_registry(self):
+        """Isolate registry for each test - save and restore."""
+        original_registry = AbstractFileReader.registry.copy()
+        AbstractFileReader.registry.clear()
+        yield
+        # Restore original registry
+        AbstractFileReader.registry.clear()
+        AbstractFileReader.registry.update(original_registry)
+    
+    @pytest.fixture
+    def txt_reader(self):
+        """Register a stateless reader for .txt files."""
+        
+        class TxtReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "txt"
+            
+            def read(self, filepath: Path) -> str:
+                return "text"
+        
+        return TxtReader
+    
+    def test_registry_counts_modifications(self):
+        """Every mutation of the registry bumps its version."""
+        assert isinstance(AbstractFileReader.registry, ReaderRegistry)
+        registry = ReaderRegistry()
+        registry["a"] = object
+        registry.update(b=object)
+        registry.setdefault("c", object)
+        registry.pop("a")
+        del registry["b"]
+        registry.clear()
+        assert registry.version == 6
+    
+    def test_concrete_registry_reused_until_change(self, txt_reader):
+        """The filtered registry is rebuilt only when a reader registers."""
+        first = AbstractFileReader._get_concrete_registry()
+        assert AbstractFileReader._get_concrete_registry() is first
+        
+        class CsvReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "csv"
+            
+            def read(self, filepath: Path) -> str:
+                return "csv"
+        
+        rebuilt = AbstractFileReader._get_concrete_registry()
+        assert rebuilt is not first
+        assert rebuilt["csv"] is CsvReader
+    
+    def test_stateless_reader_is_shared(self, txt_reader):
+        """Option-less lookups return one shared instance."""
+        reader = AbstractFileReader.get_reader(Path("a.txt"))
+        assert AbstractFileReader.get_reader(Path("b.TXT")) is reader
+    
+    def test_stateful_reader_is_not_shared(self):
+        """Readers that opt out of sharing get a new instance per lookup."""
+        
+        class LogReader(AbstractFileReader):
+            stateless = False
+            
+            @classmethod
+            def get_extension(cls) -> str:
+                return "log"
+            
+            def read(self, filepath: Path) -> str:
+                return "log"
+        
+        first = AbstractFileReader.get_reader(Path("a.log"))
+        assert AbstractFileReader.get_reader(Path("a.log")) is not first
+    
+    def test_reregistered_extension_not_served_stale(self, txt_reader):
+        """Replacing a reader class invalidates the shared instance."""
+        AbstractFileReader.get_reader(Path("a.txt"))
+        
+        class NewTxtReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "txt"
+            
+            def read(self, filepath: Path) -> str:
+                return "new"
+        
+        assert isinstance(AbstractFileReader.get_reader(Path("a.txt")), NewTxtReader)
+    
+    def test_lookup_time_independent_of_registry_size(self, txt_reader):
+        """Microbenchmark: lookups cost the same with 5 or 5000 formats."""
+        
+        def lookup_time() -> float:
+            lookup = lambda: AbstractFileReader.get_reader(Path("report.txt"))  # noqa: E731
+            lookup()  # Build the caches outside the timed region
+            return min(timeit.repeat(lookup, number=2000, repeat=5))
+        
+        for index in range(4):
+            AbstractFileReader.registry[f"small{index}"] = txt_reader
+        small = lookup_time()
+        
+        for index in range(5000):
+            AbstractFileReader.registry[f"large{index}"] = txt_reader
+        large = lookup_time()
+        
+        # Rebuilding a 5000-entry filter per lookup would be ~100x slower
+        assert large < small * 3
@@ -0,0 +1,151 @@
+"""
+Unit Tests for the Search Index
+
+Tests coverage:
+- First update indexes markdown and reader-extracted documents
+- Unchanged files are skipped; changed and removed files are re-indexed
+- Stored paths are relative to the root, also when the root is relative
+- BM25 ranking, snippets and the top limit
+- Free-text query quoting, prefix terms and raw FTS5 syntax
+- Failed extractions leave the index; old schemas are rebuilt
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (DOCX test requires python-docx)
+"""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.search import (SearchIndex,
+                                                  to_match_query)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project root with a small knowledge base."""
+    active = tmp_path / ".sia" / "knowledge" / "active"
+    archive = tmp_path / ".sia" / "knowledge" / "_archive"
+    requirements = tmp_path / ".sia" / "requirements"
+    for directory in (active, archive, requirements):
+        directory.mkdir(parents=True)
+    (active / "auth.md").write_text("# Auth\nThe token refresh flow renews tokens.\n")
+    (archive / "billing.md").write_text("# Billing\nInvoices close monthly. See user-012.\n")
+    (requirements / "REQ-001.md").write_text("# Token storage\nStore the token once.\n")
+    (tmp_path / "outside.md").write_text("token")
+    return tmp_path
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Index stored outside the project tree."""
+    with SearchIndex(tmp_path / "db" / "search.sqlite3") as search_index:
+        yield search_index
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward without changing its content."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestUpdate:
+    """Test incremental indexing."""
+    
+    def test_first_update_indexes_knowledge(self, project, index):
+        """Markdown under the default directories is indexed, nothing else."""
+        report = index.update(project, workers=1)
+        assert report.format() == "Index: 3 added, 0 updated, 0 unchanged, 0 removed, 0 failed"
+        assert len(index) == 3
+        assert {hit.path for hit in index.search("token")} == {
+            ".sia/knowledge/active/auth.md", ".sia/requirements/REQ-001.md",
+        }
+    
+    def test_rerun_skips_unchanged(self, project, index):
+        """A no-change update reads nothing."""
+        index.update(project, workers=1)
+        report = index.update(project, workers=1)
+        assert (report.added, report.updated, report.unchanged) == (0, 0, 3)
+    
+    @pytest.mark.parametrize("root", [".", "./", "project/.."])
+    def test_relative_root(self, project, index, monkeypatch, root):
+        """Relative roots store the same paths as absolute ones."""
+        (project / "project").mkdir()
+        monkeypatch.chdir(project)
+        index.update(Path(root), workers=1)
+        assert {hit.path for hit in index.search("token")} == {
+            ".sia/knowledge/active/auth.md", ".sia/requirements/REQ-001.md",
+        }
+        os.remove(".sia/knowledge/active/auth.md")
+        assert index.update(Path(root), workers=1).removed == 1
+    
+    def test_changed_and_removed_files(self, project, index):
+        """Edits are re-indexed and deleted files leave the index."""
+        index.update(project, workers=1)
+        auth = project / ".sia" / "knowledge" / "active" / "auth.md"
+        auth.write_text("# Auth\nSessions use cookies now.\n")
+        bump_mtime(auth)
+        (project / ".sia" / "knowledge" / "_archive" / "billing.md").unlink()
+        
+        report = index.update(project, workers=1)
+        assert (report.updated, report.removed, report.unchanged) == (1, 1, 1)
+        assert [hit.path for hit in index.search("cookies")] == [".sia/knowledge/active/auth.md"]
+        assert index.search("invoices") == []
+        assert [hit.path for hit in index.search("token")] == [".sia/requirements/REQ-001.md"]
+    
+    def test_reader_documents_indexed(self, project, index, sample_docx):
+        """Supported formats are extracted through the file readers."""
+        target = project / ".sia" / "requirements" / "spec.docx"
+        target.write_bytes(sample_docx.read_bytes())
+        index.update(project, workers=1)
+        assert [hit.path for hit in index.search("closing")] == [".sia/requirements/spec.docx"]
+    
+    def test_failed_extraction_dropped(self, project, index):
+        """A file that cannot be extracted is reported and not indexed."""
+        (project / ".sia" / "requirements" / "broken.pdf").write_bytes(b"not a pdf")
+        report = index.update(project, workers=1)
+        assert [path for path, _ in report.failed] == [".sia/requirements/broken.pdf"]
+        assert len(index) == 3
+    
+    def test_old_schema_rebuilt(self, tmp_path):
+        """An index from another schema version starts over empty."""
+        path = tmp_path / "search.sqlite3"
+        with sqlite3.connect(path) as connection:
+            connection.execute("CREATE TABLE documents (path TEXT)")
+            connection.execute("PRAGMA user_version = 99")
+        with SearchIndex(path) as search_index:
+            assert len(search_index) == 0
+
+
+class TestSearch:
+    """Test ranking and queries."""
+    
+    def test_ranked_with_snippets(self, project, index):
+        """More relevant documents come first; snippets highlight matches."""
+        index.update(project, workers=1)
+        hits = index.search("token")
+        assert hits[0].path == ".sia/requirements/REQ-001.md"
+        assert hits[0].score >= hits[1].score > 0
+        assert "**token**" in hits[0].snippet.lower()
+        assert len(index.search("token", top=1)) == 1
+    
+    def test_punctuation_and_prefix(self, project, index):
+        """Words are matched literally; a trailing * matches prefixes."""
+        index.update(project, workers=1)
+        assert [hit.path for hit in index.search("user-012")] == [".sia/knowledge/_archive/billing.md"]
+        assert [hit.path for hit in index.search("invoice*")] == [".sia/knowledge/_archive/billing.md"]
+    
+    def test_raw_fts5_syntax(self, project, index):
+        """Raw queries use FTS5 operators; invalid ones raise ValueError."""
+        index.update(project, workers=1)
+        assert len(index.search("cookies OR invoices", raw=True)) == 1
+        with pytest.raises(ValueError, match="Invalid search query"):
+            index.search("token AND", raw=True)
+    
+    def test_to_match_query(self):
+        """Free text becomes quoted terms; empty queries are rejected."""
+        assert to_match_query('say "hi" auth*') == '"say" """hi""" "auth"*'
+        with pytest.raises(ValueError, match="empty"):
+            to_match_query("  * ")
@@ -0,0 +1,140 @@
+"""
+Unit Tests for Page / Sheet / Block Selection
+
+Tests coverage:
+- parse_ranges / parse_span / resolve_ranges syntax and errors
+- PdfReader(pages=...) only emits selected pages
+- XlsxReader(sheet=..., sheet_index=..., rows=...) selection
+- DocxReader(block_range=...) body block selection
+- get_reader(**options) rejects options a format does not support
+- Selection options are part of the cache token
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (concrete reader tests require their libraries)
+"""
+
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                FileReaderError)
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.selection import (parse_ranges, parse_span,
+                                                     resolve_ranges)
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+
+class TestParsing:
+    """Test selection spec parsing."""
+    
+    def test_parse_ranges(self):
+        """Numbers, closed and open ranges, in the order given."""
+        assert parse_ranges("10-20,45, 50-") == [(10, 20), (45, 45), (50, None)]
+    
+    @pytest.mark.parametrize("spec, expected", [
+        ("100:200", (100, 200)),
+        ("100:", (100, None)),
+        (":50", (1, 50)),
+        ("7", (7, 7)),
+    ])
+    def test_parse_span(self, spec, expected):
+        """Either side of a span may be omitted."""
+        assert parse_span(spec) == expected
+    
+    @pytest.mark.parametrize("spec", ["", ",", "0", "a-b", "20-10", "3-x"])
+    def test_invalid_ranges_raise(self, spec):
+        """Malformed, zero-based and descending specs are rejected."""
+        with pytest.raises(ValueError, match="Invalid selection"):
+            parse_ranges(spec)
+    
+    @pytest.mark.parametrize("spec", ["x:", "5:2", "0:3"])
+    def test_invalid_span_raises(self, spec):
+        """Malformed spans are rejected."""
+        with pytest.raises(ValueError, match="Invalid selection"):
+            parse_span(spec)
+    
+    def test_resolve_ranges_clamps_and_dedupes(self):
+        """Overlaps merge and numbers past the end are dropped."""
+        spans = parse_ranges("4-6,1,5,8-")
+        assert resolve_ranges(spans, 9) == [1, 4, 5, 6, 8, 9]
+        assert resolve_ranges(parse_ranges("1-1000"), 3) == [1, 2, 3]
+
+
+class TestReaderSelection:
+    """Test selection on the bundled readers."""
+    
+    def test_pdf_pages(self, sample_pdf):
+        """Only selected pages are extracted, with original page numbers."""
+        text = PdfReader(pages="3").read(sample_pdf)
+        assert text.startswith("\n=== PAGE 3 ===\n")
+        assert "Third page text" in text
+        assert "First page text" not in text
+    
+    def test_pdf_pages_beyond_end_are_ignored(self, sample_pdf):
+        """A range past the last page selects nothing extra."""
+        assert PdfReader(pages="3-99").read(sample_pdf) == PdfReader(pages="3").read(sample_pdf)
+        assert PdfReader(pages="10-").read(sample_pdf) == ""
+    
+    def test_xlsx_sheet_by_name(self, sample_xlsx):
+        """--sheet extracts a single named sheet."""
+        text = XlsxReader(sheet="Other").read(sample_xlsx)
+        assert text == "\n=== SHEET: Other ===\n\nhello\n\t\tworld"
+    
+    def test_xlsx_sheet_by_index(self, sample_xlsx):
+        """sheet_index is 1-based in workbook order."""
+        by_index = XlsxReader(sheet_index=3).read(sample_xlsx)
+        assert by_index == XlsxReader(sheet="Other").read(sample_xlsx)
+    
+    def test_xlsx_rows(self, sample_xlsx):
+        """Row spans use sheet row numbers within each selected sheet."""
+        text = XlsxReader(sheet="Budget", rows="2:4").read(sample_xlsx)
+        assert "Item" not in text
+        assert "Rent\t1200" in text
+        assert "Power\t75.5" in text
+    
+    def test_xlsx_unknown_sheet_raises(self, sample_xlsx):
+        """Selecting a missing sheet is a reader error naming the sheets."""
+        with pytest.raises(FileReaderError, match="Budget"):
+            XlsxReader(sheet="Missing").read(sample_xlsx)
+        with pytest.raises(FileReaderError, match="out of range"):
+            XlsxReader(sheet_index=9).read(sample_xlsx)
+    
+    def test_xlsx_sheet_and_index_conflict(self):
+        """sheet and sheet_index are mutually exclusive."""
+        with pytest.raises(ValueError):
+            XlsxReader(sheet="Budget", sheet_index=1)
+    
+    def test_docx_block_range(self, sample_docx):
+        """Blocks count paragraphs (including empty ones) and tables."""
+        text = DocxReader(block_range="3:3").read(sample_docx)
+        assert text.startswith("merged\tmerged\tx")
+        assert "Title paragraph" not in text
+        assert "Closing paragraph" not in text
+        assert "[HEADER_S1]" not in text
+    
+    def test_docx_open_range(self, sample_docx):
+        """An open-ended range runs to the last body block."""
+        text = DocxReader(block_range="4:").read(sample_docx)
+        assert text == "Closing paragraph"
+
+
+class TestGetReaderOptions:
+    """Test option plumbing through the registry."""
+    
+    def test_options_forwarded(self):
+        """get_reader passes options to the reader constructor."""
+        reader = AbstractFileReader.get_reader(Path("report.pdf"), pages="1-2")
+        assert isinstance(reader, PdfReader)
+        assert reader.options() == {"pages": "1-2"}
+    
+    def test_unsupported_option_raises(self):
+        """Options the format does not accept are a ValueError."""
+        with pytest.raises(ValueError, match="XlsxReader does not accept"):
+            AbstractFileReader.get_reader(Path("data.xlsx"), pages="1")
+    
+    def test_selection_changes_cache_token(self):
+        """Different selections never share cache entries."""
+        assert PdfReader().cache_token() != PdfReader(pages="1").cache_token()
+        assert PdfReader(pages="1").cache_token() != PdfReader(pages="2").cache_token()
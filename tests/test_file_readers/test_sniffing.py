@@ -0,0 +1,157 @@
+"""
+Unit Tests for Content Sniffing
+
+Tests coverage:
+- Misnamed and extensionless files resolve to the reader for their content
+- ZIP packages told apart by [Content_Types].xml (from the head or the
+  central directory)
+- Unrecognised content keeps the extension's reader; sniff=False forces it
+- Signatures registered by custom readers
+- Sniffed head reused by validate_file_exists / hash_file
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (bundled reader tests require their libraries)
+"""
+
+import hashlib
+import shutil
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers import base
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                UnsupportedFormatError,
+                                                cached_head, read_head,
+                                                zip_content_types)
+from templates.skills.file_readers.cache import hash_file
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+
+def renamed(source: Path, tmp_path: Path, name: str) -> Path:
+    """Copy a fixture under a different name."""
+    target = tmp_path / name
+    shutil.copyfile(source, target)
+    return target
+
+
+class TestBundledFormats:
+    """Test sniffing with the bundled readers."""
+    
+    def test_docx_named_xlsx(self, tmp_path, sample_docx):
+        """A Word document with an .xlsx extension gets the DOCX reader."""
+        path = renamed(sample_docx, tmp_path, "report.xlsx")
+        reader = AbstractFileReader.get_reader(path)
+        assert isinstance(reader, DocxReader)
+        assert "Title paragraph" in reader.read(path)
+    
+    def test_xlsx_named_docx(self, tmp_path, sample_xlsx):
+        """Workbooks store [Content_Types].xml late; the central directory decides."""
+        path = renamed(sample_xlsx, tmp_path, "data.docx")
+        assert isinstance(AbstractFileReader.get_reader(path), XlsxReader)
+    
+    def test_pdf_without_extension(self, tmp_path, sample_pdf):
+        """Extensionless files are identified by their header."""
+        path = renamed(sample_pdf, tmp_path, "scan")
+        assert isinstance(AbstractFileReader.get_reader(path), PdfReader)
+    
+    def test_unknown_extension(self, tmp_path, sample_docx):
+        """Files with an unregistered extension are sniffed too."""
+        path = renamed(sample_docx, tmp_path, "upload.bin")
+        assert isinstance(AbstractFileReader.get_reader(path), DocxReader)
+    
+    def test_unrecognised_content_keeps_extension(self, tmp_path):
+        """Garbage keeps the extension's reader, which reports it as corrupted."""
+        path = tmp_path / "broken.docx"
+        path.write_bytes(b"not a zip file")
+        assert isinstance(AbstractFileReader.get_reader(path), DocxReader)
+        
+        unknown = tmp_path / "notes.bin"
+        unknown.write_bytes(b"plain text")
+        with pytest.raises(UnsupportedFormatError):
+            AbstractFileReader.get_reader(unknown)
+    
+    def test_sniff_disabled_forces_extension(self, tmp_path, sample_docx):
+        """sniff=False (used by --format) trusts the extension."""
+        path = renamed(sample_docx, tmp_path, "report.xlsx")
+        assert isinstance(AbstractFileReader.get_reader(path, sniff=False), XlsxReader)
+    
+    def test_content_types_read_from_head(self, sample_docx, sample_xlsx):
+        """Word packages list [Content_Types].xml first, inside the head."""
+        head = read_head(sample_docx)
+        assert base._content_types_from_head(head) is not None
+        assert set(DocxReader.zip_content_types) <= zip_content_types(sample_docx, head)
+        
+        workbook_types = zip_content_types(sample_xlsx, read_head(sample_xlsx))
+        assert workbook_types.intersection(XlsxReader.zip_content_types)
+
+
+class TestCustomSignatures:
+    """Test signature registration by custom readers."""
+    
+    @pytest.fixture(autouse=True)
+    def isolate_registry(self):
+        """Isolate registry for each test - save and restore."""
+        original_registry = AbstractFileReader.registry.copy()
+        AbstractFileReader.registry.clear()
+        yield
+        # Restore original registry
+        AbstractFileReader.registry.clear()
+        AbstractFileReader.registry.update(original_registry)
+    
+    def test_registered_signature_is_sniffed(self, tmp_path):
+        """A signature declared by a new reader is used immediately."""
+        
+        class MagicReader(AbstractFileReader):
+            signatures = (b"MAGIC",)
+            
+            @classmethod
+            def get_extension(cls) -> str:
+                return "magic"
+            
+            def read(self, filepath: Path) -> str:
+                return "magic"
+        
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"MAGIC\x00payload")
+        assert isinstance(AbstractFileReader.get_reader(path), MagicReader)
+        assert AbstractFileReader.sniff(tmp_path / "missing.bin") is None
+    
+    def test_readers_without_signatures_skip_sniffing(self, tmp_path):
+        """Extension-only readers never open the file in get_reader()."""
+        
+        class TxtReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "txt"
+            
+            def read(self, filepath: Path) -> str:
+                return "text"
+        
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+        assert isinstance(AbstractFileReader.get_reader(path), TxtReader)
+        assert cached_head(path) is None
+
+
+class TestHeadReuse:
+    """Test that the sniffed head spares later opens."""
+    
+    def test_small_file_hashed_from_head(self, tmp_path):
+        """Files shorter than SNIFF_BYTES are hashed without reopening."""
+        path = tmp_path / "small.pdf"
+        path.write_bytes(b"%PDF-1.7 tiny")
+        read_head(path)
+        assert cached_head(path) == b"%PDF-1.7 tiny"
+        assert hash_file(path) == hashlib.sha256(b"%PDF-1.7 tiny").hexdigest()
+    
+    def test_modified_file_not_served_stale(self, tmp_path):
+        """A changed file (size / mtime) is read again."""
+        path = tmp_path / "small.pdf"
+        path.write_bytes(b"%PDF-1.7 tiny")
+        read_head(path)
+        path.write_bytes(b"%PDF-1.7 changed content")
+        assert cached_head(path) is None
+        assert hash_file(path) == hashlib.sha256(b"%PDF-1.7 changed content").hexdigest()
@@ -0,0 +1,141 @@
+"""
+Unit Tests for Document Sources (Buffers, File Objects, Stdin)
+
+Tests coverage:
+- Readers extract from bytearray, memoryview and mmap buffers
+- from_fileobj(): regular files are mapped, BytesIO lends its buffer,
+  pipes are read
+- validate_file_exists() checks files without opening them
+- read_file.py - reads stdin (redirected file or pipe)
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (reader tests require PyMuPDF, openpyxl, python-docx)
+"""
+
+import builtins
+import io
+import mmap
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import validate_file_exists
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.source import DocumentSource
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+READ_FILE = Path(__file__).resolve().parents[2] / "templates" / "skills" / "read_file.py"
+
+READERS = [
+    (PdfReader(), "sample_pdf"),
+    (XlsxReader(engine="fast"), "sample_xlsx"),
+    (XlsxReader(engine="openpyxl"), "sample_xlsx"),
+    (DocxReader(engine="fast"), "sample_docx"),
+    (DocxReader(engine="python-docx"), "sample_docx"),
+]
+
+
+class TestBuffers:
+    """Test extraction from every supported buffer type."""
+    
+    @pytest.mark.parametrize("reader, fixture", READERS)
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_bytes_like(self, reader, fixture, wrap, request):
+        """bytearray and memoryview content reads like the file."""
+        path = request.getfixturevalue(fixture)
+        source = DocumentSource.from_bytes(wrap(path.read_bytes()), path.name)
+        assert reader.read(source) == reader.read(path)
+    
+    @pytest.mark.parametrize("reader, fixture", READERS)
+    def test_mmap(self, reader, fixture, request):
+        """Memory-mapped files are parsed in place."""
+        path = request.getfixturevalue(fixture)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+            source = DocumentSource.from_mmap(mapping, path.name)
+            assert reader.read(source) == reader.read(path)
+            assert reader.probe(source).size_bytes == path.stat().st_size
+    
+    def test_independent_readers(self, sample_docx):
+        """Each open() has its own position over the shared buffer."""
+        source = DocumentSource.from_bytes(bytearray(sample_docx.read_bytes()), "a.docx")
+        first, second = source.open(), source.open()
+        first.seek(10)
+        assert second.read(2) == b"PK"
+        assert first.tell() == 10
+
+
+class TestFileObjects:
+    """Test from_fileobj() and from_stdin()."""
+    
+    def test_regular_file_mapped(self, sample_pdf):
+        """Regular files are mapped, not read."""
+        with open(sample_pdf, "rb") as f:
+            source = DocumentSource.from_fileobj(f)
+            assert isinstance(source.data, mmap.mmap)
+            assert str(source) == str(sample_pdf)
+            assert PdfReader().read(source) == PdfReader().read(sample_pdf)
+    
+    def test_bytesio_buffer_shared(self, sample_xlsx):
+        """BytesIO content is borrowed, not copied."""
+        upload = io.BytesIO(sample_xlsx.read_bytes())
+        source = DocumentSource.from_fileobj(upload, "upload.xlsx")
+        assert isinstance(source.data, memoryview)
+        assert XlsxReader().read(source) == XlsxReader().read(sample_xlsx)
+    
+    def test_pipe_read(self, sample_docx):
+        """Non-seekable streams are read into memory."""
+        read_end, write_end = os.pipe()
+        with open(write_end, "wb") as writer:
+            writer.write(sample_docx.read_bytes())
+        with open(read_end, "rb") as reader:
+            source = DocumentSource.from_fileobj(reader, "<pipe>")
+        assert isinstance(source.data, bytes)
+        assert DocxReader().read(source) == DocxReader().read(sample_docx)
+
+
+class TestValidation:
+    """Test that validation leaves opening to the reader."""
+    
+    def test_validate_does_not_open(self, sample_pdf, monkeypatch):
+        """Existence and readability are checked without open()."""
+        def fail(*args, **kwargs):
+            raise AssertionError("validate_file_exists opened the file")
+        monkeypatch.setattr(builtins, "open", fail)
+        validate_file_exists(sample_pdf)
+    
+    def test_in_memory_always_valid(self):
+        """In-memory sources have nothing to validate."""
+        validate_file_exists(DocumentSource.from_bytes(b"", "empty.pdf"))
+
+
+class TestStdin:
+    """Test read_file.py - (standard input)."""
+    
+    def run(self, *args, **kwargs):
+        return subprocess.run(
+            [sys.executable, str(READ_FILE), "--no-daemon", "--no-cache", *args],
+            capture_output=True, **kwargs,
+        )
+    
+    def test_redirected_file(self, sample_pdf):
+        """A redirected document is identified by content and extracted."""
+        with open(sample_pdf, "rb") as stdin:
+            result = self.run("-", stdin=stdin)
+        assert result.returncode == 0
+        assert result.stdout.decode() == PdfReader().read(sample_pdf)
+    
+    def test_pipe_with_records(self, sample_xlsx):
+        """Piped input supports the single-file options; the path is <stdin>."""
+        result = self.run("-", "--jsonl", input=sample_xlsx.read_bytes())
+        assert result.returncode == 0
+        assert b'"path": "<stdin>"' in result.stdout.splitlines()[0]
+    
+    def test_unidentified_input(self):
+        """Input no reader recognises is an unsupported format."""
+        result = self.run("-", input=b"plain text")
+        assert result.returncode == 1
+        assert b"Unsupported file format" in result.stderr
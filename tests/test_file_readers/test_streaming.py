@@ -0,0 +1,116 @@
+"""
+Unit Tests for Streaming Extraction (iter_read)
+
+Tests coverage:
+- iter_joined() equivalence with str.join()
+- Default iter_read() for readers that only implement read()
+- Concrete readers: chunks concatenate to read() output
+- Early close releases the underlying document
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (concrete reader tests require their libraries)
+"""
+
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import AbstractFileReader, iter_joined
+from templates.skills.file_readers.docx_reader import DocxReader
+from templates.skills.file_readers.pdf_reader import PdfReader
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+
+class TestIterJoined:
+    """Test iter_joined() streaming join helper."""
+    
+    @pytest.mark.parametrize("parts", [
+        [],
+        ["only"],
+        ["a", "b", "c"],
+        ["", "x", ""],
+    ])
+    def test_matches_str_join(self, parts):
+        """Concatenated output equals separator.join(parts)."""
+        assert "".join(iter_joined(parts)) == "\n".join(parts)
+        assert "".join(iter_joined(iter(parts), ", ")) == ", ".join(parts)
+    
+    def test_one_chunk_per_part(self):
+        """Each part produces exactly one chunk."""
+        assert list(iter_joined(["a", "b"])) == ["a", "\nb"]
+
+
+class TestDefaultIterRead:
+    """Test the base-class iter_read() fallback."""
+    
+    @pytest.fixture(autouse=True)
+    def isolate_registry(self):
+        """Isolate registry for each test - save and restore."""
+        original_registry = AbstractFileReader.registry.copy()
+        AbstractFileReader.registry.clear()
+        yield
+        # Restore original registry
+        AbstractFileReader.registry.clear()
+        AbstractFileReader.registry.update(original_registry)
+    
+    def test_default_yields_read_output(self):
+        """Readers implementing only read() stream it as one chunk."""
+        
+        class TxtReader(AbstractFileReader):
+            @classmethod
+            def get_extension(cls) -> str:
+                return "txt"
+            
+            def read(self, filepath: Path) -> str:
+                return "whole text"
+        
+        assert list(TxtReader().iter_read(Path("file.txt"))) == ["whole text"]
+
+
+class TestConcreteReadersStream:
+    """Test iter_read() of the bundled readers."""
+    
+    def test_pdf_chunks_match_read(self, sample_pdf):
+        """PDF chunks concatenate to read() and skip empty pages."""
+        reader = PdfReader()
+        chunks = list(reader.iter_read(sample_pdf))
+        
+        assert len(chunks) == 4  # two markers + two non-empty pages
+        assert "".join(chunks) == reader.read(sample_pdf)
+        assert "=== PAGE 2 ===" not in reader.read(sample_pdf)
+    
+    def test_xlsx_chunks_match_read(self, sample_xlsx):
+        """XLSX yields one chunk per sheet header and non-empty row."""
+        reader = XlsxReader()
+        chunks = list(reader.iter_read(sample_xlsx))
+        text = reader.read(sample_xlsx)
+        
+        assert "".join(chunks) == text
+        assert chunks[0] == "\n=== SHEET: Budget ===\n"
+        assert "=== SHEET: Empty ===" in text
+        assert "Rent\t1200" in text
+    
+    def test_docx_chunks_match_read(self, sample_docx):
+        """DOCX yields paragraphs and table rows, then headers/footers."""
+        reader = DocxReader()
+        chunks = list(reader.iter_read(sample_docx))
+        
+        assert chunks[0] == "Title paragraph"
+        assert "\nmerged\tmerged\tx" in chunks
+        assert "".join(chunks) == reader.read(sample_docx)
+        assert chunks[-2:] == [
+            "\n\n[HEADER_S1] Running header",
+            "\n[FOOTER_S1] Running footer",
+        ]
+    
+    def test_early_close_releases_document(self, sample_pdf):
+        """Closing the generator early runs the reader's cleanup."""
+        generator = PdfReader().iter_read(sample_pdf)
+        assert "=== PAGE 1 ===" in next(generator)
+        generator.close()  # Must not raise; document is closed in finally
+    
+    def test_errors_raised_when_iteration_starts(self, tmp_path):
+        """Validation errors surface on first next(), not on call."""
+        generator = PdfReader().iter_read(tmp_path / "missing.pdf")
+        with pytest.raises(FileNotFoundError):
+            next(generator)
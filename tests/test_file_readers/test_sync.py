@@ -0,0 +1,209 @@
+"""
+Unit Tests for Incremental Sync
+
+Tests coverage:
+- First run extracts everything and writes the manifest
+- Unchanged and touched (mtime-only) files are skipped
+- Changed, new and reader-version-bumped files are re-extracted
+- Outputs of removed files are deleted (with emptied directories)
+- Failed files lose their outputs and are retried
+- Files edited during a sync are extracted again on the next run
+- Missing or corrupt manifests trigger a full re-extract
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (no external dependencies)
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                CorruptedFileError,
+                                                validate_file_exists)
+from templates.skills.file_readers.sync import (MANIFEST_NAME, load_manifest,
+                                                sync)
+
+
+@pytest.fixture
+def txt_reader():
+    """Register a plain-text reader that upper-cases and counts reads."""
+    original_registry = AbstractFileReader.registry.copy()
+    AbstractFileReader.registry.clear()
+    
+    class TxtReader(AbstractFileReader):
+        reads = []
+        
+        @classmethod
+        def get_extension(cls) -> str:
+            return "txt"
+        
+        def read(self, filepath: Path) -> str:
+            validate_file_exists(filepath)
+            type(self).reads.append(filepath.name)
+            text = filepath.read_text(encoding="utf-8")
+            if text == "corrupt":
+                raise CorruptedFileError(f"Cannot read {filepath.name}")
+            return text.upper()
+    
+    yield TxtReader
+    AbstractFileReader.registry.clear()
+    AbstractFileReader.registry.update(original_registry)
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    """Source tree with two text files; empty output directory path."""
+    source = tmp_path / "src"
+    (source / "sub").mkdir(parents=True)
+    (source / "a.txt").write_text("alpha")
+    (source / "sub" / "b.txt").write_text("beta")
+    (source / "notes.md").write_text("unsupported")
+    return source, tmp_path / "out"
+
+
+def run_sync(source: Path, output: Path, reader):
+    """Sync in-process, returning the report and the files actually read."""
+    reader.reads.clear()
+    report = sync(source, output, workers=1)
+    return report, sorted(reader.reads)
+
+
+def bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward without changing its content."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestSync:
+    """Test change detection and output maintenance."""
+    
+    def test_first_run_extracts_everything(self, txt_reader, dirs):
+        """Every supported file gets a .txt output and a manifest entry."""
+        source, output = dirs
+        report, reads = run_sync(source, output, txt_reader)
+        
+        assert reads == ["a.txt", "b.txt"]
+        assert (output / "a.txt.txt").read_text() == "ALPHA"
+        assert (output / "sub" / "b.txt.txt").read_text() == "BETA"
+        manifest = load_manifest(output)
+        assert sorted(manifest) == ["a.txt", "sub/b.txt"]
+        assert manifest["a.txt"].size == 5
+        assert manifest["a.txt"].reader.startswith("TxtReader:")
+        assert report.format() == "Sync: 2 extracted, 0 skipped (0 unchanged, 0 touched), 0 removed, 0 failed"
+    
+    def test_rerun_skips_unchanged(self, txt_reader, dirs):
+        """A no-change rerun reads nothing and leaves the manifest alone."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        manifest_mtime = (output / MANIFEST_NAME).stat().st_mtime_ns
+        
+        report, reads = run_sync(source, output, txt_reader)
+        assert reads == []
+        assert report.unchanged == 2 and report.skipped == 2
+        assert (output / MANIFEST_NAME).stat().st_mtime_ns == manifest_mtime
+    
+    def test_touched_file_skipped_by_hash(self, txt_reader, dirs):
+        """A new mtime with identical content is not re-extracted."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        bump_mtime(source / "a.txt")
+        
+        report, reads = run_sync(source, output, txt_reader)
+        assert reads == [] and report.touched == 1
+        # The new mtime is recorded, so the next run needs no hash
+        report, _ = run_sync(source, output, txt_reader)
+        assert report.unchanged == 2 and report.touched == 0
+    
+    def test_changed_and_new_files_extracted(self, txt_reader, dirs):
+        """Modified and added files are extracted; the rest are skipped."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        (source / "a.txt").write_text("alpha two")
+        (source / "c.txt").write_text("gamma")
+        
+        report, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt", "c.txt"]
+        assert report.unchanged == 1
+        assert (output / "a.txt.txt").read_text() == "ALPHA TWO"
+    
+    def test_edited_during_sync_re_extracted(self, txt_reader, dirs, monkeypatch):
+        """A file changed mid-extraction is not recorded with its new hash."""
+        source, output = dirs
+        read = txt_reader.read
+        
+        def read_then_edit(self, filepath: Path) -> str:
+            text = read(self, filepath)
+            if filepath.name == "a.txt" and text == "ALPHA":
+                filepath.write_text("alpha edited")
+                bump_mtime(filepath)
+            return text
+        monkeypatch.setattr(txt_reader, "read", read_then_edit)
+        
+        run_sync(source, output, txt_reader)
+        assert "a.txt" not in load_manifest(output)
+        report, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt"] and report.touched == 0
+        assert (output / "a.txt.txt").read_text() == "ALPHA EDITED"
+    
+    def test_removed_file_output_deleted(self, txt_reader, dirs):
+        """Outputs of deleted sources go, along with emptied directories."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        (source / "sub" / "b.txt").unlink()
+        
+        report, _ = run_sync(source, output, txt_reader)
+        assert report.removed == ["sub/b.txt"]
+        assert not (output / "sub").exists()
+        assert sorted(load_manifest(output)) == ["a.txt"]
+    
+    def test_missing_output_re_extracted(self, txt_reader, dirs):
+        """An output deleted by hand is regenerated."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        (output / "a.txt.txt").unlink()
+        
+        _, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt"]
+    
+    def test_reader_version_bump_re_extracts(self, txt_reader, dirs):
+        """Entries written by an older reader version are stale."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        txt_reader.reader_version = "2.0.0"
+        
+        _, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt", "b.txt"]
+        assert load_manifest(output)["a.txt"].reader == "TxtReader:2.0.0"
+    
+    def test_failed_file_retried(self, txt_reader, dirs):
+        """A file that fails loses its output and is tried again next run."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        (source / "a.txt").write_text("corrupt")
+        
+        report, _ = run_sync(source, output, txt_reader)
+        assert [result.path.name for result in report.failed] == ["a.txt"]
+        assert not (output / "a.txt.txt").exists()
+        assert "a.txt" not in load_manifest(output)
+        
+        _, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt"]
+    
+    @pytest.mark.parametrize("content", ["{not json", '{"version": 99, "files": {}}'])
+    def test_unusable_manifest_re_extracts(self, txt_reader, dirs, content):
+        """A corrupt or foreign manifest is treated as empty."""
+        source, output = dirs
+        run_sync(source, output, txt_reader)
+        (output / MANIFEST_NAME).write_text(content)
+        
+        _, reads = run_sync(source, output, txt_reader)
+        assert reads == ["a.txt", "b.txt"]
+        assert json.loads((output / MANIFEST_NAME).read_text())["version"] == 1
+    
+    def test_source_must_be_directory(self, txt_reader, tmp_path):
+        """A missing source directory raises NotADirectoryError."""
+        with pytest.raises(NotADirectoryError):
+            sync(tmp_path / "missing", tmp_path / "out", workers=1)
@@ -0,0 +1,380 @@
+"""
+Unit Tests for the Fast XLSX Engine
+
+Tests coverage:
+- Output equivalence with the openpyxl engine (types, dates, sparse sheets)
+- Shared strings, rich text and hand-written SpreadsheetML edge cases
+- Sheet / row selection through both engines
+- Fallback to openpyxl for unsupported or invalid workbooks
+- Used-range bloat: trailing empty cells trimmed, empty-row runs
+- Finished rows are detached from the tree (memory flat per row)
+- Parallel sheets: output identical to sequential, size heuristic,
+  resource limits enforced inside the sheet workers (also under spawn)
+- Engine option validation
+
+Domain: Skills (Infrastructure)
+Test Level: Unit (requires openpyxl)
+"""
+
+import datetime
+import io
+import multiprocessing
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from templates.skills.file_readers.base import (AbstractFileReader,
+                                                CorruptedFileError,
+                                                ResourceLimitExceeded)
+from templates.skills.file_readers.limits import ResourceLimits
+from templates.skills.file_readers.source import DocumentSource
+from templates.skills.file_readers.xlsx_fast import (_ROW, _SHEET_DATA,
+                                                     FastWorkbook,
+                                                     UnsupportedWorkbook,
+                                                     _iter_detached)
+from templates.skills.file_readers.xlsx_reader import XlsxReader
+
+openpyxl = pytest.importorskip("openpyxl")
+
+SHEET_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<sheetData>
+<row><c t="inlineStr"><is><r><t>ri</t></r><r><t>ch</t></r></is></c><c t="str"><v>formula</v></c></row>
+<row r="3"><c r="B3" t="e"><v>#DIV/0!</v></c><c t="b"><v>0</v></c><c><v>1E3</v></c><c><v>007</v></c></row>
+<row r="2"><c r="A2" t="str"><v>out of order</v></c></row>
+<row r="5.0"><c r="D5" t="s"><v>0</v></c><c r="A5"><v></v></c><c r="F5" t="s"><v>1</v></c></row>
+</sheetData></worksheet>"""
+
+def bloated_sheet_xml(ref: str) -> str:
+    """Sheet declaring ref, with styled empty cells and a far-off row."""
+    return (
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        f'<dimension ref="{ref}"/><sheetData>'
+        '<row r="1"><c r="A1" t="str"><v>id</v></c><c r="B1" t="str"><v>name</v></c>'
+        '<c r="C1" s="0"/><c r="Z1" s="0"/></row>'
+        '<row r="2"><c r="A2"><v>1</v></c><c r="C2" t="str"><v></v></c></row>'
+        '<row r="3"><c r="D3" s="0"/></row>'
+        '<row r="4"><c r="B4" t="str"><v>last</v></c></row>'
+        '<row r="60"><c r="A60" t="str"><v>after gap</v></c></row>'
+        '</sheetData></worksheet>'
+    )
+
+
+SHARED_STRINGS_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
+<si><t>shared</t></si>
+<si><r><t xml:space="preserve">rich </t></r><r><t>text</t></r></si>
+</sst>"""
+
+SHARED_STRINGS_OVERRIDE = (
+    b'<Override PartName="/xl/sharedStrings.xml" ContentType="application/'
+    b'vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>'
+)
+
+
+def read_both(path: Path, **options):
+    """Extract with both engines."""
+    fast = XlsxReader(engine="fast", **options).read(path)
+    reference = XlsxReader(engine="openpyxl", **options).read(path)
+    return fast, reference
+
+
+@pytest.fixture
+def mixed_xlsx(tmp_path) -> Path:
+    """Workbook covering value types, number formats and sparse layout."""
+    path = tmp_path / "mixed.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Types"
+    sheet.append(["text", 1, 2.5, 1e20, -3, 0.1 + 0.2, True, False, None, "  "])
+    sheet.append([
+        datetime.datetime(2024, 1, 2, 3, 4, 5),
+        datetime.date(2020, 5, 6),
+        datetime.time(13, 14, 15),
+        datetime.timedelta(hours=30),
+    ])
+    sheet["A3"] = "=SUM(B1:C1)"
+    sheet["C4"] = "tab\tinside"
+    sheet["D5"] = "line\nbreak"
+    sheet["B6"].number_format = "0.00"
+    sheet["B6"] = 3.14159
+    sheet["C6"].number_format = "yyyy-mm-dd"
+    sheet["C6"] = 45000
+    sheet["D6"].number_format = "[h]:mm:ss"
+    sheet["D6"] = 1.25
+    sparse = workbook.create_sheet("Sparse")
+    sparse["Z40"] = "far"
+    sparse["A1"] = "near"
+    workbook.create_sheet("Empty")
+    workbook.save(str(path))
+    return path
+
+
+@pytest.fixture
+def handwritten_xlsx(tmp_path, sample_xlsx) -> Path:
+    """Workbook whose first sheet is hand-written XML with shared strings."""
+    path = tmp_path / "handwritten.xlsx"
+    with zipfile.ZipFile(sample_xlsx) as source, zipfile.ZipFile(path, "w") as target:
+        for item in source.infolist():
+            data = source.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = SHEET_XML.encode()
+            elif item.filename == "[Content_Types].xml":
+                data = data.replace(b"</Types>", SHARED_STRINGS_OVERRIDE)
+            target.writestr(item, data)
+        target.writestr("xl/sharedStrings.xml", SHARED_STRINGS_XML)
+    return path
+
+
+@pytest.fixture
+def bloated_xlsx(tmp_path, sample_xlsx):
+    """Factory: workbook whose first sheet declares a given used range."""
+    def build(ref: str) -> Path:
+        path = tmp_path / "bloated.xlsx"
+        with zipfile.ZipFile(sample_xlsx) as source, zipfile.ZipFile(path, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = bloated_sheet_xml(ref).encode()
+                target.writestr(item, data)
+        return path
+    return build
+
+
+class TestEquivalence:
+    """Test that both engines produce identical text."""
+    
+    def test_sample_workbook(self, sample_xlsx):
+        """The shared sample workbook extracts identically."""
+        fast, reference = read_both(sample_xlsx)
+        assert fast == reference
+    
+    def test_value_types_and_dates(self, mixed_xlsx):
+        """Numbers, booleans, dates, durations and formulas match."""
+        fast, reference = read_both(mixed_xlsx)
+        assert fast == reference
+        assert "2024-01-02 03:04:05" in fast
+        assert "1 day, 6:00:00" in fast
+    
+    def test_1904_date_system(self, tmp_path, mixed_xlsx):
+        """Workbooks using the 1904 epoch convert dates like openpyxl."""
+        workbook = openpyxl.load_workbook(mixed_xlsx)
+        workbook.epoch = openpyxl.utils.datetime.CALENDAR_MAC_1904
+        path = tmp_path / "mac.xlsx"
+        workbook.save(str(path))
+        
+        fast, reference = read_both(path)
+        assert fast == reference
+    
+    def test_handwritten_xml(self, handwritten_xlsx):
+        """Shared/inline rich strings, missing refs and row order match."""
+        fast, reference = read_both(handwritten_xlsx, sheet_index=1)
+        assert fast == reference
+        assert "rich text" in fast
+        assert "out of order" not in fast  # openpyxl skips rows going backwards
+    
+    @pytest.mark.parametrize("options", [
+        {"sheet": "Sparse"},
+        {"rows": "2:5"},
+        {"rows": "30:"},
+        {"rows": ":1"},
+    ])
+    def test_selection(self, mixed_xlsx, options):
+        """Sheet and row selection behave the same in both engines."""
+        fast, reference = read_both(mixed_xlsx, **options)
+        assert fast == reference
+    
+    def test_large_sheet(self, tmp_path):
+        """Many rows stream identically (rows are cleared as they go)."""
+        path = tmp_path / "large.xlsx"
+        workbook = openpyxl.Workbook(write_only=True)
+        sheet = workbook.create_sheet("Data")
+        for index in range(2000):
+            sheet.append([index, f"name {index % 37}", index / 7, None if index % 3 else "x"])
+        workbook.save(str(path))
+        
+        fast, reference = read_both(path)
+        assert fast == reference
+
+
+class TestUsedRange:
+    """Test that output and cost follow content, not the declared range."""
+    
+    def test_trailing_cells_trimmed(self, bloated_xlsx):
+        """Rows end at their last value in both engines."""
+        fast, reference = read_both(bloated_xlsx("A1:Z100"), sheet_index=1)
+        assert fast == reference
+        assert fast.endswith("\nid\tname\n1\n\tlast\nafter gap")
+    
+    def test_declared_width_not_allocated(self, bloated_xlsx):
+        """A1:XFD1048576 yields rows as wide as their content."""
+        workbook = FastWorkbook.open(bloated_xlsx("A1:XFD1048576"))
+        try:
+            rows = list(workbook.iter_rows(workbook.sheetnames[0]))
+        finally:
+            workbook.close()
+        assert rows == [["id", "name"], ["1"], ["", "last"], ["after gap"]]
+    
+    @pytest.mark.parametrize("max_empty_rows, last", [(56, "after gap"), (55, "last"), (1, "1")])
+    def test_empty_row_run(self, bloated_xlsx, max_empty_rows, last):
+        """A sheet ends after max_empty_rows consecutive empty rows."""
+        fast, reference = read_both(bloated_xlsx("A1:Z100"), sheet_index=1,
+                                    max_empty_rows=max_empty_rows)
+        assert fast == reference
+        assert fast.rstrip().endswith(last)
+    
+    def test_empty_row_run_stops_parsing(self, bloated_xlsx):
+        """Rows after the run are never read."""
+        workbook = FastWorkbook.open(bloated_xlsx("A1:XFD1048576"))
+        try:
+            rows = list(workbook.iter_numbered_rows(workbook.sheetnames[0], max_empty_rows=10))
+        finally:
+            workbook.close()
+        assert [number for number, _ in rows] == [1, 2, 4]
+    
+    def test_rows_detached(self):
+        """Peak memory does not grow with the number of rows parsed."""
+        def peak(rows: int) -> int:
+            xml = (f'<worksheet xmlns="{_SHEET_DATA[1:].split("}")[0]}"><sheetData>'
+                   + '<row><c t="inlineStr"><is><t>cell</t></is></c></row>' * rows
+                   + "</sheetData></worksheet>").encode()
+            tracemalloc.start()
+            try:
+                for _ in _iter_detached(io.BytesIO(xml), _SHEET_DATA, _ROW):
+                    pass
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+        
+        assert peak(50_000) < peak(1_000) + 256 * 1024
+    
+    def test_option_in_cache_token(self):
+        """Stopping early changes output, so it is part of the cache key."""
+        assert XlsxReader(max_empty_rows=5).cache_token() != XlsxReader().cache_token()
+        with pytest.raises(ValueError, match="max_empty_rows"):
+            XlsxReader(max_empty_rows=0)
+
+
+@pytest.fixture
+def multi_sheet_xlsx(tmp_path) -> Path:
+    """Four sheets of different sizes (the largest in the middle)."""
+    path = tmp_path / "multi.xlsx"
+    workbook = openpyxl.Workbook(write_only=True)
+    for number, rows in enumerate([300, 50, 900, 200], start=1):
+        sheet = workbook.create_sheet(f"Sheet {number}")
+        for index in range(rows):
+            sheet.append([index, f"s{number} row {index}", index / 4])
+    workbook.save(str(path))
+    return path
+
+
+class TestParallelSheets:
+    """Test per-sheet extraction across worker processes."""
+    
+    @pytest.mark.parametrize("engine", ["fast", "openpyxl"])
+    @pytest.mark.parametrize("options", [{}, {"rows": "2:40", "max_empty_rows": 5}])
+    def test_parallel_output_identical_to_sequential(self, multi_sheet_xlsx, engine, options):
+        """Sheets come back in workbook order with the same headers."""
+        sequential = XlsxReader(engine=engine, parallel_threshold=None, **options)
+        parallel = XlsxReader(engine=engine, parallel_threshold=1, workers=3, **options)
+        text = parallel.read(multi_sheet_xlsx)
+        assert text == sequential.read(multi_sheet_xlsx)
+        assert text.index("=== SHEET: Sheet 1 ===") < text.index("=== SHEET: Sheet 3 ===")
+    
+    def test_heuristic(self, multi_sheet_xlsx):
+        """Only the XML outside the largest selected sheet counts."""
+        sizes = XlsxReader(parallel_threshold=1, workers=2)._parallel_sheet_sizes(multi_sheet_xlsx)
+        assert list(sizes) == ["Sheet 1", "Sheet 2", "Sheet 3", "Sheet 4"]
+        savable = sum(sizes.values()) - sizes["Sheet 3"]
+        
+        def decide(threshold, workers=2, **options):
+            reader = XlsxReader(parallel_threshold=threshold, workers=workers, **options)
+            return reader._parallel_sheet_sizes(multi_sheet_xlsx) is not None
+        
+        assert decide(savable)
+        assert not decide(savable + 1)
+        assert not decide(None)
+        assert not decide(1, workers=1)
+        assert not decide(1, sheet="Sheet 3")  # One sheet: nothing to overlap
+    
+    def test_in_memory_and_preview_sequential(self, multi_sheet_xlsx, monkeypatch):
+        """Buffers cannot be reopened by workers; previews stay cheap."""
+        def fail(*args):
+            raise AssertionError("parallelized")
+        monkeypatch.setattr(XlsxReader, "_iter_sheets_parallel", fail)
+        reader = XlsxReader(parallel_threshold=1, workers=4)
+        source = DocumentSource.from_bytes(multi_sheet_xlsx.read_bytes(), "multi.xlsx")
+        assert reader.read(source) == XlsxReader().read(multi_sheet_xlsx)
+        assert reader.head(multi_sheet_xlsx, 50) == XlsxReader().read(multi_sheet_xlsx)[:50]
+    
+    def test_limits_enforced_in_workers(self, multi_sheet_xlsx, monkeypatch):
+        """Spawned sheet workers get the limits and stop an oversized sheet."""
+        # Workers start from a fresh interpreter, as on macOS
+        monkeypatch.setattr(multiprocessing.context._default_context, "_actual_context",
+                            multiprocessing.get_context("spawn"))
+        AbstractFileReader.set_limits(ResourceLimits(max_rows=500))
+        try:
+            with pytest.raises(ResourceLimitExceeded, match="500 rows") as excinfo:
+                XlsxReader(parallel_threshold=1, workers=2).read(multi_sheet_xlsx)
+        finally:
+            AbstractFileReader.set_limits(None)
+        # Raised by the worker holding the 900-row sheet, not the parent
+        assert type(excinfo.value.__cause__).__name__ == "_RemoteTraceback"
+    
+    def test_early_close(self, multi_sheet_xlsx):
+        """Closing the stream early does not raise or hang."""
+        stream = XlsxReader(parallel_threshold=1, workers=2).iter_read(multi_sheet_xlsx)
+        assert next(stream) == "\n=== SHEET: Sheet 1 ===\n"
+        stream.close()
+
+
+class TestFallback:
+    """Test fallback to openpyxl for workbooks the fast engine skips."""
+    
+    def test_not_a_zip_is_unsupported(self, tmp_path):
+        """Non-ZIP input is left to openpyxl (and its error messages)."""
+        path = tmp_path / "fake.xlsx"
+        path.write_bytes(b"not a zip file")
+        with pytest.raises(UnsupportedWorkbook):
+            FastWorkbook.open(path)
+        with pytest.raises(CorruptedFileError):
+            XlsxReader(engine="fast").read(path)
+    
+    def test_chartsheet_falls_back(self, tmp_path, sample_xlsx):
+        """Chartsheets are not handled by the fast engine."""
+        workbook = openpyxl.load_workbook(sample_xlsx)
+        chart = openpyxl.chart.BarChart()
+        workbook.create_chartsheet("Chart").add_chart(chart)
+        path = tmp_path / "chart.xlsx"
+        workbook.save(str(path))
+        
+        with pytest.raises(UnsupportedWorkbook, match="chartsheet"):
+            FastWorkbook.open(path)
+    
+    def test_corrupt_worksheet_xml(self, tmp_path, sample_xlsx):
+        """Malformed sheet XML is reported as a corrupted file."""
+        path = tmp_path / "broken.xlsx"
+        with zipfile.ZipFile(sample_xlsx) as source, zipfile.ZipFile(path, "w") as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data[:len(data) // 2]
+                target.writestr(item, data)
+        
+        with pytest.raises(CorruptedFileError, match="worksheet XML"):
+            XlsxReader(engine="fast").read(path)
+
+
+class TestEngineOption:
+    """Test engine selection."""
+    
+    def test_unknown_engine_raises(self):
+        """Only known engines are accepted."""
+        with pytest.raises(ValueError, match="Unknown XLSX engine"):
+            XlsxReader(engine="turbo")
+    
+    def test_engine_not_in_cache_token(self):
+        """Engines share cache entries because their output is identical."""
+        assert XlsxReader(engine="fast").cache_token() == XlsxReader(engine="openpyxl").cache_token()